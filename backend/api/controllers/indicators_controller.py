@@ -1,22 +1,32 @@
 import os
-import importlib
-from data.repositories.sqlite3 import SQLiteDB
+from data.repositories.sqlite3 import SQLiteDB, SQLiteWriter
 from datetime import datetime
 from data.repositories.mongo import MongoDBHandler
+from data.repositories.candle_store import CandleStore
+from data.utils.candles import columns_to_frame, decode_candles, parse_candle_times
 from logs.log_manager import LogManager
 import pandas as pd
 from config.indicator_config_loader import IndicatorConfigLoader  # Import the config loader
 from api.services.state_machine import StateMachine  # Import the state machine
+from trading.indicators.core.context import IndicatorContext, resolve_outputs
+from trading.indicators.core.planner import IndicatorPlanner, discover_indicators
+from trading.indicators.core.stacked import StackedFrame
 
 # Configure logging
 logger = LogManager('indicator_controller').get_logger()
 
 class IndicatorsController:
-    def __init__(self, db_path='backend/data/repositories/databases/indicators.db', autostart=False):
+    def __init__(self, db_path='databases/indicators.db', autostart=False, max_workers=None, use_candle_store=True):
         self.db = SQLiteDB(db_path)
         self.autostart = autostart
         self.indicators_dir = os.path.join(os.path.dirname(__file__), '../../trading/indicators/')
+
+        # Planner that runs the indicator dependency graph on a thread pool
+        self.planner = IndicatorPlanner(max_workers=max_workers)
         
+        # Local memory-mapped candle store, read before falling back to MongoDB
+        self.candle_store = CandleStore() if use_candle_store else None
+
         # MongoDB handler to fetch monthly data
         self.mongo_handler = MongoDBHandler(db_name="forex_data")
         
@@ -26,97 +36,154 @@ class IndicatorsController:
         # Initialize the state machine
         self.state_machine = StateMachine(self.config_loader)
         
-        # Initialize the SQLite database
-        schema_path = '/Users/black_mac/Documents/GitHub/Forex/AI-ForXBot/backend/data/repositories/schema.sql'
-        if not os.path.isfile(schema_path):
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
-        
-        with open(schema_path, 'r') as schema_file:
-            schema_sql = schema_file.read()
-
-        self.db.initialize_db(schema_sql)
-        print(f'Schema initialized from: {schema_path}')
+        # Initialize the SQLite database from the schema.sql next to the repository module
+        self.db.initialize_db()
     
-    def get_indicator_modules(self):
+    def get_indicator_classes(self):
         """
-        Retrieve all indicator modules from the indicators directory.
+        Retrieve all indicator classes from the indicators directory, keyed by class name.
         """
-        return [
-            f
-            for f in os.listdir(self.indicators_dir)
-            if f.endswith('.py') and f != '__init__.py'
-        ]
+        return discover_indicators(self.indicators_dir)
 
-    def fetch_historical_data(self, instrument, granularity="M"):
+    def build_requests(self, tier="macro"):
+        """
+        Pair every indicator configured in the YAML file with its class and parameters.
+        :param tier: The config tier to read parameters from (macro, daily, micro).
+        :return: List of (indicator class, params) pairs.
         """
-        Fetch historical data from MongoDB for a given instrument and granularity (monthly data).
+        indicator_classes = self.get_indicator_classes()
+        requests = []
+        for indicator_name in self.config_loader.get_indicator_names():
+            if indicator_name not in indicator_classes:
+                logger.warning(f"No indicator class found for configured indicator '{indicator_name}'.")
+                continue
+            requests.append((indicator_classes[indicator_name], self.extract_parameters(indicator_name, tier)))
+        return requests
+
+    def fetch_historical_data(self, instrument, granularity="M", count=None):
+        """
+        Fetch historical data for a given instrument and granularity (monthly data), from the local
+        candle store when it mirrors the MongoDB collection and from MongoDB otherwise.
         :param instrument: The instrument to fetch (e.g., "EUR_USD").
         :param granularity: The time granularity (default is monthly "M").
+        :param count: Optional number of most recent bars to fetch (default: the whole history).
         :return: Pandas DataFrame of historical data.
         """
-        collection_name = f"{instrument.lower()}_{granularity.lower()}_data"
-        if data := self.mongo_handler.read(query={}, collection_name=collection_name):
-            return self.process_mongo_data(data, instrument)
+        collection_name = self.mongo_handler.candle_collection_name(instrument, granularity)
+        if self.candle_store is not None and self.sync_candle_store(instrument, granularity, collection_name):
+            if count is None:
+                df = self.candle_store.frame(instrument, granularity)
+            else:
+                df = columns_to_frame(self.candle_store.tail(instrument, granularity, count))
+            logger.info(f"Loaded {len(df)} rows for {instrument} from the candle store.")
+            return df
+
+        if count is None:
+            columns = self.mongo_handler.read_candles(collection_name)
+        else:
+            columns = self.mongo_handler.tail(instrument, granularity, count, as_arrays=True)
+        if len(columns['time']):
+            logger.info(f"Fetched {len(columns['time'])} rows for {instrument} from MongoDB.")
+            if self.candle_store is not None and count is None:
+                # The whole collection was just read: reload the stale store from it
+                self.candle_store.replace(instrument, granularity, columns)
+            return columns_to_frame(columns)
         logger.warning(f"No data found for {instrument} in MongoDB.")
         return None
 
+    def sync_candle_store(self, instrument, granularity, collection_name):
+        """
+        Check that the candle store holds the same series as MongoDB, filling it first if it is empty.
+
+        The population services only append new candles to the store, so a store created after the
+        collection holds just its latest bars, and one that missed a population run lags behind it.
+        The store is trusted when its first bar, last bar and bar count all match the collection's.
+        :return: True if the series can be read from the candle store.
+        """
+        mongo_count = self.mongo_handler.candle_count(collection_name)
+        if not mongo_count:
+            return False
+        store_count = self.candle_store.count(instrument, granularity)
+        if not store_count:
+            columns = self.mongo_handler.read_candles(collection_name)
+            self.candle_store.append(instrument, granularity, columns)
+            store_count = self.candle_store.count(instrument, granularity)
+
+        mongo_first, mongo_last = (int(seconds) for seconds in parse_candle_times(
+            [self.mongo_handler.first_candle_time(collection_name), self.mongo_handler.last_candle_time(collection_name)]))
+        store_first = self.candle_store.first_time(instrument, granularity)
+        store_last = self.candle_store.last_time(instrument, granularity)
+        if (store_count, store_first, store_last) == (mongo_count, mongo_first, mongo_last):
+            return True
+        logger.warning(f"Candle store of {instrument} {granularity} ({store_count} bars from {store_first} to {store_last}) "
+                       f"does not match MongoDB ({mongo_count} bars from {mongo_first} to {mongo_last}); reading MongoDB.")
+        return False
+
     def process_mongo_data(self, data, instrument):
         """
         Process MongoDB data to extract relevant fields like 'open', 'high', 'low', 'close', 'volume'.
+        The documents are decoded column-wise (see `data.utils.candles.decode_candles`).
         """
-        df = pd.DataFrame(data)
-        
-        # Extract 'o', 'h', 'l', 'c' from the 'mid' object
-        df['open'] = df['mid'].apply(lambda x: float(x['o']) if 'o' in x else None)
-        df['high'] = df['mid'].apply(lambda x: float(x['h']) if 'h' in x else None)
-        df['low'] = df['mid'].apply(lambda x: float(x['l']) if 'l' in x else None)
-        df['close'] = df['mid'].apply(lambda x: float(x['c']) if 'c' in x else None)
-        
-        # Handle volume and time
-        df['volume'] = df.get('volume', None).astype(float)
-        df['time'] = pd.to_datetime(df['time'])
-        
-        required_columns = ['open', 'high', 'low', 'close', 'volume', 'time']
-        for col in required_columns:
-            if col not in df.columns:
-                raise KeyError(f"Missing required column: {col}")
-        
+        df = columns_to_frame(decode_candles(data, count=len(data)))
         logger.info(f"Fetched {len(df)} rows for {instrument} from MongoDB.")
         return df
 
-    def extract_parameters(self, indicator_name):
+    def extract_parameters(self, indicator_name, tier="macro"):
         """
         Get parameters from the YAML config file for the specific indicator.
         """
-        return self.config_loader.get_indicator_params(indicator_name, "macro")  # Example using the "macro" tier
-    
-    def calculate_indicator(self, indicator_name, df, params, instrument):
+        tier_config = self.config_loader.get_indicator_params(indicator_name, tier) or {}
+        return tier_config.get('params', {})
+
+    def calculate_indicators(self, requests, df, instrument, granularity):
         """
-        Dynamically load and calculate the indicator values using fetched historical data.
-        :param indicator_name: The name of the indicator file (without .py).
+        Calculate all requested indicators on one instrument's historical data.
+        :param requests: List of (indicator class, params) pairs.
         :param df: Historical data as a Pandas DataFrame.
-        :param params: Calculation parameters for the indicator.
         :param instrument: The financial instrument for which the calculation is made (e.g., EUR_USD)
+        :param granularity: The granularity of the historical data.
+        :return: Dict {(indicator class, bound params): DataFrame of the indicator outputs}.
         """
-        try:
-            module_name = f'trading.indicators.{indicator_name[:-3]}'  # Remove the .py extension
-            indicator_module = importlib.import_module(module_name)
-            
-            # Dynamically load the class and instantiate it
-            class_name = indicator_name[:-3].upper()
-            if hasattr(indicator_module, class_name):
-                indicator_class = getattr(indicator_module, class_name)
-                indicator_instance = indicator_class()
-
-                # Call the calculate method and store results in the DB
-                result_df = indicator_instance.calculate(df, **params)
-                indicator_instance.insert_results_to_db(class_name, instrument, result_df, **params)
-
-                logger.info(f"Indicator {indicator_name} processed for {instrument}.")
-            else:
-                logger.warning(f"No class named '{class_name}' found in {indicator_name}.")
-        except Exception as e:
-            logger.error(f"Error calculating {indicator_name}: {e}")
+        context = IndicatorContext(df, instrument, granularity)
+        return self.planner.execute(requests, context)
+
+    def calculate_stacked_indicators(self, requests, frames, granularity):
+        """
+        Calculate all requested indicators for several instruments in one vectorized pass.
+        :param requests: List of (indicator class, params) pairs.
+        :param frames: Dict {instrument: historical data as a Pandas DataFrame}.
+        :param granularity: The granularity of the historical data.
+        :return: Dict {instrument: {(indicator class, bound params): DataFrame of the indicator outputs}}.
+        """
+        context = IndicatorContext(StackedFrame.stack(frames), ', '.join(frames), granularity)
+        stacked_results = self.planner.execute(requests, context)
+
+        results = {instrument: {} for instrument in frames}
+        for key, stacked in stacked_results.items():
+            for instrument, result_df in stacked.split().items():
+                results[instrument][key] = result_df
+        return results
+
+    def store_results(self, results, instrument, granularity, times):
+        """
+        Upsert the calculated indicator outputs into their time series (see `SQLiteDB.store_indicator_frame`).
+        The rows are queued on the DB writer; `SQLiteWriter.flush_all` waits for them.
+        :param results: Dict returned by `calculate_indicators`.
+        :param instrument: The financial instrument for which the calculation is made (e.g., EUR_USD)
+        :param granularity: The granularity of the historical data.
+        :param times: Candle times aligned with the result DataFrames.
+        """
+        for (indicator_class, params), result_df in results.items():
+            class_name = indicator_class.__name__
+            if result_df is None or result_df.empty:
+                logger.warning(f"Indicator {class_name} returned no rows for {instrument}; nothing to store.")
+                continue
+            try:
+                outputs = resolve_outputs(indicator_class, dict(params))
+                self.db.store_indicator_frame(instrument, granularity, class_name, dict(params), times, result_df, outputs)
+                logger.info(f"Indicator {class_name} queued for storage for {instrument}.")
+            except Exception as e:
+                logger.error(f"Error storing {class_name} results for {instrument}: {e}")
 
     def run(self):
         """
@@ -124,29 +191,38 @@ class IndicatorsController:
         """
         if self.autostart:
             logger.info("Autostart is enabled. Beginning indicator calculations...")
-            indicator_modules = self.get_indicator_modules()
-
-            for indicator_file in indicator_modules:
-                major_pairs = ["EUR_USD", "GBP_USD", "USD_JPY", "AUD_USD", "USD_CHF", "USD_CAD"]
-                for instrument in major_pairs:
-                    df = self.fetch_historical_data(instrument, "M")
-                    if df is not None:
-                        params = self.extract_parameters(indicator_file)
-                        self.calculate_indicator(indicator_file, df, params, instrument)
-                        
-                        # Assuming we have indicator results, we'll pass them into the state machine
-                        # For now, simulate some results to show how it would work
-                        indicator_results_macro = {
-                            'ATR': 1,
-                            'ADX': 1,
-                            'Aroon': 0,
-                            'BollingerBands': 1
-                        }
-
-                        # Calculate the state (Green/Red) using the state machine
-                        state = self.state_machine.run_state_machine({'macro': indicator_results_macro})
-                        logger.info(f"State for {instrument}: {state['macro']}")  # Example: macro state
+            requests = self.build_requests()
+            granularity = "M"
+
+            major_pairs = ["EUR_USD", "GBP_USD", "USD_JPY", "AUD_USD", "USD_CHF", "USD_CAD"]
+            frames = {}
+            for instrument in major_pairs:
+                # Fetch the history once per instrument
+                df = self.fetch_historical_data(instrument, granularity)
+                if df is not None:
+                    frames[instrument] = df
+
+            # Evaluate every indicator once for all instruments on stacked (bars x instruments) arrays
+            results = self.calculate_stacked_indicators(requests, frames, granularity) if frames else {}
+
+            for instrument, instrument_results in results.items():
+                self.store_results(instrument_results, instrument, granularity, frames[instrument]['time'])
+
+                # Assuming we have indicator results, we'll pass them into the state machine
+                # For now, simulate some results to show how it would work
+                indicator_results_macro = {
+                    'ATR': 1,
+                    'ADX': 1,
+                    'Aroon': 0,
+                    'BollingerBands': 1
+                }
+
+                # Calculate the state (Green/Red) using the state machine
+                state = self.state_machine.run_state_machine({'macro': indicator_results_macro})
+                logger.info(f"State for {instrument}: {state['macro']}")  # Example: macro state
 
+            # Wait for the queued indicator writes to be committed
+            SQLiteWriter.flush_all()
             logger.info("All indicators processed.")
         else:
             logger.info("Autostart is disabled. No indicators will be processed.")
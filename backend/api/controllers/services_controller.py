@@ -1,5 +1,5 @@
 from flask import Blueprint, jsonify, request
-from trading.brokers.oanda_client import OandaClient
+from trading.brokers.oanda_client import get_client
 from services.trading_services import TradingService as trading_service
 from api.services.data_population_service import DataPopulationService as data_population_service
 import os
@@ -13,6 +13,9 @@ The controllers here are responsible for handling incoming HTTP requests, intera
 bp = Blueprint('api', __name__)
 dp = Blueprint('data_population', __name__)
 
+# Shared OANDA client of the configured environment
+oanda_client = get_client(os.getenv('OANDA_ENV', 'practice'))
+
 @bp.route('/start', methods=['POST'])
 def start_trading():
     """
@@ -62,7 +65,7 @@ def place_order():
     :return: A JSON response containing the details of the placed order.
     """
     order_data = request.json
-    response = OandaClient.place_order(order_data)
+    response = oanda_client.place_order(order_data)
     return jsonify(response), 201
 
 @bp.route('/orders', methods=['GET'])
@@ -72,7 +75,7 @@ def get_orders():
 
     :return: A JSON response containing the list of open orders.
     """
-    orders = OandaClient.get_orders()
+    orders = oanda_client.get_orders()
     return jsonify(orders), 200
 
 @bp.route('/positions', methods=['GET'])
@@ -82,13 +85,13 @@ def get_positions():
 
     :return: A JSON response containing the current positions.
     """
-    positions = OandaClient.get_positions()
+    positions = oanda_client.get_positions()
     return jsonify(positions), 200
 
 @bp.route('/candles', methods=['GET'])
 def get_candles():
     """
-    Retrieves historical candle data for a specific instrument from OANDA by calling the `get_candles` method of the OandaClient.
+    Retrieves historical candle data for a specific instrument from OANDA by calling the `fetch_historical_data` method of the OandaClient.
     The `instrument`, `granularity`, and `count` parameters are expected to be provided as query parameters.
 
     :return: A JSON response containing the historical candle data.
@@ -96,7 +99,7 @@ def get_candles():
     instrument = request.args.get('instrument')
     granularity = request.args.get('granularity', 'M1')
     count = int(request.args.get('count', 100))
-    candles = OandaClient.get_candles(instrument, granularity, count)
+    candles = oanda_client.fetch_historical_data(instrument, granularity, count)
     return jsonify(candles), 200
 
 @bp.route('/populate_data', methods=['POST'])
@@ -1,8 +1,9 @@
 # backend/api/routes/routes.py
 from flask import Blueprint, Flask, jsonify, request
 from logs.log_manager import LogManager
-from api.services.trading_services import TradingService as trading_service
+from api.services.trading_services import trading_service
 from api.services.data_population_service import DataPopulationService
+from trading.brokers.rate_limiter import get_rate_limiter
 
 '''
 Creates the Flask app and registers the blueprints. Defines the API routes.
@@ -113,6 +114,50 @@ def trade_history():
     trade_history_data = []  # Replace with actual trade history retrieval logic
     return jsonify(trade_history_data), 200
 
+# Candles endpoint
+@bp.route('/candles/<instrument>/<granularity>', methods=['GET'])
+def candles(instrument, granularity):
+    """
+    Returns stored candles: the last `count` bars (default 200), or the bars of [from, to) when
+    either bound is given.
+    """
+    try:
+        start, end = request.args.get('from'), request.args.get('to')
+        mongo_handler = data_population_service.mongo_handler
+        if start or end:
+            data = mongo_handler.read_range(instrument, granularity, start, end)
+        else:
+            data = mongo_handler.tail(instrument, granularity, request.args.get('count', 200, type=int))
+        return jsonify(data), 200
+    except Exception as e:
+        logger.error(f"Error reading candles: {e}")
+        return jsonify({'error': str(e)}), 500
+
+# Broker rate limiter metrics
+@bp.route('/rate-limits', methods=['GET'])
+def rate_limits():
+    """
+    Returns the queue depth and wait times of the OANDA rate limiter per priority class.
+    """
+    return jsonify(get_rate_limiter().metrics()), 200
+
+# Latest prices endpoint
+@bp.route('/pricing', methods=['GET'])
+def pricing():
+    """
+    Returns the latest bid/ask of the instruments in ?instruments=EUR_USD,USD_JPY, through
+    `TradingService.get_prices` (one broker request per pricing cache window).
+    """
+    instruments = [instrument for instrument in request.args.get('instruments', '').upper().split(',') if instrument]
+    if not instruments:
+        return jsonify({'error': 'Missing instruments'}), 400
+    try:
+        snapshot = trading_service.get_prices(instruments)
+        return jsonify(snapshot.to_dict(instruments)), 200
+    except Exception as e:
+        logger.error(f"Error retrieving prices: {e}")
+        return jsonify({'error': str(e)}), 500
+
 # Data population route
 @dp.route('/populate_data', methods=['POST'])
 def populate_data():
@@ -0,0 +1,203 @@
+# backend/api/services/backfill_service.py
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from data.utils.candles import GRANULARITY_SECONDS, format_candle_time, parse_candle_times
+from logs.log_manager import LogManager
+
+# Configure loggers
+logger = LogManager('backfill_logs').get_logger()
+
+"""
+Deep historical backfill beyond OANDA's 5000-candle request limit.
+
+`plan_windows` splits a [start, end) range into consecutive windows that hold at most 5000 candles
+of the granularity. `BackfillService` fetches the windows concurrently (OandaClient sends them at
+history priority through the process-wide rate limiter) and upserts each window into MongoDB as soon as it arrives; once every
+window is in, the range is mirrored into the candle store in time order. Finished windows are
+recorded in a checkpoint file named after the series and the start of the range, so an interrupted
+multi-year backfill picks up where it stopped when run again from the same start.
+
+The broker is any object with OandaClient's `fetch_historical_data`, so the service runs as well
+against a local OANDA stand-in.
+"""
+
+MAX_CANDLES_PER_REQUEST = 5000
+DEFAULT_CHECKPOINT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir,
+                                      'data', 'repositories', 'databases', 'backfill')
+
+
+def plan_windows(granularity, start, end, max_candles=MAX_CANDLES_PER_REQUEST):
+    """
+    Split [start, end) into consecutive request windows of at most `max_candles` candles.
+
+    :param granularity: The OANDA granularity (e.g., 'M1', 'H1', 'D').
+    :param start: First time of the range (epoch seconds, datetime or time string; naive is UTC).
+    :param end: End of the range (exclusive).
+    :param max_candles: Candles per window (OANDA accepts at most 5000).
+    :return: List of (from, to) RFC3339 string pairs.
+    """
+    if granularity not in GRANULARITY_SECONDS:
+        raise ValueError(f"Unknown granularity '{granularity}'.")
+    start, end = (int(pd.Timestamp(format_candle_time(value)).timestamp()) for value in (start, end))
+    step = GRANULARITY_SECONDS[granularity] * max_candles
+    return [
+        (format_candle_time(window_start), format_candle_time(min(window_start + step, end)))
+        for window_start in range(start, end, step)
+    ]
+
+
+class BackfillCheckpoint:
+    def __init__(self, path):
+        """
+        Finished windows of one backfill, persisted as JSON.
+
+        Windows are recorded as {from: to}. A backfill up to "now" plans a longer last window on every
+        run, so a window counts as done when its start was recorded with at least the same end.
+
+        :param path: File of the checkpoint (created on the first finished window).
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.done = {}
+        if os.path.isfile(path):
+            with open(path) as f:
+                self.done = json.load(f)['done']
+
+    def is_done(self, window):
+        from_time, to_time = window
+        return from_time in self.done and self.done[from_time] >= to_time
+
+    def mark_done(self, window):
+        with self._lock:
+            from_time, to_time = window
+            self.done[from_time] = to_time
+            # Write and rename, so an interrupted save never leaves a truncated checkpoint
+            temporary = f'{self.path}.tmp'
+            with open(temporary, 'w') as f:
+                json.dump({'done': self.done}, f, sort_keys=True)
+            os.replace(temporary, self.path)
+
+    def clear(self):
+        with self._lock:
+            self.done = {}
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+
+
+class BackfillService:
+    def __init__(self, mongo_handler, oanda_client=None, candle_store=None, rate_limiter=None,
+                 max_workers=4, checkpoint_dir=None):
+        """
+        :param mongo_handler: MongoDBHandler the candles are upserted into.
+        :param oanda_client: Broker client (defaults to the handler's OandaClient).
+        :param candle_store: Optional CandleStore mirrored once the backfill completes.
+        :param rate_limiter: Optional extra limiter for brokers that do not limit their own requests.
+        :param max_workers: Windows fetched concurrently.
+        :param checkpoint_dir: Directory of the checkpoint files.
+        """
+        self.mongo_handler = mongo_handler
+        self.oanda_client = oanda_client or mongo_handler.oanda_client
+        self.candle_store = candle_store
+        self.rate_limiter = rate_limiter
+        self.max_workers = max_workers
+        self.checkpoint_dir = checkpoint_dir or DEFAULT_CHECKPOINT_DIR
+
+    def checkpoint(self, instrument, granularity, start):
+        """
+        Checkpoint of the backfill of a series from `start`, whatever the end of the range; the
+        finished windows are stored inside it.
+        """
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        name = f"{instrument.upper()}_{granularity}_{format_candle_time(start)}".replace(':', '')
+        return BackfillCheckpoint(os.path.join(self.checkpoint_dir, f'{name}.json'))
+
+    def fetch_window(self, instrument, granularity, window):
+        """
+        Fetch one window from the broker and upsert it into MongoDB.
+
+        :return: The candle documents of the window.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        from_time, to_time = window
+        candles = self.oanda_client.fetch_historical_data(instrument, granularity, from_time=from_time, to_time=to_time)
+        if candles:
+            collection_name = self.mongo_handler.candle_collection_name(instrument, granularity)
+            self.mongo_handler.upsert_candles(collection_name, candles)
+        return candles
+
+    def backfill(self, instrument, granularity, start, end=None):
+        """
+        Backfill the candles of [start, end), resuming from the checkpoint of an earlier run.
+
+        :param instrument: The forex pair (e.g., "EUR_USD").
+        :param granularity: The timeframe (e.g., "M1", "D", "H1").
+        :param start: First time of the range.
+        :param end: End of the range (defaults to now; OANDA rejects future times).
+        :return: Number of candles fetched by this run.
+        """
+        instrument = instrument.upper()
+        now = pd.Timestamp.now(tz='UTC')
+        end = now if end is None else min(pd.Timestamp(format_candle_time(end)), now)
+        windows = plan_windows(granularity, start, end)
+        if not windows:
+            return 0
+
+        collection_name = self.mongo_handler.candle_collection_name(instrument, granularity)
+        self.mongo_handler.create_collection_with_index(collection_name, index_field="time")
+
+        checkpoint = self.checkpoint(instrument, granularity, windows[0][0])
+        pending = [window for window in windows if not checkpoint.is_done(window)]
+        logger.info(f"Backfilling {instrument} {granularity}: {len(pending)} of {len(windows)} windows left.")
+
+        fetched, failed = 0, []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='backfill') as executor:
+            futures = {executor.submit(self.fetch_window, instrument, granularity, window): window for window in pending}
+            for future in as_completed(futures):
+                window = futures[future]
+                try:
+                    fetched += len(future.result())
+                except Exception as e:
+                    # Keep checkpointing the other windows; the failed one is retried by the next run
+                    logger.error(f"Backfill window {window} of {instrument} {granularity} failed: {e}")
+                    failed.append(e)
+                    continue
+                checkpoint.mark_done(window)
+
+        if failed:
+            raise RuntimeError(f"{len(failed)} of {len(pending)} backfill windows of {instrument} {granularity} failed; "
+                               f"run the backfill again to resume.") from failed[0]
+        checkpoint.clear()
+        if self.candle_store is not None:
+            self.sync_candle_store(instrument, granularity, windows)
+        logger.info(f"Backfill of {instrument} {granularity} finished: {fetched} candles fetched.")
+        return fetched
+
+    def sync_candle_store(self, instrument, granularity, windows):
+        """
+        Mirror the backfilled range from MongoDB into the candle store.
+
+        The store is append-only: when the backfill reached further back than the store's first bar
+        (or the store is empty), the whole series is reloaded from MongoDB; otherwise only the
+        windows after its last stored bar are added.
+        """
+        collection_name = self.mongo_handler.candle_collection_name(instrument, granularity)
+        first_time = self.candle_store.first_time(instrument, granularity)
+        mongo_first = self.mongo_handler.first_candle_time(collection_name)
+        if mongo_first is None:
+            return
+        if first_time is None or int(parse_candle_times([mongo_first])[0]) < first_time:
+            self.candle_store.replace(instrument, granularity, self.mongo_handler.read_candles(collection_name))
+            return
+
+        last_time = self.candle_store.last_time(instrument, granularity)
+        for from_time, to_time in windows:
+            if pd.Timestamp(to_time).timestamp() <= last_time:
+                continue
+            columns = self.mongo_handler.read_range(instrument, granularity, from_time, to_time, as_arrays=True)
+            self.candle_store.append(instrument, granularity, columns)
@@ -5,9 +5,11 @@ import os
 import time
 
 import schedule
+from data.repositories.candle_store import CandleStore
 from data.repositories.mongo import MongoDBHandler
 from logs.log_manager import LogManager
-from trading.brokers.oanda_client import OandaClient
+from trading.brokers.async_oanda_client import fetch_candles_concurrently
+from trading.brokers.oanda_client import get_client
 
 
 class DataPopulationService:
@@ -15,16 +17,20 @@ class DataPopulationService:
         """
         Initializes the DataPopulationService with MongoDBHandler and OandaClient.
         """
+        # OANDA client for fetching forex data, shared with every other user of the environment
+        self.oanda_client = get_client(
+            environment=os.getenv('OANDA_ENV', 'practice')  # Default to 'practice'
+        )
+
         # MongoDB handler for saving data
-        self.mongo_handler = MongoDBHandler(db_name="forex_data")
+        self.mongo_handler = MongoDBHandler(db_name="forex_data", oanda_client=self.oanda_client)
         
         # Ensure the database exists before querying or inserting data
         self.mongo_handler.ensure_database_exists()
 
-        # OANDA client for fetching forex data
-        self.oanda_client = OandaClient(
-            environment=os.getenv('OANDA_ENV', 'practice')  # Default to 'practice'
-        )
+        # Local columnar copy of the candles, kept in sync with MongoDB for fast reads
+        self.candle_store = CandleStore()
+
         # Logger for data population service
         self.logger = LogManager('data_population_logs').get_logger()
 
@@ -54,7 +60,7 @@ class DataPopulationService:
                 self.mongo_handler.create_collection_with_index(collection_name, index_field="time")
                 
                 # Fetch and store data after ensuring collection is created
-                self.mongo_handler.populate_historical_data(instrument, granularity, count)
+                self.populate(instrument, granularity, count)
         
             else:
                 self.logger.info(f"Collection '{collection_name}' already exists. Skipping creation.")
@@ -63,19 +69,86 @@ class DataPopulationService:
             self.logger.error(f"Error ensuring collection and populating data for {instrument}: {e}")
             raise
 
-    def populate_all_instruments(self):
+    def populate(self, instrument, granularity="D", count=5000):
+        """
+        Fetch candles into MongoDB and mirror them into the local candle store.
+
+        :param instrument: The forex pair (e.g., "EUR_USD").
+        :param granularity: The timeframe (e.g., "M1", "D", "H1").
+        :param count: The number of data points to fetch.
+        """
+        candles = self.mongo_handler.populate_historical_data(instrument, granularity, count)
+        self.mirror(instrument, granularity, candles)
+
+    def store(self, instrument, granularity, candles):
+        """
+        Upsert fetched candles into MongoDB and mirror them into the local candle store.
+
+        :param instrument: The forex pair (e.g., "EUR_USD").
+        :param granularity: The timeframe (e.g., "M1", "D", "H1").
+        :param candles: The candle documents returned by OANDA.
+        """
+        if not candles:
+            self.logger.warning(f"No data received for {instrument} with granularity {granularity}.")
+            return
+        collection_name = self.mongo_handler.candle_collection_name(instrument, granularity)
+        inserted, replaced = self.mongo_handler.upsert_candles(collection_name, candles)
+        self.logger.info(f"Stored {inserted} new and {replaced} updated data points for {instrument} in {granularity} timeframe.")
+        self.mirror(instrument, granularity, candles)
+
+    def mirror(self, instrument, granularity, candles):
+        """
+        Mirror candles just stored in MongoDB into the local candle store.
+
+        An empty store series is filled with the whole collection rather than with the new candles
+        only, so it starts at the same first bar as MongoDB.
+
+        :param instrument: The forex pair (e.g., "EUR_USD").
+        :param granularity: The timeframe (e.g., "M1", "D", "H1").
+        :param candles: The candle documents just stored.
+        """
+        if self.candle_store.count(instrument, granularity):
+            self.candle_store.append_documents(instrument, granularity, candles)
+        elif candles:
+            collection_name = self.mongo_handler.candle_collection_name(instrument, granularity)
+            self.candle_store.append(instrument, granularity, self.mongo_handler.read_candles(collection_name))
+
+    def populate_all_instruments(self, count=5000):
         """
         Populate historical data for all major forex instruments and multiple granularities.
+
+        The new candles of every pair and granularity are fetched concurrently over one pooled
+        asyncio session, then stored one series after the other.
+
+        :param count: The number of data points per request (at most 5000).
         """
         try:
             # List of major forex pairs and granularities to fetch
             major_pairs = ["EUR_USD", "GBP_USD", "USD_JPY", "AUD_USD", "USD_CHF", "USD_CAD"]
             granularities = ["M1", "D", "M"]
 
-            # Fetch and store data for each pair and granularity
+            # Fetch only what is not stored yet: from the newest stored candle of each series onwards
+            requests = []
             for pair, granularity in itertools.product(major_pairs, granularities):
-                self.mongo_handler.populate_historical_data(pair, granularity)
-        
+                collection_name = self.mongo_handler.candle_collection_name(pair, granularity)
+                self.mongo_handler.create_collection_with_index(collection_name, index_field="time")
+                last_time = self.mongo_handler.last_candle_time(collection_name)
+                requests.append({'instrument': pair, 'granularity': granularity, 'count': count, 'last_time': last_time})
+
+            results = fetch_candles_concurrently(
+                requests, environment=self.oanda_client.environment, base_url=self.oanda_client.base_url)
+
+            # Store every series that arrived, then report the ones that failed
+            failures = []
+            for request, candles in zip(requests, results):
+                if isinstance(candles, Exception):
+                    self.logger.error(f"Error populating data for {request['instrument']} {request['granularity']}: {candles}")
+                    failures.append(candles)
+                    continue
+                self.store(request['instrument'], request['granularity'], candles)
+            if failures:
+                raise failures[0]
+
         except Exception as e:
             # Log error in case of failure in populating data for all instruments
             self.logger.error(f"Error populating all instruments: {e}")
@@ -0,0 +1,162 @@
+# backend/api/services/stream_ingestion_service.py
+import queue
+import threading
+import time
+from collections import defaultdict
+
+from data.utils.candle_aggregator import DEFAULT_GRANULARITIES, CandleAggregator, tick_seconds
+from logs.log_manager import LogManager
+from trading.brokers.price_stream import PriceStream
+
+# Configure loggers
+logger = LogManager('stream_ingestion_logs').get_logger()
+
+"""
+Candles built from OANDA's price stream instead of polled from the candles endpoint.
+
+`StreamIngestionService` reads the price stream on a thread, feeds every price to a
+`CandleAggregator` and hands each candle it closes to a `CandleBatchWriter`, which upserts them into
+MongoDB (and the candle store) in batches. Heartbeats close the candles of instruments that stop
+ticking, so a candle is stored within `flush_interval` of its end instead of at the next poll.
+"""
+
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_WRITE_BATCH = 500
+
+
+class CandleBatchWriter:
+    def __init__(self, mongo_handler, candle_store=None, batch_size=DEFAULT_WRITE_BATCH,
+                 flush_interval=DEFAULT_FLUSH_INTERVAL):
+        """
+        Background writer of closed candles.
+
+        :param mongo_handler: MongoDBHandler the candles are upserted into.
+        :param candle_store: Optional CandleStore the candles are mirrored into.
+        :param batch_size: Candles that trigger a write before `flush_interval` has passed.
+        :param flush_interval: Longest time in seconds a candle waits before being written.
+        """
+        self.mongo_handler = mongo_handler
+        self.candle_store = candle_store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='candle-batch-writer', daemon=True)
+        self._thread.start()
+
+    def add(self, instrument, granularity, document):
+        self._queue.put((instrument, granularity, document))
+
+    def _write(self, pending):
+        for (instrument, granularity), documents in pending.items():
+            try:
+                collection_name = self.mongo_handler.candle_collection_name(instrument, granularity)
+                self.mongo_handler.upsert_candles(collection_name, documents)
+                if self.candle_store is not None:
+                    self.candle_store.append_documents(instrument, granularity, documents)
+                self.written += len(documents)
+            except Exception as e:
+                logger.error(f"Failed to write {len(documents)} streamed {instrument} {granularity} candles: {e}")
+
+    def _run(self):
+        pending, size, deadline, stopping = defaultdict(list), 0, None, False
+        while not stopping:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+                if item is None:
+                    stopping = True
+                else:
+                    instrument, granularity, document = item
+                    pending[(instrument, granularity)].append(document)
+                    size += 1
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+            except queue.Empty:
+                pass
+            if pending and (stopping or size >= self.batch_size or time.monotonic() >= deadline):
+                self._write(pending)
+                pending, size, deadline = defaultdict(list), 0, None
+
+    def close(self):
+        """
+        Write the pending candles and stop the writer.
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+
+class StreamIngestionService:
+    def __init__(self, mongo_handler, instruments, granularities=DEFAULT_GRANULARITIES, price_stream=None,
+                 candle_store=None, on_candle=None, batch_size=DEFAULT_WRITE_BATCH,
+                 flush_interval=DEFAULT_FLUSH_INTERVAL):
+        """
+        :param mongo_handler: MongoDBHandler the closed candles are upserted into.
+        :param instruments: Instruments to stream (e.g., ['EUR_USD', 'USD_JPY']).
+        :param granularities: Granularities built from the ticks.
+        :param price_stream: PriceStream to read (defaults to one of the instruments).
+        :param candle_store: Optional CandleStore the closed candles are mirrored into.
+        :param on_candle: Optional callback `on_candle(instrument, granularity, document)` called as
+            soon as a candle closes, before it is written (e.g., to trigger the strategies).
+        :param batch_size: Candles per MongoDB write (see CandleBatchWriter).
+        :param flush_interval: Longest delay in seconds before a closed candle is written.
+        """
+        self.mongo_handler = mongo_handler
+        self.price_stream = price_stream or PriceStream(instruments)
+        self.on_candle = on_candle
+        self.writer = None
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.candle_store = candle_store
+        self.aggregator = CandleAggregator(granularities, on_close=self._closed)
+        self.ticks = 0
+        self._thread = None
+
+    def _closed(self, instrument, granularity, document):
+        if self.on_candle is not None:
+            try:
+                self.on_candle(instrument, granularity, document)
+            except Exception as e:
+                logger.error(f"Candle callback failed for {instrument} {granularity}: {e}")
+        self.writer.add(instrument, granularity, document)
+
+    def _run(self):
+        try:
+            for message in self.price_stream.messages():
+                if message.get('type') == 'PRICE':
+                    self.aggregator.add_price(message)
+                    self.ticks += 1
+                elif message.get('type') == 'HEARTBEAT':
+                    self.aggregator.advance(tick_seconds(message['time']))
+        except Exception as e:
+            logger.error(f"Price stream ingestion stopped: {e}")
+
+    def start(self):
+        """
+        Start reading the price stream on a background thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            logger.warning("Stream ingestion is already running.")
+            return
+        self.writer = CandleBatchWriter(self.mongo_handler, self.candle_store, self.batch_size, self.flush_interval)
+        self._thread = threading.Thread(target=self._run, name='price-stream', daemon=True)
+        self._thread.start()
+        logger.info(f"Stream ingestion started for {', '.join(self.price_stream.instruments)}.")
+
+    def stop(self):
+        """
+        Close the stream and write the candles closed so far. Still-forming candles are not stored.
+        """
+        self.price_stream.close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.writer is not None:
+            self.writer.close()
+        logger.info(f"Stream ingestion stopped after {self.ticks} prices.")
+
+    def open_candles(self, instrument):
+        """
+        The still-forming candles of an instrument (see CandleAggregator.open_candles).
+        """
+        return self.aggregator.open_candles(instrument)
@@ -2,7 +2,7 @@
 import threading
 import time
 from logs.log_manager import LogManager
-from trading.brokers.oanda_client import OandaClient
+from trading.brokers.oanda_client import get_client
 from trading.managers import manager
 from data.repositories.mongo import MongoDBHandler
 
@@ -18,8 +18,8 @@ class TradingService:
         """
         self.is_trading = False
         self.trade_thread = None
-        self.mongo_handler = MongoDBHandler(db_name="trading_db", collection_name="trades")
-        self.oanda_client = OandaClient()
+        self.oanda_client = get_client()
+        self.mongo_handler = MongoDBHandler(db_name="trading_db", collection_name="trades", oanda_client=self.oanda_client)
         self.logger = LogManager('trading_service').get_logger()
 
     def start_trading(self):
@@ -78,6 +78,20 @@ class TradingService:
             self.logger.error(f"Error placing trade: {e}")
             raise
 
+    def get_prices(self, instruments):
+        """
+        Retrieves the latest prices of several instruments, shared with every other caller within
+        the pricing cache window.
+
+        :param instruments: List of instruments (e.g., ["EUR_USD", "USD_JPY"]).
+        :return: A PricingSnapshot of the instruments.
+        """
+        try:
+            return self.oanda_client.get_pricing(instruments)
+        except Exception as e:
+            self.logger.error(f"Error retrieving prices: {e}")
+            raise
+
     def get_status(self):
         """
         Retrieves the current status of the trading process.
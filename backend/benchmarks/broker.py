@@ -0,0 +1,176 @@
+# backend/benchmarks/broker.py
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from logs.log_manager import LogManager
+from simulator.server import OandaSimulator
+from trading.brokers.async_oanda_client import AsyncOandaClient
+from trading.brokers.oanda_client import OandaClient
+from trading.brokers.rate_limiter import OANDA_REQUESTS_PER_SECOND, PriorityRateLimiter
+
+# Configure loggers
+logger = LogManager('benchmark_logs').get_logger()
+
+"""
+Offline throughput and tail-latency benchmark of the broker path.
+
+Starts the local OANDA simulator with the given latency, error rate and rate limit, then sends a
+seeded mix of candle, account, position and order requests through OandaClient from a thread pool
+(or through AsyncOandaClient with `--async`), retries and client-side rate limiting included:
+
+    cd backend
+    python -m benchmarks.broker --requests 2000 --workers 16 --latency 0.005 --error-rate 0.01
+    python -m benchmarks.broker --requests 2000 --workers 16 --async --output broker.json
+
+The report gives the throughput and, per operation, the p50/p95/p99/max latency in milliseconds.
+"""
+
+INSTRUMENTS = ("EUR_USD", "GBP_USD", "USD_JPY", "AUD_USD", "USD_CHF", "USD_CAD")
+# Share of each operation in the request mix
+OPERATION_MIX = {'candles': 0.6, 'account': 0.15, 'positions': 0.1, 'order': 0.15}
+
+
+def plan_requests(requests, seed=42, mix=OPERATION_MIX):
+    """
+    Draw the seeded sequence of (operation, instrument) to send.
+    """
+    rng = random.Random(seed)
+    operations = rng.choices(list(mix), weights=list(mix.values()), k=requests)
+    return [(operation, rng.choice(INSTRUMENTS)) for operation in operations]
+
+
+def _call(client, operation, instrument):
+    if operation == 'candles':
+        return client.fetch_historical_data(instrument, 'M1', 500)
+    if operation == 'account':
+        return client.get_account()
+    if operation == 'positions':
+        return client.get_positions()
+    return client.place_order({'order': {'type': 'MARKET', 'instrument': instrument, 'units': '100'}})
+
+
+def _timed(client, operation, instrument):
+    started = time.perf_counter()
+    try:
+        _call(client, operation, instrument)
+        ok = True
+    except Exception:
+        ok = False
+    return operation, time.perf_counter() - started, ok
+
+
+def run_threads(client, plan, workers):
+    """
+    Send the plan through the synchronous client from `workers` threads.
+
+    :return: List of (operation, seconds, ok).
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda request: _timed(client, *request), plan))
+
+
+async def _timed_async(client, operation, instrument):
+    started = time.perf_counter()
+    try:
+        await _call(client, operation, instrument)
+        ok = True
+    except Exception:
+        ok = False
+    return operation, time.perf_counter() - started, ok
+
+
+def run_async(client_options, plan, concurrency):
+    """
+    Send the plan through AsyncOandaClient from `concurrency` tasks, each sending one request at a
+    time like the threads of `run_threads`.
+
+    :return: List of (operation, seconds, ok).
+    """
+    async def worker(client, requests, results):
+        for request in requests:
+            results.append(await _timed_async(client, *request))
+
+    async def run():
+        requests, results = iter(plan), []
+        async with AsyncOandaClient(max_concurrency=concurrency, pool_size=concurrency, **client_options) as client:
+            await asyncio.gather(*(worker(client, requests, results) for _ in range(concurrency)))
+        return results
+    return asyncio.run(run())
+
+
+def summarize(results, elapsed):
+    """
+    Aggregate the timings of a run.
+
+    :param results: List of (operation, seconds, ok).
+    :param elapsed: Wall-clock seconds of the run.
+    :return: Dict with the totals and per-operation latency percentiles in milliseconds.
+    """
+    summary = {'requests': len(results), 'elapsed_s': elapsed, 'throughput_rps': len(results) / elapsed,
+               'errors': sum(1 for _, _, ok in results if not ok), 'operations': {}}
+    for operation in sorted({operation for operation, _, _ in results}):
+        latencies = np.array([seconds for name, seconds, _ in results if name == operation]) * 1000
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        summary['operations'][operation] = {'count': len(latencies), 'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99,
+                                            'max_ms': float(latencies.max())}
+    return summary
+
+
+def format_summary(summary):
+    lines = [f"{summary['requests']} requests in {summary['elapsed_s']:.2f}s: "
+             f"{summary['throughput_rps']:.1f} req/s, {summary['errors']} failed",
+             f"{'operation':<12}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+    for operation, stats in summary['operations'].items():
+        lines.append(f"{operation:<12}{stats['count']:>8}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+                     f"{stats['p99_ms']:>10.2f}{stats['max_ms']:>10.2f}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the OANDA clients against the local simulator.")
+    parser.add_argument('--requests', type=int, default=1000, help="Requests to send.")
+    parser.add_argument('--workers', type=int, default=16, help="Threads (or async requests in flight).")
+    parser.add_argument('--async', dest='use_async', action='store_true', help="Use AsyncOandaClient.")
+    parser.add_argument('--seed', type=int, default=42, help="Seed of the request mix and the simulator.")
+    parser.add_argument('--latency', type=float, default=0.005, help="Simulated server latency in seconds.")
+    parser.add_argument('--latency-jitter', type=float, default=0.002, help="Mean extra exponential latency in seconds.")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with a 503.")
+    parser.add_argument('--server-rate-limit', type=float, help="Requests per second the simulator accepts.")
+    parser.add_argument('--client-rate', type=float, default=OANDA_REQUESTS_PER_SECOND,
+                        help="Requests per second of the client-side rate limiter.")
+    parser.add_argument('--output', help="Write the JSON summary to this path.")
+    args = parser.parse_args(argv)
+
+    plan = plan_requests(args.requests, args.seed)
+    with OandaSimulator(seed=args.seed, latency=args.latency, latency_jitter=args.latency_jitter,
+                        error_rate=args.error_rate, rate_limit=args.server_rate_limit) as simulator:
+        # Generate the candle history up front, so the first requests do not time it
+        for instrument in INSTRUMENTS:
+            simulator.history.series(instrument, 'M1')
+        limiter = PriorityRateLimiter(args.client_rate)
+        started = time.perf_counter()
+        if args.use_async:
+            results = run_async({'base_url': simulator.base_url, 'rate_limiter': limiter}, plan, args.workers)
+        else:
+            client = OandaClient(base_url=simulator.base_url, pool_size=args.workers, rate_limiter=limiter)
+            results = run_threads(client, plan, args.workers)
+            client.close()
+        summary = summarize(results, time.perf_counter() - started)
+        summary['server'] = {f'{endpoint} {status}': count for (endpoint, status), count in sorted(simulator.stats.items())}
+
+    print(format_summary(summary))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,352 @@
+# backend/benchmarks/suite.py
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from logs.log_manager import LogManager
+from benchmarks.synthetic import generate_candles, to_mongo_documents
+from config.indicator_config_loader import IndicatorConfigLoader
+from api.services.state_machine import StateMachine
+from trading.indicators.core.context import IndicatorContext
+from trading.indicators.core.planner import IndicatorPlanner, discover_indicators
+from trading.indicators.core.stacked import StackedFrame
+from trading.indicators.psar import PSAR
+from trading.indicators.supertrend import Supertrend
+
+# Configure loggers
+logger = LogManager('benchmark_logs').get_logger()
+
+"""
+Micro-benchmark suite for the indicator hot paths.
+
+Times every indicator class, the path-dependent recurrences (single and stacked instruments), the
+full planner run, the state machine and the MongoDB -> DataFrame decode on seeded synthetic candles, writes a JSON report and compares it with a stored baseline:
+
+    cd backend
+    python -m benchmarks.suite --sizes 1k,100k --output bench.json
+    python -m benchmarks.suite --sizes 1k,100k --baseline bench.json
+
+The process exits with status 1 when a benchmark got slower than the baseline by more than the
+threshold, so the comparison can gate a deploy.
+"""
+
+BENCHMARK_SIZES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000, '10m': 10_000_000}
+DEFAULT_SIZES = ('1k', '10k', '100k', '1m')
+
+# Instruments stacked side by side by the recurrence benchmark, like the controller's major pairs
+STACKED_INSTRUMENTS = 6
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), os.pardir, 'trading', 'indicators', 'indicator_params.yml')
+REPORT_VERSION = 1
+
+
+def parse_sizes(sizes):
+    """
+    Parse a comma separated list of bar counts.
+
+    :param sizes: String such as '1k,100k,1m' (named sizes or plain integers).
+    :return: List of bar counts.
+    """
+    bars = []
+    for size in sizes.split(','):
+        size = size.strip().lower()
+        if size in BENCHMARK_SIZES:
+            bars.append(BENCHMARK_SIZES[size])
+        elif size.isdigit():
+            bars.append(int(size))
+        else:
+            raise ValueError(f"Unknown benchmark size '{size}', expected one of {', '.join(BENCHMARK_SIZES)} or an integer.")
+    return bars
+
+
+def time_call(function, repeat=5):
+    """
+    Time a callable the way `timeit` does: calibrate the loop count, then keep the per-call times.
+
+    :param function: Callable taking no arguments.
+    :param repeat: Number of timed rounds.
+    :return: Dict with the best, median and mean seconds per call and the number of calls per round.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    timings = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'best_s': min(timings),
+        'median_s': statistics.median(timings),
+        'mean_s': statistics.fmean(timings),
+        'number': number,
+        'repeat': repeat
+    }
+
+
+def _result(group, name, bars, timing, **extra):
+    result = {'group': group, 'name': name, 'bars': bars, **timing}
+    if bars:
+        result['bars_per_s'] = bars / timing['median_s']
+    result.update(extra)
+    return result
+
+
+def load_requests(config_loader, tier='macro', names=None):
+    """
+    Pair every discovered indicator class with its configured parameters.
+
+    :param config_loader: IndicatorConfigLoader of indicator_params.yml.
+    :param tier: The config tier to read parameters from (macro, daily, micro).
+    :param names: Optional collection of class names to keep.
+    :return: List of (indicator class, params) pairs; unconfigured classes use their defaults.
+    """
+    requests = []
+    for name, indicator_class in sorted(discover_indicators().items()):
+        if names and name not in names:
+            continue
+        tier_config = config_loader.get_indicator_params(name, tier) or {}
+        requests.append((indicator_class, tier_config.get('params', {})))
+    return requests
+
+
+def benchmark_indicators(df, requests, repeat=5):
+    """
+    Time `compute` of every indicator on its own (no intermediates shared).
+
+    :param df: Candle DataFrame.
+    :param requests: List of (indicator class, params) pairs.
+    :param repeat: Number of timed rounds.
+    :return: List of result dicts.
+    """
+    results = []
+    for indicator_class, params in requests:
+        def run():
+            context = IndicatorContext(df)
+            context.indicator(indicator_class, **params)
+
+        results.append(_result('indicator', indicator_class.__name__, len(df), time_call(run, repeat), params=params))
+    return results
+
+
+def benchmark_recurrences(df, repeat=5, instruments=STACKED_INSTRUMENTS):
+    """
+    Time the bar-by-bar recurrences (Parabolic SAR, Supertrend) on one instrument and on a stack.
+
+    Their loops cannot be vectorized, so they scale with bars x instruments rather than with the
+    NumPy kernels; the stacked case runs `instruments` seeded series of `len(df)` bars side by side.
+
+    :param df: Candle DataFrame.
+    :param repeat: Number of timed rounds.
+    :param instruments: Number of instruments in the stacked case.
+    :return: List of result dicts.
+    """
+    stacked = StackedFrame.stack({f'I{i}': generate_candles(len(df), seed=i) for i in range(instruments)})
+    results = []
+    for indicator_class in (PSAR, Supertrend):
+        name = indicator_class.__name__
+        timing = time_call(lambda: indicator_class.compute(df), repeat)
+        results.append(_result('recurrence', name, len(df), timing))
+        timing = time_call(lambda: indicator_class.compute(stacked), repeat)
+        results.append(_result('recurrence', f'{name}_stacked', len(df) * instruments, timing, instruments=instruments))
+    return results
+
+
+def benchmark_planner(df, requests, repeat=5, max_workers=None):
+    """
+    Time one planner run over all requested indicators (shared intermediates, thread pool).
+
+    :param df: Candle DataFrame.
+    :param requests: List of (indicator class, params) pairs.
+    :param repeat: Number of timed rounds.
+    :param max_workers: Size of the planner's thread pool.
+    :return: List holding one result dict.
+    """
+    planner = IndicatorPlanner(max_workers=max_workers)
+    timing = time_call(lambda: planner.execute(requests, IndicatorContext(df)), repeat)
+    return [_result('planner', 'all_indicators', len(df), timing, indicators=len(requests))]
+
+
+def benchmark_state_machine(config_loader, repeat=5):
+    """
+    Time one state machine evaluation of every configured indicator across the three tiers.
+
+    :param config_loader: IndicatorConfigLoader of indicator_params.yml.
+    :param repeat: Number of timed rounds.
+    :return: List holding one result dict.
+    """
+    state_machine = StateMachine(config_loader)
+    names = config_loader.get_indicator_names()
+    results_by_tier = {tier: {name: i % 2 for i, name in enumerate(names)} for tier in ('macro', 'daily', 'micro')}
+
+    def run():
+        # The state machine prints its scores; keep them out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            state_machine.run_state_machine(results_by_tier)
+
+    return [_result('state_machine', 'run_state_machine', 0, time_call(run, repeat), indicators=len(names))]
+
+
+def benchmark_mongo_decode(df, repeat=5):
+    """
+    Time the decode of stored MongoDB candle documents into the indicator DataFrame.
+
+    :param df: Candle DataFrame the documents are generated from.
+    :param repeat: Number of timed rounds.
+    :return: List holding one result dict (marked as skipped when the controller cannot be imported).
+    """
+    try:
+        from api.controllers.indicators_controller import IndicatorsController
+    except ImportError as e:
+        logger.warning(f"Skipping MongoDB decode benchmark: {e}")
+        return [{'group': 'mongo_decode', 'name': 'process_mongo_data', 'bars': len(df), 'skipped': str(e)}]
+
+    documents = to_mongo_documents(df)
+    # Decoding needs no database handles, so skip the controller's connection setup
+    controller = IndicatorsController.__new__(IndicatorsController)
+    timing = time_call(lambda: controller.process_mongo_data(documents, 'BENCH'), repeat)
+    return [_result('mongo_decode', 'process_mongo_data', len(df), timing)]
+
+
+def run_suite(sizes, repeat=5, seed=42, names=None, tier='macro', max_decode_bars=1_000_000, max_workers=None):
+    """
+    Run every benchmark at every size.
+
+    :param sizes: List of bar counts.
+    :param repeat: Number of timed rounds per benchmark.
+    :param seed: Seed of the synthetic candles.
+    :param names: Optional collection of indicator class names to time (all by default).
+    :param tier: The config tier the indicator parameters are read from.
+    :param max_decode_bars: Largest size the MongoDB decode is timed at (documents are Python dicts).
+    :param max_workers: Size of the planner's thread pool.
+    :return: Report dict with the run metadata and the list of results.
+    """
+    config_loader = IndicatorConfigLoader(config_path=CONFIG_PATH)
+    requests = load_requests(config_loader, tier, names)
+
+    results = benchmark_state_machine(config_loader, repeat)
+    for bars in sizes:
+        logger.info(f"Benchmarking {len(requests)} indicators on {bars} bars.")
+        df = generate_candles(bars, seed=seed)
+        results += benchmark_indicators(df, requests, repeat)
+        results += benchmark_recurrences(df, repeat)
+        results += benchmark_planner(df, requests, repeat, max_workers)
+        if bars <= max_decode_bars:
+            results += benchmark_mongo_decode(df, repeat)
+
+    return {
+        'version': REPORT_VERSION,
+        'created': datetime.now().isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count()
+        },
+        'config': {'sizes': list(sizes), 'repeat': repeat, 'seed': seed, 'tier': tier},
+        'results': results
+    }
+
+
+def compare_reports(report, baseline, threshold=0.15):
+    """
+    Compare the median times of a report with a baseline report.
+
+    :param report: Report dict returned by `run_suite`.
+    :param baseline: Report dict of an earlier run.
+    :param threshold: Relative slowdown above which a benchmark counts as a regression (0.15 = 15%).
+    :return: List of comparison dicts with the current/baseline medians, their ratio and a status
+        ('regression', 'improvement', 'unchanged' or 'new').
+    """
+    baseline_results = {(r['group'], r['name'], r['bars']): r for r in baseline.get('results', []) if 'median_s' in r}
+    comparisons = []
+    for result in report['results']:
+        if 'median_s' not in result:
+            continue
+        previous = baseline_results.get((result['group'], result['name'], result['bars']))
+        comparison = {'group': result['group'], 'name': result['name'], 'bars': result['bars'], 'median_s': result['median_s']}
+        if previous is None:
+            comparison['status'] = 'new'
+        else:
+            ratio = result['median_s'] / previous['median_s']
+            comparison.update({'baseline_median_s': previous['median_s'], 'ratio': ratio})
+            if ratio > 1 + threshold:
+                comparison['status'] = 'regression'
+            elif ratio < 1 / (1 + threshold):
+                comparison['status'] = 'improvement'
+            else:
+                comparison['status'] = 'unchanged'
+        comparisons.append(comparison)
+    return comparisons
+
+
+def format_report(report, comparisons=None):
+    """
+    Render the report as a fixed-width table.
+
+    :param report: Report dict returned by `run_suite`.
+    :param comparisons: Optional list returned by `compare_reports`.
+    :return: The table as a string.
+    """
+    by_key = {(c['group'], c['name'], c['bars']): c for c in comparisons or []}
+    lines = [f"{'benchmark':<40}{'bars':>10}{'median ms':>12}{'bars/s':>14}{'vs base':>10}"]
+    for result in report['results']:
+        label = f"{result['group']}.{result['name']}"
+        if 'skipped' in result:
+            lines.append(f"{label:<40}{result['bars']:>10}  skipped: {result['skipped']}")
+            continue
+        comparison = by_key.get((result['group'], result['name'], result['bars']), {})
+        ratio = f"{comparison['ratio']:.2f}x" if 'ratio' in comparison else ''
+        flag = ' !' if comparison.get('status') == 'regression' else ''
+        bars_per_s = f"{result['bars_per_s']:.3g}" if 'bars_per_s' in result else ''
+        lines.append(f"{label:<40}{result['bars']:>10}{result['median_s'] * 1000:>12.3f}{bars_per_s:>14}{ratio:>10}{flag}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the indicator hot paths on synthetic candles.")
+    parser.add_argument('--sizes', default=','.join(DEFAULT_SIZES),
+                        help=f"Comma separated bar counts ({', '.join(BENCHMARK_SIZES)} or integers).")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed rounds per benchmark.")
+    parser.add_argument('--seed', type=int, default=42, help="Seed of the synthetic candles.")
+    parser.add_argument('--indicators', help="Comma separated indicator class names to time (default: all).")
+    parser.add_argument('--tier', default='macro', help="Config tier of the indicator parameters.")
+    parser.add_argument('--max-decode-bars', type=int, default=1_000_000, help="Largest size the MongoDB decode is timed at.")
+    parser.add_argument('--workers', type=int, help="Thread pool size of the planner benchmark.")
+    parser.add_argument('--output', help="Write the JSON report to this path.")
+    parser.add_argument('--baseline', help="Compare with the JSON report at this path.")
+    parser.add_argument('--threshold', type=float, default=0.15, help="Relative slowdown reported as a regression.")
+    args = parser.parse_args(argv)
+
+    names = set(args.indicators.split(',')) if args.indicators else None
+    report = run_suite(parse_sizes(args.sizes), args.repeat, args.seed, names, args.tier, args.max_decode_bars, args.workers)
+
+    comparisons = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            comparisons = compare_reports(report, json.load(baseline_file), args.threshold)
+        report['comparison'] = {'baseline': args.baseline, 'threshold': args.threshold, 'results': comparisons}
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+        logger.info(f"Benchmark report written to {args.output}.")
+
+    print(format_report(report, comparisons))
+
+    regressions = [c for c in comparisons or [] if c['status'] == 'regression']
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
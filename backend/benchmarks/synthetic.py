@@ -0,0 +1,87 @@
+# backend/benchmarks/synthetic.py
+import numpy as np
+import pandas as pd
+
+"""
+Seeded synthetic candle generators for the benchmark suite.
+
+Prices follow a geometric Brownian motion whose volatility switches between regimes (calm, normal,
+stressed) as a Markov chain, so the indicators see trending, ranging and spiking stretches rather than
+uniform noise. Volume is log-normal, scales with the size of the move and follows an intraday cycle.
+The same seed always produces the same candles, so timings of two runs are comparable.
+"""
+
+# Volatility multipliers of the calm, normal and stressed regimes.
+VOLATILITY_REGIMES = (0.5, 1.0, 2.5)
+
+
+def generate_candles(bars, seed=42, start='2020-01-01', freq='min', price=1.1, drift=0.0,
+                     volatility=0.0004, regimes=VOLATILITY_REGIMES, switch_probability=0.002, volume=1000):
+    """
+    Generate OHLCV candles from a regime-switching geometric Brownian motion.
+
+    :param bars: Number of candles to generate.
+    :param seed: Seed of the random generator.
+    :param start: Time of the first candle.
+    :param freq: Pandas frequency string of the candles (e.g. 'min', 'h', 'D').
+    :param price: Opening price of the first candle.
+    :param drift: Mean log return per bar.
+    :param volatility: Standard deviation of the log return per bar in the normal regime.
+    :param regimes: Volatility multipliers the chain switches between.
+    :param switch_probability: Probability per bar of drawing a new regime.
+    :param volume: Median volume per bar.
+    :return: DataFrame with 'time', 'open', 'high', 'low', 'close' and 'volume' columns.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Regime of every bar: redrawn where the chain switches, carried forward in between
+    switches = rng.random(bars) < switch_probability
+    switches[0] = True
+    draws = rng.integers(0, len(regimes), bars)
+    last_switch = np.maximum.accumulate(np.where(switches, np.arange(bars), 0))
+    sigma = volatility * np.asarray(regimes, dtype=float)[draws[last_switch]]
+
+    # GBM log returns and the close path
+    shocks = rng.standard_normal(bars)
+    returns = drift - 0.5 * sigma ** 2 + sigma * shocks
+    close = price * np.exp(np.cumsum(returns))
+    open_ = np.empty(bars)
+    open_[0] = price
+    open_[1:] = close[:-1]
+
+    # Intrabar excursions beyond the open/close range
+    high = np.maximum(open_, close) * np.exp(0.5 * sigma * np.abs(rng.standard_normal(bars)))
+    low = np.minimum(open_, close) * np.exp(-0.5 * sigma * np.abs(rng.standard_normal(bars)))
+
+    # Log-normal volume, larger on big moves and during the busy hours of the day
+    time = pd.date_range(start, periods=bars, freq=freq)
+    hours = time.hour.to_numpy() + time.minute.to_numpy() / 60
+    session = 1 + 0.5 * np.sin((hours - 8) / 24 * 2 * np.pi)
+    activity = 1 + np.abs(shocks)
+    volumes = np.maximum(1, np.rint(volume * session * activity * rng.lognormal(0.0, 0.5, bars)))
+
+    return pd.DataFrame({
+        'time': time,
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': volumes
+    })
+
+
+def to_mongo_documents(df, precision=5):
+    """
+    Convert candles to the documents stored in MongoDB, i.e. OANDA v20 candles with string prices.
+
+    :param df: DataFrame returned by `generate_candles`.
+    :param precision: Number of decimals of the price strings.
+    :return: List of {'time', 'volume', 'complete', 'mid': {'o', 'h', 'l', 'c'}} documents.
+    """
+    times = df['time'].dt.strftime('%Y-%m-%dT%H:%M:%S.000000000Z').tolist()
+    prices = [np.char.mod(f'%.{precision}f', df[col].to_numpy()).tolist() for col in ['open', 'high', 'low', 'close']]
+    volumes = df['volume'].astype(int).tolist()
+    return [
+        {'time': time, 'volume': volume, 'complete': True, 'mid': {'o': o, 'h': h, 'l': l, 'c': c}}
+        for time, volume, o, h, l, c in zip(times, volumes, *prices)
+    ]
@@ -12,12 +12,25 @@ class IndicatorConfigLoader:
         with open(self.config_path, 'r') as file:
             return yaml.safe_load(file)
 
+    def get_indicators(self):
+        """
+        Get the per-indicator section of the config (the entries under the top-level 'indicators' key).
+        """
+        return self.indicator_params.get('indicators', self.indicator_params)
+
+    def get_indicator_names(self):
+        """
+        Get the names of all configured indicators, in file order.
+        """
+        return list(self.get_indicators())
+
     def get_indicator_params(self, indicator_name, tier):
         """
         Get parameters and weight for a specific indicator and tier (macro, daily, micro).
         """
-        if indicator_name in self.indicator_params:
-            indicator_data = self.indicator_params[indicator_name]
+        indicators = self.get_indicators()
+        if indicator_name in indicators:
+            indicator_data = indicators[indicator_name]
             if tier in indicator_data:
                 return indicator_data[tier]
         return None
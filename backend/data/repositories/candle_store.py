@@ -0,0 +1,234 @@
+# backend/data/repositories/candle_store.py
+import os
+import shutil
+import tempfile
+import threading
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from data.utils.candles import documents_to_columns
+from logs.log_manager import LogManager
+
+# Initialize the logger
+logger = LogManager('candle_store_logs').get_logger()
+
+"""
+Local columnar candle store, an alternative to reading the candles back from MongoDB.
+
+Every (instrument, granularity) series is a directory of flat little-endian column files: `time`
+(int64 epoch seconds, UTC) and `open`, `high`, `low`, `close`, `volume` (float64). Files only grow
+at the end, so readers memory-map them and get zero-copy NumPy views; the OS page cache shares the
+pages between every process reading the same series, and loading years of M1 bars costs a few
+`mmap` calls instead of a full collection scan and decode.
+
+The data columns are written before `time`, and readers size their views by the `time` file, so a
+reader never sees a bar whose values are not on disk yet. The `time` file is the commit record:
+every write goes to the offset its length gives and cuts the column there, so bytes a crashed
+append left past it are overwritten rather than shifting the column. The last stored bar may be rewritten in
+place (OANDA's still-forming `complete: false` candle); every other bar is immutable. One process
+(the data population service) writes a series at a time.
+"""
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'databases', 'candles')
+VALUE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+TIME_COLUMN = 'time'
+ITEM_SIZE = 8
+
+
+class CandleStore:
+    def __init__(self, root=None):
+        """
+        Initialize the store.
+
+        :param root: Directory holding the series (defaults to $CANDLE_STORE_DIR or databases/candles).
+        """
+        self.root = root or os.getenv('CANDLE_STORE_DIR', DEFAULT_ROOT)
+        self._locks = defaultdict(threading.Lock)
+
+    def series_dir(self, instrument, granularity):
+        return os.path.join(self.root, instrument.upper(), granularity.upper())
+
+    def _column_path(self, instrument, granularity, column):
+        return os.path.join(self.series_dir(instrument, granularity), f'{column}.bin')
+
+    def count(self, instrument, granularity):
+        """
+        Number of bars stored for a series (0 if it does not exist).
+        """
+        path = self._column_path(instrument, granularity, TIME_COLUMN)
+        return os.path.getsize(path) // ITEM_SIZE if os.path.isfile(path) else 0
+
+    def check(self, instrument, granularity):
+        """
+        Check that every column of a series holds at least the bars committed to the `time` file.
+
+        Longer columns (an append interrupted before `time` was written) are harmless, as the next
+        append overwrites them from the committed length.
+
+        :return: Number of committed bars.
+        :raises ValueError: If a column is shorter than the `time` column.
+        """
+        count = self.count(instrument, granularity)
+        for column in VALUE_COLUMNS:
+            path = self._column_path(instrument, granularity, column)
+            length = os.path.getsize(path) // ITEM_SIZE if os.path.isfile(path) else 0
+            if length < count:
+                logger.error(f"Column '{column}' of {instrument} {granularity} holds {length} of {count} bars.")
+                raise ValueError(f"Candle store series {instrument} {granularity} is corrupt: "
+                                 f"column '{column}' holds {length} of {count} bars.")
+        return count
+
+    def first_time(self, instrument, granularity):
+        """
+        Epoch seconds of the first stored bar, or None if the series is empty.
+        """
+        if not self.count(instrument, granularity):
+            return None
+        with open(self._column_path(instrument, granularity, TIME_COLUMN), 'rb') as f:
+            return int(np.frombuffer(f.read(ITEM_SIZE), dtype='<i8')[0])
+
+    def last_time(self, instrument, granularity):
+        """
+        Epoch seconds of the last stored bar, or None if the series is empty.
+        """
+        count = self.count(instrument, granularity)
+        if not count:
+            return None
+        with open(self._column_path(instrument, granularity, TIME_COLUMN), 'rb') as f:
+            f.seek((count - 1) * ITEM_SIZE)
+            return int(np.frombuffer(f.read(ITEM_SIZE), dtype='<i8')[0])
+
+    def append(self, instrument, granularity, columns):
+        """
+        Append bars to a series.
+
+        Bars older than the last stored bar are ignored, a bar at the last stored time replaces it
+        (the still-forming candle) and newer bars are appended.
+
+        :param columns: Dict with a 'time' array (epoch seconds) and the OHLCV arrays.
+        :return: Number of bars written (appended or replaced).
+        """
+        times = np.asarray(columns[TIME_COLUMN], dtype=np.int64)
+        if not len(times):
+            return 0
+        # Keep the last value of each time, in time order
+        _, last_positions = np.unique(times[::-1], return_index=True)
+        order = len(times) - 1 - last_positions
+        times = times[order]
+        values = {column: np.asarray(columns[column], dtype=np.float64)[order] for column in VALUE_COLUMNS}
+
+        with self._locks[(instrument.upper(), granularity.upper())]:
+            os.makedirs(self.series_dir(instrument, granularity), exist_ok=True)
+            count = self.check(instrument, granularity)
+            last = self.last_time(instrument, granularity)
+            start = 0 if last is None else int(np.searchsorted(times, last))
+            if start == len(times):
+                return 0
+
+            # Data columns first, time last: readers size their views by the time file
+            replace = last is not None and times[start] == last
+            offset = (count - 1 if replace else count) * ITEM_SIZE
+            for column, data in [*values.items(), (TIME_COLUMN, times)]:
+                data = data[start:].astype('<i8' if column == TIME_COLUMN else '<f8', copy=False)
+                path = self._column_path(instrument, granularity, column)
+                with open(path, 'r+b' if os.path.exists(path) else 'w+b') as f:
+                    f.seek(offset)
+                    f.write(data.tobytes())
+                    f.truncate()
+
+        written = len(times) - start
+        logger.info(f"Stored {written} bars for {instrument} {granularity} in the candle store.")
+        return written
+
+    def replace(self, instrument, granularity, columns):
+        """
+        Replace a whole series, e.g. to reload it from MongoDB when it no longer mirrors the collection.
+
+        The new columns are written to a sibling directory that is then swapped in, so readers see
+        either the old or the new series; views already mapped keep the old files.
+
+        :param columns: Dict with a 'time' array (epoch seconds) and the OHLCV arrays, sorted by time.
+        :return: Number of bars stored.
+        """
+        series_dir = self.series_dir(instrument, granularity)
+        with self._locks[(instrument.upper(), granularity.upper())]:
+            parent = os.path.dirname(series_dir)
+            os.makedirs(parent, exist_ok=True)
+            staging = tempfile.mkdtemp(dir=parent, prefix='.staging-')
+            for column in (*VALUE_COLUMNS, TIME_COLUMN):
+                dtype = '<i8' if column == TIME_COLUMN else '<f8'
+                np.asarray(columns[column]).astype(dtype, copy=False).tofile(os.path.join(staging, f'{column}.bin'))
+            retired = None
+            if os.path.isdir(series_dir):
+                retired = tempfile.mkdtemp(dir=parent, prefix='.retired-')
+                os.replace(series_dir, os.path.join(retired, 'series'))
+            os.replace(staging, series_dir)
+            if retired is not None:
+                shutil.rmtree(retired, ignore_errors=True)
+
+        written = len(columns[TIME_COLUMN])
+        logger.info(f"Reloaded {written} bars for {instrument} {granularity} into the candle store.")
+        return written
+
+    def append_documents(self, instrument, granularity, documents):
+        """
+        Append OANDA candle documents (as stored in MongoDB) to a series.
+
+        :return: Number of bars written.
+        """
+        if not documents:
+            return 0
+        return self.append(instrument, granularity, documents_to_columns(documents))
+
+    def columns(self, instrument, granularity, start=None, end=None):
+        """
+        Memory-map a series.
+
+        :param start: Optional first time to include (epoch seconds or anything pandas parses).
+        :param end: Optional time to stop before (exclusive).
+        :return: Dict of read-only NumPy views: 'time' (int64 epoch seconds) and the OHLCV columns
+            (float64). Empty arrays if the series does not exist.
+        """
+        count = self.check(instrument, granularity)
+        if not count:
+            return {TIME_COLUMN: np.empty(0, dtype=np.int64), **{c: np.empty(0) for c in VALUE_COLUMNS}}
+
+        views = {TIME_COLUMN: np.memmap(self._column_path(instrument, granularity, TIME_COLUMN), dtype='<i8', mode='r', shape=(count,))}
+        for column in VALUE_COLUMNS:
+            views[column] = np.memmap(self._column_path(instrument, granularity, column), dtype='<f8', mode='r', shape=(count,))
+
+        # The series is sorted by time, so a range is a pair of binary searches
+        first = 0 if start is None else int(np.searchsorted(views[TIME_COLUMN], _epoch_seconds(start)))
+        stop = count if end is None else int(np.searchsorted(views[TIME_COLUMN], _epoch_seconds(end)))
+        return {column: view[first:stop] for column, view in views.items()}
+
+    def tail(self, instrument, granularity, n):
+        """
+        Memory-map the last `n` bars of a series (see `columns`).
+        """
+        columns = self.columns(instrument, granularity)
+        return {column: values[-n:] if n else values[:0] for column, values in columns.items()}
+
+    def frame(self, instrument, granularity, start=None, end=None):
+        """
+        Load a series as the DataFrame the indicators expect, without copying the price columns.
+
+        :return: DataFrame with 'time' (UTC) and the OHLCV columns, or None if the series is empty.
+        """
+        columns = self.columns(instrument, granularity, start, end)
+        if not len(columns[TIME_COLUMN]):
+            return None
+        df = pd.DataFrame({column: columns[column] for column in VALUE_COLUMNS}, copy=False)
+        df['time'] = pd.DatetimeIndex(columns[TIME_COLUMN].view('datetime64[s]')).tz_localize('UTC')
+        return df
+
+
+def _epoch_seconds(value):
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize('UTC')
+    return int(timestamp.timestamp())
@@ -1,9 +1,10 @@
 # backend/data/repositories/mongo.py
 import os
 from config.secrets import defs
-from pymongo import MongoClient, errors
+from pymongo import MongoClient, ReplaceOne, errors
+from data.utils.candles import CANDLE_PROJECTION, DEFAULT_BATCH_SIZE, decode_candles, format_candle_time
 from logs.log_manager import LogManager
-from trading.brokers.oanda_client import OandaClient
+from trading.brokers.oanda_client import get_client
 
 # Initialize the logger
 logger = LogManager('mongo_connection_logs').get_logger()
@@ -11,16 +12,17 @@ logger = LogManager('mongo_connection_logs').get_logger()
 class MongoDBHandler:
     _client = None
 
-    def __init__(self, db_name, collection_name=None):
+    def __init__(self, db_name, collection_name=None, oanda_client=None):
         """
         Initializes the MongoDBHandler with a connection to the specified database and optionally a collection.
 
         :param db_name: The name of the database to connect to.
         :param collection_name: The name of the collection to interact with (optional).
+        :param oanda_client: OandaClient used to fetch candles (defaults to the shared practice client).
         """
         self.mongo_url = os.getenv('MONGO_URL', defs.MONGO_URI)
         self.client = MongoDBHandler._get_mongo_client(self.mongo_url)
-        self.oanda_client = OandaClient()
+        self.oanda_client = oanda_client or get_client()
         self.db_name = db_name
         self.db = self.client[db_name]
         self.collection = self.db[collection_name] if collection_name else None
@@ -194,6 +196,95 @@ class MongoDBHandler:
             logger.error(f"Failed to read documents from {collection_name}: {err}")
             raise
 
+    def read_candles(self, collection_name, query=None, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Read candle documents as NumPy columns.
+
+        Only the fields the decoder needs are sent by the server (see CANDLE_PROJECTION), and the
+        cursor is decoded batch by batch into preallocated columns instead of being listed first.
+
+        :param collection_name: The candle collection (e.g., 'eur_usd_h1_data').
+        :param query: A dictionary representing the query to match documents.
+        :param batch_size: Documents per cursor batch (and per decode batch).
+        :return: Dict of columns as returned by `decode_candles`, in time order.
+        """
+        collection = self.db[collection_name]
+        try:
+            count = collection.count_documents(query or {})
+            cursor = collection.find(query or {}, CANDLE_PROJECTION).sort('time', 1).batch_size(batch_size)
+            columns = decode_candles(cursor, count=count, batch_size=batch_size)
+            logger.info(f"Decoded {len(columns['time'])} candles from {collection_name}.")
+            return columns
+        except errors.PyMongoError as err:
+            logger.error(f"Failed to read candles from {collection_name}: {err}")
+            raise
+
+    @staticmethod
+    def candle_collection_name(instrument, granularity):
+        return f"{instrument.lower()}_{granularity.lower()}_data"
+
+    def _read_cursor(self, collection_name, cursor, limit, as_arrays, batch_size):
+        try:
+            cursor = cursor.batch_size(batch_size)
+            if as_arrays:
+                columns = decode_candles(cursor, count=limit, batch_size=batch_size)
+                logger.info(f"Decoded {len(columns['time'])} candles from {collection_name}.")
+                return columns
+            documents = list(cursor)
+            logger.info(f"Found {len(documents)} documents in {collection_name}.")
+            return documents
+        except errors.PyMongoError as err:
+            logger.error(f"Failed to read candles from {collection_name}: {err}")
+            raise
+
+    def read_range(self, instrument, granularity, start=None, end=None, as_arrays=False, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Read the candles of [start, end) in time order.
+
+        The bounds are compared with the stored RFC3339 strings, so the query is a range scan of the
+        unique 'time' index.
+
+        :param instrument: The forex pair (e.g., "EUR_USD").
+        :param granularity: The timeframe (e.g., "M1", "D", "H1").
+        :param start: Optional first time to include (epoch seconds, datetime or time string).
+        :param end: Optional time to stop before (exclusive).
+        :param as_arrays: Return NumPy columns (see `decode_candles`) instead of documents.
+        :param batch_size: Documents per cursor batch.
+        :return: List of candle documents, or a dict of columns when `as_arrays` is set.
+        """
+        collection_name = self.candle_collection_name(instrument, granularity)
+        bounds = {}
+        if start is not None:
+            bounds['$gte'] = format_candle_time(start)
+        if end is not None:
+            bounds['$lt'] = format_candle_time(end)
+        query = {'time': bounds} if bounds else {}
+        cursor = self.db[collection_name].find(query, CANDLE_PROJECTION).sort('time', 1)
+        return self._read_cursor(collection_name, cursor, None, as_arrays, batch_size)
+
+    def tail(self, instrument, granularity, n, as_arrays=False, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Read the last `n` candles, oldest first.
+
+        Walks the unique 'time' index backwards and stops after `n` entries, so the cost depends on
+        `n` and not on the size of the history.
+
+        :param instrument: The forex pair (e.g., "EUR_USD").
+        :param granularity: The timeframe (e.g., "M1", "D", "H1").
+        :param n: Number of candles.
+        :param as_arrays: Return NumPy columns (see `decode_candles`) instead of documents.
+        :param batch_size: Documents per cursor batch.
+        :return: List of candle documents, or a dict of columns when `as_arrays` is set.
+        """
+        collection_name = self.candle_collection_name(instrument, granularity)
+        if n <= 0:
+            return decode_candles([]) if as_arrays else []
+        cursor = self.db[collection_name].find({}, CANDLE_PROJECTION).sort('time', -1).limit(n)
+        candles = self._read_cursor(collection_name, cursor, n, as_arrays, min(batch_size, n))
+        if as_arrays:
+            return {column: values[::-1].copy() for column, values in candles.items()}
+        return candles[::-1]
+
     def update(self, query, update_values):
         """
         Updates documents in the collection based on a query.
@@ -291,44 +382,107 @@ class MongoDBHandler:
             self.collection.create_index([(index_field, 1)], unique=True)
             logger.info(f"Created index on '{index_field}' for collection {collection_name}")
             
+    def last_candle_time(self, collection_name):
+        """
+        Time of the newest stored candle, read from the end of the unique 'time' index.
+
+        :param collection_name: The candle collection (e.g., 'eur_usd_h1_data').
+        :return: The RFC3339 time string, or None if the collection is empty.
+        """
+        document = self.db[collection_name].find_one({}, {'_id': 0, 'time': 1}, sort=[('time', -1)])
+        return document['time'] if document else None
+
+    def first_candle_time(self, collection_name):
+        """
+        Time of the oldest stored candle, read from the start of the unique 'time' index.
+
+        :param collection_name: The candle collection (e.g., 'eur_usd_h1_data').
+        :return: The RFC3339 time string, or None if the collection is empty.
+        """
+        document = self.db[collection_name].find_one({}, {'_id': 0, 'time': 1}, sort=[('time', 1)])
+        return document['time'] if document else None
+
+    def candle_count(self, collection_name):
+        """
+        Number of stored candles.
+
+        An exact count over the '_id' index: the collection metadata behind
+        `estimated_document_count` can be off after an unclean shutdown, and the count decides
+        whether the candle store mirrors the collection.
+
+        :param collection_name: The candle collection (e.g., 'eur_usd_h1_data').
+        :return: The document count.
+        """
+        return self.db[collection_name].count_documents({})
+
+    def upsert_candles(self, collection_name, candles, batch_size=1000):
+        """
+        Insert new candles and replace stored ones with the same time, in unordered bulk_write batches.
+
+        :param collection_name: The candle collection (e.g., 'eur_usd_h1_data').
+        :param candles: List of OANDA candle documents.
+        :param batch_size: Operations per bulk_write call.
+        :return: Tuple (inserted, replaced) document counts.
+        """
+        collection = self.db[collection_name]
+        inserted = replaced = 0
+        try:
+            for start in range(0, len(candles), batch_size):
+                operations = [ReplaceOne({'time': candle['time']}, candle, upsert=True) for candle in candles[start:start + batch_size]]
+                result = collection.bulk_write(operations, ordered=False)
+                inserted += result.upserted_count
+                replaced += result.modified_count
+        except errors.PyMongoError as err:
+            logger.error(f"Bulk upsert into {collection_name} failed: {err}")
+            raise
+        logger.info(f"Upserted candles into {collection_name}: {inserted} inserted, {replaced} replaced.")
+        return inserted, replaced
+
     def populate_historical_data(self, instrument, granularity="D", count=5000):
         """
-        Fetch and store historical data for a given forex instrument.
+        Fetch and store the historical data of a forex instrument that is not stored yet.
+
+        An empty collection is seeded with the latest `count` candles. Otherwise candles are requested
+        from the newest stored candle onwards, window after window until OANDA returns a partial
+        window, so a refresh only moves the new bars plus the stored last bar, which may have been
+        the still-forming (`complete: false`) candle and is replaced.
+
         :param instrument: The forex pair (e.g., "EUR_USD").
         :param granularity: The timeframe (e.g., "M1", "D", "H1").
-        :param count: The number of data points to fetch.
+        :param count: The number of data points per request (at most 5000).
+        :return: The fetched candle documents (empty if nothing was received).
         """
         try:
             # Ensure the instrument symbol is in uppercase, as expected by the OANDA API
             instrument = instrument.upper()
 
-            # Ensure collection exists and set it
-            collection_name = f"{instrument.lower()}_{granularity.lower()}_data"
             # Ensure collection exists before querying and switch to it
+            collection_name = self.candle_collection_name(instrument, granularity)
             self.create_collection_with_index(collection_name, index_field="time")
-            self.switch_collection(collection_name)  # Ensure collection is set
-
+            self.switch_collection(collection_name)
 
-            # Fetch historical data from OANDA
-            data = self.oanda_client.fetch_historical_data(instrument, granularity, count)
+            last_time = self.last_candle_time(collection_name)
+            if last_time is None:
+                candles = self.oanda_client.fetch_historical_data(instrument, granularity, count)
+            else:
+                candles = []
+                while True:
+                    window = self.oanda_client.fetch_historical_data(instrument, granularity, count, from_time=last_time)
+                    candles.extend(window if not candles else [candle for candle in window if candle['time'] > last_time])
+                    if len(window) < count or window[-1]['time'] == last_time:
+                        break
+                    last_time = window[-1]['time']
 
             # Check if data is returned and proceed
-            if not data:
-                self.logger.warning(f"No data received for {instrument} with granularity {granularity}.")
-                return
+            if not candles:
+                logger.warning(f"No data received for {instrument} with granularity {granularity}.")
+                return []
 
-            # Ensure collection is set before read operation or create new collection
-            if self.collection is None:
-                raise ValueError(f"MongoDB collection for {collection_name} is not set.")
-
-            if new_data := list(data):
-                self.short_bulk_insert(new_data)
-                logger.info(f"Inserted {len(new_data)} new data points for {instrument} in {granularity} timeframe.")
-            else:
-                logger.info(f"No new data to insert for {instrument} in {granularity} timeframe.")
+            inserted, replaced = self.upsert_candles(collection_name, candles)
+            logger.info(f"Stored {inserted} new and {replaced} updated data points for {instrument} in {granularity} timeframe.")
+            return candles
 
         except Exception as e:
             # Log any error during the population process
             logger.error(f"Error populating data for {instrument}: {e}")
             raise
-
@@ -25,3 +25,53 @@ CREATE TABLE IF NOT EXISTS instrument_indicator_results (
     parameter_value REAL NOT NULL,
     timestamp TEXT NOT NULL
 );
+
+-- Per-run results written by the indicators' own insert_results_to_db (one row per output value)
+CREATE TABLE IF NOT EXISTS indicator_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    indicator_id INTEGER NOT NULL,
+    time TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value REAL,
+    FOREIGN KEY(indicator_id) REFERENCES indicators(id)
+);
+
+-- Version of the time-series results schema below
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    applied_at TEXT NOT NULL
+);
+
+INSERT OR IGNORE INTO schema_version (version, applied_at) VALUES (2, datetime('now'));
+
+-- One series per (instrument, granularity, indicator, parameter set); param_hash identifies the
+-- bound parameters and outputs names the value columns of the series in order (JSON lists)
+CREATE TABLE IF NOT EXISTS indicator_series (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    instrument TEXT NOT NULL,
+    granularity TEXT NOT NULL,
+    indicator_name TEXT NOT NULL,
+    param_hash TEXT NOT NULL,
+    params TEXT NOT NULL,
+    outputs TEXT NOT NULL,
+    UNIQUE (instrument, granularity, indicator_name, param_hash)
+);
+
+-- Wide indicator values: one row per series and candle (epoch seconds, UTC), every output of the
+-- indicator in its own column. The clustered primary key makes "last N bars of a series" a range
+-- scan that never leaves the table b-tree.
+CREATE TABLE IF NOT EXISTS indicator_values (
+    series_id INTEGER NOT NULL,
+    candle_time INTEGER NOT NULL,
+    value_0 REAL,
+    value_1 REAL,
+    value_2 REAL,
+    value_3 REAL,
+    value_4 REAL,
+    value_5 REAL,
+    PRIMARY KEY (series_id, candle_time),
+    FOREIGN KEY(series_id) REFERENCES indicator_series(id)
+) WITHOUT ROWID;
+
+-- Cross-series slices at one candle time (e.g. every indicator of the latest bar)
+CREATE INDEX IF NOT EXISTS idx_indicator_values_time ON indicator_values (candle_time, series_id);
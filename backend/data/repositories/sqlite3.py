@@ -1,10 +1,338 @@
+import atexit
+import hashlib
+import json
 import os
+import queue
 import sqlite3
+import threading
+from concurrent.futures import Future
+import weakref
+from itertools import repeat
+import numpy as np
+import pandas as pd
 from logs.log_manager import LogManager  # Import the LogManager class
 
 # Configure logging
 logger = LogManager('sqlite_db_logs').get_logger()
 
+# Statements shared by the single-row and bulk paths. sqlite3 keeps the compiled form of each
+# statement per connection (keyed by its text), so `executemany` prepares them once per batch.
+INSERT_INDICATOR_SQL = "INSERT INTO indicators (name, type) VALUES (?, ?)"
+SELECT_INDICATOR_ID_SQL = "SELECT id FROM indicators WHERE name = ?"
+INSERT_INDICATOR_PARAMETER_SQL = "INSERT INTO indicator_parameters (indicator_id, key, value) VALUES (?, ?, ?)"
+INSERT_INDICATOR_RESULT_SQL = "INSERT INTO indicator_results (indicator_id, time, key, value) VALUES (?, ?, ?, ?)"
+
+# Time-series results (see indicator_series/indicator_values in schema.sql)
+SERIES_VALUE_COLUMNS = tuple(f'value_{i}' for i in range(6))
+SELECT_SERIES_SQL = (
+    "SELECT id, outputs FROM indicator_series "
+    "WHERE instrument = ? AND granularity = ? AND indicator_name = ? AND param_hash = ?"
+)
+INSERT_SERIES_SQL = (
+    "INSERT OR IGNORE INTO indicator_series (instrument, granularity, indicator_name, param_hash, params, outputs) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+# Repairs series registered without outputs (from an empty result frame)
+UPDATE_EMPTY_SERIES_OUTPUTS_SQL = "UPDATE indicator_series SET outputs = ? WHERE id = ? AND outputs = '[]'"
+UPSERT_INDICATOR_VALUES_SQL = (
+    f"INSERT INTO indicator_values (series_id, candle_time, {', '.join(SERIES_VALUE_COLUMNS)}) "
+    f"VALUES (?, ?, {', '.join('?' for _ in SERIES_VALUE_COLUMNS)}) "
+    f"ON CONFLICT (series_id, candle_time) DO UPDATE SET "
+    f"{', '.join(f'{column} = excluded.{column}' for column in SERIES_VALUE_COLUMNS)}"
+)
+SELECT_LATEST_VALUES_SQL = (
+    f"SELECT candle_time, {', '.join(SERIES_VALUE_COLUMNS)} FROM indicator_values "
+    f"WHERE series_id = ? ORDER BY candle_time DESC LIMIT ?"
+)
+
+def param_hash(params):
+    """
+    Identify a parameter set independently of its key order.
+
+    :param params: Dict of bound indicator parameters, e.g. {'period': 14}.
+    :return: 16 hex digit hash of the canonical JSON of `params`.
+    """
+    canonical = json.dumps(dict(params), sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(canonical.encode()).hexdigest()[:16]
+
+
+def epoch_seconds(times):
+    """
+    Convert candle times to the epoch seconds (UTC) stored in `indicator_values.candle_time`.
+
+    :param times: Series, array or list of datetimes (naive times are taken as UTC) or RFC3339 strings.
+    :return: int64 array.
+    """
+    return pd.DatetimeIndex(pd.to_datetime(times, utc=True)).as_unit('s').asi8
+
+
+# Pragmas applied to every new connection: WAL lets readers run alongside the single writer,
+# NORMAL sync is durable in WAL mode, and the page cache/mmap keep hot pages off the read path.
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -65536,  # 64 MiB
+    'mmap_size': 268435456,  # 256 MiB
+    'temp_store': 'MEMORY',
+    'foreign_keys': 'ON'
+}
+
+
+class SQLiteConnectionManager:
+    """
+    Per-thread persistent connections to one SQLite database.
+
+    Every thread (the TradingService loop, Flask request threads, planner workers) gets its own
+    connection, opened once with the tuned pragmas and a statement cache and reused until the thread
+    exits, so statements never pay for a reconnect. Writers wait on the busy timeout instead of
+    failing with "database is locked". Managers are shared per database path, so every SQLiteDB
+    instance on the same file shares the connections of its thread.
+    """
+    _managers = {}
+    _managers_lock = threading.Lock()
+
+    def __init__(self, db_path, pragmas=None, timeout=30.0, cached_statements=256):
+        """
+        :param db_path: Path of the database file (or ':memory:').
+        :param pragmas: Pragmas overriding DEFAULT_PRAGMAS.
+        :param timeout: Seconds a statement waits for a lock held by another connection.
+        :param cached_statements: Number of prepared statements each connection keeps.
+        """
+        self.db_path = db_path
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []  # (weakref to the owning thread, connection)
+
+        # Threads share one in-memory database through a named shared cache, kept alive by the
+        # manager's own connection
+        self._keeper = None
+        if db_path == ":memory:":
+            self._target, self._uri = f"file:memdb-{id(self)}?mode=memory&cache=shared", True
+            self._keeper = self._open()
+        else:
+            self._target, self._uri = db_path, False
+
+    @classmethod
+    def for_path(cls, db_path, **kwargs):
+        """
+        Return the manager shared by every SQLiteDB on `db_path`, creating it on first use.
+        ':memory:' databases are private, so each call gets a new manager.
+        """
+        if db_path == ":memory:":
+            return cls(db_path, **kwargs)
+        with cls._managers_lock:
+            if db_path not in cls._managers:
+                cls._managers[db_path] = cls(db_path, **kwargs)
+            return cls._managers[db_path]
+
+    def _open(self):
+        conn = sqlite3.connect(
+            self._target,
+            timeout=self.timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+            uri=self._uri
+        )
+        for pragma, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+
+    def connection(self):
+        """
+        Return the calling thread's connection, opening it on first use.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            with self._lock:
+                self._prune()
+                self._connections.append((weakref.ref(threading.current_thread()), conn))
+            logger.info(f"Connected to the database: {self.db_path}")
+        return conn
+
+    def _prune(self):
+        # Close the connections of threads that have exited (e.g. finished request threads)
+        alive = []
+        for thread_ref, conn in self._connections:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                alive.append((thread_ref, conn))
+            else:
+                conn.close()
+        self._connections = alive
+
+    def close(self):
+        """
+        Close the calling thread's connection.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.conn = None
+            with self._lock:
+                self._connections = [(t, c) for t, c in self._connections if c is not conn]
+            conn.close()
+            logger.info("Database connection closed")
+
+    def close_all(self):
+        """
+        Close every connection of the manager, e.g. on application shutdown.
+        """
+        with self._lock:
+            for _, conn in self._connections:
+                conn.close()
+            self._connections = []
+        self._local = threading.local()
+        logger.info(f"All connections to {self.db_path} closed")
+
+
+class SQLiteWriter:
+    """
+    Single writer thread that owns all bulk result writes to one SQLite database.
+
+    Compute workers `submit` batches of rows and carry on; the writer drains the queue, coalesces
+    whatever is pending into one transaction (up to `max_batch_rows` rows) and resolves each batch's
+    Future with its row count once committed. SQLite admits a single writer anyway, so funnelling the
+    writes through one connection trades lock contention for larger, cheaper transactions.
+    """
+    _writers = {}
+    _writers_lock = threading.Lock()
+
+    def __init__(self, manager, max_batch_rows=200_000, max_pending=1024):
+        """
+        :param manager: SQLiteConnectionManager of the database.
+        :param max_batch_rows: Rows after which a coalesced transaction is committed.
+        :param max_pending: Batches queued before `submit` blocks (bounds memory under backlog).
+        """
+        self.manager = manager
+        self.max_batch_rows = max_batch_rows
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"sqlite-writer:{manager.db_path}", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def for_manager(cls, manager, **kwargs):
+        """
+        Return the writer of the manager's database, starting it on first use.
+        """
+        with cls._writers_lock:
+            writer = cls._writers.get(id(manager))
+            if writer is None or writer._closed:
+                writer = cls._writers[id(manager)] = cls(manager, **kwargs)
+            return writer
+
+    def submit(self, sql, rows):
+        """
+        Queue a batch of rows for `executemany(sql, rows)`.
+
+        :param sql: Parameterized statement, e.g. INSERT_INDICATOR_RESULT_SQL.
+        :param rows: Sequence of parameter tuples.
+        :return: Future resolving to the number of rows written (or to the error of the batch).
+        """
+        if self._closed:
+            raise RuntimeError(f"Writer for {self.manager.db_path} is closed.")
+        future = Future()
+        self._queue.put((sql, rows, future))
+        return future
+
+    def flush(self):
+        """
+        Block until every batch submitted so far has been committed or has failed.
+        """
+        self._queue.join()
+
+    def close(self):
+        """
+        Write the pending batches and stop the writer thread.
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self):
+        conn = self.manager.connection()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+
+            # Coalesce everything already waiting into the same transaction
+            batch, rows = [item], len(item[1])
+            stop = False
+            while rows < self.max_batch_rows:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                rows += len(item[1])
+
+            try:
+                self._write(conn, batch)
+            finally:
+                # Always account for the batches, or `flush` would wait forever
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                self._queue.task_done()
+                break
+        self.manager.close()
+
+    def _write(self, conn, batch):
+        try:
+            counts = [conn.executemany(sql, rows).rowcount for sql, rows, _ in batch]
+            conn.commit()
+        except Exception as e:
+            # Any error (e.g. a row that cannot be bound) must fail its Future, not the writer thread
+            try:
+                conn.rollback()
+            except sqlite3.Error as rollback_error:
+                logger.error(f"Error rolling back batch on {self.manager.db_path}: {rollback_error}")
+            if len(batch) > 1:
+                # Retry one batch per transaction so a bad batch does not fail its neighbours
+                for item in batch:
+                    self._write(conn, [item])
+                return
+            logger.error(f"Error writing batch to {self.manager.db_path}: {e}")
+            batch[0][2].set_exception(e)
+            return
+        for (_, _, future), count in zip(batch, counts):
+            future.set_result(count)
+        logger.info(f"Committed {len(batch)} batches ({sum(counts)} rows) to {self.manager.db_path}")
+
+    @classmethod
+    def flush_all(cls):
+        """
+        Block until every writer has committed the batches submitted so far.
+        """
+        with cls._writers_lock:
+            writers = list(cls._writers.values())
+        for writer in writers:
+            writer.flush()
+
+    @classmethod
+    def close_all(cls):
+        """
+        Drain and stop every writer, e.g. at interpreter exit.
+        """
+        with cls._writers_lock:
+            writers, cls._writers = list(cls._writers.values()), {}
+        for writer in writers:
+            writer.close()
+
+
+atexit.register(SQLiteWriter.close_all)
+
+
 class SQLiteDB:
     def __init__(self, db_name="indicators.db"):
         if db_name != ":memory:":
@@ -12,20 +340,41 @@ class SQLiteDB:
             self.db_path = os.path.join(base_dir, db_name)
         else:
             self.db_path = db_name
-        self.conn = None
+        self.manager = SQLiteConnectionManager.for_path(self.db_path)
+        self._series = {}  # (instrument, granularity, indicator, param hash) -> (series id, outputs)
         logger.info(f"Database initialized at {self.db_path}")
 
+    @property
+    def writer(self):
+        """
+        The database's single writer thread for bulk results.
+        """
+        return SQLiteWriter.for_manager(self.manager)
+
+    def flush(self):
+        """
+        Wait until every bulk result write queued for this database has been committed.
+        """
+        self.writer.flush()
+
+    @property
+    def conn(self):
+        """
+        The calling thread's persistent connection.
+        """
+        return self.manager.connection()
+
     def _connect_db(self):
-        if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
-            logger.info(f"Connected to the database: {self.db_path}")
         return self.conn
 
+    def _rollback(self):
+        try:
+            self.conn.rollback()
+        except sqlite3.Error as e:
+            logger.error(f"Error rolling back transaction: {e}")
+
     def close_connection(self):
-        if self.conn:
-            self.conn.close()
-            self.conn = None
-            logger.info("Database connection closed")
+        self.manager.close()
 
     def execute_script(self, schema_sql):
         try:
@@ -35,9 +384,8 @@ class SQLiteDB:
             self.conn.commit()
             logger.info("SQL schema script executed successfully.")
         except sqlite3.Error as e:
+            self._rollback()
             logger.error(f"Error executing schema script: {e}")
-        finally:
-            self.close_connection()
 
     def initialize_db(self, schema_sql=None):
         if not schema_sql:
@@ -56,35 +404,227 @@ class SQLiteDB:
         try:
             self._connect_db()
             cursor = self.conn.cursor()
-            cursor.execute(
-                "INSERT INTO indicators (name, type) VALUES (?, ?)",
-                (indicator_name, indicator_type)
-            )
+            cursor.execute(INSERT_INDICATOR_SQL, (indicator_name, indicator_type))
             self.conn.commit()
             indicator_id = cursor.lastrowid
             logger.info(f"Added indicator: {indicator_name} with ID {indicator_id}")
             return indicator_id
         except sqlite3.Error as e:
+            self._rollback()
             logger.error(f"Error adding indicator: {e}")
             return None
-        finally:
-            self.close_connection()
 
-    def add_indicator_results(self, indicator_id, timestamp, param_name, param_value):
-        query = """
-        INSERT INTO indicator_results (indicator_id, time, key, value)
-        VALUES (?, ?, ?, ?)
+    def get_indicator_id(self, indicator_name, indicator_type="momentum"):
+        """
+        Retrieve the ID of an indicator, inserting the indicator if it does not exist yet.
+
+        :param indicator_name: Name of the indicator (e.g., 'RSI', 'MACD').
+        :param indicator_type: Type stored for a newly inserted indicator.
+        :return: The ID of the indicator (None on error).
+        """
+        try:
+            self._connect_db()
+            cursor = self.conn.cursor()
+            cursor.execute(SELECT_INDICATOR_ID_SQL, (indicator_name,))
+            if row := cursor.fetchone():
+                return row[0]
+            cursor.execute(INSERT_INDICATOR_SQL, (indicator_name, indicator_type))
+            self.conn.commit()
+            logger.info(f"Added indicator: {indicator_name} with ID {cursor.lastrowid}")
+            return cursor.lastrowid
+        except sqlite3.Error as e:
+            self._rollback()
+            logger.error(f"Error retrieving or adding indicator ID: {e}")
+            return None
+
+    def add_indicator_parameters(self, indicator_id, parameters):
+        """
+        Add the parameters of an indicator run in one transaction.
+
+        :param indicator_id: ID of the indicator.
+        :param parameters: Dict of parameter names and values.
         """
+        try:
+            self._connect_db()
+            self.conn.executemany(
+                INSERT_INDICATOR_PARAMETER_SQL,
+                [(indicator_id, key, str(value)) for key, value in parameters.items()]
+            )
+            self.conn.commit()
+            logger.info(f"Added parameters for indicator ID {indicator_id}")
+        except sqlite3.Error as e:
+            self._rollback()
+            logger.error(f"Error adding indicator parameters: {e}")
+
+    def add_indicator_results(self, indicator_id, timestamp, param_name, param_value):
         try:
             self._connect_db()
             cursor = self.conn.cursor()
-            cursor.execute(query, (indicator_id, timestamp, param_name, param_value))
+            cursor.execute(INSERT_INDICATOR_RESULT_SQL, (indicator_id, timestamp, param_name, param_value))
             self.conn.commit()
             logger.info(f"Inserted result for indicator ID {indicator_id} at {timestamp}")
+        except sqlite3.Error as e:
+            self._rollback()
+            logger.error(f"Error inserting indicator results: {e}")
+
+    def add_indicator_results_bulk(self, indicator_id, timestamp, results, wait=False):
+        """
+        Queue whole output columns of an indicator run on the database's single writer.
+
+        The rows are written with one `executemany`, coalesced with the batches other callers queued
+        meanwhile into one transaction; NaN (warm-up) values are stored as NULL. The caller does not
+        wait for the disk unless `wait` is set (use `flush` to wait for everything queued).
+
+        :param indicator_id: ID of the indicator.
+        :param timestamp: Time stored with every row.
+        :param results: Dict of {key: 1-D array or Series of values}, e.g. {'rsi': result_df['rsi']}.
+        :param wait: Block until the rows are committed.
+        :return: Future resolving to the number of rows inserted, or that number when `wait` is set
+            (0 on error).
+        """
+        rows = []
+        for key, values in results.items():
+            # Native floats bind faster than NumPy scalars (SQLite stores NaN as NULL)
+            values = np.asarray(values, dtype=float).tolist()
+            rows.extend(zip(repeat(indicator_id), repeat(timestamp), repeat(key), values))
+
+        future = self.writer.submit(INSERT_INDICATOR_RESULT_SQL, rows)
+        if not wait:
+            return future
+        try:
+            return future.result()
         except sqlite3.Error as e:
             logger.error(f"Error inserting indicator results: {e}")
-        finally:
-            self.close_connection()
+            return 0
+
+    def get_series(self, instrument, granularity, indicator_name, params, outputs=None):
+        """
+        Look up the time series of one indicator configuration, registering it on first use.
+
+        :param instrument: The instrument (e.g., 'EUR_USD').
+        :param granularity: The candle granularity (e.g., 'H1').
+        :param indicator_name: Name of the indicator (e.g., 'RSI').
+        :param params: Dict of bound parameters, e.g. {'period': 14}.
+        :param outputs: Output names in column order, i.e. the indicator's declared `OUTPUTS`; required
+            to register a new series (and replaces the outputs of a series registered without any).
+        :return: Tuple (series id, list of output names), or None if the series does not exist and
+            no outputs were given.
+        """
+        digest = param_hash(params)
+        key = (instrument, granularity, indicator_name, digest)
+        if key in self._series:
+            return self._series[key]
+
+        row = self.conn.execute(SELECT_SERIES_SQL, key).fetchone()
+        if outputs is not None:
+            outputs = list(outputs)
+            if not outputs:
+                raise ValueError(f"Cannot register the {indicator_name} series without outputs.")
+        if row is not None and outputs and not json.loads(row[1]):
+            try:
+                self.conn.execute(UPDATE_EMPTY_SERIES_OUTPUTS_SQL, (json.dumps(outputs), row[0]))
+                self.conn.commit()
+            except sqlite3.Error:
+                self._rollback()
+                raise
+            row = self.conn.execute(SELECT_SERIES_SQL, key).fetchone()
+        if row is None:
+            if outputs is None:
+                return None
+            if len(outputs) > len(SERIES_VALUE_COLUMNS):
+                raise ValueError(
+                    f"{indicator_name} has {len(outputs)} outputs; the results table holds {len(SERIES_VALUE_COLUMNS)}."
+                )
+            try:
+                # INSERT OR IGNORE + SELECT also resolves two threads registering the same series
+                self.conn.execute(INSERT_SERIES_SQL, (*key, json.dumps(dict(params), sort_keys=True, default=str), json.dumps(outputs)))
+                self.conn.commit()
+            except sqlite3.Error:
+                self._rollback()
+                raise
+            row = self.conn.execute(SELECT_SERIES_SQL, key).fetchone()
+
+        self._series[key] = (row[0], json.loads(row[1]))
+        return self._series[key]
+
+    def upsert_indicator_values(self, series_id, outputs, times, result_df, wait=False):
+        """
+        Queue the values of one indicator series on the database's single writer.
+
+        Rows are keyed by (series, candle time), so re-running an indicator over overlapping history
+        replaces the stored bars (e.g. the still-forming last candle) instead of duplicating them.
+
+        :param series_id: ID returned by `get_series`.
+        :param outputs: Output names of the series in column order.
+        :param times: Candle times aligned with `result_df`.
+        :param result_df: DataFrame holding the output columns.
+        :param wait: Block until the rows are committed.
+        :return: Future resolving to the number of rows written, or that number when `wait` is set
+            (0 on error).
+        """
+        candle_times = epoch_seconds(times).tolist()
+        padding = [[None] * len(candle_times)] * (len(SERIES_VALUE_COLUMNS) - len(outputs))
+        # Native floats bind faster than NumPy scalars (SQLite stores NaN as NULL)
+        columns = [np.asarray(result_df[name], dtype=float).tolist() for name in outputs] + padding
+        rows = list(zip(repeat(series_id), candle_times, *columns))
+
+        future = self.writer.submit(UPSERT_INDICATOR_VALUES_SQL, rows)
+        if not wait:
+            return future
+        try:
+            return future.result()
+        except sqlite3.Error as e:
+            logger.error(f"Error upserting indicator values: {e}")
+            return 0
+
+    def store_indicator_frame(self, instrument, granularity, indicator_name, params, times, result_df, outputs=None,
+                              wait=False):
+        """
+        Upsert every output column of an indicator run into its time series.
+
+        :param instrument: The instrument (e.g., 'EUR_USD').
+        :param granularity: The candle granularity (e.g., 'H1').
+        :param indicator_name: Name of the indicator (e.g., 'RSI').
+        :param params: Dict of bound parameters.
+        :param times: Candle times aligned with `result_df`.
+        :param result_df: DataFrame holding only the indicator outputs (as returned by `compute`).
+        :param outputs: Declared output names of the indicator (see `resolve_outputs`); defaults to the
+            columns of `result_df`.
+        :param wait: Block until the rows are committed.
+        :return: See `upsert_indicator_values`.
+        """
+        if outputs is None:
+            outputs = result_df.columns
+        series_id, outputs = self.get_series(instrument, granularity, indicator_name, params, outputs)
+        return self.upsert_indicator_values(series_id, outputs, times, result_df, wait)
+
+    def get_latest_indicator_values(self, instrument, granularity, indicator_name, params, limit=500):
+        """
+        Fetch the most recent values of one indicator series, e.g. the last 200 RSI-14 bars of EUR_USD H1.
+
+        :param instrument: The instrument (e.g., 'EUR_USD').
+        :param granularity: The candle granularity (e.g., 'H1').
+        :param indicator_name: Name of the indicator (e.g., 'RSI').
+        :param params: Dict of bound parameters.
+        :param limit: Number of bars to fetch.
+        :return: DataFrame with a UTC 'time' column and one column per output, oldest bar first
+            (empty if the series does not exist).
+        """
+        try:
+            series = self.get_series(instrument, granularity, indicator_name, params)
+            if series is None:
+                return pd.DataFrame(columns=['time'])
+            series_id, outputs = series
+            rows = self.conn.execute(SELECT_LATEST_VALUES_SQL, (series_id, limit)).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error fetching indicator values: {e}")
+            return pd.DataFrame(columns=['time'])
+
+        rows.reverse()
+        values = np.array([row[1:len(outputs) + 1] for row in rows], dtype=float).reshape(len(rows), len(outputs))
+        df = pd.DataFrame(values, columns=outputs)
+        df.insert(0, 'time', pd.to_datetime([row[0] for row in rows], unit='s', utc=True))
+        return df
 
     def get_indicator_parameters(self, indicator_id):
         """
@@ -119,5 +659,6 @@ class SQLiteDB:
             self.conn.commit()
             logger.info(f"Updated parameters for indicator ID {indicator_id}")
         except sqlite3.Error as e:
+            self._rollback()
             logger.error(f"Error updating indicator parameters: {e}")
 
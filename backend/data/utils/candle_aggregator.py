@@ -0,0 +1,143 @@
+'''
+Builds OANDA-style candles from a stream of price ticks.
+'''
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from data.utils.candles import GRANULARITY_SECONDS, format_candle_time
+
+# OANDA aligns daily candles to 17:00 New York time by default
+DAILY_ALIGNMENT_HOUR = 17
+DAILY_ALIGNMENT_TIMEZONE = ZoneInfo('America/New_York')
+
+DEFAULT_GRANULARITIES = ('M1', 'H1', 'D')
+PRICE_PRECISION = 5
+
+# Fields of an open bar
+_START, _END, _OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = range(7)
+
+
+def tick_seconds(time):
+    """
+    Convert an OANDA RFC3339 time ('2024-01-02T03:04:05.123456789Z') to float epoch seconds.
+    """
+    seconds = datetime.fromisoformat(time[:19]).replace(tzinfo=timezone.utc).timestamp()
+    fraction = time[19:].rstrip('Z')
+    return seconds + float(fraction) if fraction else seconds
+
+
+def bucket_bounds(granularity, seconds):
+    """
+    Start and end (epoch seconds) of the candle of `granularity` that contains `seconds`.
+
+    Intraday candles are aligned to UTC; daily candles start at 17:00 New York time like OANDA's.
+    """
+    if granularity == 'D':
+        local = datetime.fromtimestamp(seconds, DAILY_ALIGNMENT_TIMEZONE)
+        start = local.replace(hour=DAILY_ALIGNMENT_HOUR, minute=0, second=0, microsecond=0)
+        if local < start:
+            start -= timedelta(days=1)
+        # Day arithmetic on the wall clock keeps 17:00 across daylight saving changes
+        end = (start.replace(tzinfo=None) + timedelta(days=1)).replace(tzinfo=DAILY_ALIGNMENT_TIMEZONE)
+        return int(start.timestamp()), int(end.timestamp())
+    if granularity not in GRANULARITY_SECONDS or granularity in ('W', 'M'):
+        raise ValueError(f"Granularity '{granularity}' cannot be aggregated from ticks.")
+    length = GRANULARITY_SECONDS[granularity]
+    start = int(seconds // length * length)
+    return start, start + length
+
+
+class CandleAggregator:
+    def __init__(self, granularities=DEFAULT_GRANULARITIES, on_close=None, precision=PRICE_PRECISION):
+        """
+        Aggregate ticks into candles of several granularities at once.
+
+        :param granularities: Granularities to build (intraday ones and 'D').
+        :param on_close: Callback `on_close(instrument, granularity, document)` receiving every closed
+            candle as an OANDA candle document ({'time', 'volume', 'complete': True, 'mid'}).
+        :param precision: Number of decimals of the price strings.
+        """
+        for granularity in granularities:
+            bucket_bounds(granularity, 0)
+        self.granularities = tuple(granularities)
+        self.on_close = on_close
+        self.precision = precision
+        self._bars = {}  # (instrument, granularity) -> open bar
+        self._closed_end = {}  # (instrument, granularity) -> end of the last closed candle
+
+    def _document(self, bar, complete):
+        o, h, l, c = (f'{bar[field]:.{self.precision}f}' for field in (_OPEN, _HIGH, _LOW, _CLOSE))
+        return {'time': format_candle_time(bar[_START]), 'volume': bar[_VOLUME], 'complete': complete,
+                'mid': {'o': o, 'h': h, 'l': l, 'c': c}}
+
+    def _close(self, instrument, granularity, bar, closed):
+        self._closed_end[(instrument, granularity)] = bar[_END]
+        document = self._document(bar, True)
+        closed.append((instrument, granularity, document))
+        if self.on_close is not None:
+            self.on_close(instrument, granularity, document)
+
+    def add_tick(self, instrument, seconds, price, volume=1):
+        """
+        Add one tick.
+
+        :param instrument: The instrument of the tick (e.g., 'EUR_USD').
+        :param seconds: Epoch seconds of the tick.
+        :param price: Mid price of the tick.
+        :param volume: Tick volume (OANDA candle volumes count ticks).
+        :return: List of (instrument, granularity, document) of the candles this tick closed.
+        """
+        closed = []
+        for granularity in self.granularities:
+            key = (instrument, granularity)
+            bar = self._bars.get(key)
+            if seconds < self._closed_end.get(key, seconds) or (bar is not None and seconds < bar[_START]):
+                # Late tick of a candle that is already closed
+                continue
+            if bar is None or seconds >= bar[_END]:
+                if bar is not None:
+                    self._close(instrument, granularity, bar, closed)
+                start, end = bucket_bounds(granularity, seconds)
+                self._bars[key] = [start, end, price, price, price, price, volume]
+            else:
+                bar[_HIGH] = max(bar[_HIGH], price)
+                bar[_LOW] = min(bar[_LOW], price)
+                bar[_CLOSE] = price
+                bar[_VOLUME] += volume
+        return closed
+
+    def add_price(self, message):
+        """
+        Add an OANDA pricing message ({'type': 'PRICE', 'instrument', 'time', 'bids', 'asks'}),
+        using the mid of the best bid and ask.
+
+        :return: List of the candles the price closed (see `add_tick`).
+        """
+        bids, asks = message.get('bids'), message.get('asks')
+        if not bids or not asks:
+            return []
+        price = (float(bids[0]['price']) + float(asks[0]['price'])) / 2
+        return self.add_tick(message['instrument'], tick_seconds(message['time']), price)
+
+    def advance(self, seconds):
+        """
+        Close every candle that ends at or before `seconds`, e.g. on a stream heartbeat, so a
+        candle closes on time even when its instrument does not tick.
+
+        :return: List of the candles closed.
+        """
+        closed = []
+        for key, bar in list(self._bars.items()):
+            if seconds >= bar[_END]:
+                self._close(*key, bar, closed)
+                del self._bars[key]
+        return closed
+
+    def open_candles(self, instrument):
+        """
+        The still-forming candles of an instrument.
+
+        :return: Dict granularity -> candle document with 'complete': False.
+        """
+        return {granularity: self._document(bar, False)
+                for (bar_instrument, granularity), bar in list(self._bars.items()) if bar_instrument == instrument}
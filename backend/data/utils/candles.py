@@ -0,0 +1,175 @@
+# backend/data/utils/candles.py
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+"""
+Helpers for turning OANDA v20 candles into NumPy columns.
+"""
+
+PRICE_FIELDS = (('open', 'o'), ('high', 'h'), ('low', 'l'), ('close', 'c'))
+VALUE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Server-side projection of a stored candle: only the fields the decoder reads
+CANDLE_PROJECTION = {'_id': 0, 'time': 1, 'mid': 1, 'volume': 1, 'complete': 1}
+DEFAULT_BATCH_SIZE = 5000
+
+# Seconds per candle of the OANDA granularities (W and M use their longest length, so a window never
+# holds more candles than planned)
+GRANULARITY_SECONDS = {
+    'S5': 5, 'S10': 10, 'S15': 15, 'S30': 30,
+    'M1': 60, 'M2': 120, 'M4': 240, 'M5': 300, 'M10': 600, 'M15': 900, 'M30': 1800,
+    'H1': 3600, 'H2': 7200, 'H3': 10800, 'H4': 14400, 'H6': 21600, 'H8': 28800, 'H12': 43200,
+    'D': 86400, 'W': 604800, 'M': 2678400
+}
+
+# Byte positions of the separators of 'YYYY-MM-DDTHH:MM:SS'
+_TIME_SEPARATORS = {4: ord('-'), 7: ord('-'), 10: ord('T'), 13: ord(':'), 16: ord(':')}
+
+
+def parse_candle_times(times):
+    """
+    Parse candle times to epoch seconds (UTC), truncating any fraction of a second.
+
+    OANDA's RFC3339 times ('2024-01-02T03:04:05.000000000Z') share one fixed layout, so when every
+    string has it (and the same length) the bytes are read as a (n x length) matrix and turned into
+    seconds with integer arithmetic, with no per-string parsing. Anything else (offsets, other
+    layouts, out-of-range fields, datetimes) goes to pandas, which also raises on malformed input.
+
+    :param times: Sequence of RFC3339 strings or datetimes.
+    :return: int64 array of epoch seconds.
+    :raises ValueError: If a time cannot be parsed.
+    """
+    times = list(times)
+    if not times:
+        return np.empty(0, dtype=np.int64)
+    seconds = _parse_rfc3339(times)
+    if seconds is not None:
+        return seconds
+    # ISO8601 rather than a format inferred from the first time, so mixed layouts parse alike
+    return pd.DatetimeIndex(pd.to_datetime(times, utc=True, format='ISO8601')).as_unit('s').asi8
+
+
+def _parse_rfc3339(times):
+    """
+    Vectorized parse of 'YYYY-MM-DDTHH:MM:SS[.fraction]Z' strings of one length.
+
+    :return: int64 array of epoch seconds, or None if any time does not have the layout or holds an
+        out-of-range field.
+    """
+    if set(map(type, times)) != {str}:
+        return None
+    length = max(map(len, times))
+    # 'Z' right after the seconds, or a 1-9 digit fraction before it
+    if not (length == 20 or 22 <= length <= 30):
+        return None
+    try:
+        raw = np.array(times, dtype=f'S{length}').view(np.uint8).reshape(len(times), length)
+    except UnicodeEncodeError:
+        return None
+
+    # Shorter strings are NUL-padded, so the 'Z' check also catches mixed lengths
+    separators = {**_TIME_SEPARATORS, length - 1: ord('Z')}
+    if length > 20:
+        separators[19] = ord('.')
+    if not all((raw[:, position] == separator).all() for position, separator in separators.items()):
+        return None
+    # uint8 arithmetic wraps every non-digit byte above 9
+    digit_positions = [position for position in range(length) if position not in separators]
+    if ((raw[:, digit_positions] - np.uint8(ord('0'))) > 9).any():
+        return None
+    digits = raw[:, :19].astype(np.int64) - ord('0')
+
+    def number(first, last):
+        value = digits[:, first]
+        for position in range(first + 1, last):
+            value = value * 10 + digits[:, position]
+        return value
+
+    month, day = number(5, 7), number(8, 10)
+    hour, minute, second = number(11, 13), number(14, 16), number(17, 19)
+    if not (((month >= 1) & (month <= 12)).all() and (hour <= 23).all() and (minute <= 59).all() and (second <= 59).all()):
+        return None
+    months = ((number(0, 4) - 1970) * 12 + month - 1).astype('datetime64[M]')
+    month_start = months.astype('datetime64[D]').astype(np.int64)
+    days_in_month = (months + 1).astype('datetime64[D]').astype(np.int64) - month_start
+    if not ((day >= 1) & (day <= days_in_month)).all():
+        return None
+    return (month_start + day - 1) * 86400 + hour * 3600 + minute * 60 + second
+
+
+def format_candle_time(value):
+    """
+    Format a time the way OANDA stores candle times, so it can be compared with them as a string.
+
+    :param value: Epoch seconds, datetime, pandas Timestamp or time string (naive times are UTC).
+    :return: RFC3339 string such as '2024-01-02T03:04:05.000000000Z'.
+    """
+    timestamp = pd.Timestamp(value, unit='s') if isinstance(value, (int, float, np.integer, np.floating)) else pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+    return f"{timestamp.strftime('%Y-%m-%dT%H:%M:%S')}.{timestamp.microsecond * 1000 + timestamp.nanosecond:09d}Z"
+
+
+def documents_to_columns(documents):
+    """
+    Convert OANDA candle documents ({'time', 'volume', 'complete', 'mid': {'o', 'h', 'l', 'c'}}) to columns.
+
+    :param documents: List of candle documents.
+    :return: Dict with 'time' (int64 epoch seconds), 'open', 'high', 'low', 'close', 'volume'
+        (float64, NaN where missing) and 'complete' (bool) arrays.
+    """
+    columns = {'time': parse_candle_times([doc['time'] for doc in documents])}
+    mids = [doc.get('mid') or {} for doc in documents]
+    for column, field in PRICE_FIELDS:
+        # NumPy parses the price strings itself; None becomes NaN
+        columns[column] = np.array([mid.get(field) for mid in mids], dtype=float)
+    columns['volume'] = np.array([doc.get('volume') for doc in documents], dtype=float)
+    columns['complete'] = np.array([doc.get('complete', True) for doc in documents], dtype=bool)
+    return columns
+
+
+def decode_candles(documents, count=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Decode an iterable of candle documents (e.g. a MongoDB cursor) batch by batch into columns.
+
+    The columns are allocated once for `count` candles (grown if the cursor yields more) and every
+    batch is decoded with `documents_to_columns` straight into its slice, so at most one batch of
+    documents is held in memory at a time.
+
+    :param documents: Iterable of candle documents.
+    :param count: Expected number of candles (e.g. from `count_documents`), if known.
+    :param batch_size: Documents decoded per batch.
+    :return: Dict of columns as returned by `documents_to_columns`.
+    """
+    capacity = count or batch_size
+    columns = {'time': np.empty(capacity, dtype=np.int64), 'complete': np.empty(capacity, dtype=bool)}
+    columns.update({column: np.empty(capacity) for column in VALUE_COLUMNS})
+
+    size = 0
+    iterator = iter(documents)
+    while batch := list(islice(iterator, batch_size)):
+        if size + len(batch) > capacity:
+            capacity = max(2 * capacity, size + len(batch))
+            for column, values in columns.items():
+                grown = np.empty(capacity, dtype=values.dtype)
+                grown[:size] = values[:size]
+                columns[column] = grown
+        for column, values in documents_to_columns(batch).items():
+            columns[column][size:size + len(batch)] = values
+        size += len(batch)
+
+    return {column: values[:size] for column, values in columns.items()}
+
+
+def columns_to_frame(columns):
+    """
+    Build the indicator DataFrame from decoded candle columns.
+
+    :param columns: Dict returned by `decode_candles` or `documents_to_columns`.
+    :return: DataFrame with the OHLCV columns, 'complete' and 'time' (UTC).
+    """
+    df = pd.DataFrame({column: columns[column] for column in (*VALUE_COLUMNS, 'complete') if column in columns}, copy=False)
+    df['time'] = pd.DatetimeIndex(columns['time'].astype('datetime64[s]')).tz_localize('UTC')
+    return df
@@ -0,0 +1,129 @@
+# backend/simulator/broker.py
+import threading
+
+from data.utils.candles import format_candle_time
+from simulator.pricing import SPREAD, decimals
+
+"""
+Account state of the local OANDA stand-in: balance, pending orders and netted positions.
+
+MARKET orders fill immediately at the simulated ask (buys) or bid (sells); other order types are
+accepted and listed as pending, but never filled. Positions net long and short units per instrument
+and realize profit/loss (in the quote currency, unconverted) when they are reduced.
+"""
+
+DEFAULT_BALANCE = 100000.0
+
+
+class SimulatedAccount:
+    def __init__(self, account_id, ticks, clock, balance=DEFAULT_BALANCE, currency='USD'):
+        """
+        :param account_id: The account ID.
+        :param ticks: TickGenerator quoting the fill prices.
+        :param clock: SimulatedClock stamping the transactions.
+        :param balance: Opening balance.
+        :param currency: Home currency.
+        """
+        self.account_id = account_id
+        self.ticks = ticks
+        self.clock = clock
+        self.balance = balance
+        self.currency = currency
+        self.pending_orders = {}
+        self.positions = {}  # instrument -> {'units', 'average_price', 'realized'}
+        self.last_transaction_id = 0
+        self._lock = threading.Lock()
+
+    def _next_id(self):
+        self.last_transaction_id += 1
+        return str(self.last_transaction_id)
+
+    def _position(self, instrument):
+        return self.positions.setdefault(instrument, {'units': 0, 'average_price': 0.0, 'realized': 0.0})
+
+    def _unrealized(self, instrument, position):
+        return (self.ticks.current_price(instrument) - position['average_price']) * position['units']
+
+    def summary(self):
+        with self._lock:
+            unrealized = sum(self._unrealized(instrument, position) for instrument, position in self.positions.items())
+            return {'account': {
+                'id': self.account_id, 'currency': self.currency, 'balance': f'{self.balance:.4f}',
+                'NAV': f'{self.balance + unrealized:.4f}', 'unrealizedPL': f'{unrealized:.4f}',
+                'openPositionCount': sum(1 for position in self.positions.values() if position['units']),
+                'pendingOrderCount': len(self.pending_orders), 'lastTransactionID': str(self.last_transaction_id)
+            }}
+
+    def create_order(self, request):
+        """
+        Handle a POST /orders body ({'order': {'type', 'instrument', 'units', ...}}).
+
+        :return: (HTTP status, response body).
+        """
+        order = request.get('order') if isinstance(request, dict) else None
+        if not order or 'instrument' not in order or 'units' not in order:
+            return 400, {'errorMessage': 'Invalid order specification'}
+        try:
+            units = int(float(order['units']))
+        except (TypeError, ValueError):
+            return 400, {'errorMessage': f"Invalid units '{order['units']}'"}
+        if units == 0:
+            return 400, {'errorMessage': 'Units must not be zero'}
+
+        instrument = order['instrument'].upper()
+        time = format_candle_time(self.clock.now())
+        with self._lock:
+            order_id = self._next_id()
+            created = {'id': order_id, 'time': time, 'type': f"{order.get('type', 'MARKET')}_ORDER",
+                       'instrument': instrument, 'units': str(units)}
+            if order.get('type', 'MARKET') != 'MARKET':
+                self.pending_orders[order_id] = {**order, 'id': order_id, 'createTime': time, 'state': 'PENDING'}
+                return 201, {'orderCreateTransaction': created, 'lastTransactionID': order_id}
+
+            mid = self.ticks.current_price(instrument)
+            price = round(mid * (1 + (SPREAD / 2 if units > 0 else -SPREAD / 2)), decimals(instrument))
+            realized = self._fill(instrument, units, price)
+            self.balance += realized
+            fill_id = self._next_id()
+            fill = {'id': fill_id, 'time': time, 'type': 'ORDER_FILL', 'orderID': order_id, 'instrument': instrument,
+                    'units': str(units), 'price': str(price), 'pl': f'{realized:.4f}', 'accountBalance': f'{self.balance:.4f}'}
+            return 201, {'orderCreateTransaction': created, 'orderFillTransaction': fill, 'lastTransactionID': fill_id}
+
+    def _fill(self, instrument, units, price):
+        position = self._position(instrument)
+        held = position['units']
+        realized = 0.0
+        if held and (held > 0) != (units > 0):
+            # Reducing (and possibly flipping) the position realizes the closed part
+            closed = min(abs(units), abs(held)) * (1 if held > 0 else -1)
+            realized = (price - position['average_price']) * closed
+            position['realized'] += realized
+        total = held + units
+        if total == 0:
+            position['average_price'] = 0.0
+        elif held == 0 or (held > 0) != (total > 0):
+            position['average_price'] = price
+        elif (held > 0) == (units > 0):
+            position['average_price'] = (position['average_price'] * held + price * units) / total
+        position['units'] = total
+        return realized
+
+    def orders(self):
+        with self._lock:
+            return {'orders': list(self.pending_orders.values()), 'lastTransactionID': str(self.last_transaction_id)}
+
+    def open_positions(self):
+        with self._lock:
+            positions = []
+            for instrument, position in self.positions.items():
+                units = position['units']
+                side = {'units': str(units), 'averagePrice': str(position['average_price'])} if units else {'units': '0'}
+                empty = {'units': '0'}
+                positions.append({
+                    'instrument': instrument,
+                    'long': side if units > 0 else empty,
+                    'short': side if units < 0 else empty,
+                    'pl': f"{position['realized']:.4f}",
+                    'unrealizedPL': f'{self._unrealized(instrument, position):.4f}'
+                })
+            return {'positions': positions, 'lastTransactionID': str(self.last_transaction_id)}
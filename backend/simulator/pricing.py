@@ -0,0 +1,175 @@
+# backend/simulator/pricing.py
+import bisect
+import math
+import threading
+import time
+import zlib
+
+import numpy as np
+
+from benchmarks.synthetic import generate_candles, to_mongo_documents
+from data.utils.candle_aggregator import tick_seconds
+from data.utils.candles import GRANULARITY_SECONDS, format_candle_time
+
+"""
+Deterministic synthetic prices for the local OANDA stand-in.
+
+Every instrument follows its own seeded random walk, so the same seed replays the same ticks. The
+simulated clock starts at `start` and runs `speed` times faster than the wall clock, which lets a
+test see many M1 candles close within a few seconds. `CandleHistory` serves the candles before the
+start from the benchmark suite's regime-switching generator, seeded per instrument and granularity.
+"""
+
+DEFAULT_START = '2024-01-02T00:00:00Z'
+BASE_PRICES = {'USD_JPY': 140.0, 'EUR_JPY': 155.0, 'GBP_JPY': 180.0}
+DEFAULT_PRICE = 1.1
+SPREAD = 0.0001  # Relative bid/ask spread
+TICK_VOLATILITY = 0.00005  # Standard deviation of the log return per tick
+DEFAULT_HISTORY_BARS = 20000
+MAX_CANDLES_PER_REQUEST = 5000
+
+
+class SimulatedClock:
+    def __init__(self, start=DEFAULT_START, speed=1.0):
+        """
+        :param start: Simulated time at creation (anything pandas parses; naive is UTC).
+        :param speed: Simulated seconds per wall-clock second.
+        """
+        self.start = tick_seconds(format_candle_time(start))
+        self.speed = speed
+        self._created = time.monotonic()
+
+    def now(self):
+        """
+        Current simulated time in epoch seconds.
+        """
+        return self.start + (time.monotonic() - self._created) * self.speed
+
+
+class TickGenerator:
+    def __init__(self, seed=42, precision=5, initial_price=None):
+        """
+        :param seed: Seed of the random walks; each instrument derives its own from it.
+        :param precision: Decimals of the price strings (3 for JPY pairs).
+        :param initial_price: Optional callable giving the starting price of an instrument.
+        """
+        self.seed = seed
+        self.precision = precision
+        self.initial_price = initial_price
+        self._walks = {}
+        self._lock = threading.Lock()
+
+    def _walk(self, instrument):
+        if instrument not in self._walks:
+            rng = np.random.default_rng(series_seed(self.seed, instrument))
+            price = self.initial_price(instrument) if self.initial_price else BASE_PRICES.get(instrument, DEFAULT_PRICE)
+            self._walks[instrument] = [rng, price]
+        return self._walks[instrument]
+
+    def next_price(self, instrument):
+        """
+        Advance the instrument's walk by one tick.
+
+        :return: The new mid price.
+        """
+        with self._lock:
+            walk = self._walk(instrument)
+            walk[1] *= math.exp(TICK_VOLATILITY * walk[0].standard_normal())
+            return walk[1]
+
+    def current_price(self, instrument):
+        """
+        The instrument's current mid price, without ticking.
+        """
+        with self._lock:
+            return self._walk(instrument)[1]
+
+    def price_message(self, instrument, seconds, tick=True):
+        """
+        Return an OANDA PRICE message of the instrument at `seconds`.
+
+        :param tick: Advance the walk first (stream updates) or quote the current price (REST pricing).
+        """
+        mid = self.next_price(instrument) if tick else self.current_price(instrument)
+        places = decimals(instrument, self.precision)
+        bid, ask = (f'{mid * (1 + side * SPREAD / 2):.{places}f}' for side in (-1, 1))
+        return {
+            'type': 'PRICE', 'instrument': instrument, 'time': format_candle_time(seconds), 'tradeable': True,
+            'bids': [{'price': bid, 'liquidity': 10000000}], 'asks': [{'price': ask, 'liquidity': 10000000}],
+            'closeoutBid': bid, 'closeoutAsk': ask, 'status': 'tradeable'
+        }
+
+
+def series_seed(seed, *names):
+    return [seed, *(zlib.crc32(name.encode()) for name in names)]
+
+
+def decimals(instrument, precision=5):
+    return 3 if instrument.endswith('JPY') else precision
+
+
+def heartbeat_message(seconds):
+    return {'type': 'HEARTBEAT', 'time': format_candle_time(seconds)}
+
+
+
+class CandleHistory:
+    def __init__(self, end, bars=DEFAULT_HISTORY_BARS, seed=42):
+        """
+        Synthetic candles of every (instrument, granularity), generated on first request.
+
+        :param end: Epoch seconds the history ends at (the simulated start).
+        :param bars: Candles per series.
+        :param seed: Seed of the series; each series derives its own from it.
+        """
+        self.end = end
+        self.bars = bars
+        self.seed = seed
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def last_close(self, instrument, granularity='M1'):
+        """
+        Close of the last candle of a series, where the live prices continue from.
+        """
+        return float(self.series(instrument, granularity)[1][-1]['mid']['c'])
+
+    def series(self, instrument, granularity):
+        """
+        :return: (times, documents) of the series, sorted by time.
+        """
+        key = (instrument, granularity)
+        with self._lock:
+            if key not in self._series:
+                length = GRANULARITY_SECONDS[granularity]
+                start = (int(self.end) // length - self.bars) * length
+                df = generate_candles(self.bars, seed=series_seed(self.seed, instrument, granularity),
+                                      start=format_candle_time(start), freq=f'{length}s',
+                                      price=BASE_PRICES.get(instrument, DEFAULT_PRICE))
+                documents = to_mongo_documents(df, precision=decimals(instrument))
+                self._series[key] = ([document['time'] for document in documents], documents)
+            return self._series[key]
+
+    def query(self, instrument, granularity, count=None, from_time=None, to_time=None, include_first=True):
+        """
+        Select candles the way OANDA's candles endpoint does.
+
+        :param count: Number of candles (500 if neither or only one bound is given).
+        :param from_time: First candle time (RFC3339), if any.
+        :param to_time: End time (RFC3339, exclusive), if any.
+        :param include_first: Whether the candle at `from_time` is included.
+        :return: List of candle documents.
+        """
+        times, documents = self.series(instrument, granularity)
+        if from_time is not None:
+            from_time = format_candle_time(from_time)
+            first = (bisect.bisect_left if include_first else bisect.bisect_right)(times, from_time)
+        if to_time is not None:
+            stop = bisect.bisect_left(times, format_candle_time(to_time))
+        if from_time is not None and to_time is not None:
+            return documents[first:stop]
+        count = 500 if count is None else count
+        if from_time is not None:
+            return documents[first:first + count]
+        stop = len(documents) if to_time is None else stop
+        return documents[max(0, stop - count):stop]
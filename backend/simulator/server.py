@@ -0,0 +1,301 @@
+# backend/simulator/server.py
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from logs.log_manager import LogManager
+from simulator.broker import DEFAULT_BALANCE, SimulatedAccount
+from simulator.pricing import (DEFAULT_HISTORY_BARS, MAX_CANDLES_PER_REQUEST, CandleHistory, SimulatedClock,
+                               TickGenerator, heartbeat_message)
+from trading.brokers.rate_limiter import TokenBucket
+
+# Initialize the logger
+logger = LogManager('simulator_logs').get_logger()
+
+"""
+Local stand-in for the OANDA v20 API, served over plain HTTP on localhost.
+
+It implements the endpoints the OANDA clients use: account summary, orders (MARKET orders fill at
+the simulated price), positions, candles, pricing and the pricing stream. Point a client at
+`OandaSimulator.base_url` (REST) or `stream_url` (streaming) instead of OANDA's.
+
+The pricing stream writes chunked JSON lines like OANDA's: a PRICE message per instrument every
+`tick_interval` seconds and a HEARTBEAT every `heartbeat_interval` seconds. `disconnect_after`
+ends every stream response after that many seconds, to exercise the clients' reconnect logic.
+
+Every request can be delayed (`latency` plus a random `latency_jitter`), failed with a 503
+(`error_rate`) and throttled with a 429 and Retry-After above `rate_limit` requests per second. The
+injected delays and errors come from a seeded generator, and prices and candles from seeded paths,
+so a run is repeatable. `stats` counts the responses per endpoint and status.
+
+Run standalone with `python -m simulator.server --port 8081 --latency 0.02 --error-rate 0.01`.
+"""
+
+API_PREFIX = '/v3'
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    routes = (
+        ('GET', re.compile(r'/accounts/(?P<account_id>[^/]+)$'), 'account'),
+        ('GET', re.compile(r'/accounts/(?P<account_id>[^/]+)/summary$'), 'account'),
+        ('GET', re.compile(r'/accounts/(?P<account_id>[^/]+)/orders$'), 'orders'),
+        ('POST', re.compile(r'/accounts/(?P<account_id>[^/]+)/orders$'), 'create_order'),
+        ('GET', re.compile(r'/accounts/(?P<account_id>[^/]+)/(?:open)?[pP]ositions$'), 'positions'),
+        ('GET', re.compile(r'/accounts/(?P<account_id>[^/]+)/pricing$'), 'pricing'),
+        ('GET', re.compile(r'/accounts/(?P<account_id>[^/]+)/pricing/stream$'), 'pricing_stream'),
+        ('GET', re.compile(r'/instruments/(?P<instrument>[^/]+)/candles$'), 'candles'),
+    )
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    @property
+    def simulator(self):
+        return self.server.simulator
+
+    def _dispatch(self, method):
+        url = urlparse(self.path)
+        path = url.path[len(API_PREFIX):] if url.path.startswith(API_PREFIX) else url.path
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        # Read the body up front, so a rejected request leaves nothing unread on the keep-alive connection
+        self.body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        for route_method, pattern, name in self.routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                self.endpoint = name
+                fault = self.simulator.inject(name)
+                if fault is not None:
+                    return self.send_json(*fault)
+                return getattr(self, name)(query, **match.groupdict())
+        self.endpoint = 'unknown'
+        self.send_json(404, {'errorMessage': f'Unknown endpoint {method} {url.path}'})
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def send_response(self, code, message=None):
+        self.simulator.record(getattr(self, 'endpoint', 'unknown'), code)
+        super().send_response(code, message)
+
+    def read_json(self):
+        try:
+            return json.loads(self.body or b'{}')
+        except ValueError:
+            return None
+
+    def send_json(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _write_chunk(self, message):
+        line = json.dumps(message).encode() + b'\n'
+        self.wfile.write(f'{len(line):x}\r\n'.encode() + line + b'\r\n')
+        self.wfile.flush()
+
+    def account(self, query, account_id):
+        self.send_json(200, self.simulator.account(account_id).summary())
+
+    def orders(self, query, account_id):
+        self.send_json(200, self.simulator.account(account_id).orders())
+
+    def create_order(self, query, account_id):
+        self.send_json(*self.simulator.account(account_id).create_order(self.read_json()))
+
+    def positions(self, query, account_id):
+        self.send_json(200, self.simulator.account(account_id).open_positions())
+
+    def pricing(self, query, account_id):
+        instruments = [instrument for instrument in query.get('instruments', '').split(',') if instrument]
+        if not instruments:
+            return self.send_json(400, {'errorMessage': 'Missing instruments'})
+        seconds = self.simulator.clock.now()
+        prices = [self.simulator.ticks.price_message(instrument, seconds, tick=False) for instrument in instruments]
+        self.send_json(200, {'time': prices[0]['time'], 'prices': prices})
+
+    def candles(self, query, instrument):
+        granularity = query.get('granularity', 'S5')
+        bounded = 'from' in query and 'to' in query
+        if bounded and 'count' in query:
+            return self.send_json(400, {'errorMessage': "'count' cannot be combined with both 'from' and 'to'"})
+        count = query.get('count', '500')
+        if not count.isdigit() or not 0 < int(count) <= MAX_CANDLES_PER_REQUEST:
+            return self.send_json(400, {'errorMessage': f"Invalid value specified for 'count': {count}"})
+        count = int(count)
+        try:
+            candles = self.simulator.history.query(
+                instrument.upper(), granularity, None if bounded else count, query.get('from'), query.get('to'),
+                query.get('includeFirst', 'true') == 'true')
+        except KeyError:
+            return self.send_json(400, {'errorMessage': f"Invalid value specified for 'granularity': {granularity}"})
+        self.send_json(200, {'instrument': instrument.upper(), 'granularity': granularity, 'candles': candles})
+
+    def pricing_stream(self, query, account_id):
+        simulator = self.simulator
+        instruments = [instrument for instrument in query.get('instruments', '').split(',') if instrument]
+        if not instruments:
+            return self.send_json(400, {'errorMessage': 'Missing instruments'})
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        opened = time.monotonic()
+        next_heartbeat = opened + simulator.heartbeat_interval
+        try:
+            while not simulator.stopped.is_set():
+                now = time.monotonic()
+                if simulator.disconnect_after is not None and now - opened >= simulator.disconnect_after:
+                    break
+                seconds = simulator.clock.now()
+                for instrument in instruments:
+                    self._write_chunk(simulator.ticks.price_message(instrument, seconds))
+                if now >= next_heartbeat:
+                    self._write_chunk(heartbeat_message(seconds))
+                    next_heartbeat = now + simulator.heartbeat_interval
+                simulator.stopped.wait(simulator.tick_interval)
+            # Terminating chunk: the server ends the response
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
+
+
+class OandaSimulator:
+    def __init__(self, host='127.0.0.1', port=0, seed=42, start=None, speed=1.0, tick_interval=0.1,
+                 heartbeat_interval=5.0, disconnect_after=None, latency=0.0, latency_jitter=0.0, error_rate=0.0,
+                 rate_limit=None, history_bars=DEFAULT_HISTORY_BARS, balance=DEFAULT_BALANCE):
+        """
+        :param host: Interface to listen on.
+        :param port: Port to listen on (0 picks a free one).
+        :param seed: Seed of the synthetic prices, candles and injected faults.
+        :param start: Simulated start time (defaults to simulator.pricing.DEFAULT_START).
+        :param speed: Simulated seconds per wall-clock second.
+        :param tick_interval: Wall-clock seconds between the price updates of a stream.
+        :param heartbeat_interval: Wall-clock seconds between stream heartbeats.
+        :param disconnect_after: If set, streams are ended by the server after this many seconds.
+        :param latency: Seconds every response is delayed by.
+        :param latency_jitter: Mean of an extra, exponentially distributed delay in seconds.
+        :param error_rate: Probability of answering a request with a 503.
+        :param rate_limit: Requests per second above which requests get a 429 (unlimited if None).
+        :param history_bars: Candles served per instrument and granularity before the start.
+        :param balance: Opening balance of the accounts.
+        """
+        self.clock = SimulatedClock(start, speed) if start is not None else SimulatedClock(speed=speed)
+        self.history = CandleHistory(self.clock.start, history_bars, seed)
+        # Live prices continue from the last historical M1 close
+        self.ticks = TickGenerator(seed, initial_price=self.history.last_close)
+        self.tick_interval = tick_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.disconnect_after = disconnect_after
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        self.balance = balance
+        self.accounts = {}
+        self.stats = Counter()
+        self.stopped = threading.Event()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), SimulatorHandler)
+        self.server.daemon_threads = True
+        self.server.simulator = self
+        self._thread = None
+
+    def account(self, account_id):
+        with self._lock:
+            if account_id not in self.accounts:
+                self.accounts[account_id] = SimulatedAccount(account_id, self.ticks, self.clock, self.balance)
+            return self.accounts[account_id]
+
+    def record(self, endpoint, status):
+        with self._lock:
+            self.stats[(endpoint, status)] += 1
+
+    def inject(self, endpoint):
+        """
+        Apply the configured rate limit, latency and errors to a request.
+
+        :return: (status, body[, headers]) of an injected failure, or None to serve the request.
+        """
+        if self.rate_limiter is not None and not self.rate_limiter.try_acquire():
+            return 429, {'errorMessage': 'Rate limit exceeded'}, {'Retry-After': '1'}
+        with self._lock:
+            delay = self.latency + (self._random.expovariate(1 / self.latency_jitter) if self.latency_jitter else 0.0)
+            failed = self.error_rate and self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if failed:
+            return 503, {'errorMessage': f'Injected failure of {endpoint}'}
+        return None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}{API_PREFIX}'
+
+    @property
+    def stream_url(self):
+        return self.base_url
+
+    def start(self):
+        """
+        Serve on a background thread.
+
+        :return: The simulator.
+        """
+        self._thread = threading.Thread(target=self.server.serve_forever, name='oanda-simulator', daemon=True)
+        self._thread.start()
+        logger.info(f"OANDA simulator listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Local OANDA v20 stand-in.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--speed', type=float, default=1.0)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--latency-jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=None)
+    args = parser.parse_args()
+
+    simulator = OandaSimulator(args.host, args.port, seed=args.seed, speed=args.speed, latency=args.latency,
+                               latency_jitter=args.latency_jitter, error_rate=args.error_rate,
+                               rate_limit=args.rate_limit)
+    print(f"Serving the OANDA simulator on {simulator.base_url}")
+    try:
+        simulator.server.serve_forever()
+    except KeyboardInterrupt:
+        simulator.stop()
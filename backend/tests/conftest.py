@@ -0,0 +1,46 @@
+# backend/tests/conftest.py
+import os
+import sys
+
+import mongomock
+import pytest
+
+# Run from the backend directory or the repository root: the modules import from the backend root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import generate_candles  # noqa: E402
+import data.repositories.mongo as mongo  # noqa: E402
+
+"""
+Shared fixtures: seeded synthetic candles, and a MongoDBHandler backed by mongomock.
+"""
+
+
+@pytest.fixture
+def candles():
+    """
+    2000 seeded M1 bars with volatility regimes, the data every indicator test runs on.
+    """
+    return generate_candles(2000, seed=7)
+
+
+def _bulk_write(self, requests, ordered=True, **kwargs):
+    # mongomock's bulk_write does not take pymongo's ReplaceOne; apply the upserts one by one
+    for request in requests:
+        self.replace_one(request._filter, request._doc, upsert=request._upsert)
+
+    class Result:
+        upserted_count = len(requests)
+        modified_count = 0
+    return Result()
+
+
+@pytest.fixture
+def mongo_handler(monkeypatch):
+    """
+    MongoDBHandler of an in-memory 'forex_data' database.
+    """
+    monkeypatch.setattr(mongo, 'MongoClient', mongomock.MongoClient)
+    monkeypatch.setattr(mongo.MongoDBHandler, '_client', None)
+    monkeypatch.setattr(mongomock.collection.Collection, 'bulk_write', _bulk_write)
+    return mongo.MongoDBHandler(db_name='forex_data', oanda_client=object())
@@ -0,0 +1,57 @@
+# backend/tests/test_async_oanda_client.py
+import time
+
+import aiohttp
+import pytest
+
+from simulator.server import OandaSimulator
+from trading.brokers.async_oanda_client import fetch_candles_concurrently
+from trading.brokers.rate_limiter import PriorityRateLimiter
+
+INSTRUMENTS = ("EUR_USD", "GBP_USD", "USD_JPY", "AUD_USD", "USD_CHF", "USD_CAD")
+LATENCY = 0.2
+
+
+@pytest.fixture(scope='module')
+def simulator():
+    with OandaSimulator(latency=LATENCY, history_bars=1000) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def client_options(simulator):
+    return {'base_url': simulator.base_url, 'rate_limiter': PriorityRateLimiter(1000)}
+
+
+def test_fetches_run_concurrently_and_keep_request_order(simulator, client_options):
+    requests = [{'instrument': instrument, 'granularity': 'M1', 'count': 100} for instrument in INSTRUMENTS]
+
+    started = time.perf_counter()
+    results = fetch_candles_concurrently(requests, **client_options)
+    elapsed = time.perf_counter() - started
+
+    # One after the other the six requests would take at least 6 x LATENCY
+    assert elapsed < len(requests) * LATENCY / 2
+    for instrument, candles in zip(INSTRUMENTS, results):
+        assert candles == simulator.history.query(instrument, 'M1', count=100)
+
+
+def test_a_failed_fetch_is_returned_with_the_others(simulator, client_options):
+    requests = [{'instrument': 'EUR_USD', 'granularity': 'M1', 'count': 10},
+                {'instrument': 'EUR_USD', 'granularity': 'X9', 'count': 10},
+                {'instrument': 'USD_JPY', 'granularity': 'M1', 'count': 10}]
+
+    results = fetch_candles_concurrently(requests, **client_options)
+
+    assert isinstance(results[1], aiohttp.ClientResponseError) and results[1].status == 400
+    assert len(results[0]) == len(results[2]) == 10
+
+
+def test_fetch_since_pages_past_the_request_count(simulator, client_options):
+    times, documents = simulator.history.series('EUR_USD', 'M1')
+    last_time = times[-250]
+
+    [candles] = fetch_candles_concurrently(
+        [{'instrument': 'EUR_USD', 'granularity': 'M1', 'count': 100, 'last_time': last_time}], **client_options)
+
+    assert candles == documents[-250:]
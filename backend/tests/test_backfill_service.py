@@ -0,0 +1,89 @@
+# backend/tests/test_backfill_service.py
+import functools
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+import api.services.backfill_service as backfill_service
+from api.services.backfill_service import BackfillService, plan_windows
+from data.repositories.candle_store import CandleStore
+from simulator.pricing import CandleHistory
+
+
+class FlakyBroker:
+    """
+    Serves the simulator's candle history and fails the calls listed in `fail_calls`.
+    """
+    def __init__(self, history, fail_calls=()):
+        self.history = history
+        self.fail_calls = set(fail_calls)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def fetch_historical_data(self, instrument, granularity='M1', count=None, from_time=None, to_time=None, **kwargs):
+        with self._lock:
+            self.calls.append((from_time, to_time))
+            call = len(self.calls)
+        if call in self.fail_calls:
+            raise ConnectionError(f'call {call} failed')
+        return self.history.query(instrument, granularity, from_time=from_time, to_time=to_time)
+
+
+@pytest.fixture
+def small_windows(monkeypatch):
+    # 100-candle windows keep the in-memory MongoDB fast while still spanning several windows
+    monkeypatch.setattr(backfill_service, 'plan_windows', functools.partial(plan_windows, max_candles=100))
+
+
+@pytest.fixture
+def history():
+    return CandleHistory(pd.Timestamp.now(tz='UTC').timestamp(), bars=1000)
+
+
+def test_plan_windows_covers_the_range_in_bounded_windows():
+    windows = plan_windows('M1', '2024-01-01T00:00:00Z', '2024-01-01T12:00:00Z', max_candles=100)
+
+    assert len(windows) == 8
+    assert windows[0][0] == '2024-01-01T00:00:00.000000000Z'
+    assert windows[-1][1] == '2024-01-01T12:00:00.000000000Z'
+    assert all(previous[1] == following[0] for previous, following in zip(windows, windows[1:]))
+
+
+def test_backfill_resumes_from_checkpoint(mongo_handler, history, small_windows, tmp_path):
+    start = pd.Timestamp.now(tz='UTC') - pd.Timedelta(minutes=450)
+    broker = FlakyBroker(history, fail_calls={2})
+    service = BackfillService(mongo_handler, broker, max_workers=1, checkpoint_dir=str(tmp_path))
+
+    with pytest.raises(RuntimeError, match='1 of 5'):
+        service.backfill('EUR_USD', 'M1', start)
+    assert len(os.listdir(tmp_path)) == 1
+    failed_from, last_from = broker.calls[1][0], broker.calls[-1][0]
+
+    # "now" may have moved on, which lengthens the last window; the checkpoint must still be found
+    broker.fail_calls, broker.calls = set(), []
+    service.backfill('EUR_USD', 'M1', start)
+
+    refetched = {from_time for from_time, _ in broker.calls}
+    assert failed_from in refetched and refetched <= {failed_from, last_from}
+    assert os.listdir(tmp_path) == []
+    collection = mongo_handler.candle_collection_name('EUR_USD', 'M1')
+    times = mongo_handler.read_candles(collection)['time']
+    assert len(times) == pytest.approx(450, abs=1)
+    assert (pd.Series(times).diff().dropna() == 60).all()
+
+
+def test_backfill_reloads_a_store_missing_older_bars(mongo_handler, history, small_windows, tmp_path):
+    store = CandleStore(str(tmp_path / 'candles'))
+    service = BackfillService(mongo_handler, FlakyBroker(history), candle_store=store, max_workers=2,
+                              checkpoint_dir=str(tmp_path / 'checkpoints'))
+    now = pd.Timestamp.now(tz='UTC')
+
+    service.backfill('EUR_USD', 'M1', now - pd.Timedelta(minutes=150))
+    recent = store.count('EUR_USD', 'M1')
+    service.backfill('EUR_USD', 'M1', now - pd.Timedelta(minutes=300), now - pd.Timedelta(minutes=150))
+
+    collection = mongo_handler.candle_collection_name('EUR_USD', 'M1')
+    assert store.count('EUR_USD', 'M1') == mongo_handler.candle_count(collection) > recent
+    assert (store.columns('EUR_USD', 'M1')['time'] == mongo_handler.read_candles(collection)['time']).all()
@@ -0,0 +1,70 @@
+# backend/tests/test_candle_aggregator.py
+import pandas as pd
+import pytest
+
+from data.utils.candle_aggregator import CandleAggregator, bucket_bounds, tick_seconds
+
+
+def seconds(time):
+    return pd.Timestamp(time).timestamp()
+
+
+def test_ticks_build_ohlcv_candles_closed_by_the_next_bucket():
+    closed = []
+    aggregator = CandleAggregator(('M1', 'H1'), on_close=lambda *candle: closed.append(candle), precision=5)
+    for time, price in [('2024-01-02T10:00:05Z', 1.1), ('2024-01-02T10:00:20Z', 1.2),
+                        ('2024-01-02T10:00:40Z', 1.05), ('2024-01-02T10:00:59Z', 1.15)]:
+        assert aggregator.add_tick('EUR_USD', seconds(time), price) == []
+
+    returned = aggregator.add_tick('EUR_USD', seconds('2024-01-02T10:01:00Z'), 1.3)
+
+    assert returned == closed == [('EUR_USD', 'M1', {
+        'time': '2024-01-02T10:00:00.000000000Z', 'volume': 4, 'complete': True,
+        'mid': {'o': '1.10000', 'h': '1.20000', 'l': '1.05000', 'c': '1.15000'}})]
+    hour = aggregator.open_candles('EUR_USD')['H1']
+    assert hour['complete'] is False and hour['volume'] == 5 and hour['mid']['h'] == '1.30000'
+
+
+def test_late_ticks_of_a_closed_candle_are_dropped():
+    aggregator = CandleAggregator(('M1',))
+    aggregator.add_tick('EUR_USD', seconds('2024-01-02T10:00:30Z'), 1.1)
+    [(_, _, candle)] = aggregator.add_tick('EUR_USD', seconds('2024-01-02T10:01:10Z'), 1.2)
+
+    assert aggregator.add_tick('EUR_USD', seconds('2024-01-02T10:00:50Z'), 9.9) == []
+    assert candle['mid']['h'] == '1.10000'
+    assert aggregator.open_candles('EUR_USD')['M1']['volume'] == 1
+
+
+def test_advance_closes_candles_without_new_ticks():
+    aggregator = CandleAggregator(('M1', 'H1'))
+    aggregator.add_tick('EUR_USD', seconds('2024-01-02T10:59:30Z'), 1.1)
+
+    assert aggregator.advance(seconds('2024-01-02T10:59:59Z')) == []
+    closed = aggregator.advance(seconds('2024-01-02T11:00:00Z'))
+
+    assert [(granularity, candle['time']) for _, granularity, candle in closed] == [
+        ('M1', '2024-01-02T10:59:00.000000000Z'), ('H1', '2024-01-02T10:00:00.000000000Z')]
+    assert aggregator.open_candles('EUR_USD') == {}
+
+
+def test_add_price_uses_the_mid_of_the_best_quotes():
+    aggregator = CandleAggregator(('M1',))
+    aggregator.add_price({'type': 'PRICE', 'instrument': 'USD_JPY', 'time': '2024-01-02T10:00:00.250000000Z',
+                          'bids': [{'price': '140.000'}], 'asks': [{'price': '140.020'}]})
+
+    assert aggregator.open_candles('USD_JPY')['M1']['mid']['o'] == '140.01000'
+
+
+@pytest.mark.parametrize('time, start, end', [
+    # 17:00 New York is 22:00 UTC in winter and 21:00 UTC in summer
+    ('2024-01-10T21:59:00Z', '2024-01-09T22:00:00Z', '2024-01-10T22:00:00Z'),
+    ('2024-01-10T22:00:00Z', '2024-01-10T22:00:00Z', '2024-01-11T22:00:00Z'),
+    ('2024-07-10T21:30:00Z', '2024-07-10T21:00:00Z', '2024-07-11T21:00:00Z'),
+    ('2024-03-10T12:00:00Z', '2024-03-09T22:00:00Z', '2024-03-10T21:00:00Z'),  # Daylight saving starts
+])
+def test_daily_candles_align_to_new_york_close(time, start, end):
+    assert bucket_bounds('D', seconds(time)) == (seconds(start), seconds(end))
+
+
+def test_tick_seconds_keeps_the_fraction():
+    assert tick_seconds('2024-01-02T03:04:05.250000000Z') == seconds('2024-01-02T03:04:05Z') + 0.25
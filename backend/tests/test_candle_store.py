@@ -0,0 +1,105 @@
+# backend/tests/test_candle_store.py
+import numpy as np
+import pytest
+
+from api.controllers.indicators_controller import IndicatorsController
+from benchmarks.synthetic import to_mongo_documents
+from data.repositories.candle_store import VALUE_COLUMNS, CandleStore
+
+
+def bars(times):
+    return {'time': np.array(times), **{column: np.array(times, dtype=float) for column in VALUE_COLUMNS}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandleStore(str(tmp_path))
+
+
+def test_append_replaces_the_last_bar_and_skips_older_ones(store):
+    store.append('EUR_USD', 'M1', bars([60, 120]))
+    store.append('EUR_USD', 'M1', {**bars([60, 120, 180]), 'close': np.array([0.0, 2.0, 3.0])})
+
+    columns = store.columns('EUR_USD', 'M1')
+    assert columns['time'].tolist() == [60, 120, 180]
+    assert columns['close'].tolist() == [60.0, 2.0, 3.0]
+    assert (store.first_time('EUR_USD', 'M1'), store.last_time('EUR_USD', 'M1')) == (60, 180)
+
+
+def test_append_after_an_interrupted_append_keeps_columns_aligned(store):
+    store.append('EUR_USD', 'M1', bars([60, 120]))
+    # A crash after the data columns but before 'time' leaves uncommitted bytes behind
+    for column in VALUE_COLUMNS:
+        with open(store._column_path('EUR_USD', 'M1', column), 'ab') as f:
+            f.write(np.array([999.0]).tobytes())
+
+    store.append('EUR_USD', 'M1', bars([180]))
+
+    columns = store.columns('EUR_USD', 'M1')
+    assert columns['time'].tolist() == [60, 120, 180]
+    assert all(columns[column].tolist() == [60.0, 120.0, 180.0] for column in VALUE_COLUMNS)
+
+
+def test_a_short_column_is_reported_as_corrupt(store):
+    store.append('EUR_USD', 'M1', bars([60, 120]))
+    with open(store._column_path('EUR_USD', 'M1', 'low'), 'r+b') as f:
+        f.truncate(8)
+
+    with pytest.raises(ValueError, match="column 'low'"):
+        store.columns('EUR_USD', 'M1')
+
+
+def test_replace_swaps_the_whole_series(store):
+    store.append('EUR_USD', 'M1', bars([600, 660]))
+    store.replace('EUR_USD', 'M1', bars([60, 120, 180]))
+
+    assert store.columns('EUR_USD', 'M1')['time'].tolist() == [60, 120, 180]
+
+
+@pytest.fixture
+def controller(mongo_handler, store):
+    # Only the candle sources of the controller are needed (its config loader reads a cwd-relative path)
+    controller = IndicatorsController.__new__(IndicatorsController)
+    controller.mongo_handler = mongo_handler
+    controller.candle_store = store
+    return controller
+
+
+def test_controller_fills_an_empty_store_from_mongo(controller, candles):
+    documents = to_mongo_documents(candles.head(300))
+    controller.mongo_handler.upsert_candles(controller.mongo_handler.candle_collection_name('EUR_USD', 'M1'), documents)
+
+    df = controller.fetch_historical_data('EUR_USD', 'M1')
+
+    assert len(df) == 300 == controller.candle_store.count('EUR_USD', 'M1')
+    assert len(controller.fetch_historical_data('EUR_USD', 'M1', count=50)) == 50
+
+
+def test_controller_reads_mongo_when_the_store_holds_only_recent_bars(controller, candles):
+    documents = to_mongo_documents(candles.head(300))
+    controller.mongo_handler.upsert_candles(controller.mongo_handler.candle_collection_name('EUR_USD', 'M1'), documents)
+    controller.candle_store.append_documents('EUR_USD', 'M1', documents[-5:])
+
+    df = controller.fetch_historical_data('EUR_USD', 'M1')
+
+    assert len(df) == 300
+    # The full read reloaded the store, which is used from then on
+    assert controller.candle_store.count('EUR_USD', 'M1') == 300
+    assert controller.sync_candle_store('EUR_USD', 'M1', controller.mongo_handler.candle_collection_name('EUR_USD', 'M1'))
+
+
+def test_controller_reloads_a_store_that_lags_behind_mongo(controller, candles):
+    collection = controller.mongo_handler.candle_collection_name('EUR_USD', 'M1')
+    documents = to_mongo_documents(candles.head(301))
+    controller.mongo_handler.upsert_candles(collection, documents[:300])
+    controller.fetch_historical_data('EUR_USD', 'M1')
+    # Same first bar and bar count as the store, but MongoDB lost a bar and gained a newer one
+    controller.mongo_handler.db[collection].delete_one({'time': documents[150]['time']})
+    controller.mongo_handler.upsert_candles(collection, documents[300:])
+
+    assert not controller.sync_candle_store('EUR_USD', 'M1', collection)
+    df = controller.fetch_historical_data('EUR_USD', 'M1')
+
+    assert len(df) == 300
+    assert df['time'].iloc[-1] == candles['time'].iloc[300].tz_localize('UTC')
+    assert controller.sync_candle_store('EUR_USD', 'M1', collection)
@@ -0,0 +1,71 @@
+# backend/tests/test_candles.py
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.utils.candles import format_candle_time, parse_candle_times
+
+"""
+Checks of the vectorized candle time parser against `pd.to_datetime` with the ISO8601 format.
+"""
+
+
+def _pandas_seconds(times):
+    return pd.DatetimeIndex(pd.to_datetime(times, utc=True, format='ISO8601')).as_unit('s').asi8
+
+
+@pytest.mark.parametrize('times', [
+    # OANDA's nanosecond layout, fractions truncated to the second
+    ['2024-01-02T03:04:05.000000000Z', '2024-01-02T03:04:05.999999999Z', '2024-02-29T23:59:59.500000000Z'],
+    # Other fraction lengths, and none
+    ['2024-01-02T03:04:05.1Z', '2024-12-31T23:59:59.9Z'],
+    ['2024-01-02T03:04:05.123Z', '2023-03-01T00:00:00.001Z'],
+    ['2024-01-02T03:04:05.123456Z', '2000-02-29T12:00:00.654321Z'],
+    ['2024-01-02T03:04:05Z', '1970-01-01T00:00:00Z'],
+    # Before the epoch the truncation floors, as pandas does
+    ['1969-12-31T23:59:59.500000000Z', '1900-03-01T00:00:00.000000000Z'],
+    # Layouts the fast path leaves to pandas: mixed lengths, offsets, a bare '.', 10 fraction digits
+    ['2024-01-02T03:04:05Z', '2024-01-02T03:04:05.5Z'],
+    ['2024-01-02T03:04:05+01:00', '2024-01-02T03:04:05.000000000Z'],
+    ['2024-01-02T03:04:05.Z'],
+    ['2024-01-02T03:04:05.1234567891Z'],
+])
+def test_matches_pandas(times):
+    np.testing.assert_array_equal(parse_candle_times(times), _pandas_seconds(times))
+
+
+def test_parses_a_long_oanda_series():
+    times = [format_candle_time(1_600_000_000 + 61 * i) for i in range(50_000)]
+
+    np.testing.assert_array_equal(parse_candle_times(times), 1_600_000_000 + 61 * np.arange(50_000))
+
+
+def test_parses_datetimes_and_empty_input():
+    times = [datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), pd.Timestamp('2024-01-02T03:04:06Z')]
+
+    np.testing.assert_array_equal(parse_candle_times(times), [1704164645, 1704164646])
+    assert parse_candle_times([]).dtype == np.int64
+
+
+@pytest.mark.parametrize('bad', [
+    '2024-13-01T00:00:00.000000000Z',  # month
+    '2023-02-29T00:00:00.000000000Z',  # day (not a leap year)
+    '2024-04-31T00:00:00.000000000Z',
+    '2024-01-00T00:00:00.000000000Z',
+    '2024-01-02T24:00:00.000000000Z',  # hour
+    '2024-01-02T03:60:00.000000000Z',  # minute
+    '2016-12-31T23:59:60.000000000Z',  # leap second
+    '2024-01-0xT03:04:05.000000000Z',  # non-digit field
+    '2024-01-02T03:04:05.12a456789Z',  # non-digit fraction
+    '2024-01-02T03:04:05Zjunk',
+    'not a time',
+])
+def test_malformed_times_raise_like_pandas(bad):
+    times = ['2024-01-02T03:04:05.000000000Z', bad]
+
+    with pytest.raises(ValueError):
+        _pandas_seconds(times)
+    with pytest.raises(ValueError):
+        parse_candle_times(times)
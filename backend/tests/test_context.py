@@ -0,0 +1,75 @@
+# backend/tests/test_context.py
+from collections import Counter
+
+import pandas as pd
+
+from trading.indicators.adx import ADX
+from trading.indicators.atr import ATR
+from trading.indicators.core.context import IndicatorContext
+from trading.indicators.core.planner import IndicatorPlanner
+from trading.indicators.ema import EMA
+from trading.indicators.keltner import KeltnerChannel
+from trading.indicators.macd import MACD
+from trading.indicators.ppo import PPO
+from trading.indicators.supertrend import Supertrend
+from trading.indicators.tema import TEMA
+from trading.indicators.trix import TRIX
+
+"""
+Checks that the intermediates shared through an IndicatorContext are computed once per run.
+"""
+
+
+class CountingContext(IndicatorContext):
+    """
+    IndicatorContext that counts how many times each cached node is built.
+    """
+
+    def __init__(self, df):
+        super().__init__(df)
+        self.builds = Counter()
+
+    def _memoize(self, key, builder):
+        def counted():
+            self.builds[key] += 1
+            return builder()
+
+        return super()._memoize(key, counted)
+
+
+# Four consumers of the true range (two through the ATR indicator node) and five of the close EMAs
+REQUESTS = [
+    (ATR, {'period': 14}), (ADX, {'period': 14}), (KeltnerChannel, {'period': 14}), (Supertrend, {'period': 14}),
+    (EMA, {'period': 12}), (MACD, {}), (PPO, {}), (TEMA, {'period': 12}), (TRIX, {'period': 12}),
+]
+
+
+def test_planner_run_builds_each_intermediate_once(candles):
+    context = CountingContext(candles)
+    results = IndicatorPlanner(max_workers=8).execute(REQUESTS, context)
+
+    assert len(results) == len(REQUESTS)
+    assert context.builds['true_range'] == 1
+    assert context.builds[('indicator', ATR, (('period', 14),))] == 1
+    for key in [('ema', 'close', 12), ('ema', 'close', 26), ('ema', 'close', 12, 2), ('ema', 'close', 12, 3)]:
+        assert context.builds[key] == 1, key
+    assert set(context.builds.values()) == {1}
+
+
+def test_direct_calls_share_the_context(candles):
+    context = CountingContext(candles)
+    keltner = KeltnerChannel.compute(candles, period=14, context=context)
+    atr = ATR.compute(candles, period=14, context=context)
+    ADX.compute(candles, period=14, context=context)
+
+    assert context.builds['true_range'] == 1
+    pd.testing.assert_series_equal(keltner['keltner_upper'] - keltner['keltner_middle'], 2 * atr['atr'], check_names=False)
+
+
+def test_clear_drops_the_cache(candles):
+    context = CountingContext(candles)
+    context.true_range()
+    context.clear()
+    context.true_range()
+
+    assert context.builds['true_range'] == 2
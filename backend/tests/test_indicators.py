@@ -0,0 +1,448 @@
+# backend/tests/test_indicators.py
+import inspect
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.indicators.adx import ADX
+from trading.indicators.aroon import Aroon
+from trading.indicators.atr import ATR
+from trading.indicators.bollinger import BollingerBands
+from trading.indicators.cci import CCI
+from trading.indicators.chaikin_money_flow import ChaikinMoneyFlow
+from trading.indicators.chande_momentum import ChandeMomentumOscillator
+from trading.indicators.coppock import CoppockCurve
+from trading.indicators.core.context import resolve_outputs
+from trading.indicators.donchian import DonchianChannel
+from trading.indicators.ema import EMA
+from trading.indicators.ichimoku import IchimokuCloud
+from trading.indicators.keltner import KeltnerChannel
+from trading.indicators.ma_crossover import MACrossover
+from trading.indicators.macd import MACD
+from trading.indicators.mfi import MFI
+from trading.indicators.obv import OBV
+from trading.indicators.ppo import PPO
+from trading.indicators.psar import PSAR
+from trading.indicators.roc import ROC
+from trading.indicators.rsi import RSI
+from trading.indicators.sma import SMA
+from trading.indicators.stoch import StochasticOscillator
+from trading.indicators.stoch_rsi import StochRSI
+from trading.indicators.supertrend import Supertrend
+from trading.indicators.tema import TEMA
+from trading.indicators.trix import TRIX
+from trading.indicators.vwap import VWAP
+from trading.indicators.vwma import VWMA
+from trading.indicators.williams_r import WilliamsR
+from trading.indicators.wma import WMA
+from trading.indicators.zlema import ZLEMA
+
+"""
+Regression tests of the NumPy indicator kernels against the pandas implementations they replaced.
+
+The `reference_*` functions of the original indicators are their original `calculate` bodies, kept
+as they were apart from the two idioms pandas 3 no longer honours (chained assignment in OBV,
+`fillna(inplace=True)` on a column in ADX). The indicators added later are checked against plain
+pandas restatements of their textbook definitions, and the two recurrences (PSAR, Supertrend) also
+against short sequences worked out by hand. Every indicator's `compute` must reproduce them on the
+same seeded candles.
+"""
+
+
+def reference_adx(df, period=14):
+    df['high-low'] = df['high'] - df['low']
+    df['high-close'] = (df['high'] - df['close'].shift()).abs()
+    df['low-close'] = (df['low'] - df['close'].shift()).abs()
+    df['tr'] = df[['high-low', 'high-close', 'low-close']].max(axis=1)
+    df['plus_dm'] = np.where((df['high'] - df['high'].shift()) > (df['low'].shift() - df['low']), df['high'] - df['high'].shift(), 0)
+    df['minus_dm'] = np.where((df['low'].shift() - df['low']) > (df['high'] - df['high'].shift()), df['low'].shift() - df['low'], 0)
+    df['tr_smooth'] = df['tr'].rolling(window=period).sum()
+    df['plus_dm_smooth'] = df['plus_dm'].rolling(window=period).sum()
+    df['minus_dm_smooth'] = df['minus_dm'].rolling(window=period).sum()
+    df['plus_di'] = 100 * (df['plus_dm_smooth'] / df['tr_smooth'])
+    df['minus_di'] = 100 * (df['minus_dm_smooth'] / df['tr_smooth'])
+    df['dx'] = 100 * (abs(df['plus_di'] - df['minus_di']) / (df['plus_di'] + df['minus_di']))
+    df['adx'] = df['dx'].rolling(window=period).mean()
+    df['adx'] = df['adx'].fillna(0)
+    return df
+
+
+def reference_aroon(df, period=25):
+    df['aroon_up'] = df['high'].rolling(window=period).apply(lambda x: (x.argmax() + 1) / period * 100, raw=True)
+    df['aroon_down'] = df['low'].rolling(window=period).apply(lambda x: (x.argmin() + 1) / period * 100, raw=True)
+    return df
+
+
+def reference_atr(df, period=14):
+    df['high-low'] = df['high'] - df['low']
+    df['high-close'] = (df['high'] - df['close'].shift()).abs()
+    df['low-close'] = (df['low'] - df['close'].shift()).abs()
+    df['true_range'] = df[['high-low', 'high-close', 'low-close']].max(axis=1)
+    df['atr'] = df['true_range'].rolling(window=period).mean()
+    return df
+
+
+def reference_bollinger(df, period=20, std=2):
+    df[f'middle_{period}'] = df['close'].rolling(window=period).mean()
+    df['std'] = df['close'].rolling(window=period).std()
+    df[f'upper_{period}'] = df[f'middle_{period}'] + (df['std'] * std)
+    df[f'lower_{period}'] = df[f'middle_{period}'] - (df['std'] * std)
+    return df
+
+
+def reference_cci(df, period=14):
+    df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
+    df['tp_sma'] = df['typical_price'].rolling(window=period).mean()
+
+    def mean_deviation(series):
+        mean_value = series.mean()
+        return np.mean(np.abs(series - mean_value))
+
+    df['mean_deviation'] = df['typical_price'].rolling(window=period).apply(mean_deviation, raw=False)
+    df['cci'] = (df['typical_price'] - df['tp_sma']) / (0.015 * df['mean_deviation'])
+    return df
+
+
+def reference_ema(df, period=14):
+    df['ema'] = df['close'].ewm(span=period, adjust=False).mean()
+    return df
+
+
+def reference_ma_crossover(df, fast_period=12, slow_period=26):
+    df['fast_ma'] = df['close'].rolling(window=fast_period).mean()
+    df['slow_ma'] = df['close'].rolling(window=slow_period).mean()
+    df['crossover'] = df['fast_ma'] - df['slow_ma']
+    df['crossover_signal'] = df['crossover'].apply(lambda x: 1 if x > 0 else -1)
+    return df
+
+
+def reference_macd(df, short_period=12, long_period=26, signal_period=9):
+    df['ema_short'] = df['close'].ewm(span=short_period, adjust=False).mean()
+    df['ema_long'] = df['close'].ewm(span=long_period, adjust=False).mean()
+    df['macd'] = df['ema_short'] - df['ema_long']
+    df['signal'] = df['macd'].ewm(span=signal_period, adjust=False).mean()
+    df['histogram'] = df['macd'] - df['signal']
+    return df
+
+
+def reference_mfi(df, period=14):
+    df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
+    df['money_flow'] = df['typical_price'] * df['volume']
+    df['previous_typical_price'] = df['typical_price'].shift(1)
+    df['money_flow_positive'] = df.apply(lambda row: row['money_flow'] if row['typical_price'] > row['previous_typical_price'] else 0, axis=1)
+    df['money_flow_negative'] = df.apply(lambda row: row['money_flow'] if row['typical_price'] < row['previous_typical_price'] else 0, axis=1)
+    positive_flow = df['money_flow_positive'].rolling(window=period).sum()
+    negative_flow = df['money_flow_negative'].rolling(window=period).sum()
+    mfr = positive_flow / negative_flow
+    df['mfi'] = 100 - (100 / (1 + mfr))
+    return df
+
+
+def reference_obv(df):
+    close, volume = df['close'].tolist(), df['volume'].tolist()
+    obv = [0] * len(df)
+    for i in range(1, len(df)):
+        if close[i] > close[i - 1]:
+            obv[i] = obv[i - 1] + volume[i]
+        elif close[i] < close[i - 1]:
+            obv[i] = obv[i - 1] - volume[i]
+        else:
+            obv[i] = obv[i - 1]
+    df['obv'] = obv
+    return df
+
+
+def reference_rsi(df, period=14):
+    delta = df['close'].diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rs = gain / loss
+    df['rsi'] = 100 - (100 / (1 + rs))
+    return df
+
+
+def reference_sma(df, period=14):
+    df[f'sma_{period}'] = df['close'].rolling(window=period).mean()
+    return df
+
+
+def reference_stoch(df, period=14):
+    df['highest_high'] = df['high'].rolling(window=period).max()
+    df['lowest_low'] = df['low'].rolling(window=period).min()
+    df['stoch'] = 100 * ((df['close'] - df['lowest_low']) / (df['highest_high'] - df['lowest_low']))
+    df['stoch_signal'] = df['stoch'].rolling(window=3).mean()
+    return df
+
+
+def reference_vwap(df):
+    df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
+    df['vwap'] = (df['typical_price'] * df['volume']).cumsum() / df['volume'].cumsum()
+    return df
+
+
+def reference_chaikin_money_flow(df, period=20):
+    bar_range = df['high'] - df['low']
+    multiplier = ((df['close'] - df['low']) - (df['high'] - df['close'])) / bar_range
+    multiplier[bar_range == 0] = 0
+    df['cmf'] = (multiplier * df['volume']).rolling(window=period).sum() / df['volume'].rolling(window=period).sum()
+    return df
+
+
+def reference_chande_momentum(df, period=14):
+    delta = df['close'].diff()
+    up = delta.where(delta > 0, 0).rolling(window=period).sum()
+    down = (-delta.where(delta < 0, 0)).rolling(window=period).sum()
+    df['cmo'] = 100 * (up - down) / (up + down)
+    return df
+
+
+def _rolling_wma(series, period):
+    weights = np.arange(1, period + 1)
+    return series.rolling(window=period).apply(lambda x: np.dot(x, weights) / weights.sum(), raw=True)
+
+
+def reference_coppock(df, period=10, long_roc=14, short_roc=11):
+    roc_sum = df['close'].pct_change(long_roc) * 100 + df['close'].pct_change(short_roc) * 100
+    df['coppock'] = _rolling_wma(roc_sum, period)
+    return df
+
+
+def reference_donchian(df, period=20):
+    df['donchian_upper'] = df['high'].rolling(window=period).max()
+    df['donchian_lower'] = df['low'].rolling(window=period).min()
+    df['donchian_middle'] = (df['donchian_upper'] + df['donchian_lower']) / 2
+    return df
+
+
+def reference_ichimoku(df, period=9, base_period=26, span_period=52, displacement=26):
+    def midpoint(window):
+        return (df['high'].rolling(window=window).max() + df['low'].rolling(window=window).min()) / 2
+
+    df['tenkan_sen'] = midpoint(period)
+    df['kijun_sen'] = midpoint(base_period)
+    df['senkou_span_a'] = ((df['tenkan_sen'] + df['kijun_sen']) / 2).shift(displacement)
+    df['senkou_span_b'] = midpoint(span_period).shift(displacement)
+    return df
+
+
+def reference_keltner(df, period=20, multiplier=2):
+    atr = reference_atr(df.copy(), period)['atr']
+    df['keltner_middle'] = df['close'].ewm(span=period, adjust=False).mean()
+    df['keltner_upper'] = df['keltner_middle'] + multiplier * atr
+    df['keltner_lower'] = df['keltner_middle'] - multiplier * atr
+    return df
+
+
+def reference_roc(df, period=12):
+    df['roc'] = df['close'].pct_change(period) * 100
+    return df
+
+
+def reference_trix(df, period=15):
+    ema3 = df['close'].ewm(span=period, adjust=False).mean()
+    for _ in range(2):
+        ema3 = ema3.ewm(span=period, adjust=False).mean()
+    df['trix'] = ema3.pct_change() * 100
+    return df
+
+
+def reference_wma(df, period=14):
+    df['wma'] = _rolling_wma(df['close'], period)
+    return df
+
+
+def reference_zlema(df, period=14):
+    lag = (period - 1) // 2
+    df['zlema'] = (df['close'] + (df['close'] - df['close'].shift(lag))).ewm(span=period, adjust=False).mean()
+    return df
+
+
+def reference_vwma(df, period=20):
+    df['vwma'] = (df['close'] * df['volume']).rolling(window=period).sum() / df['volume'].rolling(window=period).sum()
+    return df
+
+
+def reference_tema(df, period=14):
+    ema1 = df['close'].ewm(span=period, adjust=False).mean()
+    ema2 = ema1.ewm(span=period, adjust=False).mean()
+    ema3 = ema2.ewm(span=period, adjust=False).mean()
+    df['tema'] = 3 * ema1 - 3 * ema2 + ema3
+    return df
+
+
+def reference_supertrend(df, period=10, multiplier=3):
+    atr = reference_atr(df.copy(), period)['atr'].to_numpy()
+    high, low, close = df['high'].to_numpy(), df['low'].to_numpy(), df['close'].to_numpy()
+    upper = (high + low) / 2 + multiplier * atr
+    lower = (high + low) / 2 - multiplier * atr
+    supertrend = np.full(len(df), np.nan)
+    direction = np.full(len(df), np.nan)
+    for i in range(len(df)):
+        if np.isnan(atr[i]):
+            continue
+        if i == 0 or np.isnan(atr[i - 1]):
+            direction[i] = 1 if close[i] > upper[i] else -1
+        else:
+            if upper[i] >= upper[i - 1] and close[i - 1] <= upper[i - 1]:
+                upper[i] = upper[i - 1]
+            if lower[i] <= lower[i - 1] and close[i - 1] >= lower[i - 1]:
+                lower[i] = lower[i - 1]
+            direction[i] = direction[i - 1]
+            if direction[i] == -1 and close[i] > upper[i]:
+                direction[i] = 1
+            elif direction[i] == 1 and close[i] < lower[i]:
+                direction[i] = -1
+        supertrend[i] = lower[i] if direction[i] == 1 else upper[i]
+    df['supertrend'] = supertrend
+    df['supertrend_direction'] = direction
+    return df
+
+
+def reference_stoch_rsi(df, period=14, fast=3, slow=3):
+    rsi = reference_rsi(df.copy(), period)['rsi']
+    lowest, highest = rsi.rolling(window=period).min(), rsi.rolling(window=period).max()
+    df['stoch_rsi'] = 100 * (rsi - lowest) / (highest - lowest)
+    df['stoch_rsi_k'] = df['stoch_rsi'].rolling(window=fast).mean()
+    df['stoch_rsi_d'] = df['stoch_rsi_k'].rolling(window=slow).mean()
+    return df
+
+
+def reference_ppo(df, period=9, fast=12, slow=26):
+    ema_fast = df['close'].ewm(span=fast, adjust=False).mean()
+    ema_slow = df['close'].ewm(span=slow, adjust=False).mean()
+    df['ppo'] = (ema_fast - ema_slow) / ema_slow * 100
+    df['ppo_signal'] = df['ppo'].ewm(span=period, adjust=False).mean()
+    df['ppo_histogram'] = df['ppo'] - df['ppo_signal']
+    return df
+
+
+def reference_psar(df, step=0.02, max_step=0.2):
+    high, low = df['high'].to_numpy(), df['low'].to_numpy()
+    psar = np.full(len(df), np.nan)
+    direction = np.full(len(df), np.nan)
+    long = high[1] + low[1] >= high[0] + low[0]
+    sar, extreme = (low[0], high[1]) if long else (high[0], low[1])
+    factor = step
+    psar[1], direction[1] = sar, 1 if long else -1
+    for i in range(2, len(df)):
+        sar = sar + factor * (extreme - sar)
+        if long:
+            sar = min(sar, low[i - 1], low[i - 2])
+            if low[i] < sar:
+                long, sar, extreme, factor = False, extreme, low[i], step
+            elif high[i] > extreme:
+                extreme, factor = high[i], min(factor + step, max_step)
+        else:
+            sar = max(sar, high[i - 1], high[i - 2])
+            if high[i] > sar:
+                long, sar, extreme, factor = True, extreme, high[i], step
+            elif low[i] < extreme:
+                extreme, factor = low[i], min(factor + step, max_step)
+        psar[i], direction[i] = sar, 1 if long else -1
+    df['psar'] = psar
+    df['psar_direction'] = direction
+    return df
+
+
+def reference_williams_r(df, period=14):
+    high_max = df['high'].rolling(window=period).max()
+    low_min = df['low'].rolling(window=period).min()
+    df['williams_r'] = (high_max - df['close']) / (high_max - low_min) * -100
+    return df
+
+
+CASES = [
+    (ADX, reference_adx, {}),
+    (ADX, reference_adx, {'period': 30}),
+    (Aroon, reference_aroon, {}),
+    (Aroon, reference_aroon, {'period': 200}),
+    (ATR, reference_atr, {}),
+    (BollingerBands, reference_bollinger, {}),
+    (BollingerBands, reference_bollinger, {'period': 50, 'std': 3}),
+    (CCI, reference_cci, {}),
+    (CCI, reference_cci, {'period': 100}),
+    (ChaikinMoneyFlow, reference_chaikin_money_flow, {}),
+    (ChandeMomentumOscillator, reference_chande_momentum, {}),
+    (CoppockCurve, reference_coppock, {}),
+    (DonchianChannel, reference_donchian, {}),
+    (IchimokuCloud, reference_ichimoku, {}),
+    (IchimokuCloud, reference_ichimoku, {'period': 5, 'base_period': 10, 'span_period': 30, 'displacement': 3}),
+    (KeltnerChannel, reference_keltner, {}),
+    (KeltnerChannel, reference_keltner, {'period': 10, 'multiplier': 1.5}),
+    (EMA, reference_ema, {}),
+    (MACrossover, reference_ma_crossover, {}),
+    (MACrossover, reference_ma_crossover, {'fast_period': 5, 'slow_period': 60}),
+    (MACD, reference_macd, {}),
+    (MFI, reference_mfi, {}),
+    (OBV, reference_obv, {}),
+    (PPO, reference_ppo, {}),
+    (PSAR, reference_psar, {}),
+    (PSAR, reference_psar, {'step': 0.01, 'max_step': 0.1}),
+    (ROC, reference_roc, {}),
+    (RSI, reference_rsi, {}),
+    (RSI, reference_rsi, {'period': 2}),
+    (SMA, reference_sma, {}),
+    (StochasticOscillator, reference_stoch, {}),
+    (StochRSI, reference_stoch_rsi, {}),
+    (Supertrend, reference_supertrend, {}),
+    (Supertrend, reference_supertrend, {'period': 20, 'multiplier': 1.5}),
+    (TEMA, reference_tema, {}),
+    (TRIX, reference_trix, {}),
+    (VWAP, reference_vwap, {}),
+    (VWMA, reference_vwma, {}),
+    (WilliamsR, reference_williams_r, {}),
+    (WilliamsR, reference_williams_r, {'period': 60}),
+    (WMA, reference_wma, {}),
+    (ZLEMA, reference_zlema, {}),
+    (ZLEMA, reference_zlema, {'period': 21}),
+]
+
+
+@pytest.mark.parametrize('indicator_class, reference, params', CASES,
+                         ids=[f'{case[0].__name__}-{case[2]}' for case in CASES])
+def test_compute_matches_pandas_reference(candles, indicator_class, reference, params):
+    expected = reference(candles.copy(), **params)
+    result = indicator_class.compute(candles.copy(), **params)
+
+    defaults = {name: parameter.default for name, parameter in inspect.signature(indicator_class.compute).parameters.items()
+                if parameter.default is not inspect.Parameter.empty}
+    assert list(result.columns) == resolve_outputs(indicator_class, {**defaults, **params})
+    for column in result.columns:
+        np.testing.assert_allclose(result[column].to_numpy(dtype=float), expected[column].to_numpy(dtype=float),
+                                   rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=f'{indicator_class.__name__}.{column}')
+
+
+@pytest.mark.parametrize('indicator_class, reference, params', CASES[:4],
+                         ids=[f'{case[0].__name__}-{case[2]}' for case in CASES[:4]])
+def test_calculate_keeps_the_input_frame(candles, indicator_class, reference, params):
+    df = candles.copy()
+    returned = indicator_class.calculate(df, **params)
+
+    assert returned is df
+    assert set(candles.columns) <= set(df.columns)
+    pd.testing.assert_frame_equal(df[candles.columns], candles)
+
+
+def test_insufficient_data_returns_no_outputs(candles):
+    assert RSI.compute(candles.head(5), period=14).empty
+
+
+def test_psar_reverses_on_a_hand_checked_sequence():
+    # Long from bar 1 (the median rose); bar 2's SAR is clamped to the lows of bars 0-1; bar 4's low
+    # pierces the SAR and bar 6's high pierces the short SAR, each restarting from the extreme point
+    df = pd.DataFrame({'high': [10, 11, 12, 13, 9, 8.5, 14], 'low': [9, 10, 11, 12, 8, 7.5, 12]}, dtype=float)
+    result = PSAR.compute(df, step=0.02, max_step=0.2)
+
+    np.testing.assert_allclose(result['psar'], [np.nan, 9, 9, 9.12, 13, 13, 7.5], equal_nan=True)
+    np.testing.assert_array_equal(result['psar_direction'], [np.nan, 1, 1, 1, -1, -1, 1])
+
+
+def test_supertrend_reverses_on_a_hand_checked_sequence():
+    # period=1 makes the ATR the true range. Bar 2 closes above the held upper band of 12 and turns
+    # the trend up; bar 4 closes below the ratcheted lower band of 9.5 and turns it back down
+    df = pd.DataFrame({'high': [11, 11, 14, 13, 9], 'low': [9, 9, 12, 11, 7], 'close': [10, 10, 13.5, 12, 7.5]}, dtype=float)
+    result = Supertrend.compute(df, period=1, multiplier=1)
+
+    np.testing.assert_allclose(result['supertrend'], [12, 12, 9, 9.5, 13])
+    np.testing.assert_array_equal(result['supertrend_direction'], [-1, -1, 1, 1, -1])
@@ -0,0 +1,114 @@
+# backend/tests/test_planner.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.suite import CONFIG_PATH, load_requests
+from config.indicator_config_loader import IndicatorConfigLoader
+from trading.indicators.atr import ATR
+from trading.indicators.core.context import IndicatorContext, bind_params, resolve_outputs
+from trading.indicators.core.planner import IndicatorPlanner
+from trading.indicators.keltner import KeltnerChannel
+from trading.indicators.macd import MACD
+from trading.indicators.psar import PSAR
+from trading.indicators.rsi import RSI
+from trading.indicators.stoch_rsi import StochRSI
+from trading.indicators.supertrend import Supertrend
+
+"""
+Checks of the indicator dependency graph built from the configured tiers: the planned order, the
+indicator-on-indicator edges, the binding of configured parameters and the executed results.
+"""
+
+TIERS = ('macro', 'daily', 'micro')
+
+
+@pytest.fixture(scope='module')
+def config_loader():
+    return IndicatorConfigLoader(config_path=CONFIG_PATH)
+
+
+@pytest.mark.parametrize('tier', TIERS)
+def test_topological_order_puts_dependencies_first(config_loader, tier):
+    planner = IndicatorPlanner()
+    graph, roots = planner.plan(load_requests(config_loader, tier))
+    order = planner.topological_order(graph)
+
+    assert sorted(order, key=repr) == sorted(graph, key=repr)
+    position = {node: i for i, node in enumerate(order)}
+    for node, dependencies in graph.items():
+        for dependency in dependencies:
+            assert position[dependency] < position[node], f'{planner.describe(dependency)} after {planner.describe(node)}'
+    assert set(roots) <= set(graph)
+
+
+@pytest.mark.parametrize('tier', TIERS)
+def test_configured_params_are_bound(config_loader, tier):
+    planner = IndicatorPlanner()
+    _, roots = planner.plan(load_requests(config_loader, tier))
+    bound = {node[1].__name__: dict(node[2]) for node in roots}
+
+    macd = config_loader.get_indicator_params('MACD', tier)['params']
+    assert bound['MACD']['short_period'] == macd['fast']
+    assert bound['MACD']['long_period'] == macd['slow']
+    psar = config_loader.get_indicator_params('PSAR', tier)['params']
+    assert bound['PSAR'] == {'step': psar['step'], 'max_step': psar['max']}
+
+
+def test_bind_params_applies_aliases_and_defaults():
+    assert bind_params(MACD, {'fast': 5, 'slow': 35, 'period': 14}) == \
+        {'short_period': 5, 'long_period': 35, 'signal_period': 9}
+    assert bind_params(PSAR, {'max': 0.3}) == {'step': 0.02, 'max_step': 0.3}
+    assert bind_params(RSI, None) == {'period': 14}
+
+
+def test_indicator_inputs_become_indicator_nodes():
+    planner = IndicatorPlanner()
+    graph, roots = planner.plan([(KeltnerChannel, {'period': 10}), (Supertrend, {'period': 10}), (StochRSI, {'period': 7})])
+
+    atr = ('indicator', ATR, (('period', 10),))
+    rsi = ('indicator', RSI, (('period', 7),))
+    assert graph[roots[0]] == {('ema', 'close', 10), atr}
+    assert graph[roots[1]] == {atr}
+    assert graph[roots[2]] == {rsi}
+    # The shared ATR node is planned once, with its own inputs
+    assert graph[atr] == {('true_range',)}
+    assert graph[rsi] == {('gains',), ('losses',)}
+    assert len(graph) == 9
+
+
+def test_duplicate_requests_share_a_node():
+    graph, roots = IndicatorPlanner().plan([(RSI, {}), (RSI, {'period': 14}), (MACD, {'fast': 12})])
+
+    assert len(roots) == 2
+    assert sum(node[0] == 'indicator' and node[1] is RSI for node in graph) == 1
+
+
+def test_cycles_are_rejected():
+    graph = {('a',): {('b',)}, ('b',): {('a',)}}
+
+    with pytest.raises(ValueError):
+        IndicatorPlanner().topological_order(graph)
+
+
+@pytest.mark.parametrize('tier', TIERS)
+def test_execute_matches_compute(candles, config_loader, tier):
+    requests = load_requests(config_loader, tier)
+    results = IndicatorPlanner(max_workers=4).execute(requests, IndicatorContext(candles))
+
+    assert len(results) == len(requests)
+    for (indicator_class, params), result in results.items():
+        params = dict(params)
+        expected = indicator_class.compute(candles, **params)
+        assert list(result.columns) == resolve_outputs(indicator_class, params)
+        pd.testing.assert_frame_equal(result, expected[result.columns], check_exact=False, rtol=1e-12,
+                                      obj=indicator_class.__name__)
+
+
+def test_a_failing_dependency_skips_its_dependents(candles):
+    # Without 'high' the ATR (and Keltner on top of it) fail; the RSI branch still runs
+    df = candles.drop(columns=['high'])
+    results = IndicatorPlanner().execute([(KeltnerChannel, {}), (RSI, {})], IndicatorContext(df))
+
+    assert [indicator_class for indicator_class, _ in results] == [RSI]
+    assert not np.isnan(results[(RSI, (('period', 14),))]['rsi'].iloc[-1])
@@ -0,0 +1,92 @@
+# backend/tests/test_pricing.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from simulator.server import OandaSimulator
+from trading.brokers.oanda_client import PRICING_TTL, OandaClient
+from trading.brokers.pricing import PricingSnapshot
+from trading.brokers.rate_limiter import PriorityRateLimiter
+
+
+@pytest.fixture
+def simulator():
+    with OandaSimulator(history_bars=100) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def client(simulator):
+    client = OandaClient(base_url=simulator.base_url, rate_limiter=PriorityRateLimiter(1000))
+    yield client
+    client.close()
+
+
+def pricing_requests(simulator):
+    return simulator.stats[('pricing', 200)]
+
+
+def test_calls_within_the_ttl_share_one_request(simulator, client):
+    first = client.get_pricing(['EUR_USD', 'USD_JPY'])
+    second = client.get_pricing(['usd_jpy'])
+
+    assert second is first
+    assert pricing_requests(simulator) == 1
+
+
+def test_max_age_zero_forces_a_request(simulator, client):
+    client.get_pricing(['EUR_USD'])
+    client.get_pricing(['EUR_USD'], max_age=0)
+
+    assert pricing_requests(simulator) == 2
+
+
+def test_an_expired_snapshot_is_refetched(simulator, client):
+    client.get_pricing(['EUR_USD'])
+    time.sleep(PRICING_TTL + 0.05)
+    client.get_pricing(['EUR_USD'])
+
+    assert pricing_requests(simulator) == 2
+
+
+def test_a_new_instrument_refetches_the_combined_list(simulator, client):
+    client.get_pricing(['EUR_USD', 'GBP_USD'])
+    snapshot = client.get_pricing(['USD_JPY'])
+
+    assert pricing_requests(simulator) == 2
+    assert set(snapshot.instruments) == {'EUR_USD', 'GBP_USD', 'USD_JPY'}
+    # The combined snapshot now serves every earlier caller from the cache
+    assert client.get_pricing(['GBP_USD', 'EUR_USD']) is snapshot
+    assert pricing_requests(simulator) == 2
+
+
+def test_concurrent_callers_wait_for_the_fetch_in_flight():
+    with OandaSimulator(latency=0.2, history_bars=100) as simulator:
+        client = OandaClient(base_url=simulator.base_url, rate_limiter=PriorityRateLimiter(1000))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            snapshots = list(executor.map(lambda _: client.get_pricing(['EUR_USD']), range(8)))
+        client.close()
+
+    assert pricing_requests(simulator) == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+
+
+def test_snapshot_decodes_the_best_quotes():
+    snapshot = PricingSnapshot.from_prices([
+        {'instrument': 'EUR_USD', 'time': '2024-01-02T10:00:00.500000000Z', 'tradeable': True,
+         'bids': [{'price': '1.10000'}, {'price': '1.09990'}], 'asks': [{'price': '1.10020'}]},
+        {'instrument': 'USD_JPY', 'time': '2024-01-02T10:00:01.000000000Z', 'status': 'non-tradeable',
+         'bids': [], 'asks': [{'price': '140.010'}]},
+    ])
+
+    np.testing.assert_array_equal(snapshot.bid, [1.1, np.nan])
+    np.testing.assert_array_equal(snapshot.ask, [1.1002, 140.01])
+    np.testing.assert_allclose(snapshot.mid[:1], [1.1001])
+    np.testing.assert_allclose(snapshot.spread[:1], [0.0002])
+    assert snapshot.times.tolist() == [1704189600, 1704189601]
+    assert snapshot.tradeable.tolist() == [True, False]
+    assert snapshot.covers(['USD_JPY']) and 'GBP_USD' not in snapshot
+    assert snapshot.to_dict(['EUR_USD'])['EUR_USD']['time'] == '2024-01-02T10:00:00.000000000Z'
+    assert snapshot.price('EUR_USD')['bid'] == 1.1
@@ -0,0 +1,128 @@
+# backend/tests/test_rate_limiter.py
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import trading.brokers.rate_limiter as rate_limiter
+from trading.brokers.rate_limiter import (PRIORITY_ACCOUNT, PRIORITY_HISTORY, PRIORITY_NAMES, PRIORITY_ORDER,
+                                          PriorityRateLimiter)
+
+"""
+Checks of the OANDA rate limiter: the refill rate and burst, the order in which queued priority
+classes are served, and the metrics it reports.
+
+The limiter reads a fake monotonic clock, so each refill is an explicit step of the test; waiters
+still block on the real condition variable.
+"""
+
+RATE = 4.0
+TICK = 1 / RATE  # Clock step that refills exactly one token
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, 'time', SimpleNamespace(monotonic=clock, sleep=time.sleep))
+    return clock
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_refill_rate_and_burst(clock):
+    limiter = PriorityRateLimiter(rate=RATE, burst=2)
+
+    assert [limiter.try_acquire() for _ in range(3)] == [True, True, False]
+    clock.now += TICK
+    assert [limiter.try_acquire() for _ in range(2)] == [True, False]
+    clock.now += TICK / 2
+    assert not limiter.try_acquire()
+    clock.now += TICK / 2
+    assert limiter.try_acquire()
+    # A long idle spell refills at most the burst
+    clock.now += 100
+    assert [limiter.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+def test_acquire_paces_callers_at_the_rate():
+    # Real clock: 1 token up front, then 10 more at 100 per second
+    limiter = PriorityRateLimiter(rate=100, burst=1)
+    started = time.monotonic()
+    for _ in range(11):
+        limiter.acquire()
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_queued_classes_are_served_by_priority(clock):
+    limiter = PriorityRateLimiter(rate=RATE, burst=1)
+    assert limiter.acquire(priority=PRIORITY_ORDER) == 0.0
+
+    served, lock = [], threading.Lock()
+
+    def request(priority):
+        limiter.acquire(priority=priority)
+        with lock:
+            served.append(PRIORITY_NAMES[priority])
+
+    # Queue in the reverse of the serving order: history first, the order last
+    threads = []
+    for priority in (PRIORITY_HISTORY, PRIORITY_HISTORY, PRIORITY_ACCOUNT, PRIORITY_ORDER):
+        name = PRIORITY_NAMES[priority]
+        queued = limiter.metrics()['classes'][name]['queue_depth']
+        thread = threading.Thread(target=request, args=(priority,), daemon=True)
+        thread.start()
+        threads.append(thread)
+        _wait_for(lambda: limiter.metrics()['classes'][name]['queue_depth'] == queued + 1)
+
+    # Refill one token at a time and wake the head of the queue
+    for count in range(1, len(threads) + 1):
+        clock.now += TICK
+        with limiter._condition:
+            limiter._condition.notify_all()
+        _wait_for(lambda: len(served) == count)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert served == ['order', 'account', 'history', 'history']
+
+    metrics = limiter.metrics()
+    assert metrics['rate'] == RATE
+    assert metrics['tokens'] == 0.0
+    # The order waited one tick, the account two, the history requests three and four
+    assert metrics['classes'] == {
+        'order': {'queue_depth': 0, 'granted': 2, 'wait_mean': TICK / 2, 'wait_max': TICK},
+        'account': {'queue_depth': 0, 'granted': 1, 'wait_mean': 2 * TICK, 'wait_max': 2 * TICK},
+        'history': {'queue_depth': 0, 'granted': 2, 'wait_mean': 3.5 * TICK, 'wait_max': 4 * TICK},
+    }
+
+
+def test_try_acquire_does_not_jump_the_queue(clock):
+    limiter = PriorityRateLimiter(rate=RATE, burst=1)
+    limiter.acquire()
+    thread = threading.Thread(target=limiter.acquire, daemon=True)
+    thread.start()
+    _wait_for(lambda: limiter.metrics()['classes']['history']['queue_depth'] == 1)
+
+    assert not limiter.try_acquire(priority=PRIORITY_ORDER)
+
+    clock.now += TICK
+    with limiter._condition:
+        limiter._condition.notify_all()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert limiter.metrics()['classes']['order']['granted'] == 0
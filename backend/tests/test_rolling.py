@@ -0,0 +1,70 @@
+# backend/tests/test_rolling.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.indicators.core import rolling
+from trading.indicators.core.rolling import DEQUE_MIN_WINDOW, RollingMax, RollingMin
+
+"""
+Checks of the rolling extrema against pandas, on values full of ties and with NaN gaps, for windows
+on both sides of DEQUE_MIN_WINDOW (where the position kernels switch from NumPy to the deque).
+"""
+
+WINDOWS = [1, 5, DEQUE_MIN_WINDOW - 1, DEQUE_MIN_WINDOW, DEQUE_MIN_WINDOW + 72]
+
+
+@pytest.fixture
+def values():
+    # Few distinct levels, so most windows hold tied extrema, and NaN gaps of 1 and 3 bars
+    values = np.random.default_rng(11).integers(0, 8, 1200).astype(float)
+    values[[40, 400, 401, 402, 900]] = np.nan
+    return values
+
+
+def _pandas(values, window, method):
+    return getattr(pd.Series(values).rolling(window=window), method)().to_numpy()
+
+
+def _pandas_position(values, window, pick):
+    return pd.Series(values).rolling(window=window).apply(pick, raw=True).to_numpy()
+
+
+@pytest.mark.parametrize('window', WINDOWS)
+def test_batch_extrema_match_pandas(values, window):
+    np.testing.assert_array_equal(rolling.rolling_max(values, window), _pandas(values, window, 'max'))
+    np.testing.assert_array_equal(rolling.rolling_min(values, window), _pandas(values, window, 'min'))
+
+
+@pytest.mark.parametrize('window', WINDOWS)
+def test_positions_match_pandas_and_pick_the_oldest_tie(values, window):
+    np.testing.assert_array_equal(rolling.rolling_argmax(values, window), _pandas_position(values, window, np.argmax))
+    np.testing.assert_array_equal(rolling.rolling_argmin(values, window), _pandas_position(values, window, np.argmin))
+
+
+@pytest.mark.parametrize('window', WINDOWS)
+def test_incremental_extrema_match_pandas(values, window):
+    for stream_class, method, pick in ((RollingMax, 'max', np.argmax), (RollingMin, 'min', np.argmin)):
+        stream = stream_class(window)
+        extrema, positions = [], []
+        for value in values:
+            extrema.append(stream.update(value))
+            positions.append(stream.position)
+
+        np.testing.assert_array_equal(extrema, _pandas(values, window, method), err_msg=method)
+        np.testing.assert_array_equal(positions, _pandas_position(values, window, pick), err_msg=method)
+
+
+@pytest.mark.parametrize('window', [5, DEQUE_MIN_WINDOW + 72])
+def test_stacked_columns_are_independent(values, window):
+    stacked = np.column_stack([values, values[::-1]])
+
+    for function in (rolling.rolling_max, rolling.rolling_min, rolling.rolling_argmax, rolling.rolling_argmin):
+        result = function(stacked, window)
+        np.testing.assert_array_equal(result[:, 0], function(values, window))
+        np.testing.assert_array_equal(result[:, 1], function(values[::-1], window))
+
+
+def test_window_must_be_positive():
+    with pytest.raises(ValueError):
+        RollingMax(0)
@@ -0,0 +1,94 @@
+# backend/tests/test_simulator.py
+import json
+
+import pytest
+import requests
+
+from api.services.backfill_service import plan_windows
+from config.secrets import defs
+from simulator.pricing import CandleHistory
+from simulator.server import OandaSimulator
+from trading.brokers.oanda_client import OandaClient
+from trading.brokers.rate_limiter import PriorityRateLimiter
+
+
+@pytest.fixture(scope='module')
+def simulator():
+    with OandaSimulator(history_bars=3000) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def client(simulator):
+    client = OandaClient(base_url=simulator.base_url, rate_limiter=PriorityRateLimiter(1000))
+    yield client
+    client.close()
+
+
+def test_history_is_reproducible_per_seed():
+    first, again, other = (CandleHistory(1704153600, bars=200, seed=seed).query('EUR_USD', 'H1', count=200)
+                           for seed in (1, 1, 2))
+
+    assert first == again
+    assert first != other
+    assert first[-1]['time'] == '2024-01-01T23:00:00.000000000Z'
+
+
+def test_candle_windows_tile_the_history(simulator, client):
+    windows = plan_windows('M1', '2024-01-01T00:00:00Z', '2024-01-02T00:00:00Z', max_candles=500)
+
+    candles = [candle for from_time, to_time in windows
+               for candle in client.fetch_historical_data('EUR_USD', 'M1', from_time=from_time, to_time=to_time)]
+
+    assert len(candles) == 1440
+    assert candles == simulator.history.query('EUR_USD', 'M1', count=1440)
+
+
+def test_candles_reject_count_with_both_bounds(simulator):
+    response = requests.get(f'{simulator.base_url}/instruments/EUR_USD/candles', params={
+        'granularity': 'M1', 'count': 10, 'from': '2024-01-01T00:00:00Z', 'to': '2024-01-01T01:00:00Z'})
+
+    assert response.status_code == 400
+
+
+def test_market_orders_fill_and_net_positions(simulator, client):
+    fill = client.place_order({'order': {'type': 'MARKET', 'instrument': 'GBP_USD', 'units': '1000'}})
+    client.place_order({'order': {'type': 'MARKET', 'instrument': 'GBP_USD', 'units': '-400'}})
+    client.place_order({'order': {'type': 'LIMIT', 'instrument': 'GBP_USD', 'units': '10', 'price': '1.0'}})
+
+    assert float(fill['orderFillTransaction']['price']) > 0
+    positions = {position['instrument']: position for position in client.get_positions()['positions']}
+    assert positions['GBP_USD']['long']['units'] == '600'
+    assert [order['type'] for order in client.get_orders()['orders']] == ['LIMIT']
+
+
+def test_rate_limit_answers_429_with_retry_after():
+    with OandaSimulator(rate_limit=5, history_bars=100) as simulator:
+        with requests.Session() as session:
+            responses = [session.get(f'{simulator.base_url}/accounts/{defs.ACCOUNT_ID}') for _ in range(15)]
+
+    throttled = [response for response in responses if response.status_code == 429]
+    assert throttled and all(response.headers['Retry-After'] == '1' for response in throttled)
+    assert simulator.stats[('account', 200)] + simulator.stats[('account', 429)] == 15
+
+
+def test_injected_errors_are_retried_by_the_client():
+    with OandaSimulator(error_rate=1.0, history_bars=100) as simulator:
+        client = OandaClient(base_url=simulator.base_url, max_retries=2, rate_limiter=PriorityRateLimiter(1000))
+        with pytest.raises(requests.HTTPError):
+            client.get_account()
+        client.close()
+
+    assert simulator.stats[('account', 503)] == 3
+
+
+def test_price_stream_sends_prices_and_heartbeats_until_disconnect():
+    with OandaSimulator(tick_interval=0.02, heartbeat_interval=0.1, disconnect_after=0.5, history_bars=100) as simulator:
+        response = requests.get(f'{simulator.stream_url}/accounts/{defs.ACCOUNT_ID}/pricing/stream',
+                                params={'instruments': 'EUR_USD,USD_JPY'}, stream=True, timeout=5)
+        messages = [json.loads(line) for line in response.iter_lines() if line]
+
+    prices = [message for message in messages if message['type'] == 'PRICE']
+    assert {message['instrument'] for message in prices} == {'EUR_USD', 'USD_JPY'}
+    assert any(message['type'] == 'HEARTBEAT' for message in messages)
+    assert all(float(message['bids'][0]['price']) < float(message['asks'][0]['price']) for message in prices)
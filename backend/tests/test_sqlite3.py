@@ -0,0 +1,43 @@
+# backend/tests/test_sqlite3.py
+import pandas as pd
+import pytest
+
+from data.repositories.sqlite3 import INSERT_INDICATOR_SQL, INSERT_SERIES_SQL, SQLiteDB, param_hash
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLiteDB(str(tmp_path / 'indicators.db'))
+    db.initialize_db()
+    return db
+
+
+class UnreadableRows(list):
+    def __iter__(self):
+        raise RuntimeError('rows cannot be read')
+
+
+def test_writer_fails_only_the_bad_batch_and_keeps_running(db):
+    bad = db.writer.submit(INSERT_INDICATOR_SQL, UnreadableRows([('RSI', 'momentum')]))
+    good = db.writer.submit(INSERT_INDICATOR_SQL, [('RSI', 'momentum')])
+    db.writer.flush()
+
+    assert isinstance(bad.exception(), RuntimeError)
+    assert good.result() == 1
+    later = db.writer.submit(INSERT_INDICATOR_SQL, [('ATR', 'volatility')])
+    db.writer.flush()
+    assert later.result() == 1
+
+
+def test_series_is_registered_with_the_declared_outputs(db):
+    with pytest.raises(ValueError):
+        db.get_series('EUR_USD', 'D', 'RSI', {'period': 14}, outputs=[])
+
+    # A series registered without outputs by an earlier version is repaired on the next write
+    db.conn.execute(INSERT_SERIES_SQL, ('EUR_USD', 'D', 'ATR', param_hash({'period': 14}), '{}', '[]'))
+    db.conn.commit()
+    times = pd.date_range('2024-01-01', periods=3, freq='D', tz='UTC')
+    db.store_indicator_frame('EUR_USD', 'D', 'ATR', {'period': 14}, times, pd.DataFrame({'atr': [1.0, 2.0, 3.0]}),
+                             outputs=['atr'], wait=True)
+
+    assert db.get_latest_indicator_values('EUR_USD', 'D', 'ATR', {'period': 14})['atr'].tolist() == [1.0, 2.0, 3.0]
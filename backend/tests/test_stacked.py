@@ -0,0 +1,61 @@
+# backend/tests/test_stacked.py
+import pandas as pd
+import pytest
+
+from api.controllers.indicators_controller import IndicatorsController
+from benchmarks.synthetic import generate_candles
+from trading.indicators.core.planner import IndicatorPlanner, discover_indicators
+from trading.indicators.core.stacked import StackedFrame
+
+"""
+Checks that the stacked (bars x instruments) run gives every instrument the results of its own run,
+when the instruments' histories have different lengths and are right-aligned with NaN padding.
+"""
+
+# Lengths above every default warm-up, so each instrument also gets rows when run on its own
+LENGTHS = {'EUR_USD': 600, 'GBP_USD': 420, 'USD_JPY': 250}
+
+
+@pytest.fixture
+def frames():
+    frames = {}
+    for seed, (instrument, bars) in enumerate(LENGTHS.items()):
+        df = generate_candles(bars, seed=seed)
+        # Distinct indexes, which `split` must restore
+        df.index = pd.RangeIndex(1000 * seed, 1000 * seed + bars)
+        frames[instrument] = df
+    return frames
+
+
+@pytest.fixture
+def controller():
+    # The calculation methods need only the planner, not the database and config handles
+    controller = IndicatorsController.__new__(IndicatorsController)
+    controller.planner = IndicatorPlanner(max_workers=2)
+    return controller
+
+
+def test_stack_and_split_round_trip(frames):
+    stacked = StackedFrame.stack(frames)
+
+    assert len(stacked) == max(LENGTHS.values())
+    padding = len(stacked) - LENGTHS['USD_JPY']
+    assert stacked['close']['USD_JPY'].iloc[:padding].isna().all()
+    assert stacked['close']['USD_JPY'].iloc[padding:].notna().all()
+    for instrument, df in stacked.split().items():
+        pd.testing.assert_frame_equal(df[['open', 'high', 'low', 'close', 'volume']],
+                                      frames[instrument][['open', 'high', 'low', 'close', 'volume']])
+
+
+def test_stacked_results_match_separate_runs(controller, frames):
+    requests = [(indicator_class, {}) for _, indicator_class in sorted(discover_indicators().items())]
+    stacked_results = controller.calculate_stacked_indicators(requests, frames, 'M1')
+
+    assert set(stacked_results) == set(frames)
+    for instrument, df in frames.items():
+        separate = controller.calculate_indicators(requests, df, instrument, 'M1')
+        assert set(stacked_results[instrument]) == set(separate)
+        for (indicator_class, params), expected in separate.items():
+            result = stacked_results[instrument][(indicator_class, params)]
+            pd.testing.assert_frame_equal(result, expected, check_dtype=False, check_exact=False, rtol=1e-9, atol=1e-9,
+                                          obj=f'{indicator_class.__name__} of {instrument}')
@@ -0,0 +1,30 @@
+# backend/tests/test_stream_ingestion_service.py
+import time
+
+from api.services.stream_ingestion_service import StreamIngestionService
+from data.repositories.candle_store import CandleStore
+from simulator.server import OandaSimulator
+from trading.brokers.price_stream import PriceStream
+
+
+def test_streamed_ticks_are_stored_as_candles(mongo_handler, tmp_path):
+    closed = []
+    store = CandleStore(str(tmp_path))
+    # 600 simulated seconds per second: an M1 candle closes every 0.1 s
+    with OandaSimulator(speed=600, tick_interval=0.01, heartbeat_interval=0.1) as simulator:
+        stream = PriceStream(['EUR_USD', 'USD_JPY'], stream_url=simulator.stream_url, heartbeat_timeout=2)
+        service = StreamIngestionService(mongo_handler, ['EUR_USD', 'USD_JPY'], granularities=('M1',),
+                                         price_stream=stream, candle_store=store, flush_interval=0.1,
+                                         on_candle=lambda *candle: closed.append(candle))
+        service.start()
+        time.sleep(1.5)
+        service.stop()
+
+    documents = list(mongo_handler.db['eur_usd_m1_data'].find({}, {'_id': 0}).sort('time', 1))
+    times = [document['time'] for document in documents]
+    assert len(documents) >= 5
+    assert len(set(times)) == len(times)
+    assert all(document['complete'] and document['volume'] > 0 for document in documents)
+    assert [candle['time'] for instrument, _, candle in closed if instrument == 'EUR_USD'] == times
+    assert store.count('EUR_USD', 'M1') == len(documents)
+    assert mongo_handler.db['usd_jpy_m1_data'].count_documents({}) >= 5
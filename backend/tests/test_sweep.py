@@ -0,0 +1,84 @@
+# backend/tests/test_sweep.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.indicators.adx import ADX
+from trading.indicators.atr import ATR
+from trading.indicators.cci import CCI
+from trading.indicators.core import sweep
+from trading.indicators.macd import MACD
+from trading.indicators.rsi import RSI
+
+"""
+Checks of the parameter sweeps: every column of `sweep(df, periods)` must equal the single-period
+`compute` with that period, whatever the order, repetition or size of the periods.
+"""
+
+SWEEPS = [(ADX, 'adx'), (ATR, 'atr'), (CCI, 'cci'), (RSI, 'rsi')]
+
+# Unsorted, with a repeat and the degenerate period 1
+PERIODS = [14, 1, 30, 5, 14, 2]
+
+
+@pytest.mark.parametrize('indicator_class, output', SWEEPS, ids=[case[0].__name__ for case in SWEEPS])
+def test_sweep_columns_match_compute(candles, indicator_class, output):
+    result = indicator_class.sweep(candles, PERIODS)
+
+    assert result.shape == (len(candles), len(PERIODS))
+    for column, period in enumerate(PERIODS):
+        expected = indicator_class.compute(candles, period=period)[output].to_numpy(dtype=float)
+        np.testing.assert_allclose(result[:, column], expected, rtol=1e-8, atol=1e-8, equal_nan=True,
+                                   err_msg=f'{indicator_class.__name__} period {period}')
+
+
+@pytest.mark.parametrize('indicator_class, output', SWEEPS, ids=[case[0].__name__ for case in SWEEPS])
+def test_sweep_period_longer_than_the_data(candles, indicator_class, output):
+    df = candles.head(40)
+    result = indicator_class.sweep(df, [10, 41])
+
+    np.testing.assert_allclose(result[:, 0], indicator_class.compute(df, period=10)[output].to_numpy(dtype=float),
+                               rtol=1e-8, atol=1e-8, equal_nan=True)
+    # compute() returns no rows there; the sweep keeps its shape with the warm-up value throughout
+    assert indicator_class.compute(df, period=41).empty
+    warm_up = result[0, 1]
+    assert np.isnan(warm_up) or warm_up == 0
+    np.testing.assert_array_equal(result[:, 1], np.full(len(df), warm_up))
+
+
+def test_macd_sweep_columns_match_compute(candles):
+    short_periods, long_periods, signal_periods = [12, 5, 12, 3], [26, 35, 26, 50], [9, 5, 9, 1]
+    result = MACD.sweep(candles, short_periods, long_periods, signal_periods)
+
+    for column, (short, long, signal) in enumerate(zip(short_periods, long_periods, signal_periods)):
+        expected = MACD.compute(candles, short_period=short, long_period=long, signal_period=signal)
+        for name in ('macd', 'signal', 'histogram'):
+            np.testing.assert_allclose(result[name][:, column], expected[name].to_numpy(dtype=float),
+                                       rtol=1e-9, atol=1e-12, err_msg=f'{name} {short}/{long}/{signal}')
+
+
+def test_macd_sweep_broadcasts_scalars(candles):
+    result = MACD.sweep(candles, 12, [20, 26, 40], 9)
+
+    assert result['macd'].shape == (len(candles), 3)
+    expected = MACD.compute(candles, short_period=12, long_period=40, signal_period=9)
+    np.testing.assert_allclose(result['signal'][:, 2], expected['signal'].to_numpy(dtype=float), rtol=1e-9, atol=1e-12)
+
+
+def test_rolling_kernels_match_pandas_with_gaps_and_flat_runs():
+    values = np.array([1.0, 2.0, np.nan, 4.0, 4.0, 4.0, 4.0, -1.0, np.inf, 3.0, 2.5, 2.5, 7.0])
+    periods = [3, 1, 2, 3, 20]
+    sums, means = sweep.rolling_sum(values, periods), sweep.rolling_mean(values, periods)
+
+    for column, period in enumerate(periods):
+        rolling = pd.Series(values).replace(np.inf, np.nan).rolling(window=period)
+        np.testing.assert_allclose(sums[:, column], rolling.sum().to_numpy(), rtol=1e-12, equal_nan=True)
+        np.testing.assert_allclose(means[:, column], rolling.mean().to_numpy(), rtol=1e-12, equal_nan=True)
+    # A window of identical values is exact, as in pandas
+    assert sums[6, 0] == 12.0
+
+
+@pytest.mark.parametrize('periods', [[], [3, 0], [[2, 3]]])
+def test_invalid_periods_are_rejected(periods):
+    with pytest.raises(ValueError):
+        sweep.as_periods(periods)
@@ -0,0 +1,250 @@
+# backend/trading/brokers/async_oanda_client.py
+import asyncio
+
+import aiohttp
+from config.secrets import defs
+from logs.log_manager import LogManager
+from trading.brokers.oanda_client import DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT, MAX_RETRIES, RETRY_STATUSES, backoff_delay
+from trading.brokers.pricing import PricingSnapshot
+from trading.brokers.rate_limiter import PRIORITY_ACCOUNT, PRIORITY_HISTORY, PRIORITY_ORDER, get_rate_limiter
+
+# Initialize the logger
+logger = LogManager('oanda_client_logs').get_logger()
+
+"""
+Asyncio client for the OANDA v20 API, with the surface of OandaClient.
+
+All requests share one aiohttp session, i.e. one pool of keep-alive connections, and at most
+`max_concurrency` requests are in flight at a time, so many instruments can be fetched concurrently
+without opening a connection per request. Retries, backoff and the process-wide priority rate
+limiter work as in OandaClient.
+
+The session belongs to the event loop it was opened on: use the client as `async with` inside one
+`asyncio.run(...)`. Threads without a loop (the population service, the trading loop) can run a batch
+of candle fetches with `fetch_candles_concurrently`.
+"""
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class AsyncOandaClient:
+    def __init__(self, environment='practice', base_url=None, timeout=DEFAULT_TIMEOUT, pool_size=DEFAULT_POOL_SIZE,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY, max_retries=MAX_RETRIES, rate_limiter=None):
+        """
+        Initializes the AsyncOandaClient with the provided environment.
+
+        :param environment: The trading environment to use ('live' or 'practice').
+        :param base_url: Optional API URL overriding the environment's (e.g., a local OANDA stand-in).
+        :param timeout: (connect, read) timeout of every request in seconds.
+        :param pool_size: Keep-alive connections held open to OANDA.
+        :param max_concurrency: Requests in flight at a time.
+        :param max_retries: Retries of a throttled or failed request before giving up.
+        :param rate_limiter: Limiter every request waits on (defaults to the process-wide one).
+        """
+        self.environment = environment
+        self.base_url = base_url or (defs.OANDA_URL_D if environment == 'practice' else defs.OANDA_URL_L)
+        self.headers = defs.SECURE_HEADER
+        self.account_id = defs.ACCOUNT_ID
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def open(self):
+        """
+        Open the pooled session on the running event loop (done by the first request if needed).
+        """
+        if self.session is None or self.session.closed:
+            connect_timeout, read_timeout = self.timeout
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30)
+            # aiohttp asks for gzip-compressed responses and decompresses them itself
+            self.session = aiohttp.ClientSession(
+                headers=self.headers, connector=connector,
+                timeout=aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout))
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self):
+        """
+        Close the pooled connections.
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _acquire_token(self, priority):
+        # The limiter is shared with the threads of the process; only block a worker thread on it
+        if not self.rate_limiter.try_acquire(priority=priority):
+            await asyncio.to_thread(self.rate_limiter.acquire, priority=priority)
+
+    async def request(self, method, path, priority=PRIORITY_ACCOUNT, **kwargs):
+        """
+        Send a request through the pooled session, retrying throttled and failed attempts.
+
+        GET requests are retried on connection errors, timeouts, 429 and 5xx responses; other
+        methods only on 429, so an order is never sent twice.
+
+        :param method: HTTP method ('GET', 'POST', ...).
+        :param path: Path below the API URL (e.g., '/accounts/<id>/orders').
+        :param priority: Rate limiter priority class of the request.
+        :param kwargs: Passed to `aiohttp.ClientSession.request` (params, json, ...).
+        :return: The decoded JSON body.
+        """
+        await self.open()
+        idempotent = method.upper() == 'GET'
+        url = f'{self.base_url}{path}'
+        attempt = 0
+        async with self._semaphore:
+            while True:
+                await self._acquire_token(priority)
+                try:
+                    async with self.session.request(method, url, **kwargs) as response:
+                        retryable = response.status == 429 or (idempotent and response.status in RETRY_STATUSES)
+                        if not retryable or attempt >= self.max_retries:
+                            response.raise_for_status()
+                            return await response.json()
+                        delay = backoff_delay(attempt, response.headers.get('Retry-After'))
+                        logger.warning(f"{method} {path} returned {response.status}; retrying in {delay:.2f}s.")
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if not idempotent or attempt >= self.max_retries:
+                        raise
+                    delay = backoff_delay(attempt)
+                    logger.warning(f"{method} {path} failed ({e!r}); retrying in {delay:.2f}s.")
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def get_account(self):
+        """
+        Retrieves account details from OANDA.
+
+        :return: A dictionary containing account details.
+        """
+        try:
+            return await self.request('GET', f'/accounts/{self.account_id}')
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to retrieve account details: {e}")
+            raise
+
+    async def place_order(self, order_data):
+        """
+        Places a new order with OANDA.
+
+        :param order_data: A dictionary containing order details.
+        :return: A dictionary containing the response from OANDA.
+        """
+        try:
+            return await self.request('POST', f'/accounts/{self.account_id}/orders', priority=PRIORITY_ORDER, json=order_data)
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to place order: {e}")
+            raise
+
+    async def get_orders(self):
+        """
+        Retrieves a list of open orders from OANDA.
+
+        :return: A dictionary containing the list of open orders.
+        """
+        try:
+            return await self.request('GET', f'/accounts/{self.account_id}/orders')
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to retrieve orders: {e}")
+            raise
+
+    async def get_positions(self):
+        """
+        Retrieves current positions from OANDA.
+
+        :return: A dictionary containing current positions.
+        """
+        try:
+            return await self.request('GET', f'/accounts/{self.account_id}/positions')
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to retrieve positions: {e}")
+            raise
+
+    async def get_pricing(self, instruments):
+        """
+        Retrieves the current prices of several instruments in one request.
+
+        :param instruments: Iterable of instruments (e.g., ['EUR_USD', 'USD_JPY']).
+        :return: A PricingSnapshot of the instruments (uncached; see OandaClient.get_pricing).
+        """
+        params = {'instruments': ','.join(instrument.upper() for instrument in instruments)}
+        try:
+            data = await self.request('GET', f'/accounts/{self.account_id}/pricing', params=params)
+            return PricingSnapshot.from_prices(data.get('prices', []))
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to retrieve pricing for {params['instruments']}: {e}")
+            raise
+
+    async def fetch_historical_data(self, instrument, granularity='M1', count=500, from_time=None, to_time=None,
+                                    include_first=True, priority=PRIORITY_HISTORY):
+        """
+        Retrieves historical candle data for a specific instrument from OANDA.
+
+        Takes the parameters of `OandaClient.fetch_historical_data`.
+
+        :return: A list of candle data.
+        """
+        params = {'granularity': granularity, 'count': count}
+        if from_time is not None:
+            params['from'] = from_time
+            params['includeFirst'] = 'true' if include_first else 'false'
+        if to_time is not None:
+            params['to'] = to_time
+        if from_time is not None and to_time is not None:
+            del params['count']
+        try:
+            data = await self.request('GET', f'/instruments/{instrument}/candles', priority=priority, params=params)
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to fetch historical data for {instrument}: {e}")
+            raise
+        if 'candles' in data:
+            logger.info(f"Successfully fetched {len(data['candles'])} candles for {instrument}")
+            return data['candles']
+        logger.error(f"Unexpected response format: {data}")
+        return []
+
+    async def fetch_candles_since(self, instrument, granularity='M1', count=5000, last_time=None):
+        """
+        Fetch the candles from `last_time` onwards, window after window, or the latest `count` candles
+        when `last_time` is None (the incremental fetch of `MongoDBHandler.populate_historical_data`).
+
+        :return: The candles; the one at `last_time` (possibly still forming) is included.
+        """
+        if last_time is None:
+            return await self.fetch_historical_data(instrument, granularity, count)
+        candles = []
+        while True:
+            window = await self.fetch_historical_data(instrument, granularity, count, from_time=last_time)
+            candles.extend(window if not candles else [candle for candle in window if candle['time'] > last_time])
+            if len(window) < count or window[-1]['time'] == last_time:
+                return candles
+            last_time = window[-1]['time']
+
+
+async def _fetch_all(requests, client_options):
+    async with AsyncOandaClient(**client_options) as client:
+        return await asyncio.gather(
+            *(client.fetch_candles_since(**request) for request in requests), return_exceptions=True)
+
+
+def fetch_candles_concurrently(requests, **client_options):
+    """
+    Run a batch of candle fetches concurrently from synchronous code (a thread without an event loop).
+
+    :param requests: List of keyword dicts for `AsyncOandaClient.fetch_candles_since`
+        (instrument, granularity, count, last_time).
+    :param client_options: Keyword arguments of AsyncOandaClient (environment, base_url, ...).
+    :return: One result per request, in order: the list of candles, or the exception it raised.
+    """
+    return asyncio.run(_fetch_all(requests, client_options))
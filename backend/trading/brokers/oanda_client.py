@@ -1,21 +1,157 @@
+import random
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
 from config.secrets import defs
 from logs.log_manager import LogManager
+from trading.brokers.pricing import PricingSnapshot
+from trading.brokers.rate_limiter import PRIORITY_ACCOUNT, PRIORITY_HISTORY, PRIORITY_ORDER, get_rate_limiter
 
 # Initialize the logger
 logger = LogManager('oanda_client_logs').get_logger()
 
+"""
+REST client for the OANDA v20 API.
+
+Every client sends its requests through one `requests.Session`, so connections to OANDA are kept
+alive and reused instead of paying a TCP and TLS handshake per call. Responses are gzip-compressed,
+every request has a connect/read timeout, and throttled (429) or failed (5xx) requests are retried
+with jittered exponential backoff. `get_client` hands out one shared client per environment, so
+every service of the process shares the same connection pool.
+
+Every attempt first takes a token from the process-wide priority rate limiter: orders are sent
+before account polling, which is sent before history requests.
+
+`get_pricing` fetches the prices of many instruments in one call and caches the snapshot for
+`PRICING_TTL` seconds, so every caller of the shared client within that window is served by one
+round-trip. Its caller today is `TradingService.get_prices`, behind the /api/pricing route.
+"""
+
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+DEFAULT_POOL_SIZE = 16
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.25  # Seconds before the first retry, doubled on every attempt
+BACKOFF_MAX = 8.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+PRICING_TTL = 1.0  # Seconds a pricing snapshot is served from the cache
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def create_session(headers, pool_size=DEFAULT_POOL_SIZE):
+    """
+    Create a keep-alive session with a connection pool of `pool_size` connections per host.
+
+    :param headers: Headers sent with every request (authorization, content type).
+    :param pool_size: Connections kept open per host; threads beyond it wait for a free connection.
+    :return: The configured requests.Session.
+    """
+    session = requests.Session()
+    # Retries are done by OandaClient, which knows which requests are safe to repeat
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0, pool_block=True)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(headers)
+    session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'})
+    return session
+
+
+def backoff_delay(attempt, retry_after=None):
+    """
+    Seconds to wait before retry number `attempt` (0-based): full-jitter exponential backoff,
+    or the server's Retry-After when it sends one.
+    """
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), BACKOFF_MAX)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def get_client(environment='practice'):
+    """
+    Return the shared OandaClient of an environment, creating it on first use.
+
+    :param environment: The trading environment ('live' or 'practice').
+    :return: The process-wide OandaClient of the environment.
+    """
+    with _clients_lock:
+        if environment not in _clients:
+            _clients[environment] = OandaClient(environment)
+        return _clients[environment]
+
+
 class OandaClient:
-    def __init__(self, environment='practice'):
+    def __init__(self, environment='practice', base_url=None, timeout=DEFAULT_TIMEOUT,
+                 pool_size=DEFAULT_POOL_SIZE, max_retries=MAX_RETRIES, rate_limiter=None):
         """
         Initializes the OandaClient with the provided environment.
 
         :param environment: The trading environment to use ('live' or 'practice').
+        :param base_url: Optional API URL overriding the environment's (e.g., a local OANDA stand-in).
+        :param timeout: (connect, read) timeout of every request in seconds.
+        :param pool_size: Keep-alive connections held open to OANDA.
+        :param max_retries: Retries of a throttled or failed request before giving up.
+        :param rate_limiter: Limiter every request waits on (defaults to the process-wide one).
         """
         self.environment = environment
-        self.base_url = defs.OANDA_URL_D if environment == 'practice' else defs.OANDA_URL_L
+        self.base_url = base_url or (defs.OANDA_URL_D if environment == 'practice' else defs.OANDA_URL_L)
         self.headers = defs.SECURE_HEADER
         self.account_id = defs.ACCOUNT_ID
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.session = create_session(self.headers, pool_size)
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self._pricing = None
+        self._pricing_lock = threading.Lock()
+
+    def request(self, method, path, priority=PRIORITY_ACCOUNT, **kwargs):
+        """
+        Send a request through the pooled session, retrying throttled and failed attempts.
+
+        GET requests are retried on connection errors, timeouts, 429 and 5xx responses. Other
+        methods (order placement) are only retried on 429, which OANDA answers before acting on
+        the request, so an order is never sent twice.
+
+        :param method: HTTP method ('GET', 'POST', ...).
+        :param path: Path below the API URL (e.g., '/accounts/<id>/orders').
+        :param priority: Rate limiter priority class of the request.
+        :param kwargs: Passed to `requests.Session.request` (params, json, ...).
+        :return: The successful requests.Response.
+        """
+        idempotent = method.upper() == 'GET'
+        kwargs.setdefault('timeout', self.timeout)
+        url = f'{self.base_url}{path}'
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(priority=priority)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                delay = backoff_delay(attempt)
+                logger.warning(f"{method} {path} failed ({e}); retrying in {delay:.2f}s.")
+            else:
+                retryable = response.status_code == 429 or (idempotent and response.status_code in RETRY_STATUSES)
+                if not retryable or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    return response
+                delay = backoff_delay(attempt, response.headers.get('Retry-After'))
+                logger.warning(f"{method} {path} returned {response.status_code}; retrying in {delay:.2f}s.")
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self):
+        """
+        Close the pooled connections.
+        """
+        self.session.close()
 
     def get_account(self):
         """
@@ -23,10 +159,8 @@ class OandaClient:
 
         :return: A dictionary containing account details.
         """
-        url = f'{self.base_url}/accounts/{self.account_id}'
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
+            response = self.request('GET', f'/accounts/{self.account_id}')
             return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to retrieve account details: {e}")
@@ -39,10 +173,8 @@ class OandaClient:
         :param order_data: A dictionary containing order details.
         :return: A dictionary containing the response from OANDA.
         """
-        url = f'{self.base_url}/accounts/{self.account_id}/orders'
         try:
-            response = requests.post(url, json=order_data, headers=self.headers)
-            response.raise_for_status()
+            response = self.request('POST', f'/accounts/{self.account_id}/orders', priority=PRIORITY_ORDER, json=order_data)
             return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to place order: {e}")
@@ -54,10 +186,8 @@ class OandaClient:
 
         :return: A dictionary containing the list of open orders.
         """
-        url = f'{self.base_url}/accounts/{self.account_id}/orders'
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
+            response = self.request('GET', f'/accounts/{self.account_id}/orders')
             return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to retrieve orders: {e}")
@@ -69,32 +199,71 @@ class OandaClient:
 
         :return: A dictionary containing current positions.
         """
-        url = f'{self.base_url}/accounts/{self.account_id}/positions'
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
+            response = self.request('GET', f'/accounts/{self.account_id}/positions')
             return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to retrieve positions: {e}")
             raise
 
-    def fetch_historical_data(self, instrument, granularity='M1', count=500):
+    def get_pricing(self, instruments, max_age=PRICING_TTL):
+        """
+        Retrieves the latest bid/ask of several instruments in one pricing call.
+
+        The snapshot is cached: a call within `max_age` seconds of the last fetch that asks for
+        instruments it already holds is served without a request. Concurrent callers wait for the
+        fetch in flight instead of sending their own. A fetch also refreshes the instruments of the
+        previous snapshot, so callers asking for different lists share one request.
+
+        :param instruments: Iterable of instruments (e.g., ['EUR_USD', 'USD_JPY']).
+        :param max_age: Oldest cached snapshot in seconds the caller accepts (0 forces a fetch).
+        :return: A PricingSnapshot holding at least the requested instruments.
+        """
+        instruments = [instrument.upper() for instrument in instruments]
+        with self._pricing_lock:
+            cached = self._pricing
+            if cached is not None and cached.age() <= max_age and cached.covers(instruments):
+                return cached
+
+            wanted = list(dict.fromkeys([*instruments, *(cached.instruments if cached is not None else ())]))
+            params = {'instruments': ','.join(wanted)}
+            try:
+                response = self.request('GET', f'/accounts/{self.account_id}/pricing', params=params)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Failed to retrieve pricing for {params['instruments']}: {e}")
+                raise
+            self._pricing = PricingSnapshot.from_prices(response.json().get('prices', []))
+            return self._pricing
+
+    def fetch_historical_data(self, instrument, granularity='M1', count=500, from_time=None, to_time=None, include_first=True,
+                              priority=PRIORITY_HISTORY):
         """
         Retrieves historical candle data for a specific instrument from OANDA.
 
         :param instrument: The instrument to retrieve candle data for (e.g., 'EUR_USD').
         :param granularity: The granularity of the candle data (e.g., 'M1', 'D').
-        :param count: The number of candles to retrieve.
+        :param count: The number of candles to retrieve (at most 5000; ignored when both
+            `from_time` and `to_time` are given, which OANDA does not accept together with a count).
+        :param from_time: Optional RFC3339 time of the first candle to retrieve.
+        :param to_time: Optional RFC3339 time of the last candle to retrieve.
+        :param include_first: Whether the candle at `from_time` itself is returned.
+        :param priority: Rate limiter priority class (history by default; the trading loop's
+            latest-candle fetch may pass PRIORITY_ACCOUNT).
         :return: A list of candle data.
         """
-        url = f'{self.base_url}/instruments/{instrument}/candles'
         params = {
             'granularity': granularity,
             'count': count
         }
+        if from_time is not None:
+            params['from'] = from_time
+            params['includeFirst'] = 'true' if include_first else 'false'
+        if to_time is not None:
+            params['to'] = to_time
+        if from_time is not None and to_time is not None:
+            del params['count']
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()  # Raise an error for bad responses
+            response = self.request('GET', f'/instruments/{instrument}/candles', priority=priority, params=params)
             data = response.json()
             if 'candles' in data:
                 logger.info(f"Successfully fetched {len(data['candles'])} candles for {instrument}")
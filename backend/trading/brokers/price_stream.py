@@ -0,0 +1,109 @@
+# backend/trading/brokers/price_stream.py
+import json
+import threading
+
+import requests
+from config.secrets import defs
+from logs.log_manager import LogManager
+from trading.brokers.oanda_client import create_session, backoff_delay
+from trading.brokers.rate_limiter import PRIORITY_ACCOUNT, get_rate_limiter
+
+# Initialize the logger
+logger = LogManager('price_stream_logs').get_logger()
+
+"""
+Client of OANDA's streaming pricing endpoint.
+
+The endpoint keeps one HTTP response open and writes a JSON line per price update, plus a HEARTBEAT
+line every 5 seconds. `PriceStream.messages` yields those lines as dicts and reconnects with jittered
+backoff whenever the connection drops, the server ends the response, or no line (not even a
+heartbeat) arrives within `heartbeat_timeout` seconds.
+"""
+
+STREAM_URL_PRACTICE = 'https://stream-fxpractice.oanda.com/v3'
+STREAM_URL_LIVE = 'https://stream-fxtrade.oanda.com/v3'
+HEARTBEAT_TIMEOUT = 10  # OANDA sends a heartbeat every 5 seconds
+CONNECT_TIMEOUT = 5
+
+
+class PriceStream:
+    def __init__(self, instruments, environment='practice', stream_url=None, heartbeat_timeout=HEARTBEAT_TIMEOUT,
+                 rate_limiter=None):
+        """
+        :param instruments: Instruments to stream (e.g., ['EUR_USD', 'USD_JPY']).
+        :param environment: The trading environment to use ('live' or 'practice').
+        :param stream_url: Optional stream API URL overriding the environment's (e.g., a local stand-in).
+        :param heartbeat_timeout: Seconds without any line after which the stream is reconnected.
+        :param rate_limiter: Limiter the (re)connections wait on (defaults to the process-wide one).
+        """
+        self.instruments = [instrument.upper() for instrument in instruments]
+        self.environment = environment
+        if environment == 'practice':
+            default_url = getattr(defs, 'OANDA_STREAM_URL_D', STREAM_URL_PRACTICE)
+        else:
+            default_url = getattr(defs, 'OANDA_STREAM_URL_L', STREAM_URL_LIVE)
+        self.stream_url = stream_url or default_url
+        self.account_id = defs.ACCOUNT_ID
+        self.heartbeat_timeout = heartbeat_timeout
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.session = create_session(defs.SECURE_HEADER, pool_size=1)
+        self.reconnects = 0
+        self._stop = threading.Event()
+        self._response = None
+
+    def messages(self):
+        """
+        Yield the stream's messages until `close` is called, reconnecting as needed.
+
+        :return: Generator of message dicts ({'type': 'PRICE', ...} or {'type': 'HEARTBEAT', 'time'}).
+        """
+        url = f'{self.stream_url}/accounts/{self.account_id}/pricing/stream'
+        params = {'instruments': ','.join(self.instruments)}
+        attempt = 0
+        while not self._stop.is_set():
+            self.rate_limiter.acquire(priority=PRIORITY_ACCOUNT)
+            try:
+                with self.session.get(url, params=params, stream=True,
+                                      timeout=(CONNECT_TIMEOUT, self.heartbeat_timeout)) as response:
+                    if response.status_code != 429 and response.status_code < 500:
+                        response.raise_for_status()
+                    if response.ok:
+                        self._response = response
+                        logger.info(f"Price stream connected for {params['instruments']}.")
+                        for line in response.iter_lines():
+                            if self._stop.is_set():
+                                return
+                            if line:
+                                attempt = 0
+                                yield json.loads(line)
+                        logger.warning("Price stream ended by the server; reconnecting.")
+                    else:
+                        logger.warning(f"Price stream returned {response.status_code}; reconnecting.")
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                if self._stop.is_set():
+                    return
+                logger.warning(f"Price stream interrupted ({e}); reconnecting.")
+            except requests.exceptions.HTTPError as e:
+                logger.error(f"Price stream rejected: {e}")
+                raise
+            except Exception:
+                # Closing the response from another thread breaks the read in various ways
+                if self._stop.is_set():
+                    return
+                raise
+            finally:
+                self._response = None
+            self.reconnects += 1
+            self._stop.wait(backoff_delay(attempt))
+            attempt += 1
+
+    def close(self):
+        """
+        Stop the stream; a consumer blocked in `messages` returns shortly after.
+        """
+        self._stop.set()
+        response = self._response
+        if response is not None:
+            response.close()
+        self.session.close()
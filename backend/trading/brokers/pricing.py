@@ -0,0 +1,93 @@
+# backend/trading/brokers/pricing.py
+import time
+
+import numpy as np
+
+from data.utils.candles import format_candle_time, parse_candle_times
+
+"""
+Array-backed snapshot of OANDA prices.
+
+A pricing response holds one price object per instrument, with bids and asks as lists of
+{'price': '1.10012', 'liquidity': ...} entries. `PricingSnapshot` keeps only the best bid and ask
+of each instrument, in float64 arrays indexed by instrument, so comparing or scanning many prices
+is a NumPy operation rather than a walk over nested dicts.
+"""
+
+
+class PricingSnapshot:
+    def __init__(self, instruments, bid, ask, times, tradeable, fetched_at=None):
+        """
+        :param instruments: Instruments of the snapshot, in array order.
+        :param bid: float64 array of best bids (NaN where none was quoted).
+        :param ask: float64 array of best asks (NaN where none was quoted).
+        :param times: int64 array of the price times (epoch seconds).
+        :param tradeable: bool array, whether the instrument could be traded.
+        :param fetched_at: `time.monotonic()` of the fetch (defaults to now).
+        """
+        self.instruments = tuple(instruments)
+        self.index = {instrument: position for position, instrument in enumerate(self.instruments)}
+        self.bid = bid
+        self.ask = ask
+        self.times = times
+        self.tradeable = tradeable
+        self.fetched_at = time.monotonic() if fetched_at is None else fetched_at
+
+    @classmethod
+    def from_prices(cls, prices):
+        """
+        Decode the 'prices' list of an OANDA pricing response.
+        """
+        def best(quotes):
+            return float(quotes[0]['price']) if quotes else np.nan
+
+        return cls(
+            [price['instrument'] for price in prices],
+            np.array([best(price.get('bids')) for price in prices], dtype=float),
+            np.array([best(price.get('asks')) for price in prices], dtype=float),
+            parse_candle_times([price['time'] for price in prices]),
+            np.array([price.get('tradeable', price.get('status') == 'tradeable') for price in prices], dtype=bool),
+        )
+
+    @property
+    def mid(self):
+        return (self.bid + self.ask) / 2
+
+    @property
+    def spread(self):
+        return self.ask - self.bid
+
+    def age(self):
+        """
+        Seconds since the snapshot was fetched.
+        """
+        return time.monotonic() - self.fetched_at
+
+    def covers(self, instruments):
+        return all(instrument in self.index for instrument in instruments)
+
+    def __contains__(self, instrument):
+        return instrument in self.index
+
+    def __len__(self):
+        return len(self.instruments)
+
+    def price(self, instrument):
+        """
+        Prices of one instrument.
+
+        :return: Dict with 'bid', 'ask', 'mid', 'time' (epoch seconds) and 'tradeable'.
+        """
+        position = self.index[instrument]
+        return {'bid': float(self.bid[position]), 'ask': float(self.ask[position]),
+                'mid': float(self.mid[position]), 'time': int(self.times[position]),
+                'tradeable': bool(self.tradeable[position])}
+
+    def to_dict(self, instruments=None):
+        """
+        JSON-serializable prices, keyed by instrument.
+
+        :param instruments: Optional subset of the instruments to include.
+        """
+        return {instrument: {**self.price(instrument), 'time': format_candle_time(int(self.times[self.index[instrument]]))}
+                for instrument in (instruments or self.instruments)}
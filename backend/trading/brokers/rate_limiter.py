@@ -0,0 +1,198 @@
+# backend/trading/brokers/rate_limiter.py
+import heapq
+import itertools
+import os
+import threading
+import time
+
+"""
+Rate limiting for the OANDA REST API.
+
+OANDA allows about 120 requests per second per account, and a burst above it is answered with 429s.
+`TokenBucket` spreads the calls of every thread sharing it over time: tokens refill at `rate` per
+second up to `burst`, and `acquire` blocks until a token is available.
+
+`PriorityRateLimiter` is the process-wide limiter every OandaClient request goes through (see
+`get_rate_limiter`). Waiting requests are served by priority class, so a backlog of history
+backfill requests never delays an order: orders go before account polling, which goes before
+history. It keeps per-class queue-depth and wait-time metrics.
+"""
+
+OANDA_REQUESTS_PER_SECOND = 100
+
+# Priority classes, served lowest first
+PRIORITY_ORDER = 0
+PRIORITY_ACCOUNT = 1
+PRIORITY_HISTORY = 2
+PRIORITY_NAMES = {PRIORITY_ORDER: 'order', PRIORITY_ACCOUNT: 'account', PRIORITY_HISTORY: 'history'}
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+    Return the process-wide OANDA rate limiter, creating it on first use.
+
+    The rate can be set with $OANDA_REQUESTS_PER_SECOND.
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = PriorityRateLimiter(float(os.getenv('OANDA_REQUESTS_PER_SECOND', OANDA_REQUESTS_PER_SECOND)))
+        return _rate_limiter
+
+
+class TokenBucket:
+    def __init__(self, rate=OANDA_REQUESTS_PER_SECOND, burst=None):
+        """
+        :param rate: Tokens added per second.
+        :param burst: Bucket capacity, i.e. the largest burst allowed (defaults to `rate`).
+        """
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens=1):
+        """
+        Take `tokens` if they are available right now.
+
+        :return: True if the tokens were taken.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens=1):
+        """
+        Block until `tokens` are available and take them.
+
+        :return: Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class PriorityRateLimiter(TokenBucket):
+    def __init__(self, rate=OANDA_REQUESTS_PER_SECOND, burst=None):
+        """
+        Token bucket that hands out tokens to waiting callers by priority class.
+
+        :param rate: Tokens added per second.
+        :param burst: Bucket capacity (defaults to `rate`).
+        """
+        super().__init__(rate, burst)
+        self._condition = threading.Condition(self._lock)
+        self._waiters = []  # Heap of (priority, sequence); FIFO within a class
+        self._sequence = itertools.count()
+        self._stats = {}
+        for priority in PRIORITY_NAMES:
+            self._class_stats(priority)
+
+    def _class_stats(self, priority):
+        return self._stats.setdefault(priority, {'queued': 0, 'granted': 0, 'wait_total': 0.0, 'wait_max': 0.0})
+
+    def _record(self, priority, waited):
+        stats = self._class_stats(priority)
+        stats['granted'] += 1
+        stats['wait_total'] += waited
+        stats['wait_max'] = max(stats['wait_max'], waited)
+
+    def try_acquire(self, tokens=1, priority=PRIORITY_HISTORY):
+        """
+        Take `tokens` if they are available right now and nobody is queued.
+
+        :return: True if the tokens were taken.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if not self._waiters and self._tokens >= tokens:
+                self._tokens -= tokens
+                self._record(priority, 0.0)
+                return True
+            return False
+
+    def acquire(self, tokens=1, priority=PRIORITY_HISTORY):
+        """
+        Block until `tokens` are available and every caller of a more urgent class (or of the same
+        class and queued earlier) has been served, then take them.
+
+        :param tokens: Tokens to take.
+        :param priority: PRIORITY_ORDER, PRIORITY_ACCOUNT or PRIORITY_HISTORY.
+        :return: Seconds spent waiting.
+        """
+        started = time.monotonic()
+        with self._condition:
+            self._refill(started)
+            if not self._waiters and self._tokens >= tokens:
+                self._tokens -= tokens
+                self._record(priority, 0.0)
+                return 0.0
+
+            entry = (priority, next(self._sequence))
+            heapq.heappush(self._waiters, entry)
+            stats = self._class_stats(priority)
+            stats['queued'] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._waiters[0] == entry:
+                        if self._tokens >= tokens:
+                            heapq.heappop(self._waiters)
+                            self._tokens -= tokens
+                            break
+                        # Only the head of the queue sleeps on the refill; the others wait for it
+                        self._condition.wait((tokens - self._tokens) / self.rate)
+                    else:
+                        self._condition.wait()
+            except BaseException:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                raise
+            finally:
+                stats['queued'] -= 1
+                # Wake the next head of the queue
+                self._condition.notify_all()
+
+            waited = time.monotonic() - started
+            self._record(priority, waited)
+            return waited
+
+    def metrics(self):
+        """
+        Snapshot of the limiter's metrics.
+
+        :return: Dict with 'rate', 'tokens' and, per priority class name, the current queue depth,
+            the requests granted and their mean and max wait in seconds.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            classes = {
+                PRIORITY_NAMES.get(priority, str(priority)): {
+                    'queue_depth': stats['queued'],
+                    'granted': stats['granted'],
+                    'wait_mean': stats['wait_total'] / stats['granted'] if stats['granted'] else 0.0,
+                    'wait_max': stats['wait_max'],
+                }
+                for priority, stats in sorted(self._stats.items())
+            }
+            return {'rate': self.rate, 'tokens': self._tokens, 'classes': classes}
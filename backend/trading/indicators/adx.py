@@ -4,12 +4,19 @@ import numpy as np
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext
+from trading.indicators.core.outputs import assign_outputs, output_frame, wrap_like
+from trading.indicators.core.streaming import RollingWindow, TrueRangeState, divide, is_nan
+from trading.indicators.core import sweep
 
 # Configure loggers
 logger = LogManager("adx_logs").get_logger()
 
 
 class ADX:
+    INPUTS = ('true_range',)
+    OUTPUTS = ('adx', 'plus_di', 'minus_di')
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the ADX class with a SQLiteDB handler.
@@ -18,21 +25,18 @@ class ADX:
         """
         self.db_handler = SQLiteDB(db_name=db_name)
 
-    import pandas as pd
-import numpy as np
-from logs.log_manager import LogManager
-
-logger = LogManager('adx_logs').get_logger()
-
-class ADX:
     @staticmethod
-    def calculate(df, period=14):
+    def compute(df, period=14, context=None, dtype=None):
         """
         Calculate the Average Directional Index (ADX) for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'high', 'low', and 'close' prices.
         :param period: Lookback period for ADX calculation.
-        :return: DataFrame with the ADX values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the ADX, +DI and -DI columns.
         """
         # Ensure the necessary columns exist
         if any(col not in df.columns for col in ['high', 'low', 'close']):
@@ -41,38 +45,106 @@ class ADX:
 
         if len(df) < period:
             logger.warning("Insufficient data for ADX calculation.")
-            return df
+            return output_frame(df, {})
 
-        # Calculate True Range (TR)
-        df['high-low'] = df['high'] - df['low']
-        df['high-close'] = (df['high'] - df['close'].shift()).abs()
-        df['low-close'] = (df['low'] - df['close'].shift()).abs()
-        df['tr'] = df[['high-low', 'high-close', 'low-close']].max(axis=1)
+        # True Range (TR), shared with the other indicators of the run
+        context = IndicatorContext.for_frame(df, context)
+        tr = context.true_range()
 
         # Calculate the Directional Movement (DM)
-        df['plus_dm'] = np.where((df['high'] - df['high'].shift()) > (df['low'].shift() - df['low']), df['high'] - df['high'].shift(), 0)
-        df['minus_dm'] = np.where((df['low'].shift() - df['low']) > (df['high'] - df['high'].shift()), df['low'].shift() - df['low'], 0)
+        up_move = df['high'] - df['high'].shift()
+        down_move = df['low'].shift() - df['low']
+        plus_dm = wrap_like(up_move, np.where(up_move > down_move, up_move, 0))
+        minus_dm = wrap_like(down_move, np.where(down_move > up_move, down_move, 0))
 
-        # Smooth the values with a rolling average
-        df['tr_smooth'] = df['tr'].rolling(window=period).sum()
-        df['plus_dm_smooth'] = df['plus_dm'].rolling(window=period).sum()
-        df['minus_dm_smooth'] = df['minus_dm'].rolling(window=period).sum()
+        # Smooth the values with a rolling sum
+        tr_smooth = tr.rolling(window=period).sum()
+        plus_dm_smooth = plus_dm.rolling(window=period).sum()
+        minus_dm_smooth = minus_dm.rolling(window=period).sum()
 
         # Calculate the Directional Indicators (DI)
-        df['plus_di'] = 100 * (df['plus_dm_smooth'] / df['tr_smooth'])
-        df['minus_di'] = 100 * (df['minus_dm_smooth'] / df['tr_smooth'])
+        plus_di = 100 * (plus_dm_smooth / tr_smooth)
+        minus_di = 100 * (minus_dm_smooth / tr_smooth)
 
         # Calculate the Directional Index (DX)
-        df['dx'] = 100 * (abs(df['plus_di'] - df['minus_di']) / (df['plus_di'] + df['minus_di']))
-
-        # Calculate the ADX by smoothing the DX values
-        df['adx'] = df['dx'].rolling(window=period).mean()
+        dx = 100 * (abs(plus_di - minus_di) / (plus_di + minus_di))
 
-        # Fill NaN values in the 'adx' column
-        df['adx'].fillna(0, inplace=True)
+        # Calculate the ADX by smoothing the DX values, filling the warm-up with 0
+        adx = dx.rolling(window=period).mean().fillna(0)
 
         logger.info(f"ADX calculation for period={period} completed.")
-        return df
+        return output_frame(df, {'adx': adx, 'plus_di': plus_di, 'minus_di': minus_di}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Average Directional Index (ADX) for a given DataFrame.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param period: Lookback period for ADX calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the ADX values.
+        """
+        return assign_outputs(df, ADX.compute(df, period, context=context))
+
+    @staticmethod
+    def sweep(df, periods, context=None):
+        """
+        Calculate the ADX for several periods in one pass, e.g. for a parameter search.
+
+        The smoothed true range and directional movements share one prefix sum per series; only the
+        final averaging of each period's DX runs per period.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param periods: Sequence of lookback periods.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: Array (bars x periods) of ADX values; column j uses periods[j].
+        """
+        # Ensure the necessary columns exist
+        if any(col not in df.columns for col in ['high', 'low', 'close']):
+            logger.error("DataFrame must contain 'high', 'low', and 'close' columns.")
+            raise KeyError("DataFrame must contain 'high', 'low', and 'close' columns.")
+
+        periods = sweep.as_periods(periods)
+        context = IndicatorContext.for_frame(df, context)
+        high, low = df['high'].to_numpy(dtype=float), df['low'].to_numpy(dtype=float)
+
+        # Directional Movement, as in compute()
+        up_move = np.full_like(high, np.nan)
+        down_move = np.full_like(low, np.nan)
+        up_move[1:] = high[1:] - high[:-1]
+        down_move[1:] = low[:-1] - low[1:]
+        with np.errstate(invalid='ignore'):
+            plus_dm = np.where(up_move > down_move, up_move, 0)
+            minus_dm = np.where(down_move > up_move, down_move, 0)
+
+        tr_smooth = sweep.rolling_sum(context.true_range().to_numpy(), periods)
+        plus_dm_smooth = sweep.rolling_sum(plus_dm, periods)
+        minus_dm_smooth = sweep.rolling_sum(minus_dm, periods)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            plus_di = 100 * (plus_dm_smooth / tr_smooth)
+            minus_di = 100 * (minus_dm_smooth / tr_smooth)
+            dx = 100 * (np.abs(plus_di - minus_di) / (plus_di + minus_di))
+
+        # Average the DX of each period over that period, filling the warm-up with 0. DX holds
+        # near-0/0 ratios of arbitrary size, so it is averaged per column rather than by prefix sum:
+        # one pandas rolling pass per period, so this step costs O(bars x periods) and, unlike the
+        # prefix sums above, grows with the number of periods swept
+        adx = pd.DataFrame(dx).apply(lambda column: column.rolling(window=periods[column.name]).mean()).fillna(0).to_numpy()
+
+        logger.info(f"ADX sweep over {adx.shape[1]} periods completed.")
+        return adx
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming ADX calculator that is fed one candle at a time.
+
+        :param period: Lookback period for ADX calculation.
+        :return: An ADXStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return ADXStream(period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period):
         """
@@ -86,17 +158,54 @@ class ADX:
         indicator_id = self.db_handler.get_indicator_id(indicator_name)
         timestamp = datetime.now().isoformat()
 
-        # Insert ADX, plus_di, and minus_di results row by row
-        for _, row in result_df.iterrows():
-            self.db_handler.add_indicator_results(
-                indicator_id, timestamp, "adx", row["adx"]
-            )
-            self.db_handler.add_indicator_results(
-                indicator_id, timestamp, "plus_di", row["plus_di"]
-            )
-            self.db_handler.add_indicator_results(
-                indicator_id, timestamp, "minus_di", row["minus_di"]
-            )
-            self.db_handler.add_indicator_parameters(indicator_id, {"period": period})
+        # Insert the ADX, plus_di, and minus_di results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in ('adx', 'plus_di', 'minus_di')})
+        self.db_handler.add_indicator_parameters(indicator_id, {"period": period})
 
         logger.info(f"Inserted ADX results for {instrument} into SQLite.")
+
+
+class ADXStream:
+    def __init__(self, period=14):
+        """
+        Keep the directional movement and true range sums needed to produce the next ADX in O(1).
+
+        :param period: Lookback period for ADX calculation.
+        """
+        self.period = period
+        self.prev_high = None
+        self.prev_low = None
+        self.true_range = TrueRangeState()
+        self.tr_window = RollingWindow(period)
+        self.plus_dm_window = RollingWindow(period)
+        self.minus_dm_window = RollingWindow(period)
+        self.dx_window = RollingWindow(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the ADX state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high', 'low' and 'close' prices.
+        :return: Dict with the 'adx', 'plus_di' and 'minus_di' values for this candle.
+        """
+        high, low, close = float(candle['high']), float(candle['low']), float(candle['close'])
+
+        plus_dm = minus_dm = 0.0
+        if self.prev_high is not None:
+            up_move = high - self.prev_high
+            down_move = self.prev_low - low
+            plus_dm = up_move if up_move > down_move else 0.0
+            minus_dm = down_move if down_move > up_move else 0.0
+        self.prev_high, self.prev_low = high, low
+
+        self.tr_window.push(self.true_range.update(high, low, close))
+        self.plus_dm_window.push(plus_dm)
+        self.minus_dm_window.push(minus_dm)
+
+        tr_smooth = self.tr_window.sum()
+        plus_di = 100 * divide(self.plus_dm_window.sum(), tr_smooth)
+        minus_di = 100 * divide(self.minus_dm_window.sum(), tr_smooth)
+        self.dx_window.push(100 * divide(abs(plus_di - minus_di), plus_di + minus_di))
+
+        adx = self.dx_window.mean()
+        return {'adx': 0.0 if is_nan(adx) else adx, 'plus_di': plus_di, 'minus_di': minus_di}
@@ -3,6 +3,9 @@ import numpy as np
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core import rolling
+from trading.indicators.core.rolling import RollingMax, RollingMin
+from trading.indicators.core.outputs import assign_outputs, output_frame
 
 # Configure loggers
 logger = LogManager('aroon_logs').get_logger()
@@ -12,6 +15,9 @@ logger = LogManager('aroon_logs').get_logger()
 """
 
 class Aroon:
+    INPUTS = ()
+    OUTPUTS = ('aroon_up', 'aroon_down')
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the Aroon class with a SQLiteDB handler.
@@ -21,13 +27,17 @@ class Aroon:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, period=25):
+    def compute(df, period=25, context=None, dtype=None):
         """
         Calculate the Aroon Up and Aroon Down indicators for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'high' and 'low' prices.
         :param period: Lookback period for Aroon calculation.
-        :return: DataFrame with the Aroon Up and Aroon Down values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the Aroon Up and Aroon Down columns.
         """
         # Ensure the necessary columns exist
         if any(col not in df.columns for col in ['high', 'low']):
@@ -36,14 +46,36 @@ class Aroon:
 
         if len(df) < period:
             logger.warning("Insufficient data for Aroon calculation.")
-            return df
+            return output_frame(df, {})
 
         # Calculate Aroon Up and Aroon Down
-        df['aroon_up'] = df['high'].rolling(window=period).apply(lambda x: (x.argmax() + 1) / period * 100, raw=True)
-        df['aroon_down'] = df['low'].rolling(window=period).apply(lambda x: (x.argmin() + 1) / period * 100, raw=True)
+        aroon_up = (rolling.rolling_argmax(df['high'].to_numpy(), period) + 1) / period * 100
+        aroon_down = (rolling.rolling_argmin(df['low'].to_numpy(), period) + 1) / period * 100
 
         logger.info(f"Aroon calculation for period={period} completed.")
-        return df
+        return output_frame(df, {'aroon_up': aroon_up, 'aroon_down': aroon_down}, dtype)
+
+    @staticmethod
+    def calculate(df, period=25, context=None):
+        """
+        Calculate the Aroon Up and Aroon Down indicators for a given DataFrame.
+
+        :param df: DataFrame with 'high' and 'low' prices.
+        :param period: Lookback period for Aroon calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the Aroon Up and Aroon Down values.
+        """
+        return assign_outputs(df, Aroon.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=25):
+        """
+        Create a streaming Aroon calculator that is fed one candle at a time.
+
+        :param period: Lookback period for Aroon calculation.
+        :return: An AroonStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return AroonStream(period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period):
         """
@@ -57,10 +89,36 @@ class Aroon:
         indicator_id = self.db_handler.get_indicator_id(indicator_name)
         timestamp = datetime.now().isoformat()
 
-        # Insert Aroon Up and Aroon Down results row by row
-        for _, row in result_df.iterrows():
-            self.db_handler.add_indicator_results(indicator_id, timestamp, 'aroon_up', row['aroon_up'])
-            self.db_handler.add_indicator_results(indicator_id, timestamp, 'aroon_down', row['aroon_down'])
-            self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+        # Insert the Aroon Up and Aroon Down results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in ('aroon_up', 'aroon_down')})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
 
         logger.info(f"Inserted Aroon results for {instrument} into SQLite.")
+
+
+class AroonStream:
+    def __init__(self, period=25):
+        """
+        Keep the monotonic high/low deques needed to produce the next Aroon values in O(1).
+
+        :param period: Lookback period for Aroon calculation.
+        """
+        self.period = period
+        self.highest = RollingMax(period)
+        self.lowest = RollingMin(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Aroon state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high' and 'low' prices.
+        :return: Dict with the 'aroon_up' and 'aroon_down' values for this candle.
+        """
+        self.highest.update(candle['high'])
+        self.lowest.update(candle['low'])
+
+        # Position of the first extreme inside the window, oldest bar first (same as np.argmax/argmin)
+        return {
+            'aroon_up': (self.highest.position + 1) / self.period * 100,
+            'aroon_down': (self.lowest.position + 1) / self.period * 100,
+        }
@@ -3,11 +3,18 @@ import numpy as np
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext
+from trading.indicators.core.outputs import assign_outputs, output_frame
+from trading.indicators.core.streaming import RollingWindow, TrueRangeState
+from trading.indicators.core import sweep
 
 # Configure loggers
 logger = LogManager('atr_logs').get_logger()
 
 class ATR:
+    INPUTS = ('true_range',)
+    OUTPUTS = ('atr',)
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the ATR class with a SQLiteDB handler.
@@ -17,13 +24,17 @@ class ATR:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, period=14):
+    def compute(df, period=14, context=None, dtype=None):
         """
         Calculate the Average True Range (ATR) for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'high', 'low', and 'close' prices.
         :param period: Lookback period for ATR calculation.
-        :return: DataFrame with the ATR values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the ATR columns.
         """
         # Ensure the necessary columns exist
         if any(col not in df.columns for col in ['high', 'low', 'close']):
@@ -32,19 +43,59 @@ class ATR:
 
         if len(df) < period:
             logger.warning("Insufficient data for ATR calculation.")
-            return df
+            return output_frame(df, {})
 
-        # Calculate True Range (TR)
-        df['high-low'] = df['high'] - df['low']
-        df['high-close'] = (df['high'] - df['close'].shift()).abs()
-        df['low-close'] = (df['low'] - df['close'].shift()).abs()
-        df['true_range'] = df[['high-low', 'high-close', 'low-close']].max(axis=1)
-
-        # Calculate the ATR using exponential moving average
-        df['atr'] = df['true_range'].rolling(window=period).mean()
+        # Calculate the ATR as the rolling mean of the True Range (TR), shared with the other indicators of the run
+        context = IndicatorContext.for_frame(df, context)
+        atr = context.true_range().rolling(window=period).mean()
 
         logger.info(f"ATR calculation for period={period} completed.")
-        return df
+        return output_frame(df, {'atr': atr}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Average True Range (ATR) for a given DataFrame.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param period: Lookback period for ATR calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the ATR values.
+        """
+        return assign_outputs(df, ATR.compute(df, period, context=context))
+
+    @staticmethod
+    def sweep(df, periods, context=None):
+        """
+        Calculate the ATR for several periods in one pass, e.g. for a parameter search.
+
+        Every period reads its rolling mean off one prefix sum of the shared true range.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param periods: Sequence of lookback periods.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: Array (bars x periods) of ATR values; column j uses periods[j].
+        """
+        # Ensure the necessary columns exist
+        if any(col not in df.columns for col in ['high', 'low', 'close']):
+            logger.error("DataFrame must contain 'high', 'low', and 'close' columns.")
+            raise KeyError("DataFrame must contain 'high', 'low', and 'close' columns.")
+
+        context = IndicatorContext.for_frame(df, context)
+        atr = sweep.rolling_mean(context.true_range().to_numpy(), periods)
+
+        logger.info(f"ATR sweep over {atr.shape[1]} periods completed.")
+        return atr
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming ATR calculator that is fed one candle at a time.
+
+        :param period: Lookback period for ATR calculation.
+        :return: An ATRStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return ATRStream(period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period):
         """
@@ -59,10 +110,30 @@ class ATR:
         timestamp = datetime.now().isoformat()
 
         param_name = 'atr'
-        # Insert ATR results row by row
-        for _, row in result_df.iterrows():
-            param_value = row['atr']
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
-            self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+        # Insert the ATR results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df['atr']})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
 
         logger.info(f"Inserted ATR results for {instrument} into SQLite.")
+
+
+class ATRStream:
+    def __init__(self, period=14):
+        """
+        Keep the previous close and the true range window needed to produce the next ATR in O(1).
+
+        :param period: Lookback period for ATR calculation.
+        """
+        self.period = period
+        self.true_range = TrueRangeState()
+        self.window = RollingWindow(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the ATR state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high', 'low' and 'close' prices.
+        :return: The ATR value for this candle (NaN during warm-up).
+        """
+        self.window.push(self.true_range.update(float(candle['high']), float(candle['low']), float(candle['close'])))
+        return self.window.mean()
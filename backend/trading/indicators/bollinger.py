@@ -3,11 +3,17 @@ import pandas as pd
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.streaming import RollingMoments
+from trading.indicators.core.outputs import assign_outputs, output_frame
 
 # Configure loggers
 logger = LogManager('bollinger_logs').get_logger()
 
 class BollingerBands:
+    INPUTS = (('sma', 'close', Param('period')),)
+    OUTPUTS = ('middle_{period}', 'upper_{period}', 'lower_{period}')
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the BollingerBands class with a SQLiteDB handler.
@@ -17,38 +23,65 @@ class BollingerBands:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, period=20, std=2):
+    def compute(df, period=20, std=2, context=None, dtype=None):
         """
         Calculate the Bollinger Bands for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'close' prices.
         :param period: Lookback period for the moving average.
         :param std: Number of standard deviations for the bands.
-        :return: DataFrame with the middle, upper, and lower Bollinger Bands.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the middle, upper and lower band columns.
         """
         # Ensure the necessary 'close' column exists
         if 'close' not in df.columns:
             logger.error("DataFrame must contain 'close' column.")
             raise KeyError("DataFrame must contain 'close' column.")
 
-        # Ensure there is enough data to calculate the Bollinger Bands
         if len(df) < period:
             logger.warning("Insufficient data for Bollinger Bands calculation.")
-            return df
+            return output_frame(df, {})
 
         # Calculate the middle band (simple moving average)
-        df[f'middle_{period}'] = df['close'].rolling(window=period).mean()
+        middle = IndicatorContext.for_frame(df, context).sma('close', period)
 
         # Calculate the standard deviation over the rolling window
-        df['std'] = df['close'].rolling(window=period).std()
+        deviation = df['close'].rolling(window=period).std()
 
         # Calculate the upper and lower bands
-        df[f'upper_{period}'] = df[f'middle_{period}'] + (df['std'] * std)
-        df[f'lower_{period}'] = df[f'middle_{period}'] - (df['std'] * std)
+        upper = middle + (deviation * std)
+        lower = middle - (deviation * std)
 
         # Log the completion of the calculation
         logger.info(f"Bollinger Bands calculation for period={period}, std={std} completed.")
-        return df
+        return output_frame(df, {f'middle_{period}': middle, f'upper_{period}': upper, f'lower_{period}': lower}, dtype)
+
+    @staticmethod
+    def calculate(df, period=20, std=2, context=None):
+        """
+        Calculate the Bollinger Bands for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period for the moving average.
+        :param std: Number of standard deviations for the bands.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the middle, upper, and lower Bollinger Bands.
+        """
+        return assign_outputs(df, BollingerBands.compute(df, period, std, context=context))
+
+    @staticmethod
+    def stream(period=20, std=2):
+        """
+        Create a streaming Bollinger Bands calculator that is fed one candle at a time.
+
+        :param period: Lookback period for the moving average.
+        :param std: Number of standard deviations for the bands.
+        :return: A BollingerBandsStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return BollingerBandsStream(period, std)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period, std):
         """
@@ -63,10 +96,37 @@ class BollingerBands:
         indicator_id = self.db_handler.get_indicator_id(indicator_name)
         timestamp = datetime.now().isoformat()
 
-        # Insert Bollinger Bands results row by row
-        for _, row in result_df.iterrows():
-            self.db_handler.add_indicator_results(indicator_id, timestamp, 'upper_band', row['upper_band'])
-            self.db_handler.add_indicator_results(indicator_id, timestamp, 'lower_band', row['lower_band'])
-            self.db_handler.add_indicator_parameters(indicator_id, {'period': period, 'std_dev': std})
+        # Insert the Bollinger Bands results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in ('upper_band', 'lower_band')})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period, 'std_dev': std})
 
         logger.info(f"Inserted Bollinger Bands results for {instrument} into SQLite.")
+
+
+class BollingerBandsStream:
+    def __init__(self, period=20, std=2):
+        """
+        Keep the rolling mean and variance needed to produce the next bands in O(1).
+
+        :param period: Lookback period for the moving average.
+        :param std: Number of standard deviations for the bands.
+        """
+        self.period = period
+        self.std = std
+        self.window = RollingMoments(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Bollinger Bands state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: Dict with the middle, upper and lower band values for this candle.
+        """
+        self.window.push(float(candle['close']))
+        middle = self.window.mean()
+        deviation = self.window.std() * self.std
+        return {
+            f'middle_{self.period}': middle,
+            f'upper_{self.period}': middle + deviation,
+            f'lower_{self.period}': middle - deviation,
+        }
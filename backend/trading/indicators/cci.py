@@ -3,6 +3,11 @@ import numpy as np
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext
+from trading.indicators.core import kernels
+from trading.indicators.core.streaming import NAN, RollingWindow, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
+from trading.indicators.core import sweep
 
 # Configure loggers
 logger = LogManager('cci_logs').get_logger()
@@ -12,6 +17,9 @@ Calculate the Commodity Channel Index (CCI) for a given DataFrame. The CCI is ca
 """
 
 class CCI:
+    INPUTS = ('typical_price',)
+    OUTPUTS = ('cci',)
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the CCI class with a SQLiteDB handler.
@@ -21,43 +29,92 @@ class CCI:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, period=14):
+    def compute(df, period=14, context=None, dtype=None):
         """
         Calculate the Commodity Channel Index (CCI) for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'high', 'low', and 'close' prices.
         :param period: Lookback period for CCI calculation.
-        :return: DataFrame with the CCI values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the CCI columns.
         """
         # Ensure the necessary columns exist
         if any(col not in df.columns for col in ['high', 'low', 'close']):
             logger.error("DataFrame must contain 'high', 'low', and 'close' columns.")
             raise KeyError("DataFrame must contain 'high', 'low', and 'close' columns.")
 
-        # Ensure there is enough data for the calculation
         if len(df) < period:
             logger.warning("Insufficient data for CCI calculation.")
-            return df
+            return output_frame(df, {})
 
-        # Calculate the typical price
-        df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
+        # Calculate the typical price, shared with the other indicators of the run
+        typical_price = IndicatorContext.for_frame(df, context).typical_price()
 
         # Calculate the rolling mean of the typical price
-        df['tp_sma'] = df['typical_price'].rolling(window=period).mean()
+        tp_sma = typical_price.rolling(window=period).mean()
 
-        # Manually calculate the mean absolute deviation (MAD)
-        def mean_deviation(series):
-            mean_value = series.mean()
-            return np.mean(np.abs(series - mean_value))
-
-        # Apply the mean deviation function to the rolling window
-        df['mean_deviation'] = df['typical_price'].rolling(window=period).apply(mean_deviation, raw=False)
+        # Calculate the mean absolute deviation (MAD) over each rolling window
+        mean_deviation = kernels.rolling_mean_abs_dev(typical_price.to_numpy(), period)
 
         # Calculate the CCI
-        df['cci'] = (df['typical_price'] - df['tp_sma']) / (0.015 * df['mean_deviation'])
+        cci = (typical_price - tp_sma) / (0.015 * mean_deviation)
 
         logger.info(f"CCI calculation for period={period} completed.")
-        return df
+        return output_frame(df, {'cci': cci}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Commodity Channel Index (CCI) for a given DataFrame.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param period: Lookback period for CCI calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the CCI values.
+        """
+        return assign_outputs(df, CCI.compute(df, period, context=context))
+
+    @staticmethod
+    def sweep(df, periods, context=None):
+        """
+        Calculate the CCI for several periods in one pass, e.g. for a parameter search.
+
+        The typical-price means share one prefix sum; the mean absolute deviation has no prefix
+        form and still runs one windowed kernel per period.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param periods: Sequence of lookback periods.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: Array (bars x periods) of CCI values; column j uses periods[j].
+        """
+        # Ensure the necessary columns exist
+        if any(col not in df.columns for col in ['high', 'low', 'close']):
+            logger.error("DataFrame must contain 'high', 'low', and 'close' columns.")
+            raise KeyError("DataFrame must contain 'high', 'low', and 'close' columns.")
+
+        periods = sweep.as_periods(periods)
+        typical_price = IndicatorContext.for_frame(df, context).typical_price().to_numpy()
+        tp_sma = sweep.rolling_mean(typical_price, periods)
+        mean_deviation = np.column_stack([kernels.rolling_mean_abs_dev(typical_price, period) for period in periods])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cci = (typical_price[:, None] - tp_sma) / (0.015 * mean_deviation)
+
+        logger.info(f"CCI sweep over {periods.size} periods completed.")
+        return cci
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming CCI calculator that is fed one candle at a time.
+
+        :param period: Lookback period for CCI calculation.
+        :return: A CCIStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return CCIStream(period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period):
         """
@@ -72,10 +129,38 @@ class CCI:
         timestamp = datetime.now().isoformat()
 
         param_name = 'cci'
-        # Insert CCI results row by row
-        for _, row in result_df.iterrows():
-            param_value = row['cci']
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
-            self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+        # Insert the CCI results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df['cci']})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
 
         logger.info(f"Inserted CCI results for {instrument} into SQLite.")
+
+
+class CCIStream:
+    def __init__(self, period=14):
+        """
+        Keep the typical price window needed to produce the next CCI value.
+
+        The moving average is O(1); the mean absolute deviation has no running form and is
+        evaluated over the ring buffer, which is still O(period) rather than O(history).
+
+        :param period: Lookback period for CCI calculation.
+        """
+        self.period = period
+        self.window = RollingWindow(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the CCI state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high', 'low' and 'close' prices.
+        :return: The CCI value for this candle (NaN during warm-up).
+        """
+        typical_price = (float(candle['high']) + float(candle['low']) + float(candle['close'])) / 3
+        self.window.push(typical_price)
+        if not self.window.ready:
+            return NAN
+
+        tp_sma = self.window.mean()
+        mean_deviation = sum(abs(value - tp_sma) for value in self.window.values) / self.period
+        return divide(typical_price - tp_sma, 0.015 * mean_deviation)
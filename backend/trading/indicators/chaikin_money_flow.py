@@ -0,0 +1,125 @@
+# backend/trading/indicators/chaikin_money_flow.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core.streaming import RollingWindow, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('chaikin_money_flow_logs').get_logger()
+
+class ChaikinMoneyFlow:
+    INPUTS = ()
+    OUTPUTS = ('cmf',)
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the ChaikinMoneyFlow class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=20, context=None, dtype=None):
+        """
+        Calculate the Chaikin Money Flow (CMF) for a given DataFrame.
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'high', 'low', 'close', and 'volume' columns.
+        :param period: Lookback period for CMF calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the CMF columns.
+        """
+        # Ensure the necessary columns exist
+        if any(col not in df.columns for col in ['high', 'low', 'close', 'volume']):
+            logger.error("DataFrame must contain 'high', 'low', 'close', and 'volume' columns.")
+            raise KeyError("DataFrame must contain 'high', 'low', 'close', and 'volume' columns.")
+
+        if len(df) < period:
+            logger.warning("Insufficient data for Chaikin Money Flow calculation.")
+            return output_frame(df, {})
+
+        # Money flow multiplier: where the close sits in the bar's range (0 for a flat bar)
+        high, low, close = df['high'], df['low'], df['close']
+        bar_range = high - low
+        multiplier = ((close - low) - (high - close)).div(bar_range).where(bar_range != 0, 0)
+
+        # Money flow volume summed over the period, relative to the volume traded
+        money_flow_volume = multiplier * df['volume']
+        cmf = money_flow_volume.rolling(window=period).sum() / df['volume'].rolling(window=period).sum()
+
+        logger.info(f"Chaikin Money Flow calculation for period {period} completed.")
+        return output_frame(df, {'cmf': cmf}, dtype)
+
+    @staticmethod
+    def calculate(df, period=20, context=None):
+        """
+        Calculate the Chaikin Money Flow (CMF) for a given DataFrame.
+
+        :param df: DataFrame with 'high', 'low', 'close', and 'volume' columns.
+        :param period: Lookback period for CMF calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the CMF values.
+        """
+        return assign_outputs(df, ChaikinMoneyFlow.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=20):
+        """
+        Create a streaming Chaikin Money Flow calculator that is fed one candle at a time.
+
+        :param period: Lookback period for CMF calculation.
+        :return: A ChaikinMoneyFlowStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return ChaikinMoneyFlowStream(period)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period):
+        """
+        Insert the Chaikin Money Flow results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'ChaikinMoneyFlow').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated CMF values.
+        :param period: Period for which the CMF was calculated.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        param_name = 'cmf'
+        # Insert the CMF results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+
+        logger.info(f"Inserted Chaikin Money Flow results for {instrument} into SQLite.")
+
+
+class ChaikinMoneyFlowStream:
+    def __init__(self, period=20):
+        """
+        Keep the rolling money flow volume and volume sums needed to produce the next CMF value in O(1).
+
+        :param period: Lookback period for CMF calculation.
+        """
+        self.period = period
+        self.money_flow_volume = RollingWindow(period)
+        self.volume = RollingWindow(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the CMF state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high', 'low', 'close' and 'volume' values.
+        :return: The CMF value for this candle (NaN during warm-up).
+        """
+        high, low, close = float(candle['high']), float(candle['low']), float(candle['close'])
+        volume = float(candle['volume'])
+
+        bar_range = high - low
+        multiplier = 0.0 if bar_range == 0 else divide((close - low) - (high - close), bar_range)
+
+        self.money_flow_volume.push(multiplier * volume)
+        self.volume.push(volume)
+        return divide(self.money_flow_volume.sum(), self.volume.sum())
@@ -0,0 +1,125 @@
+# backend/trading/indicators/chande_momentum.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core.context import IndicatorContext
+from trading.indicators.core.streaming import NAN, RollingWindow, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('chande_momentum_logs').get_logger()
+
+class ChandeMomentumOscillator:
+    INPUTS = ('gains', 'losses')
+    OUTPUTS = ('cmo',)
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the ChandeMomentumOscillator class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=14, context=None, dtype=None):
+        """
+        Calculate the Chande Momentum Oscillator (CMO) for a given DataFrame.
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period for CMO calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the CMO columns.
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        if len(df) < period:
+            logger.warning("Insufficient data for Chande Momentum Oscillator calculation.")
+            return output_frame(df, {})
+
+        # Sum the gains and losses over the period, shared with RSI through the context
+        context = IndicatorContext.for_frame(df, context)
+        gain = context.gains().rolling(window=period).sum()
+        loss = context.losses().rolling(window=period).sum()
+
+        cmo = 100 * (gain - loss) / (gain + loss)
+
+        logger.info(f"Chande Momentum Oscillator calculation for period {period} completed.")
+        return output_frame(df, {'cmo': cmo}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Chande Momentum Oscillator (CMO) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period for CMO calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the CMO values.
+        """
+        return assign_outputs(df, ChandeMomentumOscillator.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming Chande Momentum Oscillator calculator that is fed one candle at a time.
+
+        :param period: Lookback period for CMO calculation.
+        :return: A ChandeMomentumOscillatorStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return ChandeMomentumOscillatorStream(period)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period):
+        """
+        Insert the Chande Momentum Oscillator results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'ChandeMomentumOscillator').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated CMO values.
+        :param period: Period for which the CMO was calculated.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        param_name = 'cmo'
+        # Insert the CMO results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+
+        logger.info(f"Inserted Chande Momentum Oscillator results for {instrument} into SQLite.")
+
+
+class ChandeMomentumOscillatorStream:
+    def __init__(self, period=14):
+        """
+        Keep the rolling gain/loss sums needed to produce the next CMO value in O(1).
+
+        :param period: Lookback period for CMO calculation.
+        """
+        self.period = period
+        self.prev_close = None
+        self.gains = RollingWindow(period)
+        self.losses = RollingWindow(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the CMO state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: The CMO value for this candle (NaN during warm-up).
+        """
+        close = float(candle['close'])
+        delta = NAN if self.prev_close is None else close - self.prev_close
+        self.prev_close = close
+
+        self.gains.push(delta if delta > 0 else 0.0)
+        self.losses.push(-delta if delta < 0 else 0.0)
+
+        gain, loss = self.gains.sum(), self.losses.sum()
+        return 100 * divide(gain - loss, gain + loss)
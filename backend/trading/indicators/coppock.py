@@ -0,0 +1,137 @@
+# backend/trading/indicators/coppock.py
+from collections import deque
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core import kernels
+from trading.indicators.core.outputs import assign_outputs, output_frame, wrap_like
+from trading.indicators.core.streaming import NAN, WeightedWindow, divide
+
+# Configure loggers
+logger = LogManager('coppock_logs').get_logger()
+
+class CoppockCurve:
+    INPUTS = ()
+    OUTPUTS = ('coppock',)
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the CoppockCurve class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=10, long_roc=14, short_roc=11, context=None, dtype=None):
+        """
+        Calculate the Coppock Curve for a given DataFrame.
+
+        The curve is the weighted moving average of the sum of a long and a short rate of change.
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period of the weighted moving average.
+        :param long_roc: Lookback period of the long rate of change.
+        :param short_roc: Lookback period of the short rate of change.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the Coppock Curve columns.
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        if len(df) < max(long_roc, short_roc) + period:
+            logger.warning("Insufficient data for Coppock Curve calculation.")
+            return output_frame(df, {})
+
+        # Sum of the two rates of change, in percent
+        close = df['close']
+        roc_sum = (close / close.shift(long_roc) - 1) * 100 + (close / close.shift(short_roc) - 1) * 100
+
+        # Weighted moving average of the summed rates of change
+        coppock = wrap_like(roc_sum, kernels.weighted_moving_average(roc_sum.to_numpy(), period))
+
+        logger.info(f"Coppock Curve calculation for period {period} completed.")
+        return output_frame(df, {'coppock': coppock}, dtype)
+
+    @staticmethod
+    def calculate(df, period=10, long_roc=14, short_roc=11, context=None):
+        """
+        Calculate the Coppock Curve for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period of the weighted moving average.
+        :param long_roc: Lookback period of the long rate of change.
+        :param short_roc: Lookback period of the short rate of change.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the Coppock Curve values.
+        """
+        return assign_outputs(df, CoppockCurve.compute(df, period, long_roc, short_roc, context=context))
+
+    @staticmethod
+    def stream(period=10, long_roc=14, short_roc=11):
+        """
+        Create a streaming Coppock Curve calculator that is fed one candle at a time.
+
+        :param period: Lookback period of the weighted moving average.
+        :param long_roc: Lookback period of the long rate of change.
+        :param short_roc: Lookback period of the short rate of change.
+        :return: A CoppockCurveStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return CoppockCurveStream(period, long_roc, short_roc)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period, long_roc, short_roc):
+        """
+        Insert the Coppock Curve results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'CoppockCurve').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated Coppock Curve values.
+        :param period: Period of the weighted moving average.
+        :param long_roc: Period of the long rate of change.
+        :param short_roc: Period of the short rate of change.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        param_name = 'coppock'
+        # Insert the Coppock Curve results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period, 'long_roc': long_roc, 'short_roc': short_roc})
+
+        logger.info(f"Inserted Coppock Curve results for {instrument} into SQLite.")
+
+
+class CoppockCurveStream:
+    def __init__(self, period=10, long_roc=14, short_roc=11):
+        """
+        Keep the recent closes and the weighted window needed to produce the next Coppock value in O(1).
+
+        :param period: Lookback period of the weighted moving average.
+        :param long_roc: Lookback period of the long rate of change.
+        :param short_roc: Lookback period of the short rate of change.
+        """
+        self.long_roc = long_roc
+        self.short_roc = short_roc
+        self.closes = deque(maxlen=max(long_roc, short_roc) + 1)
+        self.window = WeightedWindow(period)
+
+    def _roc(self, close, lookback):
+        if len(self.closes) <= lookback:
+            return NAN
+        return (divide(close, self.closes[-1 - lookback]) - 1) * 100
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Coppock Curve state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: The Coppock Curve value for this candle (NaN during warm-up).
+        """
+        close = float(candle['close'])
+        self.closes.append(close)
+        self.window.push(self._roc(close, self.long_roc) + self._roc(close, self.short_roc))
+        return self.window.weighted_mean()
@@ -0,0 +1,235 @@
+# backend/trading/indicators/core/context.py
+import inspect
+import threading
+
+import numpy as np
+
+from trading.indicators.core import rolling
+from trading.indicators.core.outputs import wrap_like
+from trading.indicators.core.stacked import StackedFrame
+
+"""
+Per-(instrument, granularity) computation context shared by the indicators of one run.
+
+Several indicators derive the same intermediate series from the OHLCV frame: ATR and ADX both need
+the true range, CCI, MFI and VWAP the typical price, RSI the close-to-close gains and losses,
+Stochastic and Williams %R the same rolling highs and lows. `IndicatorContext` computes each of
+these once on first use and hands the cached series to every later indicator, so the controller
+can build one context per frame and pass it to every `calculate` call of the run.
+
+Intermediates are addressed by node keys, tuples of a context method name and its arguments
+(e.g. `('true_range',)`, `('ema', 'close', 12)`). Indicator classes declare the nodes they read in
+`INPUTS`, using `Param('name')` for arguments taken from their own parameters, so the planner can
+schedule and dedupe them before the indicators run. The cache is thread-safe: concurrent requests
+for the same node compute it once. A context can also wrap a `StackedFrame`, in which case every
+node is a (bars x instruments) DataFrame covering all instruments at once.
+"""
+
+
+class Param:
+    """
+    Placeholder inside an `INPUTS` node key that is replaced by the indicator parameter of that name.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Param({self.name!r})"
+
+
+def bind_params(indicator_class, params=None):
+    """
+    Bind configured parameters to an indicator's `calculate` signature.
+
+    Applies the class's optional `PARAM_ALIASES` (config name -> argument name), drops keys that
+    `calculate` does not accept and fills in the defaults of the remaining arguments.
+
+    :param indicator_class: The indicator class.
+    :param params: Parameters from the config (may be None).
+    :return: Dict of every `calculate` parameter (except `df` and `context`) with its value.
+    """
+    aliases = getattr(indicator_class, 'PARAM_ALIASES', {})
+    params = {aliases.get(key, key): value for key, value in (params or {}).items()}
+
+    bound = {}
+    for name, parameter in inspect.signature(indicator_class.calculate).parameters.items():
+        if name in ('df', 'context') or parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        if name in params:
+            bound[name] = params[name]
+        elif parameter.default is not parameter.empty:
+            bound[name] = parameter.default
+    return bound
+
+
+def resolve_node(node, params):
+    """
+    Turn a declared `INPUTS` entry into a concrete node key.
+
+    :param node: A method name, or a tuple of a method name and arguments that may contain `Param`s.
+    :param params: The bound parameters of the declaring indicator.
+    :return: A hashable node key tuple.
+    """
+    if isinstance(node, str):
+        return (node,)
+    return tuple(params[item.name] if isinstance(item, Param) else item for item in node)
+
+
+def resolve_outputs(indicator_class, params):
+    """
+    Format the declared `OUTPUTS` column names (e.g. 'sma_{period}') with the bound parameters.
+    """
+    return [name.format(**params) for name in indicator_class.OUTPUTS]
+
+
+class IndicatorContext:
+    def __init__(self, df, instrument=None, granularity=None, dtype=None):
+        """
+        Initialize a context over one OHLCV DataFrame.
+
+        :param df: DataFrame with the OHLCV columns the indicators read.
+        :param instrument: The instrument the frame belongs to (e.g., 'EUR_USD'), for logging.
+        :param granularity: The granularity of the frame (e.g., 'M1'), for logging.
+        :param dtype: Optional floating dtype (e.g. np.float32) of the indicator outputs it caches.
+        """
+        self.df = df
+        self.instrument = instrument
+        self.granularity = granularity
+        self.dtype = dtype
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    @classmethod
+    def for_frame(cls, df, context=None):
+        """
+        Return the given context, or a private one over `df` when the caller did not pass any.
+
+        :param df: DataFrame the indicator is calculated on.
+        :param context: Optional shared context.
+        :return: An IndicatorContext over `df`.
+        """
+        return context if context is not None else cls(df)
+
+    def _memoize(self, key, builder):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._cache:
+                self._cache[key] = builder()
+        return self._cache[key]
+
+    def clear(self):
+        """
+        Drop every cached intermediate series.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._key_locks.clear()
+
+    def evaluate(self, node):
+        """
+        Compute (or fetch from the cache) the series behind a node key.
+
+        :param node: Node key tuple, e.g. ('true_range',) or ('ema', 'close', 12).
+        :return: The intermediate series.
+        """
+        return getattr(self, node[0])(*node[1:])
+
+    def indicator(self, indicator_class, **params):
+        """
+        Calculate an indicator on this context's frame once and cache its declared outputs.
+
+        Lets an indicator consume another one (e.g. a StochRSI reading RSI) without recomputing it
+        when the planner, or another consumer, already did.
+
+        :param indicator_class: The indicator class to calculate.
+        :param params: Parameters for the indicator's `compute`.
+        :return: DataFrame with the declared output columns (empty if the frame was too short).
+        """
+        params = bind_params(indicator_class, params)
+        key = ('indicator', indicator_class, tuple(sorted(params.items())))
+
+        def build():
+            # Output-only mode: concurrent indicators never add columns to the shared frame
+            result = indicator_class.compute(self.df, **params, context=self, dtype=self.dtype)
+            outputs = [name for name in resolve_outputs(indicator_class, params) if name in result.columns]
+            return result[outputs]
+
+        return self._memoize(key, build)
+
+    def mask_padding(self, values):
+        """
+        Set the NaN padding rows of a stacked frame back to NaN after an operation that filled them.
+
+        Series derived with `where(..., 0)` turn the padding of shorter histories into zeros, which
+        rolling windows would then count as data. Plain frames have no padding and pass through.
+
+        :param values: Series or (bars x instruments) DataFrame.
+        :return: `values` with the padding rows set to NaN.
+        """
+        if isinstance(self.df, StackedFrame):
+            return values.where(self.df.valid)
+        return values
+
+    def prev_close(self):
+        return self._memoize('prev_close', lambda: self.df['close'].shift())
+
+    def true_range(self):
+        """
+        True range: max(high - low, |high - previous close|, |low - previous close|).
+
+        The first bar has no previous close, so its true range is high - low.
+        """
+        def build():
+            high, low, prev_close = self.df['high'], self.df['low'], self.prev_close()
+            return np.fmax(high - low, np.fmax((high - prev_close).abs(), (low - prev_close).abs()))
+
+        return self._memoize('true_range', build)
+
+    def typical_price(self):
+        """
+        Typical price: (high + low + close) / 3.
+        """
+        return self._memoize('typical_price', lambda: (self.df['high'] + self.df['low'] + self.df['close']) / 3)
+
+    def close_diff(self):
+        return self._memoize('close_diff', lambda: self.df['close'].diff())
+
+    def gains(self):
+        """
+        Positive close-to-close changes, 0 elsewhere.
+        """
+        return self._memoize('gains', lambda: self.mask_padding(self.close_diff().where(self.close_diff() > 0, 0)))
+
+    def losses(self):
+        """
+        Magnitude of negative close-to-close changes, 0 elsewhere.
+        """
+        return self._memoize('losses', lambda: self.mask_padding(-self.close_diff().where(self.close_diff() < 0, 0)))
+
+    def sma(self, column, period):
+        return self._memoize(('sma', column, period), lambda: self.df[column].rolling(window=period).mean())
+
+    def ema(self, column, span, depth=1):
+        """
+        EMA of a column; `depth` > 1 smooths the previous depth again (the EMA chains of TRIX and TEMA).
+        """
+        if depth > 1:
+            return self._memoize(('ema', column, span, depth),
+                                 lambda: self.ema(column, span, depth - 1).ewm(span=span, adjust=False).mean())
+        return self._memoize(('ema', column, span), lambda: self.df[column].ewm(span=span, adjust=False).mean())
+
+    def rolling_max(self, column, period):
+        return self._memoize(('rolling_max', column, period),
+                             lambda: wrap_like(self.df[column], rolling.rolling_max(self.df[column].to_numpy(), period)))
+
+    def rolling_min(self, column, period):
+        return self._memoize(('rolling_min', column, period),
+                             lambda: wrap_like(self.df[column], rolling.rolling_min(self.df[column].to_numpy(), period)))
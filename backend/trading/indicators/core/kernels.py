@@ -0,0 +1,273 @@
+# backend/trading/indicators/core/kernels.py
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: the recurrences then run as interpreted loops, with the same results
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+"""
+NumPy kernels shared by the batch indicator calculations.
+
+The kernels take and return plain float arrays so the indicator classes can keep their
+DataFrame-in/DataFrame-out interface while the per-row work happens in compiled code. Bars run
+along the first axis: a 2-D (bars x instruments) array of a `StackedFrame` is processed column-wise
+in the same call. Windowed kernels return NaN for the first `window - 1` positions, like
+`Series.rolling(window)`.
+
+The path-dependent recurrences (Parabolic SAR, Supertrend) cannot be vectorized; their loops are
+compiled with numba when it is installed and loop over the instrument columns inside the compiled
+code. Their streaming classes implement the same rules one bar at a time.
+"""
+
+# Rows processed per block by the kernels that materialise (rows x window) temporaries.
+CHUNK_ROWS = 65536
+
+
+def _as_float_array(values):
+    return np.asarray(values, dtype=np.float64)
+
+
+def _windowed(values, window, reducer):
+    """
+    Apply a reducer over every full sliding window, in blocks to bound temporary memory.
+
+    :param values: 1-D array of values, or 2-D (bars x instruments) array.
+    :param window: Window length.
+    :param reducer: Callable reducing the last axis of a (rows [x instruments] x window) view.
+    :return: Array of reduced values aligned to the window end, NaN-padded at the start.
+    """
+    values = _as_float_array(values)
+    out = np.full(values.shape, np.nan)
+    if window < 1 or values.shape[0] < window:
+        return out
+
+    windows = sliding_window_view(values, window, axis=0)
+    for start in range(0, windows.shape[0], CHUNK_ROWS):
+        block = windows[start:start + CHUNK_ROWS]
+        out[start + window - 1:start + window - 1 + block.shape[0]] = reducer(block)
+    return out
+
+
+def _nan_if_incomplete(block, reduced):
+    # rolling() yields NaN for windows holding a NaN; argmax/argmin would point at the NaN instead
+    return np.where(np.isnan(block).any(axis=-1), np.nan, reduced)
+
+
+def obv(close, volume):
+    """
+    On-Balance Volume as a signed cumulative sum of volume.
+
+    :param close: Array of close prices.
+    :param volume: Array of volumes.
+    :return: Array of OBV values, starting at 0 on the first bar.
+    """
+    close = _as_float_array(close)
+    direction = np.zeros_like(close)
+    direction[1:] = np.sign(np.diff(close, axis=0))
+    # NaN closes contribute no volume, matching the strict > / < comparisons of the row loop
+    direction[np.isnan(direction)] = 0
+    # Unchanged closes skip the bar entirely, so a missing volume (or stacked padding) adds nothing
+    flow = np.where(direction == 0, 0.0, direction * _as_float_array(volume))
+    return np.cumsum(flow, axis=0)
+
+
+def rolling_argmax(values, window):
+    """
+    Position of the first maximum inside each sliding window (0 = oldest bar).
+
+    :param values: 1-D array of values.
+    :param window: Window length.
+    :return: Float array of positions, NaN until the first full window.
+    """
+    return _windowed(values, window, lambda block: _nan_if_incomplete(block, np.argmax(block, axis=-1)))
+
+
+def rolling_argmin(values, window):
+    """
+    Position of the first minimum inside each sliding window (0 = oldest bar).
+
+    :param values: 1-D array of values.
+    :param window: Window length.
+    :return: Float array of positions, NaN until the first full window.
+    """
+    return _windowed(values, window, lambda block: _nan_if_incomplete(block, np.argmin(block, axis=-1)))
+
+
+def rolling_mean_abs_dev(values, window):
+    """
+    Mean absolute deviation of each sliding window around its own mean.
+
+    :param values: 1-D array of values.
+    :param window: Window length.
+    :return: Float array of mean absolute deviations, NaN until the first full window.
+    """
+    def reducer(block):
+        return np.mean(np.abs(block - block.mean(axis=-1, keepdims=True)), axis=-1)
+
+    return _windowed(values, window, reducer)
+
+
+def weighted_moving_average(values, window):
+    """
+    Linearly weighted moving average (weights 1..window, the newest bar weighted most).
+
+    :param values: 1-D array of values, or 2-D (bars x instruments) array.
+    :param window: Window length.
+    :return: Float array of weighted averages, NaN until the first full window.
+    """
+    weights = np.arange(1, window + 1, dtype=np.float64)
+    weights /= weights.sum()
+    return _windowed(values, window, lambda block: block @ weights)
+
+
+def sign_signal(values):
+    """
+    Map values to a +1 / -1 signal (+1 when strictly positive, -1 otherwise, including NaN).
+
+    :param values: Array of values.
+    :return: Integer array of signals.
+    """
+    return np.where(_as_float_array(values) > 0, 1, -1)
+
+
+def where_greater(left, right, values):
+    """
+    Select `values` where `left > right`, 0 elsewhere (NaN comparisons select 0).
+
+    :param left: Array compared on the left-hand side.
+    :param right: Array compared on the right-hand side.
+    :param values: Array of values to select from.
+    :return: Float array.
+    """
+    return np.where(_as_float_array(left) > _as_float_array(right), _as_float_array(values), 0.0)
+
+
+def _as_rows(values):
+    # The compiled loops walk each instrument's bars contiguously: (instruments x bars) arrays
+    values = _as_float_array(values)
+    return np.ascontiguousarray(values.reshape(len(values), -1).T)
+
+
+@njit(cache=True)
+def _psar_rows(high, low, step, max_step):
+    instruments, bars = high.shape
+    psar = np.full((instruments, bars), np.nan)
+    direction = np.full((instruments, bars), np.nan)
+    for j in range(instruments):
+        # Bars seen since the last gap (0, 1, or 2 once the trend runs)
+        seen = 0
+        sar = extreme = factor = trend = 0.0
+        older_high = older_low = prev_high = prev_low = 0.0
+        for i in range(bars):
+            bar_high, bar_low = high[j, i], low[j, i]
+            if np.isnan(bar_high) or np.isnan(bar_low):
+                # A gap restarts the SAR from the next two valid bars
+                seen = 0
+                continue
+            if seen == 0:
+                prev_high, prev_low = bar_high, bar_low
+                seen = 1
+                continue
+            if seen == 1:
+                # Second bar: the trend follows the move of the median price
+                trend = 1.0 if bar_high + bar_low >= prev_high + prev_low else -1.0
+                sar = prev_low if trend == 1.0 else prev_high
+                extreme = bar_high if trend == 1.0 else bar_low
+                factor = step
+                seen = 2
+            else:
+                sar = sar + factor * (extreme - sar)
+                if trend == 1.0:
+                    # The SAR may not rise above the last two lows
+                    sar = min(sar, prev_low, older_low)
+                    if bar_low < sar:
+                        trend, sar, extreme, factor = -1.0, extreme, bar_low, step
+                    elif bar_high > extreme:
+                        extreme = bar_high
+                        factor = min(factor + step, max_step)
+                else:
+                    # The SAR may not fall below the last two highs
+                    sar = max(sar, prev_high, older_high)
+                    if bar_high > sar:
+                        trend, sar, extreme, factor = 1.0, extreme, bar_high, step
+                    elif bar_low < extreme:
+                        extreme = bar_low
+                        factor = min(factor + step, max_step)
+            older_high, older_low, prev_high, prev_low = prev_high, prev_low, bar_high, bar_low
+            psar[j, i] = sar
+            direction[j, i] = trend
+    return psar, direction
+
+
+def psar(high, low, step, max_step):
+    """
+    Wilder's Parabolic SAR (the rules of `PSARStream.step`, run over whole columns).
+
+    :param high: Array of high prices.
+    :param low: Array of low prices.
+    :param step: Acceleration factor increment (and starting value).
+    :param max_step: Maximum acceleration factor.
+    :return: Tuple (psar, direction) of float arrays shaped like `high`; NaN on the first bar of
+        every run and on missing prices.
+    """
+    shape = np.shape(high)
+    sar, direction = _psar_rows(_as_rows(high), _as_rows(low), float(step), float(max_step))
+    return sar.T.reshape(shape), direction.T.reshape(shape)
+
+
+@njit(cache=True)
+def _supertrend_rows(high, low, close, atr, multiplier):
+    instruments, bars = close.shape
+    supertrend = np.full((instruments, bars), np.nan)
+    direction = np.full((instruments, bars), np.nan)
+    for j in range(instruments):
+        running = False
+        trend = prev_upper = prev_lower = prev_close = 0.0
+        for i in range(bars):
+            if np.isnan(atr[j, i]) or np.isnan(close[j, i]):
+                running = False
+                continue
+            median = (high[j, i] + low[j, i]) / 2
+            upper = median + multiplier * atr[j, i]
+            lower = median - multiplier * atr[j, i]
+            if not running:
+                # First bar of a run: start in a downtrend unless the close is already above the upper band
+                trend = 1.0 if close[j, i] > upper else -1.0
+                running = True
+            else:
+                # The bands only tighten while the previous close stays inside them
+                if not (upper < prev_upper or prev_close > prev_upper):
+                    upper = prev_upper
+                if not (lower > prev_lower or prev_close < prev_lower):
+                    lower = prev_lower
+                if trend == -1.0 and close[j, i] > upper:
+                    trend = 1.0
+                elif trend == 1.0 and close[j, i] < lower:
+                    trend = -1.0
+            prev_upper, prev_lower, prev_close = upper, lower, close[j, i]
+            supertrend[j, i] = lower if trend == 1.0 else upper
+            direction[j, i] = trend
+    return supertrend, direction
+
+
+def supertrend(high, low, close, atr, multiplier):
+    """
+    Supertrend line and direction (the rules of `SupertrendState.step`, run over whole columns).
+
+    :param high: Array of high prices.
+    :param low: Array of low prices.
+    :param close: Array of close prices.
+    :param atr: Array of ATR values (NaN during warm-up).
+    :param multiplier: Number of ATRs between the median price and each band.
+    :return: Tuple (supertrend, direction) of float arrays shaped like `close`, NaN while the ATR
+        is not available.
+    """
+    shape = np.shape(close)
+    line, direction = _supertrend_rows(_as_rows(high), _as_rows(low), _as_rows(close),
+                                          _as_rows(atr), float(multiplier))
+    return line.T.reshape(shape), direction.T.reshape(shape)
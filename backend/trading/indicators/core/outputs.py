@@ -0,0 +1,61 @@
+# backend/trading/indicators/core/outputs.py
+import numpy as np
+import pandas as pd
+
+from trading.indicators.core.stacked import StackedFrame
+
+"""
+Helpers for the output-only `compute` mode of the indicators.
+
+`compute` reads the OHLCV columns, keeps its temporaries in local variables and returns a new
+DataFrame holding only the declared outputs, so the caller's frame is never widened with scratch
+columns and the temporaries are freed as soon as the call returns. `calculate` keeps its historical
+in-place behaviour by writing those outputs back into the caller's frame. Both also accept a
+`StackedFrame`, whose outputs are (bars x instruments) DataFrames.
+"""
+
+
+def wrap_like(template, values):
+    """
+    Wrap the array result of a NumPy kernel in the pandas type of the series it was computed from.
+
+    :param template: Series, or (bars x instruments) DataFrame of a StackedFrame.
+    :param values: Array shaped like `template`.
+    :return: Series or DataFrame sharing the index (and columns) of `template`.
+    """
+    if isinstance(template, pd.DataFrame):
+        return pd.DataFrame(values, index=template.index, columns=template.columns)
+    return pd.Series(values, index=template.index)
+
+
+def output_frame(df, outputs, dtype=None):
+    """
+    Build the output DataFrame of a `compute` call.
+
+    :param df: The input DataFrame (its index is reused) or StackedFrame.
+    :param outputs: Dict {column name: Series or array} in declared order; empty if nothing was computed.
+    :param dtype: Optional floating dtype (e.g. np.float32) for the floating-point outputs.
+    :return: DataFrame indexed like `df` holding only the outputs (a StackedFrame for stacked input).
+    """
+    columns = {}
+    for name, values in outputs.items():
+        values = values.to_numpy() if isinstance(values, (pd.Series, pd.DataFrame)) else np.asarray(values)
+        if dtype is not None and np.issubdtype(values.dtype, np.floating):
+            values = values.astype(dtype, copy=False)
+        columns[name] = values
+    if isinstance(df, StackedFrame):
+        return df.with_columns(columns)
+    return pd.DataFrame(columns, index=df.index)
+
+
+def assign_outputs(df, outputs):
+    """
+    Write the columns of a `compute` result into the caller's DataFrame.
+
+    :param df: The DataFrame passed to `calculate`.
+    :param outputs: DataFrame returned by `compute`.
+    :return: `df`, with the output columns added or replaced.
+    """
+    for name in outputs.columns:
+        df[name] = outputs[name].to_numpy()
+    return df
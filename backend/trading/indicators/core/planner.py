@@ -0,0 +1,182 @@
+# backend/trading/indicators/core/planner.py
+import importlib
+import inspect
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from logs.log_manager import LogManager
+from trading.indicators.core.context import Param, bind_params, resolve_node
+
+# Configure loggers
+logger = LogManager('indicator_planner_logs').get_logger()
+
+"""
+Dependency planner for the indicator run.
+
+Every indicator class declares the intermediate nodes it reads in `INPUTS` (see
+`trading.indicators.core.context`) and the columns it produces in `OUTPUTS`; an `INPUTS` entry of
+the form `('indicator', OtherIndicator, {...})` makes it depend on another indicator. The planner
+expands the requested indicators into a DAG, dedupes nodes shared by several indicators (the true
+range of ATR and ADX, the EMAs of MACD and PPO, ...) and evaluates it in topological order on a
+thread pool, so independent branches run concurrently (NumPy and the pandas window kernels release
+the GIL) and each node is computed exactly once per context.
+"""
+
+INDICATORS_PACKAGE = 'trading.indicators'
+
+
+def discover_indicators(indicators_dir=None):
+    """
+    Import every indicator module and collect the classes that declare `OUTPUTS`.
+
+    :param indicators_dir: Directory holding the indicator modules (defaults to trading/indicators).
+    :return: Dict of {class name: class}, e.g. {'ATR': ATR, 'BollingerBands': BollingerBands}.
+    """
+    indicators_dir = indicators_dir or os.path.join(os.path.dirname(__file__), os.pardir)
+    indicator_classes = {}
+    for file_name in sorted(os.listdir(indicators_dir)):
+        if not file_name.endswith('.py') or file_name == '__init__.py':
+            continue
+        module_name = f'{INDICATORS_PACKAGE}.{file_name[:-3]}'
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            logger.error(f"Failed to import indicator module {module_name}: {e}")
+            continue
+        for name, member in inspect.getmembers(module, inspect.isclass):
+            if member.__module__ == module_name and hasattr(member, 'OUTPUTS'):
+                indicator_classes[name] = member
+    return indicator_classes
+
+
+def _indicator_node(indicator_class, params):
+    params = bind_params(indicator_class, params)
+    return ('indicator', indicator_class, tuple(sorted(params.items())))
+
+
+class IndicatorPlanner:
+    def __init__(self, max_workers=None):
+        """
+        Initialize the planner.
+
+        :param max_workers: Size of the thread pool used to run independent nodes (None = executor default).
+        """
+        self.max_workers = max_workers
+
+    def _dependencies(self, node):
+        if node[0] != 'indicator':
+            return []
+        indicator_class, params = node[1], dict(node[2])
+        dependencies = []
+        for declared in getattr(indicator_class, 'INPUTS', ()):
+            if not isinstance(declared, str) and declared[0] == 'indicator':
+                dependency_params = {key: params[value.name] if isinstance(value, Param) else value
+                                     for key, value in declared[2].items()}
+                dependencies.append(_indicator_node(declared[1], dependency_params))
+            else:
+                dependencies.append(resolve_node(declared, params))
+        return dependencies
+
+    def plan(self, requests):
+        """
+        Build the dependency graph for a set of indicator requests.
+
+        :param requests: Iterable of (indicator class, params) pairs.
+        :return: Tuple of (dict {node: set of dependency nodes}, list of requested indicator nodes).
+        """
+        graph = {}
+        roots = []
+        stack = []
+        for indicator_class, params in requests:
+            node = _indicator_node(indicator_class, params)
+            if node not in roots:
+                roots.append(node)
+            stack.append(node)
+
+        while stack:
+            node = stack.pop()
+            if node in graph:
+                continue
+            graph[node] = set(self._dependencies(node))
+            stack.extend(dependency for dependency in graph[node] if dependency not in graph)
+
+        return graph, roots
+
+    def topological_order(self, graph):
+        """
+        Order the nodes of a graph so that every node comes after its dependencies.
+
+        :param graph: Dict {node: set of dependency nodes}.
+        :return: List of nodes.
+        """
+        order, state = [], {}
+
+        def visit(node):
+            if state.get(node) == 'done':
+                return
+            if state.get(node) == 'visiting':
+                raise ValueError(f"Indicator dependency cycle through {node}")
+            state[node] = 'visiting'
+            for dependency in graph[node]:
+                visit(dependency)
+            state[node] = 'done'
+            order.append(node)
+
+        for node in graph:
+            visit(node)
+        return order
+
+    def _evaluate(self, context, node):
+        if node[0] == 'indicator':
+            return context.indicator(node[1], **dict(node[2]))
+        return context.evaluate(node)
+
+    def execute(self, requests, context):
+        """
+        Evaluate the requested indicators on a context, running independent nodes in parallel.
+
+        A node that fails is logged and its dependents are skipped; the other branches still run.
+
+        :param requests: Iterable of (indicator class, params) pairs.
+        :param context: IndicatorContext over the frame to calculate on.
+        :return: Dict {(indicator class, bound params): output DataFrame} for each request that succeeded.
+        """
+        graph, roots = self.plan(requests)
+        self.topological_order(graph)  # Fail fast on cycles before anything is submitted
+
+        remaining = {node: set(dependencies) for node, dependencies in graph.items()}
+        dependents = {node: set() for node in graph}
+        for node, dependencies in graph.items():
+            for dependency in dependencies:
+                dependents[dependency].add(node)
+
+        results, failed = {}, set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {pool.submit(self._evaluate, context, node): node
+                       for node, dependencies in remaining.items() if not dependencies}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    try:
+                        results[node] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error calculating {self.describe(node)} for {context.instrument}: {e}")
+                        failed.add(node)
+                        continue
+                    for dependent in dependents[node]:
+                        remaining[dependent].discard(node)
+                        if not remaining[dependent] and not (graph[dependent] & failed):
+                            running[pool.submit(self._evaluate, context, dependent)] = dependent
+
+        skipped = [node for node in roots if node not in results and node not in failed]
+        for node in skipped:
+            logger.warning(f"Skipped {self.describe(node)} for {context.instrument}: a dependency failed.")
+
+        return {(node[1], node[2]): results[node] for node in roots if node in results}
+
+    @staticmethod
+    def describe(node):
+        if node[0] == 'indicator':
+            return f"{node[1].__name__}{dict(node[2])}"
+        return ':'.join(str(part) for part in node)
@@ -0,0 +1,172 @@
+# backend/trading/indicators/core/rolling.py
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from trading.indicators.core import kernels
+
+"""
+Rolling extrema (max/min and their position) backed by monotonic deques.
+
+Each window element enters and leaves the deque at most once, so both the incremental
+`RollingMax`/`RollingMin` classes and the batch `rolling_*` functions cost amortized O(1) per bar
+whatever the window length. Ties resolve to the oldest bar, like `np.argmax`/`np.argmin`, and a
+window that contains a NaN yields NaN, like `Series.rolling(window)`.
+"""
+
+# Below this window length the strided NumPy argmax (O(n*window) in C) beats the Python deque loop.
+DEQUE_MIN_WINDOW = 128
+
+
+class RollingMax:
+    """
+    Incremental rolling maximum over the last `window` values.
+
+    After each `update` the `position` attribute holds the offset of the maximum inside the window
+    (0 = oldest bar, window - 1 = newest), or NaN while the window is not full.
+    """
+
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("Rolling window length must be at least 1.")
+        self.window = window
+        self.position = float('nan')
+        self._candidates = deque()  # (index, key) pairs with strictly decreasing keys
+        self._index = -1
+        self._last_nan = -window - 1
+
+    def _key(self, value):
+        return value
+
+    def update(self, value):
+        """
+        Push a new value into the window.
+
+        :param value: The new value.
+        :return: The extremum of the current window (NaN during warm-up or if the window holds NaN).
+        """
+        self._index += 1
+        index = self._index
+        value = float(value)
+
+        if value != value:
+            self._last_nan = index
+        else:
+            key = self._key(value)
+            while self._candidates and self._candidates[-1][1] < key:
+                self._candidates.pop()
+            self._candidates.append((index, key))
+
+        oldest = index - self.window + 1
+        while self._candidates and self._candidates[0][0] < oldest:
+            self._candidates.popleft()
+
+        if oldest < 0 or self._last_nan >= oldest:
+            self.position = float('nan')
+            return float('nan')
+
+        best_index, best_key = self._candidates[0]
+        self.position = best_index - oldest
+        return self._key(best_key)
+
+
+class RollingMin(RollingMax):
+    """
+    Incremental rolling minimum over the last `window` values (see `RollingMax`).
+    """
+
+    def _key(self, value):
+        return -value
+
+
+def _rolling_extremum(values, window):
+    """
+    Monotonic-deque sweep returning the rolling maximum and its position inside each window.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    count = values.shape[0]
+    extremum = np.full(count, np.nan)
+    position = np.full(count, np.nan)
+
+    candidates = deque()
+    last_nan = -window - 1
+    keys = values.tolist()
+    for index, key in enumerate(keys):
+        if key != key:
+            last_nan = index
+        else:
+            while candidates and keys[candidates[-1]] < key:
+                candidates.pop()
+            candidates.append(index)
+
+        oldest = index - window + 1
+        while candidates and candidates[0] < oldest:
+            candidates.popleft()
+        if oldest >= 0 and last_nan < oldest:
+            best = candidates[0]
+            extremum[index] = keys[best]
+            position[index] = best - oldest
+
+    return extremum, position
+
+
+def _as_frame(values):
+    values = np.asarray(values, dtype=np.float64)
+    return pd.Series(values) if values.ndim == 1 else pd.DataFrame(values)
+
+
+def rolling_max(values, window):
+    """
+    Rolling maximum of an array.
+
+    Delegates to pandas' `rolling().max()`, which runs the same monotonic-deque algorithm in Cython.
+
+    :param values: 1-D array of values, or 2-D (bars x instruments) array processed column-wise.
+    :param window: Window length.
+    :return: Float array, NaN until the first full window.
+    """
+    return _as_frame(values).rolling(window=window).max().to_numpy()
+
+
+def rolling_min(values, window):
+    """
+    Rolling minimum of an array (see `rolling_max`).
+
+    :param values: 1-D array of values, or 2-D (bars x instruments) array processed column-wise.
+    :param window: Window length.
+    :return: Float array, NaN until the first full window.
+    """
+    return _as_frame(values).rolling(window=window).min().to_numpy()
+
+
+def rolling_argmax(values, window):
+    """
+    Offset of the first maximum inside each sliding window (0 = oldest bar).
+
+    :param values: 1-D array of values, or 2-D (bars x instruments) array processed column-wise.
+    :param window: Window length.
+    :return: Float array of offsets, NaN until the first full window.
+    """
+    if window < DEQUE_MIN_WINDOW:
+        return kernels.rolling_argmax(values, window)
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 2:
+        return np.column_stack([rolling_argmax(column, window) for column in values.T])
+    return _rolling_extremum(values, window)[1]
+
+
+def rolling_argmin(values, window):
+    """
+    Offset of the first minimum inside each sliding window (0 = oldest bar).
+
+    :param values: 1-D array of values, or 2-D (bars x instruments) array processed column-wise.
+    :param window: Window length.
+    :return: Float array of offsets, NaN until the first full window.
+    """
+    if window < DEQUE_MIN_WINDOW:
+        return kernels.rolling_argmin(values, window)
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 2:
+        return np.column_stack([rolling_argmin(column, window) for column in values.T])
+    return _rolling_extremum(-values, window)[1]
@@ -0,0 +1,117 @@
+# backend/trading/indicators/core/stacked.py
+import numpy as np
+import pandas as pd
+
+"""
+Cross-instrument stacking for the indicator run.
+
+`StackedFrame` holds the OHLCV series of many instruments as one (bars x instruments) DataFrame per
+column, so every indicator is evaluated for all instruments in a single vectorized call instead of
+once per pair. Each instrument's history is right-aligned on the most recent bar and left-padded
+with NaN, which the rolling windows, EWMs and cumulative sums treat like the warm-up of a shorter
+series; `split` trims the padding again and restores each instrument's own index.
+
+A StackedFrame quacks like the OHLCV DataFrame the indicators expect: `frame['close']`,
+`frame.columns`, `frame.index` and `len(frame)` work, and `compute` returns a StackedFrame holding
+its outputs.
+"""
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class StackedFrame:
+    def __init__(self, columns, instruments, lengths, indexes):
+        """
+        Initialize a stacked frame from already aligned columns (see `stack`).
+
+        :param columns: Dict {column name: DataFrame (bars x instruments)}.
+        :param instruments: List of instruments, in column order.
+        :param lengths: Dict {instrument: number of real bars}.
+        :param indexes: Dict {instrument: the index of its original DataFrame}.
+        """
+        self._columns = dict(columns)
+        self.instruments = list(instruments)
+        self.lengths = dict(lengths)
+        self.indexes = dict(indexes)
+        self.index = pd.RangeIndex(max(self.lengths.values(), default=0))
+
+    @classmethod
+    def stack(cls, frames, columns=OHLCV_COLUMNS):
+        """
+        Right-align the OHLCV frames of several instruments into (bars x instruments) DataFrames.
+
+        :param frames: Dict {instrument: DataFrame with the OHLCV columns}.
+        :param columns: Columns to stack (each must exist in every frame).
+        :return: A StackedFrame.
+        """
+        instruments = list(frames)
+        lengths = {instrument: len(df) for instrument, df in frames.items()}
+        bars = max(lengths.values(), default=0)
+        index = pd.RangeIndex(bars)
+
+        stacked = {}
+        for column in columns:
+            data = np.full((bars, len(instruments)), np.nan)
+            for position, instrument in enumerate(instruments):
+                values = frames[instrument][column].to_numpy(dtype=np.float64)
+                data[bars - len(values):, position] = values
+            stacked[column] = pd.DataFrame(data, index=index, columns=instruments)
+
+        return cls(stacked, instruments, lengths, {instrument: df.index for instrument, df in frames.items()})
+
+    def with_columns(self, columns):
+        """
+        Build a StackedFrame over the same instruments from new (bars x instruments) columns.
+
+        :param columns: Dict {column name: DataFrame or 2-D array (bars x instruments)}.
+        :return: A StackedFrame.
+        """
+        wide = {name: values if isinstance(values, pd.DataFrame)
+                else pd.DataFrame(values, index=self.index, columns=self.instruments)
+                for name, values in columns.items()}
+        return StackedFrame(wide, self.instruments, self.lengths, self.indexes)
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    @property
+    def valid(self):
+        """
+        Boolean DataFrame (bars x instruments), False on the NaN padding of shorter histories.
+        """
+        bars = len(self.index)
+        starts = np.array([bars - self.lengths[instrument] for instrument in self.instruments])
+        return pd.DataFrame(np.arange(bars)[:, None] >= starts, index=self.index, columns=self.instruments)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, column):
+        return column in self._columns
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._columns[key]
+        return self.with_columns({column: self._columns[column] for column in key})
+
+    def __setitem__(self, column, values):
+        if not isinstance(values, pd.DataFrame):
+            values = pd.DataFrame(values, index=self.index, columns=self.instruments)
+        self._columns[column] = values
+
+    def split(self):
+        """
+        Split the stacked columns back into one DataFrame per instrument.
+
+        :return: Dict {instrument: DataFrame with every column, trimmed of its padding and carrying
+            the instrument's original index}.
+        """
+        bars = len(self.index)
+        frames = {}
+        for position, instrument in enumerate(self.instruments):
+            start = bars - self.lengths[instrument]
+            frames[instrument] = pd.DataFrame(
+                {column: values.iloc[start:, position].to_numpy() for column, values in self._columns.items()},
+                index=self.indexes[instrument])
+        return frames
@@ -0,0 +1,220 @@
+# backend/trading/indicators/core/streaming.py
+import math
+from collections import deque
+
+"""
+Rolling state primitives shared by the streaming indicator calculators.
+
+Every indicator module exposes a `<Name>Stream` class (created through `<Name>.stream(...)`) that
+is fed one candle at a time with `update(candle)`. The primitives below keep only the state needed
+to produce the next value and reproduce the pandas semantics used by the batch `calculate` methods
+(NaN until the window is full, `ewm(adjust=False)` seeding, NaN propagation inside windows).
+"""
+
+NAN = float('nan')
+
+# Running sums are recomputed from the buffer after this many full window turns to bound float drift.
+RESYNC_WINDOWS = 64
+
+
+def is_nan(value):
+    """
+    Check whether a value is NaN (or None, which is treated as a missing value).
+
+    :param value: The value to check.
+    :return: True if the value is missing.
+    """
+    return value is None or value != value
+
+
+def divide(numerator, denominator):
+    """
+    Divide two floats with NumPy semantics (x/0 -> +/-inf, 0/0 -> NaN) instead of raising.
+
+    :param numerator: The dividend.
+    :param denominator: The divisor.
+    :return: The quotient.
+    """
+    if is_nan(numerator) or is_nan(denominator):
+        return NAN
+    if denominator == 0:
+        if numerator == 0:
+            return NAN
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+class RollingWindow:
+    """
+    Fixed-length ring buffer that keeps a running sum of the values it holds.
+
+    Matches `Series.rolling(window=period)` with the default `min_periods`: aggregates are NaN until
+    the buffer is full and whenever a NaN is inside the window.
+    """
+
+    def __init__(self, period):
+        if period < 1:
+            raise ValueError("Rolling window period must be at least 1.")
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.total = 0.0
+        self.nan_count = 0
+        self._pushes = 0
+
+    def push(self, value):
+        """
+        Add a value to the window, evicting the oldest one once the window is full.
+
+        :param value: The new value (NaN is allowed and poisons the window until it is evicted).
+        """
+        value = NAN if value is None else float(value)
+        if len(self.values) == self.period:
+            oldest = self.values[0]
+            if is_nan(oldest):
+                self.nan_count -= 1
+            else:
+                self.total -= oldest
+        self.values.append(value)
+        if is_nan(value):
+            self.nan_count += 1
+        else:
+            self.total += value
+
+        self._pushes += 1
+        if self._pushes >= RESYNC_WINDOWS * self.period:
+            self.total = math.fsum(v for v in self.values if not is_nan(v))
+            self._pushes = 0
+
+    @property
+    def ready(self):
+        """
+        True when the window is full and contains no NaN values.
+        """
+        return len(self.values) == self.period and self.nan_count == 0
+
+    def sum(self):
+        return self.total if self.ready else NAN
+
+    def mean(self):
+        return self.total / self.period if self.ready else NAN
+
+
+class RollingMoments(RollingWindow):
+    """
+    Rolling window that also tracks the sample variance with a sliding Welford update.
+
+    Matches `Series.rolling(window=period).std()` (ddof=1) without re-scanning the window.
+    """
+
+    def __init__(self, period):
+        super().__init__(period)
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, value):
+        value = NAN if value is None else float(value)
+        evicted = self.values[0] if len(self.values) == self.period else None
+        super().push(value)
+
+        if self.nan_count or len(self.values) < self.period:
+            return
+        if evicted is None or is_nan(evicted) or self._pushes == 0:
+            # Window just (re)filled or was resynced: rebuild the moments from the buffer.
+            self._rebuild()
+            return
+        old_mean = self._mean
+        self._mean += (value - evicted) / self.period
+        self._m2 += (value - evicted) * (value - self._mean + evicted - old_mean)
+        if self._m2 < 0:
+            self._m2 = 0.0
+
+    def _rebuild(self):
+        count = len(self.values)
+        self._mean = math.fsum(self.values) / count if count else 0.0
+        self._m2 = math.fsum((v - self._mean) ** 2 for v in self.values)
+
+    def std(self):
+        if not self.ready or self.period < 2:
+            return NAN
+        return math.sqrt(self._m2 / (self.period - 1))
+
+
+class WeightedWindow(RollingWindow):
+    """
+    Rolling window that also keeps the linearly weighted sum (weights 1..period, newest heaviest).
+
+    Matches the batch `kernels.weighted_moving_average` with an O(1) update per value.
+    """
+
+    def __init__(self, period):
+        super().__init__(period)
+        self.weighted = 0.0
+
+    def push(self, value):
+        value = NAN if value is None else float(value)
+        previous_total = self.total if self.ready else None
+        super().push(value)
+
+        if not self.ready:
+            return
+        if previous_total is None or self._pushes == 0:
+            # Window just (re)filled or was resynced: rebuild the weighted sum from the buffer.
+            self.weighted = math.fsum(weight * v for weight, v in enumerate(self.values, 1))
+            return
+        # Every value loses one unit of weight and the new one enters with the full weight
+        self.weighted += self.period * value - previous_total
+
+    def weighted_mean(self):
+        return self.weighted / (self.period * (self.period + 1) / 2) if self.ready else NAN
+
+
+class EMAState:
+    """
+    Exponential moving average state matching `Series.ewm(span=span, adjust=False).mean()`.
+    """
+
+    def __init__(self, span):
+        if span < 1:
+            raise ValueError("EMA span must be at least 1.")
+        self.alpha = 2.0 / (span + 1.0)
+        self.value = None
+        self.old_weight = 1.0
+
+    def update(self, value):
+        """
+        Fold a new observation into the average.
+
+        :param value: The new observation; NaN leaves the average unchanged but keeps decaying its
+            weight, so the next observation counts more (pandas' default `ignore_na=False`).
+        :return: The current EMA value (NaN until the first valid observation).
+        """
+        if self.value is None:
+            if not is_nan(value):
+                self.value = float(value)
+        else:
+            self.old_weight *= 1.0 - self.alpha
+            if not is_nan(value):
+                if self.old_weight == 1.0 - self.alpha:
+                    self.value = (1.0 - self.alpha) * self.value + self.alpha * value
+                else:
+                    self.value = (self.old_weight * self.value + self.alpha * value) / (self.old_weight + self.alpha)
+                self.old_weight = 1.0
+        return NAN if self.value is None else self.value
+
+
+class TrueRangeState:
+    """
+    Incremental true range matching the batch `max(high-low, |high-prev_close|, |low-prev_close|)`.
+
+    The first bar has no previous close, so its true range is `high - low`.
+    """
+
+    def __init__(self):
+        self.prev_close = None
+
+    def update(self, high, low, close):
+        true_range = high - low
+        if self.prev_close is not None:
+            true_range = max(true_range, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        return true_range
@@ -0,0 +1,120 @@
+# backend/trading/indicators/core/sweep.py
+import numpy as np
+
+"""
+Parameter-vectorized window kernels for the indicator `sweep` entry points.
+
+A parameter search evaluates the same indicator for many window lengths. Instead of one rolling
+pass per period, these kernels build the prefix sum of a series once and read every window sum as
+the difference of two prefix entries, so each extra period costs one vector subtraction. Results
+are (bars x periods) arrays; column j uses `periods[j]`.
+
+Like `Series.rolling(window)`, a window that is not full yet or holds a NaN or infinity yields NaN
+and a window of identical values yields their exact sum. Values are centred on their first finite
+value before summing so the prefix sums of price-like series stay small; elsewhere the results
+agree with the single-period rolling calculation to rounding (~1e-12 relative on prices).
+"""
+
+
+def as_periods(periods):
+    """
+    Validate a vector of window lengths.
+
+    :param periods: Int or sequence of ints.
+    :return: 1-D int array of periods.
+    """
+    periods = np.atleast_1d(np.asarray(periods, dtype=np.int64))
+    if periods.ndim != 1 or periods.size == 0:
+        raise ValueError("Periods must be a non-empty 1-D sequence of window lengths.")
+    if (periods < 1).any():
+        raise ValueError("Rolling window length must be at least 1.")
+    return periods
+
+
+def _prefix_sums(values):
+    """
+    Prefix sums of the centred values and of the non-finite flags, along the first axis.
+
+    :return: Tuple (value prefix, missing-count prefix, centre), both prefixes with a leading 0 row.
+    """
+    # Infinities are counted as missing: they would poison every later prefix entry, and pandas
+    # rolling sums also return NaN for windows holding one
+    missing = ~np.isfinite(values)
+    finite = values[~missing]
+    centre = finite.flat[0] if finite.size else 0.0
+    filled = np.where(missing, 0.0, values - centre)
+
+    zeros = np.zeros((1,) + values.shape[1:])
+    value_prefix = np.concatenate([zeros, np.cumsum(filled, axis=0)])
+    nan_prefix = np.concatenate([zeros, np.cumsum(missing, axis=0)])
+    return value_prefix, nan_prefix, centre
+
+
+def _run_lengths(values):
+    """
+    Length of the run of identical values ending at each bar, along the first axis.
+    """
+    count = values.shape[0]
+    index = np.arange(count).reshape((count,) + (1,) * (values.ndim - 1))
+    changed = np.ones(values.shape, dtype=bool)
+    changed[1:] = values[1:] != values[:-1]
+    run_start = np.maximum.accumulate(np.where(changed, index, 0), axis=0)
+    return index - run_start + 1
+
+
+def _rolling(values, periods, mean):
+    periods = as_periods(periods)
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 2 and values.shape[1] != periods.size:
+        raise ValueError("A 2-D input needs exactly one column per period.")
+
+    count = values.shape[0]
+    value_prefix, nan_prefix, centre = _prefix_sums(values)
+    run_lengths = _run_lengths(values)
+    # Windows of a non-negative series (true range, gains, volumes) must not round below zero
+    non_negative = not (values < 0).any()
+    out = np.full((count, periods.size), np.nan)
+
+    for column, period in enumerate(periods):
+        if period > count:
+            continue
+        if values.ndim == 2:
+            prefix, nans = value_prefix[:, column], nan_prefix[:, column]
+            series, runs = values[:, column], run_lengths[:, column]
+        else:
+            prefix, nans, series, runs = value_prefix, nan_prefix, values, run_lengths
+        window = prefix[period:] - prefix[:count - period + 1] + period * centre
+        flat_value = series[period - 1:]
+        if mean:
+            window = window / period
+        else:
+            flat_value = flat_value * period
+        # A window of identical values is exact, as in pandas, so flat stretches give exact zeros
+        window = np.where(runs[period - 1:] >= period, flat_value, window)
+        if non_negative:
+            window = np.maximum(window, 0.0)
+        window_nans = nans[period:] - nans[:count - period + 1]
+        out[period - 1:, column] = np.where(window_nans > 0, np.nan, window)
+    return out
+
+
+def rolling_sum(values, periods):
+    """
+    Rolling sums of a series for several window lengths at once.
+
+    :param values: 1-D array shared by every period, or 2-D (bars x periods) array with one column per period.
+    :param periods: Sequence of window lengths.
+    :return: Float array (bars x periods), NaN until each window is full or where it holds a NaN.
+    """
+    return _rolling(values, periods, mean=False)
+
+
+def rolling_mean(values, periods):
+    """
+    Rolling means of a series for several window lengths at once (see `rolling_sum`).
+
+    :param values: 1-D array shared by every period, or 2-D (bars x periods) array with one column per period.
+    :param periods: Sequence of window lengths.
+    :return: Float array (bars x periods).
+    """
+    return _rolling(values, periods, mean=True)
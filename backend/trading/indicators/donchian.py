@@ -0,0 +1,119 @@
+# backend/trading/indicators/donchian.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.rolling import RollingMax, RollingMin
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('donchian_logs').get_logger()
+
+class DonchianChannel:
+    INPUTS = (('rolling_max', 'high', Param('period')), ('rolling_min', 'low', Param('period')))
+    OUTPUTS = ('donchian_upper', 'donchian_middle', 'donchian_lower')
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the DonchianChannel class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=20, context=None, dtype=None):
+        """
+        Calculate the Donchian Channel for a given DataFrame.
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'high' and 'low' prices.
+        :param period: Lookback period for the channel.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the upper, middle and lower channel columns.
+        """
+        # Ensure the necessary columns exist
+        if any(col not in df.columns for col in ['high', 'low']):
+            logger.error("DataFrame must contain 'high' and 'low' columns.")
+            raise KeyError("DataFrame must contain 'high' and 'low' columns.")
+
+        if len(df) < period:
+            logger.warning("Insufficient data for Donchian Channel calculation.")
+            return output_frame(df, {})
+
+        # Highest high and lowest low of the period, shared with Stochastic and Williams %R
+        context = IndicatorContext.for_frame(df, context)
+        upper = context.rolling_max('high', period)
+        lower = context.rolling_min('low', period)
+
+        logger.info(f"Donchian Channel calculation for period {period} completed.")
+        return output_frame(df, {
+            'donchian_upper': upper,
+            'donchian_middle': (upper + lower) / 2,
+            'donchian_lower': lower
+        }, dtype)
+
+    @staticmethod
+    def calculate(df, period=20, context=None):
+        """
+        Calculate the Donchian Channel for a given DataFrame.
+
+        :param df: DataFrame with 'high' and 'low' prices.
+        :param period: Lookback period for the channel.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the upper, middle and lower channel values.
+        """
+        return assign_outputs(df, DonchianChannel.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=20):
+        """
+        Create a streaming Donchian Channel calculator that is fed one candle at a time.
+
+        :param period: Lookback period for the channel.
+        :return: A DonchianChannelStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return DonchianChannelStream(period)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period):
+        """
+        Insert the Donchian Channel results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'DonchianChannel').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated channel values.
+        :param period: Period for which the channel was calculated.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        # Insert the Donchian Channel results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in self.OUTPUTS})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+
+        logger.info(f"Inserted Donchian Channel results for {instrument} into SQLite.")
+
+
+class DonchianChannelStream:
+    def __init__(self, period=20):
+        """
+        Keep the monotonic high/low deques needed to produce the next channel values in O(1).
+
+        :param period: Lookback period for the channel.
+        """
+        self.period = period
+        self.upper = RollingMax(period)
+        self.lower = RollingMin(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Donchian Channel state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high' and 'low' prices.
+        :return: Dict with the 'donchian_upper', 'donchian_middle' and 'donchian_lower' values for this candle.
+        """
+        upper = self.upper.update(candle['high'])
+        lower = self.lower.update(candle['low'])
+        return {'donchian_upper': upper, 'donchian_middle': (upper + lower) / 2, 'donchian_lower': lower}
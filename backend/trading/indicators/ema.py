@@ -2,11 +2,17 @@
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.streaming import EMAState
+from trading.indicators.core.outputs import assign_outputs, output_frame
 
 # Configure loggers
 logger = LogManager('ema_logs').get_logger()
 
 class EMA:
+    INPUTS = (('ema', 'close', Param('period')),)
+    OUTPUTS = ('ema',)
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the EMA class with a SQLiteDB handler.
@@ -16,29 +22,54 @@ class EMA:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, period=14):
+    def compute(df, period=14, context=None, dtype=None):
         """
         Calculate the Exponential Moving Average (EMA) for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'close' prices.
         :param period: Lookback period for EMA calculation.
-        :return: DataFrame with the EMA values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the EMA columns.
         """
         # Ensure the necessary 'close' column exists
         if 'close' not in df.columns:
             logger.error("DataFrame must contain 'close' column.")
             raise KeyError("DataFrame must contain 'close' column.")
 
-        # Ensure there is enough data to calculate the EMA
         if len(df) < period:
             logger.warning("Insufficient data for EMA calculation.")
-            return df
+            return output_frame(df, {})
 
         # Calculate the EMA
-        df['ema'] = df['close'].ewm(span=period, adjust=False).mean()
+        ema = IndicatorContext.for_frame(df, context).ema('close', period)
 
         logger.info(f"EMA calculation for period={period} completed.")
-        return df
+        return output_frame(df, {'ema': ema}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Exponential Moving Average (EMA) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period for EMA calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the EMA values.
+        """
+        return assign_outputs(df, EMA.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming EMA calculator that is fed one candle at a time.
+
+        :param period: Lookback period for EMA calculation.
+        :return: An EMAStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return EMAStream(period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period):
         """
@@ -53,10 +84,28 @@ class EMA:
         timestamp = datetime.now().isoformat()
 
         param_name = 'ema'
-        # Insert EMA results row by row
-        for _, row in result_df.iterrows():
-            param_value = row['ema']
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
-            self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+        # Insert the EMA results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df['ema']})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
 
         logger.info(f"Inserted EMA results for {instrument} into SQLite.")
+
+
+class EMAStream:
+    def __init__(self, period=14):
+        """
+        Keep the running EMA value needed to produce the next value in O(1).
+
+        :param period: Lookback period for EMA calculation.
+        """
+        self.period = period
+        self.ema = EMAState(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the EMA state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: The EMA value for this candle.
+        """
+        return self.ema.update(float(candle['close']))
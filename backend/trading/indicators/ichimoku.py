@@ -0,0 +1,160 @@
+# backend/trading/indicators/ichimoku.py
+from collections import deque
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.rolling import RollingMax, RollingMin
+from trading.indicators.core.streaming import NAN
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('ichimoku_logs').get_logger()
+
+class IchimokuCloud:
+    INPUTS = (
+        ('rolling_max', 'high', Param('period')), ('rolling_min', 'low', Param('period')),
+        ('rolling_max', 'high', Param('base_period')), ('rolling_min', 'low', Param('base_period')),
+        ('rolling_max', 'high', Param('span_period')), ('rolling_min', 'low', Param('span_period')),
+    )
+    OUTPUTS = ('tenkan_sen', 'kijun_sen', 'senkou_span_a', 'senkou_span_b')
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the IchimokuCloud class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=9, base_period=26, span_period=52, displacement=26, context=None, dtype=None):
+        """
+        Calculate the Ichimoku Cloud lines for a given DataFrame.
+
+        The chikou span (the close plotted `displacement` bars back) is not produced: stored per bar
+        it would hold a future close. Output-only mode: the given DataFrame is not modified.
+
+        :param df: DataFrame with 'high' and 'low' prices.
+        :param period: Lookback period of the conversion line (tenkan-sen).
+        :param base_period: Lookback period of the base line (kijun-sen).
+        :param span_period: Lookback period of the leading span B.
+        :param displacement: Number of bars the leading spans are shifted forward.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the Ichimoku line columns.
+        """
+        # Ensure the necessary columns exist
+        if any(col not in df.columns for col in ['high', 'low']):
+            logger.error("DataFrame must contain 'high' and 'low' columns.")
+            raise KeyError("DataFrame must contain 'high' and 'low' columns.")
+
+        if len(df) < max(period, base_period, span_period):
+            logger.warning("Insufficient data for Ichimoku Cloud calculation.")
+            return output_frame(df, {})
+
+        # Midpoints of the rolling high/low ranges, shared with the Donchian Channel
+        context = IndicatorContext.for_frame(df, context)
+
+        def midpoint(lookback):
+            return (context.rolling_max('high', lookback) + context.rolling_min('low', lookback)) / 2
+
+        tenkan_sen = midpoint(period)
+        kijun_sen = midpoint(base_period)
+
+        # Leading spans, projected `displacement` bars forward
+        senkou_span_a = ((tenkan_sen + kijun_sen) / 2).shift(displacement)
+        senkou_span_b = midpoint(span_period).shift(displacement)
+
+        logger.info(f"Ichimoku Cloud calculation for period={period}, base_period={base_period}, span_period={span_period} completed.")
+        return output_frame(df, {
+            'tenkan_sen': tenkan_sen,
+            'kijun_sen': kijun_sen,
+            'senkou_span_a': senkou_span_a,
+            'senkou_span_b': senkou_span_b
+        }, dtype)
+
+    @staticmethod
+    def calculate(df, period=9, base_period=26, span_period=52, displacement=26, context=None):
+        """
+        Calculate the Ichimoku Cloud lines for a given DataFrame.
+
+        :param df: DataFrame with 'high' and 'low' prices.
+        :param period: Lookback period of the conversion line (tenkan-sen).
+        :param base_period: Lookback period of the base line (kijun-sen).
+        :param span_period: Lookback period of the leading span B.
+        :param displacement: Number of bars the leading spans are shifted forward.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the Ichimoku line values.
+        """
+        return assign_outputs(df, IchimokuCloud.compute(df, period, base_period, span_period, displacement, context=context))
+
+    @staticmethod
+    def stream(period=9, base_period=26, span_period=52, displacement=26):
+        """
+        Create a streaming Ichimoku Cloud calculator that is fed one candle at a time.
+
+        :param period: Lookback period of the conversion line (tenkan-sen).
+        :param base_period: Lookback period of the base line (kijun-sen).
+        :param span_period: Lookback period of the leading span B.
+        :param displacement: Number of bars the leading spans are shifted forward.
+        :return: An IchimokuCloudStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return IchimokuCloudStream(period, base_period, span_period, displacement)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period, base_period, span_period, displacement):
+        """
+        Insert the Ichimoku Cloud results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'IchimokuCloud').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated Ichimoku lines.
+        :param period: Lookback period of the conversion line.
+        :param base_period: Lookback period of the base line.
+        :param span_period: Lookback period of the leading span B.
+        :param displacement: Number of bars the leading spans are shifted forward.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+        parameters = {'period': period, 'base_period': base_period, 'span_period': span_period, 'displacement': displacement}
+
+        # Insert the Ichimoku Cloud results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in self.OUTPUTS})
+        self.db_handler.add_indicator_parameters(indicator_id, parameters)
+
+        logger.info(f"Inserted Ichimoku Cloud results for {instrument} into SQLite.")
+
+
+class IchimokuCloudStream:
+    def __init__(self, period=9, base_period=26, span_period=52, displacement=26):
+        """
+        Keep the high/low deques and the last `displacement` span values needed to produce the next lines in O(1).
+
+        :param period: Lookback period of the conversion line (tenkan-sen).
+        :param base_period: Lookback period of the base line (kijun-sen).
+        :param span_period: Lookback period of the leading span B.
+        :param displacement: Number of bars the leading spans are shifted forward.
+        """
+        self.ranges = {lookback: (RollingMax(lookback), RollingMin(lookback))
+                       for lookback in {period, base_period, span_period}}
+        self.period = period
+        self.base_period = base_period
+        self.span_period = span_period
+        self.spans = deque(maxlen=displacement + 1)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Ichimoku state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high' and 'low' prices.
+        :return: Dict with the 'tenkan_sen', 'kijun_sen', 'senkou_span_a' and 'senkou_span_b' values for this candle.
+        """
+        midpoints = {lookback: (highest.update(candle['high']) + lowest.update(candle['low'])) / 2
+                     for lookback, (highest, lowest) in self.ranges.items()}
+        tenkan_sen = midpoints[self.period]
+        kijun_sen = midpoints[self.base_period]
+
+        # The leading spans reported now are the ones computed `displacement` bars ago
+        self.spans.append(((tenkan_sen + kijun_sen) / 2, midpoints[self.span_period]))
+        span_a, span_b = self.spans[0] if len(self.spans) == self.spans.maxlen else (NAN, NAN)
+        return {'tenkan_sen': tenkan_sen, 'kijun_sen': kijun_sen, 'senkou_span_a': span_a, 'senkou_span_b': span_b}
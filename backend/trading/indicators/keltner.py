@@ -0,0 +1,129 @@
+# backend/trading/indicators/keltner.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.atr import ATR, ATRStream
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.streaming import EMAState
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('keltner_logs').get_logger()
+
+class KeltnerChannel:
+    INPUTS = (('ema', 'close', Param('period')), ('indicator', ATR, {'period': Param('period')}))
+    OUTPUTS = ('keltner_middle', 'keltner_upper', 'keltner_lower')
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the KeltnerChannel class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=20, multiplier=2, context=None, dtype=None):
+        """
+        Calculate the Keltner Channel for a given DataFrame.
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param period: Lookback period of the EMA middle line and of the ATR.
+        :param multiplier: Number of ATRs between the middle line and each band.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the middle, upper and lower channel columns.
+        """
+        # Ensure the necessary columns exist
+        if any(col not in df.columns for col in ['high', 'low', 'close']):
+            logger.error("DataFrame must contain 'high', 'low', and 'close' columns.")
+            raise KeyError("DataFrame must contain 'high', 'low', and 'close' columns.")
+
+        if len(df) < period:
+            logger.warning("Insufficient data for Keltner Channel calculation.")
+            return output_frame(df, {})
+
+        # EMA middle line and ATR, both reused from the other indicators of the run
+        context = IndicatorContext.for_frame(df, context)
+        middle = context.ema('close', period)
+        atr = context.indicator(ATR, period=period)['atr']
+
+        logger.info(f"Keltner Channel calculation for period={period}, multiplier={multiplier} completed.")
+        return output_frame(df, {
+            'keltner_middle': middle,
+            'keltner_upper': middle + multiplier * atr,
+            'keltner_lower': middle - multiplier * atr
+        }, dtype)
+
+    @staticmethod
+    def calculate(df, period=20, multiplier=2, context=None):
+        """
+        Calculate the Keltner Channel for a given DataFrame.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param period: Lookback period of the EMA middle line and of the ATR.
+        :param multiplier: Number of ATRs between the middle line and each band.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the middle, upper and lower channel values.
+        """
+        return assign_outputs(df, KeltnerChannel.compute(df, period, multiplier, context=context))
+
+    @staticmethod
+    def stream(period=20, multiplier=2):
+        """
+        Create a streaming Keltner Channel calculator that is fed one candle at a time.
+
+        :param period: Lookback period of the EMA middle line and of the ATR.
+        :param multiplier: Number of ATRs between the middle line and each band.
+        :return: A KeltnerChannelStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return KeltnerChannelStream(period, multiplier)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period, multiplier):
+        """
+        Insert the Keltner Channel results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'KeltnerChannel').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated channel values.
+        :param period: Period of the EMA and the ATR.
+        :param multiplier: Number of ATRs between the middle line and each band.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        # Insert the Keltner Channel results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in self.OUTPUTS})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period, 'multiplier': multiplier})
+
+        logger.info(f"Inserted Keltner Channel results for {instrument} into SQLite.")
+
+
+class KeltnerChannelStream:
+    def __init__(self, period=20, multiplier=2):
+        """
+        Keep the EMA seed and the ATR state needed to produce the next channel values in O(1).
+
+        :param period: Lookback period of the EMA middle line and of the ATR.
+        :param multiplier: Number of ATRs between the middle line and each band.
+        """
+        self.multiplier = multiplier
+        self.middle = EMAState(period)
+        self.atr = ATRStream(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Keltner Channel state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high', 'low' and 'close' prices.
+        :return: Dict with the 'keltner_middle', 'keltner_upper' and 'keltner_lower' values for this candle.
+        """
+        middle = self.middle.update(float(candle['close']))
+        atr = self.atr.update(candle)
+        return {
+            'keltner_middle': middle,
+            'keltner_upper': middle + self.multiplier * atr,
+            'keltner_lower': middle - self.multiplier * atr
+        }
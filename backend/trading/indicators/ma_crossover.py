@@ -3,11 +3,18 @@ import numpy as np
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core import kernels
+from trading.indicators.core.streaming import RollingWindow
+from trading.indicators.core.outputs import assign_outputs, output_frame
 
 # Configure loggers
 logger = LogManager('ma_logs').get_logger()
 
 class MACrossover:
+    INPUTS = (('sma', 'close', Param('fast_period')), ('sma', 'close', Param('slow_period')))
+    OUTPUTS = ('fast_ma', 'slow_ma', 'crossover', 'crossover_signal')
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the MACrossover class with a SQLiteDB handler.
@@ -17,35 +24,68 @@ class MACrossover:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, fast_period=12, slow_period=26):
+    def compute(df, fast_period=12, slow_period=26, context=None, dtype=None):
         """
         Calculate the Moving Average Crossover for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'close' prices.
         :param fast_period: Lookback period for the fast moving average.
         :param slow_period: Lookback period for the slow moving average.
-        :return: DataFrame with the fast and slow moving averages and the crossover signal.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the moving average and crossover columns.
         """
         # Ensure the necessary 'close' column exists
         if 'close' not in df.columns:
             logger.error("DataFrame must contain 'close' column.")
             raise KeyError("DataFrame must contain 'close' column.")
-        
-        # Ensure the DataFrame has enough rows to calculate the moving averages
+
         if len(df) < slow_period:
             logger.warning("Insufficient data for moving average calculation.")
-            return df
+            return output_frame(df, {})
 
         # Calculate the fast and slow moving averages
-        df['fast_ma'] = df['close'].rolling(window=fast_period).mean()
-        df['slow_ma'] = df['close'].rolling(window=slow_period).mean()
+        context = IndicatorContext.for_frame(df, context)
+        fast_ma = context.sma('close', fast_period)
+        slow_ma = context.sma('close', slow_period)
 
         # Generate the crossover signal
-        df['crossover'] = df['fast_ma'] - df['slow_ma']
-        df['crossover_signal'] = df['crossover'].apply(lambda x: 1 if x > 0 else -1)
+        crossover = fast_ma - slow_ma
+        crossover_signal = kernels.sign_signal(crossover.to_numpy())
 
         logger.info("Moving Average Crossover calculation completed.")
-        return df
+        return output_frame(df, {
+            'fast_ma': fast_ma,
+            'slow_ma': slow_ma,
+            'crossover': crossover,
+            'crossover_signal': crossover_signal
+        }, dtype)
+
+    @staticmethod
+    def calculate(df, fast_period=12, slow_period=26, context=None):
+        """
+        Calculate the Moving Average Crossover for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param fast_period: Lookback period for the fast moving average.
+        :param slow_period: Lookback period for the slow moving average.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the fast and slow moving averages and the crossover signal.
+        """
+        return assign_outputs(df, MACrossover.compute(df, fast_period, slow_period, context=context))
+
+    @staticmethod
+    def stream(fast_period=12, slow_period=26):
+        """
+        Create a streaming Moving Average Crossover calculator that is fed one candle at a time.
+
+        :param fast_period: Lookback period for the fast moving average.
+        :param slow_period: Lookback period for the slow moving average.
+        :return: A MACrossoverStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return MACrossoverStream(fast_period, slow_period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, fast_period, slow_period):
         """
@@ -61,10 +101,39 @@ class MACrossover:
         timestamp = datetime.now().isoformat()
 
         param_name = 'ma_crossover'
-        # Insert MA Crossover results row by row
-        for _, row in result_df.iterrows():
-            param_value = row['crossover_signal']
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
-            self.db_handler.add_indicator_parameters(indicator_id, {'fast_period': fast_period, 'slow_period': slow_period})
+        # Insert the MA Crossover results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df['crossover_signal']})
+        self.db_handler.add_indicator_parameters(indicator_id, {'fast_period': fast_period, 'slow_period': slow_period})
 
         logger.info(f"Inserted MA Crossover results for {instrument} into SQLite.")
+
+
+class MACrossoverStream:
+    def __init__(self, fast_period=12, slow_period=26):
+        """
+        Keep the fast and slow moving average windows needed to produce the next signal in O(1).
+
+        :param fast_period: Lookback period for the fast moving average.
+        :param slow_period: Lookback period for the slow moving average.
+        """
+        self.fast = RollingWindow(fast_period)
+        self.slow = RollingWindow(slow_period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the crossover state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: Dict with 'fast_ma', 'slow_ma', 'crossover' and 'crossover_signal' for this candle.
+        """
+        close = float(candle['close'])
+        self.fast.push(close)
+        self.slow.push(close)
+        fast_ma, slow_ma = self.fast.mean(), self.slow.mean()
+        crossover = fast_ma - slow_ma
+        return {
+            'fast_ma': fast_ma,
+            'slow_ma': slow_ma,
+            'crossover': crossover,
+            'crossover_signal': 1 if crossover > 0 else -1,
+        }
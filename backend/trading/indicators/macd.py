@@ -1,11 +1,20 @@
 # backend/trading/indicators/macd.py
+import pandas as pd
+import numpy as np
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.streaming import EMAState
+from trading.indicators.core.outputs import assign_outputs, output_frame
         
 logger = LogManager('macd_logs').get_logger()
 
 class MACD:
+    INPUTS = (('ema', 'close', Param('short_period')), ('ema', 'close', Param('long_period')))
+    OUTPUTS = ('macd', 'signal', 'histogram')
+    PARAM_ALIASES = {'fast': 'short_period', 'slow': 'long_period'}
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the MACD class with a SQLiteDB handler.
@@ -15,39 +24,105 @@ class MACD:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, short_period=12, long_period=26, signal_period=9):
+    def compute(df, short_period=12, long_period=26, signal_period=9, context=None, dtype=None):
         """
         Calculate the Moving Average Convergence Divergence (MACD) for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'close' prices.
         :param short_period: Lookback period for the short-term EMA.
         :param long_period: Lookback period for the long-term EMA.
         :param signal_period: Lookback period for the signal line.
-        :return: DataFrame with the MACD, signal, and histogram values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the MACD, signal and histogram columns.
         """
         # Ensure the necessary 'close' column exists
         if 'close' not in df.columns:
             logger.error("DataFrame must contain 'close' column.")
             raise KeyError("DataFrame must contain 'close' column.")
 
-        # Ensure there is enough data for the calculation
         if len(df) < long_period:
             logger.warning("Insufficient data for MACD calculation.")
-            return df
+            return output_frame(df, {})
 
         # Calculate the short and long EMA
-        df['ema_short'] = df['close'].ewm(span=short_period, adjust=False).mean()
-        df['ema_long'] = df['close'].ewm(span=long_period, adjust=False).mean()
+        context = IndicatorContext.for_frame(df, context)
+        ema_short = context.ema('close', short_period)
+        ema_long = context.ema('close', long_period)
 
         # Calculate MACD and signal line
-        df['macd'] = df['ema_short'] - df['ema_long']
-        df['signal'] = df['macd'].ewm(span=signal_period, adjust=False).mean()
+        macd = ema_short - ema_long
+        signal = macd.ewm(span=signal_period, adjust=False).mean()
 
         # Calculate the MACD histogram
-        df['histogram'] = df['macd'] - df['signal']
+        histogram = macd - signal
 
         logger.info(f"MACD calculation for short_period={short_period}, long_period={long_period}, signal_period={signal_period} completed.")
-        return df
+        return output_frame(df, {'macd': macd, 'signal': signal, 'histogram': histogram}, dtype)
+
+    @staticmethod
+    def calculate(df, short_period=12, long_period=26, signal_period=9, context=None):
+        """
+        Calculate the Moving Average Convergence Divergence (MACD) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param short_period: Lookback period for the short-term EMA.
+        :param long_period: Lookback period for the long-term EMA.
+        :param signal_period: Lookback period for the signal line.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the MACD, signal, and histogram values.
+        """
+        return assign_outputs(df, MACD.compute(df, short_period, long_period, signal_period, context=context))
+
+    @staticmethod
+    def sweep(df, short_periods, long_periods, signal_periods, context=None):
+        """
+        Calculate the MACD for several (short, long, signal) combinations in one pass.
+
+        The period arguments are broadcast against each other, so a scalar can be combined with a
+        vector. Each distinct EMA span is computed once (and cached on the context), and the signal
+        lines of all combinations sharing a signal period are smoothed in one column-wise EWM.
+
+        :param df: DataFrame with 'close' prices.
+        :param short_periods: Int or sequence of short-term EMA periods.
+        :param long_periods: Int or sequence of long-term EMA periods.
+        :param signal_periods: Int or sequence of signal line periods.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: Dict {'macd', 'signal', 'histogram'} of arrays (bars x combinations).
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        short_periods, long_periods, signal_periods = np.broadcast_arrays(
+            np.atleast_1d(short_periods), np.atleast_1d(long_periods), np.atleast_1d(signal_periods))
+
+        context = IndicatorContext.for_frame(df, context)
+        emas = {span: context.ema('close', int(span)).to_numpy() for span in np.unique(np.concatenate([short_periods, long_periods]))}
+        macd = np.column_stack([emas[short] - emas[long] for short, long in zip(short_periods, long_periods)])
+
+        signal = np.empty_like(macd)
+        for span in np.unique(signal_periods):
+            columns = np.flatnonzero(signal_periods == span)
+            signal[:, columns] = pd.DataFrame(macd[:, columns]).ewm(span=int(span), adjust=False).mean().to_numpy()
+
+        logger.info(f"MACD sweep over {macd.shape[1]} combinations completed.")
+        return {'macd': macd, 'signal': signal, 'histogram': macd - signal}
+
+    @staticmethod
+    def stream(short_period=12, long_period=26, signal_period=9):
+        """
+        Create a streaming MACD calculator that is fed one candle at a time.
+
+        :param short_period: Lookback period for the short-term EMA.
+        :param long_period: Lookback period for the long-term EMA.
+        :param signal_period: Lookback period for the signal line.
+        :return: A MACDStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return MACDStream(short_period, long_period, signal_period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, short_period, long_period, signal_period):
         """
@@ -63,23 +138,41 @@ class MACD:
         indicator_id = self.db_handler.get_indicator_id(indicator_name)
         timestamp = datetime.now().isoformat()
 
-        # Insert MACD, signal, and histogram results row by row
-        for _, row in result_df.iterrows():
-            macd_value = row['macd']
-            signal_value = row['signal']
-            histogram_value = row['histogram']
-            self.db_handler.add_indicator_results(indicator_id, timestamp, 'macd', macd_value)
-            self.db_handler.add_indicator_results(indicator_id, timestamp, 'signal', signal_value)
-            self.db_handler.add_indicator_results(indicator_id, timestamp, 'histogram', histogram_value)
-
-            # Insert the indicator parameters
-            self.db_handler.add_indicator_parameters(indicator_id, {
-                'short_period': short_period,
-                'long_period': long_period,
-                'signal_period': signal_period
-            })
-
-        self.logger.info(f"Inserted MACD results for {instrument} into SQLite.")
+        # Insert the MACD, signal, and histogram results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in ('macd', 'signal', 'histogram')})
+        self.db_handler.add_indicator_parameters(indicator_id, {
+            'short_period': short_period,
+            'long_period': long_period,
+            'signal_period': signal_period
+        })
+
+        logger.info(f"Inserted MACD results for {instrument} into SQLite.")
+
+
+class MACDStream:
+    def __init__(self, short_period=12, long_period=26, signal_period=9):
+        """
+        Keep the three EMA seeds needed to produce the next MACD values in O(1).
+
+        :param short_period: Lookback period for the short-term EMA.
+        :param long_period: Lookback period for the long-term EMA.
+        :param signal_period: Lookback period for the signal line.
+        """
+        self.ema_short = EMAState(short_period)
+        self.ema_long = EMAState(long_period)
+        self.signal = EMAState(signal_period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the MACD state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: Dict with the 'macd', 'signal' and 'histogram' values for this candle.
+        """
+        close = float(candle['close'])
+        macd = self.ema_short.update(close) - self.ema_long.update(close)
+        signal = self.signal.update(macd)
+        return {'macd': macd, 'signal': signal, 'histogram': macd - signal}
 
 # Example usage:
 # macd_calculator = MACD(db_name="indicators.db")
@@ -2,6 +2,10 @@
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext
+from trading.indicators.core import kernels
+from trading.indicators.core.streaming import RollingWindow, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame, wrap_like
 
 # Configure loggers
 logger = LogManager('mfi_logs').get_logger()
@@ -11,6 +15,9 @@ logger = LogManager('mfi_logs').get_logger()
 """
 
 class MFI:
+    INPUTS = ('typical_price',)
+    OUTPUTS = ('mfi',)
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the MFI class with a SQLiteDB handler.
@@ -20,51 +27,75 @@ class MFI:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, period=14):
+    def compute(df, period=14, context=None, dtype=None):
         """
         Calculate the Money Flow Index (MFI) for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'high', 'low', 'close', and 'volume' columns.
         :param period: Lookback period for MFI calculation.
-        :return: DataFrame with the MFI values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the MFI columns.
         """
         # Ensure the necessary columns exist
-        if any(
-            col not in df.columns for col in ['high', 'low', 'close', 'volume']
-        ):
+        if any(col not in df.columns for col in ['high', 'low', 'close', 'volume']):
             logger.error("DataFrame must contain 'high', 'low', 'close', and 'volume' columns.")
             raise KeyError("DataFrame must contain 'high', 'low', 'close', and 'volume' columns.")
 
         if len(df) < period:
             logger.warning("Insufficient data for MFI calculation.")
-            return df
+            return output_frame(df, {})
 
-        # Calculate typical price
-        df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
+        # Calculate typical price, shared with the other indicators of the run
+        context = IndicatorContext.for_frame(df, context)
+        typical_price = context.typical_price()
 
         # Calculate raw money flow
-        df['money_flow'] = df['typical_price'] * df['volume']
+        money_flow = typical_price * df['volume']
 
         # Calculate the shifted typical price
-        df['previous_typical_price'] = df['typical_price'].shift(1)
+        previous_typical_price = typical_price.shift(1)
 
         # Positive and negative money flow
-        df['money_flow_positive'] = df.apply(lambda row: row['money_flow'] if row['typical_price'] > row['previous_typical_price'] else 0, axis=1)
-        df['money_flow_negative'] = df.apply(lambda row: row['money_flow'] if row['typical_price'] < row['previous_typical_price'] else 0, axis=1)
+        money_flow_positive = context.mask_padding(wrap_like(money_flow, kernels.where_greater(typical_price, previous_typical_price, money_flow)))
+        money_flow_negative = context.mask_padding(wrap_like(money_flow, kernels.where_greater(previous_typical_price, typical_price, money_flow)))
 
         # Rolling sums of positive and negative money flow
-        positive_flow = df['money_flow_positive'].rolling(window=period).sum()
-        negative_flow = df['money_flow_negative'].rolling(window=period).sum()
+        positive_flow = money_flow_positive.rolling(window=period).sum()
+        negative_flow = money_flow_negative.rolling(window=period).sum()
 
         # Money Flow Ratio (MFR)
         mfr = positive_flow / negative_flow
 
         # Money Flow Index (MFI)
-        df['mfi'] = 100 - (100 / (1 + mfr))
+        mfi = 100 - (100 / (1 + mfr))
 
         logger.info(f"MFI calculation for period {period} completed.")
-        return df
+        return output_frame(df, {'mfi': mfi}, dtype)
 
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Money Flow Index (MFI) for a given DataFrame.
+
+        :param df: DataFrame with 'high', 'low', 'close', and 'volume' columns.
+        :param period: Lookback period for MFI calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the MFI values.
+        """
+        return assign_outputs(df, MFI.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming MFI calculator that is fed one candle at a time.
+
+        :param period: Lookback period for MFI calculation.
+        :return: An MFIStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return MFIStream(period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period):
         """
@@ -79,10 +110,39 @@ class MFI:
         timestamp = datetime.now().isoformat()
 
         param_name = 'mfi'
-        # Insert MFI results row by row
-        for _, row in result_df.iterrows():
-            param_value = row['mfi']
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
-            self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+        # Insert the MFI results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df['mfi']})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
 
         logger.info(f"Inserted MFI results for {instrument} into SQLite.")
+
+
+class MFIStream:
+    def __init__(self, period=14):
+        """
+        Keep the positive/negative money flow sums needed to produce the next MFI value in O(1).
+
+        :param period: Lookback period for MFI calculation.
+        """
+        self.period = period
+        self.prev_typical_price = None
+        self.positive_flow = RollingWindow(period)
+        self.negative_flow = RollingWindow(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the MFI state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high', 'low', 'close' and 'volume'.
+        :return: The MFI value for this candle (NaN during warm-up).
+        """
+        typical_price = (float(candle['high']) + float(candle['low']) + float(candle['close'])) / 3
+        money_flow = typical_price * float(candle['volume'])
+
+        previous = self.prev_typical_price
+        self.prev_typical_price = typical_price
+        self.positive_flow.push(money_flow if previous is not None and typical_price > previous else 0.0)
+        self.negative_flow.push(money_flow if previous is not None and typical_price < previous else 0.0)
+
+        mfr = divide(self.positive_flow.sum(), self.negative_flow.sum())
+        return 100 - divide(100, 1 + mfr)
@@ -2,6 +2,8 @@
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core import kernels
+from trading.indicators.core.outputs import assign_outputs, output_frame
 
 # Configure loggers
 logger = LogManager('obv_logs').get_logger()
@@ -11,6 +13,9 @@ Calculate the On-Balance Volume (OBV) for a given DataFrame. The OBV is the runn
 """
 
 class OBV:
+    INPUTS = ()
+    OUTPUTS = ('obv',)
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the OBV class with a SQLiteDB handler.
@@ -20,32 +25,47 @@ class OBV:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df):
+    def compute(df, context=None, dtype=None):
         """
         Calculate the On-Balance Volume (OBV) for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'close' and 'volume' columns.
-        :return: DataFrame with the OBV values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the OBV columns.
         """
-        # Ensure the necessary 'close' and 'volume' columns exist
+        # Ensure the necessary columns exist
         if any(col not in df.columns for col in ['close', 'volume']):
             logger.error("DataFrame must contain 'close' and 'volume' columns.")
             raise KeyError("DataFrame must contain 'close' and 'volume' columns.")
 
-        # Initialize the OBV column
-        df['obv'] = 0
-
-        # Calculate the OBV values based on price changes and volume
-        for i in range(1, len(df)):
-            if df['close'][i] > df['close'][i - 1]:
-                df['obv'][i] = df['obv'][i - 1] + df['volume'][i]
-            elif df['close'][i] < df['close'][i - 1]:
-                df['obv'][i] = df['obv'][i - 1] - df['volume'][i]
-            else:
-                df['obv'][i] = df['obv'][i - 1]
+        # Calculate the OBV as the cumulative sum of volume signed by the price change
+        obv = kernels.obv(df['close'].to_numpy(), df['volume'].to_numpy())
 
         logger.info("OBV calculation completed.")
-        return df
+        return output_frame(df, {'obv': obv}, dtype)
+
+    @staticmethod
+    def calculate(df, context=None):
+        """
+        Calculate the On-Balance Volume (OBV) for a given DataFrame.
+
+        :param df: DataFrame with 'close' and 'volume' columns.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the OBV values.
+        """
+        return assign_outputs(df, OBV.compute(df, context=context))
+
+    @staticmethod
+    def stream():
+        """
+        Create a streaming OBV calculator that is fed one candle at a time.
+
+        :return: An OBVStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return OBVStream()
 
     def insert_results_to_db(self, indicator_name, instrument, result_df):
         """
@@ -59,9 +79,32 @@ class OBV:
         timestamp = datetime.now().isoformat()
 
         param_name = 'obv'
-        # Insert OBV results row by row
-        for _, row in result_df.iterrows():
-            param_value = row['obv']
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
+        # Insert the OBV results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df['obv']})
 
         logger.info(f"Inserted OBV results for {instrument} into SQLite.")
+
+
+class OBVStream:
+    def __init__(self):
+        """
+        Keep the running OBV total and the previous close.
+        """
+        self.prev_close = None
+        self.obv = 0
+
+    def update(self, candle):
+        """
+        Fold a new candle into the OBV state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'close' and 'volume'.
+        :return: The OBV value for this candle.
+        """
+        close = candle['close']
+        if self.prev_close is not None:
+            if close > self.prev_close:
+                self.obv += candle['volume']
+            elif close < self.prev_close:
+                self.obv -= candle['volume']
+        self.prev_close = close
+        return self.obv
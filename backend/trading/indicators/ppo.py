@@ -0,0 +1,131 @@
+# backend/trading/indicators/ppo.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.streaming import EMAState, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('ppo_logs').get_logger()
+
+class PPO:
+    INPUTS = (('ema', 'close', Param('fast')), ('ema', 'close', Param('slow')))
+    OUTPUTS = ('ppo', 'ppo_signal', 'ppo_histogram')
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the PPO class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=9, fast=12, slow=26, context=None, dtype=None):
+        """
+        Calculate the Percentage Price Oscillator (PPO) for a given DataFrame.
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period of the signal line.
+        :param fast: Lookback period of the fast EMA.
+        :param slow: Lookback period of the slow EMA.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the PPO, signal and histogram columns.
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        if len(df) < slow:
+            logger.warning("Insufficient data for PPO calculation.")
+            return output_frame(df, {})
+
+        # The fast and slow EMAs are the ones MACD uses, shared through the context
+        context = IndicatorContext.for_frame(df, context)
+        ema_fast = context.ema('close', fast)
+        ema_slow = context.ema('close', slow)
+
+        # EMA spread as a percentage of the slow EMA, and its signal line
+        ppo = 100 * (ema_fast - ema_slow) / ema_slow
+        signal = ppo.ewm(span=period, adjust=False).mean()
+
+        logger.info(f"PPO calculation for period={period}, fast={fast}, slow={slow} completed.")
+        return output_frame(df, {'ppo': ppo, 'ppo_signal': signal, 'ppo_histogram': ppo - signal}, dtype)
+
+    @staticmethod
+    def calculate(df, period=9, fast=12, slow=26, context=None):
+        """
+        Calculate the Percentage Price Oscillator (PPO) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period of the signal line.
+        :param fast: Lookback period of the fast EMA.
+        :param slow: Lookback period of the slow EMA.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the PPO, signal and histogram values.
+        """
+        return assign_outputs(df, PPO.compute(df, period, fast, slow, context=context))
+
+    @staticmethod
+    def stream(period=9, fast=12, slow=26):
+        """
+        Create a streaming PPO calculator that is fed one candle at a time.
+
+        :param period: Lookback period of the signal line.
+        :param fast: Lookback period of the fast EMA.
+        :param slow: Lookback period of the slow EMA.
+        :return: A PPOStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return PPOStream(period, fast, slow)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period, fast, slow):
+        """
+        Insert the PPO results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'PPO').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated PPO values.
+        :param period: Period of the signal line.
+        :param fast: Period of the fast EMA.
+        :param slow: Period of the slow EMA.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        # Insert the PPO results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in self.OUTPUTS})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period, 'fast': fast, 'slow': slow})
+
+        logger.info(f"Inserted PPO results for {instrument} into SQLite.")
+
+
+class PPOStream:
+    def __init__(self, period=9, fast=12, slow=26):
+        """
+        Keep the three EMA seeds needed to produce the next PPO values in O(1).
+
+        :param period: Lookback period of the signal line.
+        :param fast: Lookback period of the fast EMA.
+        :param slow: Lookback period of the slow EMA.
+        """
+        self.ema_fast = EMAState(fast)
+        self.ema_slow = EMAState(slow)
+        self.signal = EMAState(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the PPO state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: Dict with the 'ppo', 'ppo_signal' and 'ppo_histogram' values for this candle.
+        """
+        close = float(candle['close'])
+        ema_fast, ema_slow = self.ema_fast.update(close), self.ema_slow.update(close)
+        ppo = 100 * divide(ema_fast - ema_slow, ema_slow)
+        signal = self.signal.update(ppo)
+        return {'ppo': ppo, 'ppo_signal': signal, 'ppo_histogram': ppo - signal}
@@ -0,0 +1,177 @@
+# backend/trading/indicators/psar.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core import kernels
+from trading.indicators.core.streaming import NAN, is_nan
+from trading.indicators.core.outputs import assign_outputs, output_frame, wrap_like
+
+# Configure loggers
+logger = LogManager('psar_logs').get_logger()
+
+class PSAR:
+    INPUTS = ()
+    OUTPUTS = ('psar', 'psar_direction')
+    PARAM_ALIASES = {'max': 'max_step'}
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the PSAR class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, step=0.02, max_step=0.2, context=None, dtype=None):
+        """
+        Calculate Wilder's Parabolic SAR for a given DataFrame.
+
+        Every bar clamps and possibly reverses on the previous bars, so the SAR is carried by one
+        scalar recurrence rather than vectorized; it runs as a compiled loop over every instrument
+        column (see `kernels.psar`), with the rules of `PSARStream`.
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'high' and 'low' prices.
+        :param step: Acceleration factor increment (and starting value).
+        :param max_step: Maximum acceleration factor.
+        :param context: Optional IndicatorContext (unused: the SAR shares no intermediate series).
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the SAR and its direction (1 long, -1 short).
+        """
+        # Ensure the necessary columns exist
+        if any(col not in df.columns for col in ['high', 'low']):
+            logger.error("DataFrame must contain 'high' and 'low' columns.")
+            raise KeyError("DataFrame must contain 'high' and 'low' columns.")
+
+        if len(df) < 2:
+            logger.warning("Insufficient data for PSAR calculation.")
+            return output_frame(df, {})
+
+        high = df['high']
+        psar, direction = kernels.psar(high.to_numpy(dtype=float), df['low'].to_numpy(dtype=float), step, max_step)
+
+        logger.info(f"PSAR calculation for step={step}, max_step={max_step} completed.")
+        return output_frame(df, {'psar': wrap_like(high, psar), 'psar_direction': wrap_like(high, direction)}, dtype)
+
+    @staticmethod
+    def calculate(df, step=0.02, max_step=0.2, context=None):
+        """
+        Calculate Wilder's Parabolic SAR for a given DataFrame.
+
+        :param df: DataFrame with 'high' and 'low' prices.
+        :param step: Acceleration factor increment (and starting value).
+        :param max_step: Maximum acceleration factor.
+        :param context: Optional IndicatorContext (unused: the SAR shares no intermediate series).
+        :return: DataFrame with the SAR and direction values.
+        """
+        return assign_outputs(df, PSAR.compute(df, step, max_step, context=context))
+
+    @staticmethod
+    def stream(step=0.02, max_step=0.2):
+        """
+        Create a streaming Parabolic SAR calculator that is fed one candle at a time.
+
+        :param step: Acceleration factor increment (and starting value).
+        :param max_step: Maximum acceleration factor.
+        :return: A PSARStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return PSARStream(step, max_step)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, step, max_step):
+        """
+        Insert the Parabolic SAR results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'PSAR').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated SAR values.
+        :param step: Acceleration factor increment.
+        :param max_step: Maximum acceleration factor.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        # Insert the PSAR results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in self.OUTPUTS})
+        self.db_handler.add_indicator_parameters(indicator_id, {'step': step, 'max': max_step})
+
+        logger.info(f"Inserted PSAR results for {instrument} into SQLite.")
+
+
+class PSARStream:
+    def __init__(self, step=0.02, max_step=0.2):
+        """
+        Keep the SAR, extreme point, acceleration factor and last two bars needed to produce the next SAR in O(1).
+
+        :param step: Acceleration factor increment (and starting value).
+        :param max_step: Maximum acceleration factor.
+        """
+        self.step_size = step
+        self.max_step = max_step
+        self._reset()
+
+    def _reset(self):
+        self.sar = None
+        self.extreme = None
+        self.factor = self.step_size
+        self.direction = None
+        self.bars = []
+
+    def step(self, high, low):
+        """
+        Advance the recurrence by one bar.
+
+        :param high: High price of the bar.
+        :param low: Low price of the bar.
+        :return: Tuple (psar, direction) for the bar; NaN on the first bar of a run and on missing prices.
+        """
+        if is_nan(high) or is_nan(low):
+            # A gap restarts the SAR from the next two valid bars
+            self._reset()
+            return NAN, NAN
+
+        if self.direction is None:
+            if not self.bars:
+                self.bars.append((high, low))
+                return NAN, NAN
+            # Second bar: the trend follows the move of the median price
+            first_high, first_low = self.bars[0]
+            self.direction = 1 if high + low >= first_high + first_low else -1
+            self.sar = first_low if self.direction == 1 else first_high
+            self.extreme = high if self.direction == 1 else low
+            self.bars.append((high, low))
+            return self.sar, float(self.direction)
+
+        (older_high, older_low), (prev_high, prev_low) = self.bars
+        sar = self.sar + self.factor * (self.extreme - self.sar)
+
+        if self.direction == 1:
+            # The SAR may not rise above the last two lows
+            sar = min(sar, prev_low, older_low)
+            if low < sar:
+                self.direction, sar, self.extreme, self.factor = -1, self.extreme, low, self.step_size
+            elif high > self.extreme:
+                self.extreme = high
+                self.factor = min(self.factor + self.step_size, self.max_step)
+        else:
+            # The SAR may not fall below the last two highs
+            sar = max(sar, prev_high, older_high)
+            if high > sar:
+                self.direction, sar, self.extreme, self.factor = 1, self.extreme, high, self.step_size
+            elif low < self.extreme:
+                self.extreme = low
+                self.factor = min(self.factor + self.step_size, self.max_step)
+
+        self.sar = sar
+        self.bars = [(prev_high, prev_low), (high, low)]
+        return sar, float(self.direction)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Parabolic SAR state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high' and 'low' prices.
+        :return: Dict with the 'psar' and 'psar_direction' values for this candle.
+        """
+        psar, direction = self.step(float(candle['high']), float(candle['low']))
+        return {'psar': psar, 'psar_direction': direction}
@@ -0,0 +1,114 @@
+# backend/trading/indicators/roc.py
+from collections import deque
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core.streaming import NAN, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('roc_logs').get_logger()
+
+class ROC:
+    INPUTS = ()
+    OUTPUTS = ('roc',)
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the ROC class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=12, context=None, dtype=None):
+        """
+        Calculate the Rate of Change (ROC) for a given DataFrame.
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Number of bars the close is compared against.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the ROC columns.
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        if len(df) <= period:
+            logger.warning("Insufficient data for ROC calculation.")
+            return output_frame(df, {})
+
+        # Percentage change of the close over the period
+        roc = (df['close'] / df['close'].shift(period) - 1) * 100
+
+        logger.info(f"ROC calculation for period {period} completed.")
+        return output_frame(df, {'roc': roc}, dtype)
+
+    @staticmethod
+    def calculate(df, period=12, context=None):
+        """
+        Calculate the Rate of Change (ROC) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Number of bars the close is compared against.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the ROC values.
+        """
+        return assign_outputs(df, ROC.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=12):
+        """
+        Create a streaming ROC calculator that is fed one candle at a time.
+
+        :param period: Number of bars the close is compared against.
+        :return: A ROCStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return ROCStream(period)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period):
+        """
+        Insert the ROC results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'ROC').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated ROC values.
+        :param period: Period for which the ROC was calculated.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        param_name = 'roc'
+        # Insert the ROC results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+
+        logger.info(f"Inserted ROC results for {instrument} into SQLite.")
+
+
+class ROCStream:
+    def __init__(self, period=12):
+        """
+        Keep the last `period` closes needed to produce the next ROC value in O(1).
+
+        :param period: Number of bars the close is compared against.
+        """
+        self.period = period
+        self.closes = deque(maxlen=period + 1)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the ROC state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: The ROC value for this candle (NaN during warm-up).
+        """
+        self.closes.append(float(candle['close']))
+        if len(self.closes) <= self.period:
+            return NAN
+        return (divide(self.closes[-1], self.closes[0]) - 1) * 100
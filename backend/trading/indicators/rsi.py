@@ -3,11 +3,18 @@ import numpy as np
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext
+from trading.indicators.core.streaming import NAN, RollingWindow, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
+from trading.indicators.core import sweep
 
 # Configure loggers
 logger = LogManager('rsi_logs').get_logger()
 
 class RSI:
+    INPUTS = ('gains', 'losses')
+    OUTPUTS = ('rsi',)
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the RSI class with a SQLiteDB handler.
@@ -17,39 +24,89 @@ class RSI:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, period=14):
+    def compute(df, period=14, context=None, dtype=None):
         """
         Calculate the Relative Strength Index (RSI) for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'close' prices.
         :param period: Lookback period for RSI calculation.
-        :return: DataFrame with the RSI values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the RSI columns.
         """
         # Ensure the necessary 'close' column exists
         if 'close' not in df.columns:
             logger.error("DataFrame must contain 'close' column.")
             raise KeyError("DataFrame must contain 'close' column.")
-        
-        # Ensure there is enough data for the RSI calculation
+
         if len(df) < period:
             logger.warning("Insufficient data for RSI calculation.")
-            return df
-
-        # Calculate the price changes
-        delta = df['close'].diff()
+            return output_frame(df, {})
 
-        # Separate the gains and losses
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        # Separate the price changes into gains and losses, shared with the other indicators of the run
+        context = IndicatorContext.for_frame(df, context)
+        gain = context.gains().rolling(window=period).mean()
+        loss = context.losses().rolling(window=period).mean()
 
         # Calculate the Relative Strength (RS)
         rs = gain / loss
 
         # Calculate the RSI
-        df['rsi'] = 100 - (100 / (1 + rs))
+        rsi = 100 - (100 / (1 + rs))
 
         logger.info(f"RSI calculation for period {period} completed.")
-        return df
+        return output_frame(df, {'rsi': rsi}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Relative Strength Index (RSI) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period for RSI calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the RSI values.
+        """
+        return assign_outputs(df, RSI.compute(df, period, context=context))
+
+    @staticmethod
+    def sweep(df, periods, context=None):
+        """
+        Calculate the RSI for several periods in one pass, e.g. for a parameter search.
+
+        The rolling means of the gains and losses are read off one prefix sum per series.
+
+        :param df: DataFrame with 'close' prices.
+        :param periods: Sequence of lookback periods.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: Array (bars x periods) of RSI values; column j uses periods[j].
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        context = IndicatorContext.for_frame(df, context)
+        gain = sweep.rolling_mean(context.gains().to_numpy(), periods)
+        loss = sweep.rolling_mean(context.losses().to_numpy(), periods)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - (100 / (1 + gain / loss))
+
+        logger.info(f"RSI sweep over {gain.shape[1]} periods completed.")
+        return rsi
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming RSI calculator that is fed one candle at a time.
+
+        :param period: Lookback period for RSI calculation.
+        :return: An RSIStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return RSIStream(period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period):
         """
@@ -64,10 +121,38 @@ class RSI:
         timestamp = datetime.now().isoformat()
 
         param_name = 'rsi'
-        # Insert RSI results row by row
-        for _, row in result_df.iterrows():
-            param_value = row['rsi']
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
-            self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+        # Insert the RSI results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df['rsi']})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
 
         logger.info(f"Inserted RSI results for {instrument} into SQLite.")
+
+
+class RSIStream:
+    def __init__(self, period=14):
+        """
+        Keep the rolling gain/loss sums needed to produce the next RSI value in O(1).
+
+        :param period: Lookback period for RSI calculation.
+        """
+        self.period = period
+        self.prev_close = None
+        self.gains = RollingWindow(period)
+        self.losses = RollingWindow(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the RSI state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: The RSI value for this candle (NaN during warm-up).
+        """
+        close = float(candle['close'])
+        delta = NAN if self.prev_close is None else close - self.prev_close
+        self.prev_close = close
+
+        self.gains.push(delta if delta > 0 else 0.0)
+        self.losses.push(-delta if delta < 0 else 0.0)
+
+        rs = divide(self.gains.mean(), self.losses.mean())
+        return 100 - divide(100, 1 + rs)
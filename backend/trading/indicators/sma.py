@@ -2,11 +2,17 @@
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.streaming import RollingWindow
+from trading.indicators.core.outputs import assign_outputs, output_frame
 
 # Configure loggers
 logger = LogManager('sma_logs').get_logger()
 
 class SMA:
+    INPUTS = (('sma', 'close', Param('period')),)
+    OUTPUTS = ('sma_{period}',)
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the SMA class with a SQLiteDB handler.
@@ -16,29 +22,54 @@ class SMA:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, period=14):
+    def compute(df, period=14, context=None, dtype=None):
         """
         Calculate the Simple Moving Average (SMA) for a given DataFrame.
 
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'close' prices.
         :param period: Lookback period for SMA calculation.
-        :return: DataFrame with the SMA values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the SMA columns.
         """
         # Ensure the necessary 'close' column exists
         if 'close' not in df.columns:
             logger.error("DataFrame must contain 'close' column.")
             raise KeyError("DataFrame must contain 'close' column.")
-        
-        # Ensure the DataFrame has enough rows to calculate the SMA
+
         if len(df) < period:
             logger.warning("Insufficient data for SMA calculation.")
-            return df
+            return output_frame(df, {})
 
-        # Calculate the SMA and assign it to a new column
-        df[f'sma_{period}'] = df['close'].rolling(window=period).mean()
+        # Calculate the SMA
+        sma = IndicatorContext.for_frame(df, context).sma('close', period)
 
         logger.info(f"SMA calculation for period {period} completed.")
-        return df
+        return output_frame(df, {f'sma_{period}': sma}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Simple Moving Average (SMA) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period for SMA calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the SMA values.
+        """
+        return assign_outputs(df, SMA.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming SMA calculator that is fed one candle at a time.
+
+        :param period: Lookback period for SMA calculation.
+        :return: An SMAStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return SMAStream(period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period):
         """
@@ -53,10 +84,29 @@ class SMA:
         timestamp = datetime.now().isoformat()
 
         param_name = f'sma_{period}'
-        # Insert SMA results row by row
-        for _, row in result_df.iterrows():
-            param_value = row[param_name]
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
-            self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+        # Insert the SMA results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
 
         logger.info(f"Inserted SMA results for {instrument} into SQLite.")
+
+
+class SMAStream:
+    def __init__(self, period=14):
+        """
+        Keep the ring buffer and running sum needed to produce the next SMA value in O(1).
+
+        :param period: Lookback period for SMA calculation.
+        """
+        self.period = period
+        self.window = RollingWindow(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the SMA state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: The SMA value for this candle (NaN during warm-up).
+        """
+        self.window.push(float(candle['close']))
+        return self.window.mean()
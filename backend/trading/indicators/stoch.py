@@ -2,11 +2,18 @@
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.rolling import RollingMax, RollingMin
+from trading.indicators.core.streaming import RollingWindow, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
 
 # Configure loggers
 logger = LogManager('stochastic_logs').get_logger()
 
 class StochasticOscillator:
+    INPUTS = (('rolling_max', 'high', Param('period')), ('rolling_min', 'low', Param('period')))
+    OUTPUTS = ('stoch', 'stoch_signal')
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the Stochastic Oscillator class with a SQLiteDB handler.
@@ -16,13 +23,17 @@ class StochasticOscillator:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df, period=14):
+    def compute(df, period=14, context=None, dtype=None):
         """
         Calculate the Stochastic Oscillator for a given DataFrame.
-        
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'high', 'low', and 'close' prices.
         :param period: Lookback period for Stochastic Oscillator calculation.
-        :return: DataFrame with the Stochastic Oscillator values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the %K and %D columns.
         """
         # Ensure the necessary columns exist
         if any(col not in df.columns for col in ['high', 'low', 'close']):
@@ -31,20 +42,43 @@ class StochasticOscillator:
 
         if len(df) < period:
             logger.warning("Insufficient data for Stochastic Oscillator calculation.")
-            return df
+            return output_frame(df, {})
 
         # Calculate the rolling highest high and lowest low over the period
-        df['highest_high'] = df['high'].rolling(window=period).max()
-        df['lowest_low'] = df['low'].rolling(window=period).min()
+        context = IndicatorContext.for_frame(df, context)
+        highest_high = context.rolling_max('high', period)
+        lowest_low = context.rolling_min('low', period)
 
         # Calculate the %K (Stochastic Oscillator value)
-        df['stoch'] = 100 * ((df['close'] - df['lowest_low']) / (df['highest_high'] - df['lowest_low']))
+        stoch = 100 * ((df['close'] - lowest_low) / (highest_high - lowest_low))
 
         # Calculate the %D (signal line, typically a 3-period SMA of %K)
-        df['stoch_signal'] = df['stoch'].rolling(window=3).mean()
+        stoch_signal = stoch.rolling(window=3).mean()
 
         logger.info("Stochastic Oscillator calculation completed.")
-        return df
+        return output_frame(df, {'stoch': stoch, 'stoch_signal': stoch_signal}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Stochastic Oscillator for a given DataFrame.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param period: Lookback period for Stochastic Oscillator calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the Stochastic Oscillator values.
+        """
+        return assign_outputs(df, StochasticOscillator.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming Stochastic Oscillator calculator that is fed one candle at a time.
+
+        :param period: Lookback period for Stochastic Oscillator calculation.
+        :return: A StochasticOscillatorStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return StochasticOscillatorStream(period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period):
         """
@@ -59,10 +93,35 @@ class StochasticOscillator:
         timestamp = datetime.now().isoformat()
 
         param_name = 'stoch'
-        # Insert Stochastic Oscillator results row by row
-        for _, row in result_df.iterrows():
-            param_value = row[param_name]
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
-            self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+        # Insert the Stochastic Oscillator results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
 
         logger.info(f"Inserted Stochastic Oscillator results for {instrument} into SQLite.")
+
+
+class StochasticOscillatorStream:
+    def __init__(self, period=14):
+        """
+        Keep the monotonic high/low deques and the %K window needed to produce the next values in O(1).
+
+        :param period: Lookback period for Stochastic Oscillator calculation.
+        """
+        self.period = period
+        self.highest_high = RollingMax(period)
+        self.lowest_low = RollingMin(period)
+        self.signal = RollingWindow(3)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Stochastic Oscillator state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high', 'low' and 'close' prices.
+        :return: Dict with the 'stoch' (%K) and 'stoch_signal' (%D) values for this candle.
+        """
+        highest_high = self.highest_high.update(candle['high'])
+        lowest_low = self.lowest_low.update(candle['low'])
+
+        stoch = 100 * divide(float(candle['close']) - lowest_low, highest_high - lowest_low)
+        self.signal.push(stoch)
+        return {'stoch': stoch, 'stoch_signal': self.signal.mean()}
@@ -0,0 +1,141 @@
+# backend/trading/indicators/stoch_rsi.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.rsi import RSI, RSIStream
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.rolling import RollingMax, RollingMin
+from trading.indicators.core.streaming import RollingWindow, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('stoch_rsi_logs').get_logger()
+
+class StochRSI:
+    INPUTS = (('indicator', RSI, {'period': Param('period')}),)
+    OUTPUTS = ('stoch_rsi', 'stoch_rsi_k', 'stoch_rsi_d')
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the StochRSI class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=14, fast=3, slow=3, context=None, dtype=None):
+        """
+        Calculate the Stochastic RSI for a given DataFrame.
+
+        The RSI is placed within its own `period` high/low range (0-100), then smoothed into %K and %D.
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period of the RSI and of its high/low range.
+        :param fast: Smoothing period of %K.
+        :param slow: Smoothing period of %D (applied to %K).
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the Stochastic RSI, %K and %D columns.
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        if len(df) < 2 * period:
+            logger.warning("Insufficient data for Stochastic RSI calculation.")
+            return output_frame(df, {})
+
+        # RSI of the run (computed once even when RSI itself is also requested)
+        rsi = IndicatorContext.for_frame(df, context).indicator(RSI, period=period)['rsi']
+
+        # Position of the RSI within its rolling range, then the %K and %D smoothing
+        lowest_rsi = rsi.rolling(window=period).min()
+        highest_rsi = rsi.rolling(window=period).max()
+        stoch_rsi = 100 * (rsi - lowest_rsi) / (highest_rsi - lowest_rsi)
+        k = stoch_rsi.rolling(window=fast).mean()
+        d = k.rolling(window=slow).mean()
+
+        logger.info(f"Stochastic RSI calculation for period={period}, fast={fast}, slow={slow} completed.")
+        return output_frame(df, {'stoch_rsi': stoch_rsi, 'stoch_rsi_k': k, 'stoch_rsi_d': d}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, fast=3, slow=3, context=None):
+        """
+        Calculate the Stochastic RSI for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period of the RSI and of its high/low range.
+        :param fast: Smoothing period of %K.
+        :param slow: Smoothing period of %D (applied to %K).
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the Stochastic RSI, %K and %D values.
+        """
+        return assign_outputs(df, StochRSI.compute(df, period, fast, slow, context=context))
+
+    @staticmethod
+    def stream(period=14, fast=3, slow=3):
+        """
+        Create a streaming Stochastic RSI calculator that is fed one candle at a time.
+
+        :param period: Lookback period of the RSI and of its high/low range.
+        :param fast: Smoothing period of %K.
+        :param slow: Smoothing period of %D (applied to %K).
+        :return: A StochRSIStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return StochRSIStream(period, fast, slow)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period, fast, slow):
+        """
+        Insert the Stochastic RSI results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'StochRSI').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated Stochastic RSI values.
+        :param period: Period of the RSI and of its high/low range.
+        :param fast: Smoothing period of %K.
+        :param slow: Smoothing period of %D.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        # Insert the Stochastic RSI results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in self.OUTPUTS})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period, 'fast': fast, 'slow': slow})
+
+        logger.info(f"Inserted Stochastic RSI results for {instrument} into SQLite.")
+
+
+class StochRSIStream:
+    def __init__(self, period=14, fast=3, slow=3):
+        """
+        Keep the RSI state, the RSI high/low deques and the smoothing windows needed to produce the next values in O(1).
+
+        :param period: Lookback period of the RSI and of its high/low range.
+        :param fast: Smoothing period of %K.
+        :param slow: Smoothing period of %D (applied to %K).
+        """
+        self.rsi = RSIStream(period)
+        self.highest_rsi = RollingMax(period)
+        self.lowest_rsi = RollingMin(period)
+        self.k = RollingWindow(fast)
+        self.d = RollingWindow(slow)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Stochastic RSI state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: Dict with the 'stoch_rsi', 'stoch_rsi_k' and 'stoch_rsi_d' values for this candle.
+        """
+        rsi = self.rsi.update(candle)
+        highest_rsi = self.highest_rsi.update(rsi)
+        lowest_rsi = self.lowest_rsi.update(rsi)
+
+        stoch_rsi = 100 * divide(rsi - lowest_rsi, highest_rsi - lowest_rsi)
+        self.k.push(stoch_rsi)
+        k = self.k.mean()
+        self.d.push(k)
+        return {'stoch_rsi': stoch_rsi, 'stoch_rsi_k': k, 'stoch_rsi_d': self.d.mean()}
@@ -0,0 +1,175 @@
+# backend/trading/indicators/supertrend.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.atr import ATR, ATRStream
+from trading.indicators.core import kernels
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.streaming import NAN, is_nan
+from trading.indicators.core.outputs import assign_outputs, output_frame, wrap_like
+
+# Configure loggers
+logger = LogManager('supertrend_logs').get_logger()
+
+class Supertrend:
+    INPUTS = (('indicator', ATR, {'period': Param('period')}),)
+    OUTPUTS = ('supertrend', 'supertrend_direction')
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the Supertrend class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=10, multiplier=3, context=None, dtype=None):
+        """
+        Calculate the Supertrend for a given DataFrame.
+
+        The final bands ratchet on the previous bar's band and close, so the trend is carried by one
+        scalar recurrence over the vectorized ATR bands; it runs as a compiled loop over every
+        instrument column (see `kernels.supertrend`), with the rules of `SupertrendState`.
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param period: Lookback period of the ATR.
+        :param multiplier: Number of ATRs between the median price and each band.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the Supertrend line and its direction (1 up, -1 down).
+        """
+        # Ensure the necessary columns exist
+        if any(col not in df.columns for col in ['high', 'low', 'close']):
+            logger.error("DataFrame must contain 'high', 'low', and 'close' columns.")
+            raise KeyError("DataFrame must contain 'high', 'low', and 'close' columns.")
+
+        if len(df) < period:
+            logger.warning("Insufficient data for Supertrend calculation.")
+            return output_frame(df, {})
+
+        # ATR of the run (computed once even when ATR itself is also requested)
+        atr = IndicatorContext.for_frame(df, context).indicator(ATR, period=period)['atr']
+        columns = [df[col].to_numpy(dtype=float) for col in ['high', 'low', 'close']] + [atr.to_numpy(dtype=float)]
+        supertrend, direction = kernels.supertrend(*columns, multiplier)
+
+        logger.info(f"Supertrend calculation for period={period}, multiplier={multiplier} completed.")
+        return output_frame(df, {
+            'supertrend': wrap_like(atr, supertrend),
+            'supertrend_direction': wrap_like(atr, direction)
+        }, dtype)
+
+    @staticmethod
+    def calculate(df, period=10, multiplier=3, context=None):
+        """
+        Calculate the Supertrend for a given DataFrame.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param period: Lookback period of the ATR.
+        :param multiplier: Number of ATRs between the median price and each band.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the Supertrend line and direction values.
+        """
+        return assign_outputs(df, Supertrend.compute(df, period, multiplier, context=context))
+
+    @staticmethod
+    def stream(period=10, multiplier=3):
+        """
+        Create a streaming Supertrend calculator that is fed one candle at a time.
+
+        :param period: Lookback period of the ATR.
+        :param multiplier: Number of ATRs between the median price and each band.
+        :return: A SupertrendStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return SupertrendStream(period, multiplier)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period, multiplier):
+        """
+        Insert the Supertrend results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'Supertrend').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated Supertrend values.
+        :param period: Period of the ATR.
+        :param multiplier: Number of ATRs between the median price and each band.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        # Insert the Supertrend results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {name: result_df[name] for name in self.OUTPUTS})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period, 'multiplier': multiplier})
+
+        logger.info(f"Inserted Supertrend results for {instrument} into SQLite.")
+
+
+class SupertrendState:
+    """
+    Final-band ratchet and trend direction of the Supertrend, advanced one bar at a time.
+    """
+
+    def __init__(self, multiplier=3):
+        self.multiplier = multiplier
+        self.upper = None
+        self.lower = None
+        self.close = None
+        self.direction = None
+
+    def step(self, high, low, close, atr):
+        """
+        Advance the recurrence by one bar.
+
+        :param high: High price of the bar.
+        :param low: Low price of the bar.
+        :param close: Close price of the bar.
+        :param atr: ATR of the bar; NaN restarts the recurrence.
+        :return: Tuple (supertrend, direction) for the bar, NaN while the ATR is not available.
+        """
+        if is_nan(atr) or is_nan(close):
+            self.upper = self.lower = self.close = self.direction = None
+            return NAN, NAN
+
+        median = (high + low) / 2
+        upper = median + self.multiplier * atr
+        lower = median - self.multiplier * atr
+
+        if self.direction is None:
+            # First bar of a run: start in a downtrend unless the close is already above the upper band
+            self.direction = 1 if close > upper else -1
+        else:
+            # The bands only tighten while the previous close stays inside them
+            if not (upper < self.upper or self.close > self.upper):
+                upper = self.upper
+            if not (lower > self.lower or self.close < self.lower):
+                lower = self.lower
+            if self.direction == -1 and close > upper:
+                self.direction = 1
+            elif self.direction == 1 and close < lower:
+                self.direction = -1
+
+        self.upper, self.lower, self.close = upper, lower, close
+        return (lower if self.direction == 1 else upper), float(self.direction)
+
+
+class SupertrendStream:
+    def __init__(self, period=10, multiplier=3):
+        """
+        Keep the ATR state and the final bands needed to produce the next Supertrend values in O(1).
+
+        :param period: Lookback period of the ATR.
+        :param multiplier: Number of ATRs between the median price and each band.
+        """
+        self.atr = ATRStream(period)
+        self.state = SupertrendState(multiplier)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Supertrend state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high', 'low' and 'close' prices.
+        :return: Dict with the 'supertrend' and 'supertrend_direction' values for this candle.
+        """
+        atr = self.atr.update(candle)
+        supertrend, direction = self.state.step(float(candle['high']), float(candle['low']), float(candle['close']), atr)
+        return {'supertrend': supertrend, 'supertrend_direction': direction}
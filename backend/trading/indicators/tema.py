@@ -0,0 +1,120 @@
+# backend/trading/indicators/tema.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.streaming import EMAState
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('tema_logs').get_logger()
+
+class TEMA:
+    INPUTS = (('ema', 'close', Param('period'), 3),)
+    OUTPUTS = ('tema',)
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the TEMA class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=14, context=None, dtype=None):
+        """
+        Calculate the Triple Exponential Moving Average (TEMA) for a given DataFrame.
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Span of each of the three EMAs.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the TEMA columns.
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        if len(df) < period:
+            logger.warning("Insufficient data for TEMA calculation.")
+            return output_frame(df, {})
+
+        # The EMA chain is shared with TRIX (and EMA) through the context
+        context = IndicatorContext.for_frame(df, context)
+        ema1 = context.ema('close', period)
+        ema2 = context.ema('close', period, 2)
+        ema3 = context.ema('close', period, 3)
+
+        tema = 3 * ema1 - 3 * ema2 + ema3
+
+        logger.info(f"TEMA calculation for period {period} completed.")
+        return output_frame(df, {'tema': tema}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Triple Exponential Moving Average (TEMA) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Span of each of the three EMAs.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the TEMA values.
+        """
+        return assign_outputs(df, TEMA.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming TEMA calculator that is fed one candle at a time.
+
+        :param period: Span of each of the three EMAs.
+        :return: A TEMAStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return TEMAStream(period)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period):
+        """
+        Insert the TEMA results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'TEMA').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated TEMA values.
+        :param period: Period for which the TEMA was calculated.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        param_name = 'tema'
+        # Insert the TEMA results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+
+        logger.info(f"Inserted TEMA results for {instrument} into SQLite.")
+
+
+class TEMAStream:
+    def __init__(self, period=14):
+        """
+        Keep the three chained EMA seeds needed to produce the next TEMA value in O(1).
+
+        :param period: Span of each of the three EMAs.
+        """
+        self.ema1 = EMAState(period)
+        self.ema2 = EMAState(period)
+        self.ema3 = EMAState(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the TEMA state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: The TEMA value for this candle.
+        """
+        ema1 = self.ema1.update(float(candle['close']))
+        ema2 = self.ema2.update(ema1)
+        ema3 = self.ema3.update(ema2)
+        return 3 * ema1 - 3 * ema2 + ema3
@@ -0,0 +1,117 @@
+# backend/trading/indicators/trix.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.streaming import NAN, EMAState, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('trix_logs').get_logger()
+
+class TRIX:
+    INPUTS = (('ema', 'close', Param('period'), 3),)
+    OUTPUTS = ('trix',)
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the TRIX class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=15, context=None, dtype=None):
+        """
+        Calculate the TRIX (rate of change of a triple-smoothed EMA) for a given DataFrame.
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Span of each of the three EMAs.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the TRIX columns.
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        if len(df) < period:
+            logger.warning("Insufficient data for TRIX calculation.")
+            return output_frame(df, {})
+
+        # One-bar percentage change of the triple EMA, shared with TEMA through the context
+        ema3 = IndicatorContext.for_frame(df, context).ema('close', period, 3)
+        trix = (ema3 / ema3.shift(1) - 1) * 100
+
+        logger.info(f"TRIX calculation for period {period} completed.")
+        return output_frame(df, {'trix': trix}, dtype)
+
+    @staticmethod
+    def calculate(df, period=15, context=None):
+        """
+        Calculate the TRIX (rate of change of a triple-smoothed EMA) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Span of each of the three EMAs.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the TRIX values.
+        """
+        return assign_outputs(df, TRIX.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=15):
+        """
+        Create a streaming TRIX calculator that is fed one candle at a time.
+
+        :param period: Span of each of the three EMAs.
+        :return: A TRIXStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return TRIXStream(period)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period):
+        """
+        Insert the TRIX results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'TRIX').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated TRIX values.
+        :param period: Period for which the TRIX was calculated.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        param_name = 'trix'
+        # Insert the TRIX results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+
+        logger.info(f"Inserted TRIX results for {instrument} into SQLite.")
+
+
+class TRIXStream:
+    def __init__(self, period=15):
+        """
+        Keep the three chained EMA seeds and the previous triple EMA needed to produce the next TRIX in O(1).
+
+        :param period: Span of each of the three EMAs.
+        """
+        self.ema1 = EMAState(period)
+        self.ema2 = EMAState(period)
+        self.ema3 = EMAState(period)
+        self.prev_ema3 = NAN
+
+    def update(self, candle):
+        """
+        Fold a new candle into the TRIX state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: The TRIX value for this candle (NaN on the first bar).
+        """
+        ema3 = self.ema3.update(self.ema2.update(self.ema1.update(float(candle['close']))))
+        trix = (divide(ema3, self.prev_ema3) - 1) * 100
+        self.prev_ema3 = ema3
+        return trix
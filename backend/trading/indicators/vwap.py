@@ -2,11 +2,17 @@
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext
+from trading.indicators.core.streaming import NAN, divide, is_nan
+from trading.indicators.core.outputs import assign_outputs, output_frame
 
 # Configure loggers
 logger = LogManager('vwap_logs').get_logger()
 
 class VWAP:
+    INPUTS = ('typical_price',)
+    OUTPUTS = ('vwap',)
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the VWAP class with a SQLiteDB handler.
@@ -16,28 +22,50 @@ class VWAP:
         self.db_handler = SQLiteDB(db_name=db_name)
 
     @staticmethod
-    def calculate(df):
+    def compute(df, context=None, dtype=None):
         """
         Calculate the Volume Weighted Average Price (VWAP) for a given DataFrame.
-        
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'high', 'low', 'close', and 'volume' columns.
-        :return: DataFrame with VWAP values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the VWAP columns.
         """
         # Ensure the necessary columns exist
-        if any(
-            col not in df.columns for col in ['high', 'low', 'close', 'volume']
-        ):
+        if any(col not in df.columns for col in ['high', 'low', 'close', 'volume']):
             logger.error("DataFrame must contain 'high', 'low', 'close', and 'volume' columns.")
             raise KeyError("DataFrame must contain 'high', 'low', 'close', and 'volume' columns.")
 
-        # Calculate the typical price (average of high, low, and close)
-        df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
+        # Calculate the typical price (average of high, low, and close), shared across indicators
+        typical_price = IndicatorContext.for_frame(df, context).typical_price()
 
         # Calculate the VWAP
-        df['vwap'] = (df['typical_price'] * df['volume']).cumsum() / df['volume'].cumsum()
+        vwap = (typical_price * df['volume']).cumsum() / df['volume'].cumsum()
 
         logger.info("VWAP calculation completed.")
-        return df
+        return output_frame(df, {'vwap': vwap}, dtype)
+
+    @staticmethod
+    def calculate(df, context=None):
+        """
+        Calculate the Volume Weighted Average Price (VWAP) for a given DataFrame.
+
+        :param df: DataFrame with 'high', 'low', 'close', and 'volume' columns.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with VWAP values.
+        """
+        return assign_outputs(df, VWAP.compute(df, context=context))
+
+    @staticmethod
+    def stream():
+        """
+        Create a streaming VWAP calculator that is fed one candle at a time.
+
+        :return: A VWAPStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return VWAPStream()
 
     def insert_results_to_db(self, indicator_name, instrument, result_df):
         """
@@ -51,9 +79,35 @@ class VWAP:
         timestamp = datetime.now().isoformat()
 
         param_name = 'vwap'
-        # Insert VWAP results row by row
-        for _, row in result_df.iterrows():
-            param_value = row['vwap']
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
+        # Insert the VWAP results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df['vwap']})
 
         logger.info(f"Inserted VWAP results for {instrument} into SQLite.")
+
+
+class VWAPStream:
+    def __init__(self):
+        """
+        Keep the cumulative price-volume and volume totals.
+        """
+        self.cumulative_pv = 0.0
+        self.cumulative_volume = 0.0
+
+    def update(self, candle):
+        """
+        Fold a new candle into the VWAP state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high', 'low', 'close' and 'volume'.
+        :return: The VWAP value for this candle.
+        """
+        typical_price = (float(candle['high']) + float(candle['low']) + float(candle['close'])) / 3
+        volume = float(candle['volume'])
+        price_volume = typical_price * volume
+        # Like `cumsum`, a missing value leaves the totals untouched and only this bar's VWAP is NaN
+        if not is_nan(price_volume):
+            self.cumulative_pv += price_volume
+        if not is_nan(volume):
+            self.cumulative_volume += volume
+        if is_nan(price_volume) or is_nan(volume):
+            return NAN
+        return divide(self.cumulative_pv, self.cumulative_volume)
@@ -0,0 +1,114 @@
+# backend/trading/indicators/vwma.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core.streaming import RollingWindow, divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('vwma_logs').get_logger()
+
+class VWMA:
+    INPUTS = ()
+    OUTPUTS = ('vwma',)
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the VWMA class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=20, context=None, dtype=None):
+        """
+        Calculate the Volume Weighted Moving Average (VWMA) for a given DataFrame.
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'close' and 'volume' columns.
+        :param period: Lookback period for VWMA calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the VWMA columns.
+        """
+        # Ensure the necessary columns exist
+        if any(col not in df.columns for col in ['close', 'volume']):
+            logger.error("DataFrame must contain 'close' and 'volume' columns.")
+            raise KeyError("DataFrame must contain 'close' and 'volume' columns.")
+
+        if len(df) < period:
+            logger.warning("Insufficient data for VWMA calculation.")
+            return output_frame(df, {})
+
+        # Volume-weighted sum of the closes over the rolling volume
+        vwma = (df['close'] * df['volume']).rolling(window=period).sum() / df['volume'].rolling(window=period).sum()
+
+        logger.info(f"VWMA calculation for period {period} completed.")
+        return output_frame(df, {'vwma': vwma}, dtype)
+
+    @staticmethod
+    def calculate(df, period=20, context=None):
+        """
+        Calculate the Volume Weighted Moving Average (VWMA) for a given DataFrame.
+
+        :param df: DataFrame with 'close' and 'volume' columns.
+        :param period: Lookback period for VWMA calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the VWMA values.
+        """
+        return assign_outputs(df, VWMA.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=20):
+        """
+        Create a streaming VWMA calculator that is fed one candle at a time.
+
+        :param period: Lookback period for VWMA calculation.
+        :return: A VWMAStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return VWMAStream(period)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period):
+        """
+        Insert the VWMA results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'VWMA').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated VWMA values.
+        :param period: Period for which the VWMA was calculated.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        param_name = 'vwma'
+        # Insert the VWMA results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+
+        logger.info(f"Inserted VWMA results for {instrument} into SQLite.")
+
+
+class VWMAStream:
+    def __init__(self, period=20):
+        """
+        Keep the rolling price-volume and volume sums needed to produce the next VWMA value in O(1).
+
+        :param period: Lookback period for VWMA calculation.
+        """
+        self.period = period
+        self.price_volume = RollingWindow(period)
+        self.volume = RollingWindow(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the VWMA state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'close' and 'volume' values.
+        :return: The VWMA value for this candle (NaN during warm-up).
+        """
+        volume = float(candle['volume'])
+        self.price_volume.push(float(candle['close']) * volume)
+        self.volume.push(volume)
+        return divide(self.price_volume.sum(), self.volume.sum())
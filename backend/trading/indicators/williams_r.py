@@ -2,11 +2,18 @@
 from logs.log_manager import LogManager
 from data.repositories.sqlite3 import SQLiteDB
 from datetime import datetime
+from trading.indicators.core.context import IndicatorContext, Param
+from trading.indicators.core.rolling import RollingMax, RollingMin
+from trading.indicators.core.streaming import divide
+from trading.indicators.core.outputs import assign_outputs, output_frame
 
 # Configure loggers
 logger = LogManager('williams_r_logs').get_logger()
 
 class WilliamsR:
+    INPUTS = (('rolling_max', 'high', Param('period')), ('rolling_min', 'low', Param('period')))
+    OUTPUTS = ('williams_r',)
+
     def __init__(self, db_name="indicators.db"):
         """
         Initialize the Williams %R class with a SQLiteDB handler.
@@ -23,13 +30,17 @@ class WilliamsR:
         :return: DataFrame with Williams %R values.
         """
     @staticmethod
-    def calculate(df, period=14):
+    def compute(df, period=14, context=None, dtype=None):
         """
         Calculate the Williams %R for the given DataFrame.
-        
+
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
         :param df: DataFrame with 'high', 'low', and 'close' prices.
         :param period: The lookback period for Williams %R calculation.
-        :return: DataFrame with the Williams %R values.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the Williams %R columns.
         """
         # Ensure the necessary columns exist
         if any(col not in df.columns for col in ['high', 'low', 'close']):
@@ -38,15 +49,38 @@ class WilliamsR:
 
         if len(df) < period:
             logger.warning("Insufficient data for Williams %R calculation.")
-            return df
+            return output_frame(df, {})
 
         # Calculate the Williams %R
-        high_max = df['high'].rolling(window=period).max()
-        low_min = df['low'].rolling(window=period).min()
-        df['williams_r'] = (high_max - df['close']) / (high_max - low_min) * -100
+        context = IndicatorContext.for_frame(df, context)
+        high_max = context.rolling_max('high', period)
+        low_min = context.rolling_min('low', period)
+        williams_r = (high_max - df['close']) / (high_max - low_min) * -100
 
         logger.info("Williams %R calculation completed.")
-        return df
+        return output_frame(df, {'williams_r': williams_r}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Williams %R for the given DataFrame.
+
+        :param df: DataFrame with 'high', 'low', and 'close' prices.
+        :param period: The lookback period for Williams %R calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the Williams %R values.
+        """
+        return assign_outputs(df, WilliamsR.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming Williams %R calculator that is fed one candle at a time.
+
+        :param period: The lookback period for Williams %R calculation.
+        :return: A WilliamsRStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return WilliamsRStream(period)
 
     def insert_results_to_db(self, indicator_name, instrument, result_df, period):
         """
@@ -61,10 +95,31 @@ class WilliamsR:
         timestamp = datetime.now().isoformat()
 
         param_name = 'williams_r'
-        # Insert Williams %R results row by row
-        for _, row in result_df.iterrows():
-            param_value = row[param_name]
-            self.db_handler.add_indicator_results(indicator_id, timestamp, param_name, param_value)
-            self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+        # Insert the Williams %R results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
 
         logger.info(f"Inserted Williams %R results for {instrument} into SQLite.")
+
+
+class WilliamsRStream:
+    def __init__(self, period=14):
+        """
+        Keep the monotonic high/low deques needed to produce the next Williams %R value in O(1).
+
+        :param period: The lookback period for Williams %R calculation.
+        """
+        self.period = period
+        self.high_max = RollingMax(period)
+        self.low_min = RollingMin(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the Williams %R state.
+
+        :param candle: Mapping (dict or DataFrame row) with 'high', 'low' and 'close' prices.
+        :return: The Williams %R value for this candle (NaN during warm-up).
+        """
+        high_max = self.high_max.update(candle['high'])
+        low_min = self.low_min.update(candle['low'])
+        return divide(high_max - float(candle['close']), high_max - low_min) * -100
@@ -0,0 +1,113 @@
+# backend/trading/indicators/wma.py
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core import kernels
+from trading.indicators.core.streaming import WeightedWindow
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('wma_logs').get_logger()
+
+class WMA:
+    INPUTS = ()
+    OUTPUTS = ('wma',)
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the WMA class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=14, context=None, dtype=None):
+        """
+        Calculate the Weighted Moving Average (WMA) for a given DataFrame.
+
+        The weights grow linearly from 1 on the oldest bar to `period` on the newest.
+        Output-only mode: the given DataFrame is not modified and intermediates are not kept.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period for WMA calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the WMA columns.
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        if len(df) < period:
+            logger.warning("Insufficient data for WMA calculation.")
+            return output_frame(df, {})
+
+        # Weighted average of each window in one strided matrix product
+        wma = kernels.weighted_moving_average(df['close'].to_numpy(), period)
+
+        logger.info(f"WMA calculation for period {period} completed.")
+        return output_frame(df, {'wma': wma}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Weighted Moving Average (WMA) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Lookback period for WMA calculation.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the WMA values.
+        """
+        return assign_outputs(df, WMA.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming WMA calculator that is fed one candle at a time.
+
+        :param period: Lookback period for WMA calculation.
+        :return: A WMAStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return WMAStream(period)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period):
+        """
+        Insert the WMA results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'WMA').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated WMA values.
+        :param period: Period for which the WMA was calculated.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        param_name = 'wma'
+        # Insert the WMA results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+
+        logger.info(f"Inserted WMA results for {instrument} into SQLite.")
+
+
+class WMAStream:
+    def __init__(self, period=14):
+        """
+        Keep the ring buffer and weighted sum needed to produce the next WMA value in O(1).
+
+        :param period: Lookback period for WMA calculation.
+        """
+        self.period = period
+        self.window = WeightedWindow(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the WMA state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: The WMA value for this candle (NaN during warm-up).
+        """
+        self.window.push(float(candle['close']))
+        return self.window.weighted_mean()
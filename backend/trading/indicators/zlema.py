@@ -0,0 +1,118 @@
+# backend/trading/indicators/zlema.py
+from collections import deque
+from logs.log_manager import LogManager
+from data.repositories.sqlite3 import SQLiteDB
+from datetime import datetime
+from trading.indicators.core.streaming import NAN, EMAState
+from trading.indicators.core.outputs import assign_outputs, output_frame
+
+# Configure loggers
+logger = LogManager('zlema_logs').get_logger()
+
+class ZLEMA:
+    INPUTS = ()
+    OUTPUTS = ('zlema',)
+
+    def __init__(self, db_name="indicators.db"):
+        """
+        Initialize the ZLEMA class with a SQLiteDB handler.
+
+        :param db_name: The name of the SQLite database file.
+        """
+        self.db_handler = SQLiteDB(db_name=db_name)
+
+    @staticmethod
+    def compute(df, period=14, context=None, dtype=None):
+        """
+        Calculate the Zero-Lag Exponential Moving Average (ZLEMA) for a given DataFrame.
+
+        The EMA is taken over the close plus its change over (period - 1) // 2 bars, which removes
+        most of the EMA's lag. Output-only mode: the given DataFrame is not modified.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Span of the EMA.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :param dtype: Optional floating dtype for the outputs (e.g. np.float32) to halve their memory.
+        :return: DataFrame indexed like `df` holding only the ZLEMA columns.
+        """
+        # Ensure the necessary 'close' column exists
+        if 'close' not in df.columns:
+            logger.error("DataFrame must contain 'close' column.")
+            raise KeyError("DataFrame must contain 'close' column.")
+
+        if len(df) < period:
+            logger.warning("Insufficient data for ZLEMA calculation.")
+            return output_frame(df, {})
+
+        # De-lagged close, then its EMA (which starts at the first complete value)
+        lag = (period - 1) // 2
+        close = df['close']
+        zlema = (2 * close - close.shift(lag)).ewm(span=period, adjust=False).mean()
+
+        logger.info(f"ZLEMA calculation for period {period} completed.")
+        return output_frame(df, {'zlema': zlema}, dtype)
+
+    @staticmethod
+    def calculate(df, period=14, context=None):
+        """
+        Calculate the Zero-Lag Exponential Moving Average (ZLEMA) for a given DataFrame.
+
+        :param df: DataFrame with 'close' prices.
+        :param period: Span of the EMA.
+        :param context: Optional IndicatorContext sharing intermediate series across indicators.
+        :return: DataFrame with the ZLEMA values.
+        """
+        return assign_outputs(df, ZLEMA.compute(df, period, context=context))
+
+    @staticmethod
+    def stream(period=14):
+        """
+        Create a streaming ZLEMA calculator that is fed one candle at a time.
+
+        :param period: Span of the EMA.
+        :return: A ZLEMAStream whose `update(candle)` matches `calculate` bar for bar.
+        """
+        return ZLEMAStream(period)
+
+    def insert_results_to_db(self, indicator_name, instrument, result_df, period):
+        """
+        Insert the ZLEMA results into the SQLite database.
+
+        :param indicator_name: The name of the indicator (e.g., 'ZLEMA').
+        :param instrument: The instrument for which the calculation was made (e.g., 'EUR_USD').
+        :param result_df: DataFrame containing the calculated ZLEMA values.
+        :param period: Period for which the ZLEMA was calculated.
+        """
+        indicator_id = self.db_handler.get_indicator_id(indicator_name)
+        timestamp = datetime.now().isoformat()
+
+        param_name = 'zlema'
+        # Insert the ZLEMA results in one transaction
+        self.db_handler.add_indicator_results_bulk(indicator_id, timestamp, {param_name: result_df[param_name]})
+        self.db_handler.add_indicator_parameters(indicator_id, {'period': period})
+
+        logger.info(f"Inserted ZLEMA results for {instrument} into SQLite.")
+
+
+class ZLEMAStream:
+    def __init__(self, period=14):
+        """
+        Keep the lagged closes and the EMA seed needed to produce the next ZLEMA value in O(1).
+
+        :param period: Span of the EMA.
+        """
+        self.lag = (period - 1) // 2
+        self.closes = deque(maxlen=self.lag + 1)
+        self.ema = EMAState(period)
+
+    def update(self, candle):
+        """
+        Fold a new candle into the ZLEMA state.
+
+        :param candle: Mapping (dict or DataFrame row) with a 'close' price.
+        :return: The ZLEMA value for this candle (NaN during warm-up).
+        """
+        close = float(candle['close'])
+        self.closes.append(close)
+        delagged = 2 * close - self.closes[0] if len(self.closes) > self.lag else NAN
+        return self.ema.update(delagged)